@@ -1,35 +1,45 @@
 import sys
-import numpy as np
+import os
 import sympy as sp
 from sympy.parsing.sympy_parser import parse_expr, standard_transformations, implicit_multiplication_application
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                               QHBoxLayout, QTabWidget, QPushButton, QLabel,
-                              QListWidget, QMenuBar, QMenu, QGridLayout,
-                              QLineEdit, QMessageBox, QFileDialog, QSplitter,
-                              QSizePolicy)
+                              QListWidget, QListWidgetItem, QMenuBar, QMenu, QGridLayout,
+                              QLineEdit, QMessageBox, QFileDialog, QSplitter, QComboBox,
+                              QSizePolicy, QInputDialog)
 from PySide6.QtCore import Qt, Signal, Slot
-from PySide6.QtWebEngineWidgets import QWebEngineView
 from PySide6.QtGui import QIcon
-from PySide6.QtUiTools import QUiLoader
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-import matplotlib
-matplotlib.use('Qt5Agg')
-
-class CalculatorApp(QMainWindow):
-    def __init__(self):
+
+import engine
+import numeric_solve
+from parse_cache import ParseCache
+from latex_view import MathJaxView, choose_renderer, create_latex_view, effective_renderer
+from preview import PreviewScheduler
+from calculator_mixin import CalculatorMixin
+from ui_loader import load_ui
+
+class CalculatorApp(CalculatorMixin, QMainWindow):
+    # 定积分结果的前缀，与本窗口其他英文结果一致
+    DEFINITE_LABELS = ("Exact", "Approximate")
+
+    def __init__(self, renderer=None):
         super().__init__()
 
-        # 加载UI文件
-        loader = QUiLoader()
-        self.ui = loader.load("qtUI.ui", self)
-        self.setCentralWidget(self.ui)
+        # 公式渲染方式，需要在加载UI文件之前确定
+        self.renderer = effective_renderer(renderer or choose_renderer(sys.argv))
+
+        # 加载界面（优先使用预生成的ui_qtUI.py）
+        self.ui = load_ui(self)
 
         # 初始化符号变量
         self.x, self.y, self.z = sp.symbols('x y z')
+        # 参数曲线的参数
+        self.t = sp.Symbol('t')
         self.current_expression = ""
         self.history = []
+        self.dataset = None
         self.transformations = standard_transformations + (implicit_multiplication_application,)
+        self.parse_cache = ParseCache(maxsize=256)
 
         # 角度制设置，默认为弧度制
         self.angle_mode = "RAD" 
@@ -45,9 +55,30 @@ class CalculatorApp(QMainWindow):
             "tab_char": False
         }
 
+        # 后台计算引擎
+        self.setup_evaluator()
+
+        # 输入预览调度
+        self.setup_preview()
+
         # 连接UI元素和信号
         self.setup_ui_connections()
 
+    def setup_preview(self):
+        """初始化输入预览调度器，防抖时间可通过QSettings的preview/delay_ms修改"""
+        delay_ms = self.settings.value("preview/delay_ms", 80, type=int)
+        self.input_preview = PreviewScheduler(self.show_input_preview, delay_ms=delay_ms, parent=self)
+
+    def show_input_preview(self, content):
+        """显示预览内容，content为 (类型, 文本)"""
+        kind, text = content
+        if kind == "latex":
+            self.latex_view.set_latex("input", text)
+        elif kind == "text":
+            self.latex_view.set_text("input", text)
+        else:
+            self.latex_view.clear("input")
+
     def setup_ui_connections(self):
         """设置UI元素和连接信号"""
         # 输入框
@@ -56,8 +87,7 @@ class CalculatorApp(QMainWindow):
         self.expression_input.returnPressed.connect(self.calculate)
 
         # LaTeX显示视图初始化
-        self.web_view = self.ui.webEngineView
-        self.web_view.setHtml("<html><body></body></html>")
+        self.latex_view = create_latex_view(self.ui.webEngineView, self.renderer)
 
         # 连接所有标签页的切换信号
         self.ui.tabWidget.currentChanged.connect(self.on_tab_changed)
@@ -65,6 +95,19 @@ class CalculatorApp(QMainWindow):
         # 连接所有按钮
         self.connect_all_buttons()
 
+        # 统计菜单：数据导入（File > CSV File > Import）、汇总统计、百分位数、出现次数最多的数值和数值表
+        if hasattr(self.ui, "actionImport"):
+            self.ui.actionImport.triggered.connect(self.import_dataset)
+        if hasattr(self.ui, "actionStatistics"):
+            self.ui.actionStatistics.triggered.connect(self.calculate_summary)
+        if hasattr(self.ui, "menuFile"):
+            self.ui.menuFile.addAction("Quantiles", self.calculate_quantiles)
+            self.ui.menuFile.addAction("Top Values", self.calculate_top_k)
+            self.ui.menuFile.addAction("Table...", self.show_table)
+
+        # 矩阵工作区（File > Matrix）
+        self.setup_matrix_workspace()
+
         # 显示主窗口
         self.show()
 
@@ -360,6 +403,12 @@ class CalculatorApp(QMainWindow):
             self.calculate_std()
         elif text == 'σ²':  # 方差
             self.calculate_variance()
+        elif text == 'Summary':  # 汇总统计
+            self.calculate_summary()
+        elif text == 'Quantiles':  # 百分位数
+            self.calculate_quantiles()
+        elif text == 'Top-k':  # 出现次数最多的数值
+            self.calculate_top_k()
         # 矩阵/集合运算
         elif text in '[]{}⟨⟩|∈∩∪\⊂⊃⊆⊇∀∃△∅#':
             # 特殊字符直接添加到表达式
@@ -440,9 +489,7 @@ class CalculatorApp(QMainWindow):
 
             # 弹出对话框获取变量
             var_name, ok = QMessageBox.question(self, "偏导数", 
-                                               "选择变量:
-[是] - 对x求偏导
-[否] - 对y求偏导",
+                                               "选择变量:\n[是] - 对x求偏导\n[否] - 对y求偏导",
                                                QMessageBox.Yes | QMessageBox.No)
 
             if not ok:
@@ -451,9 +498,8 @@ class CalculatorApp(QMainWindow):
             var = self.x if var_name == QMessageBox.Yes else self.y
 
             # 解析表达式
-            expr = parse_expr(self.current_expression,
-                             local_dict={'x': self.x, 'y': self.y, 'z': self.z},
-                             transformations=self.transformations)
+            expr = self.parse_expression(self.current_expression,
+                                         {'x': self.x, 'y': self.y, 'z': self.z})
 
             # 计算偏导数
             result = sp.diff(expr, var)
@@ -479,9 +525,8 @@ class CalculatorApp(QMainWindow):
                 return
 
             # 解析表达式
-            expr = parse_expr(self.current_expression,
-                             local_dict={'x': self.x, 'y': self.y},
-                             transformations=self.transformations)
+            expr = self.parse_expression(self.current_expression,
+                                         {'x': self.x, 'y': self.y})
 
             # 先对x积分
             integral_x = sp.integrate(expr, self.x)
@@ -504,21 +549,15 @@ class CalculatorApp(QMainWindow):
     def calculate_gcd(self):
         """计算最大公约数"""
         try:
-            data_str = self.stats_input.text()
-            if not data_str:
+            dataset = self.current_dataset()
+            if dataset is None:
                 QMessageBox.warning(self, "输入错误", "请先输入数据")
                 return
 
-            # 解析输入数据为整数列表
-            data = [int(float(x)) for x in data_str.split(",")]
-
-            # 使用sympy计算最大公约数
-            result = data[0]
-            for num in data[1:]:
-                result = sp.gcd(result, num)
+            result = engine.statistic("gcd", dataset.values)
 
             # 显示结果
-            self.current_expression = f"GCD({data_str}) = {result}"
+            self.current_expression = f"GCD({dataset.label}) = {result}"
             self.expression_input.setText(self.current_expression)
             self.update_input_latex_display()
             self.update_result_latex_display(str(result))
@@ -529,21 +568,15 @@ class CalculatorApp(QMainWindow):
     def calculate_lcm(self):
         """计算最小公倍数"""
         try:
-            data_str = self.stats_input.text()
-            if not data_str:
+            dataset = self.current_dataset()
+            if dataset is None:
                 QMessageBox.warning(self, "输入错误", "请先输入数据")
                 return
 
-            # 解析输入数据为整数列表
-            data = [int(float(x)) for x in data_str.split(",")]
-
-            # 使用sympy计算最小公倍数
-            result = data[0]
-            for num in data[1:]:
-                result = sp.lcm(result, num)
+            result = engine.statistic("lcm", dataset.values)
 
             # 显示结果
-            self.current_expression = f"LCM({data_str}) = {result}"
+            self.current_expression = f"LCM({dataset.label}) = {result}"
             self.expression_input.setText(self.current_expression)
             self.update_input_latex_display()
             self.update_result_latex_display(str(result))
@@ -554,17 +587,15 @@ class CalculatorApp(QMainWindow):
     def calculate_max(self):
         """计算最大值"""
         try:
-            data_str = self.stats_input.text()
-            if not data_str:
+            dataset = self.current_dataset()
+            if dataset is None:
                 QMessageBox.warning(self, "输入错误", "请先输入数据")
                 return
 
-            # 解析输入数据
-            data = [float(x) for x in data_str.split(",")]
-            max_value = max(data)
+            max_value = engine.statistic("max", dataset.values)
 
             # 显示结果
-            self.current_expression = f"Max({data_str}) = {max_value}"
+            self.current_expression = f"Max({dataset.label}) = {max_value}"
             self.expression_input.setText(self.current_expression)
             self.update_input_latex_display()
             self.update_result_latex_display(str(max_value))
@@ -575,17 +606,15 @@ class CalculatorApp(QMainWindow):
     def calculate_min(self):
         """计算最小值"""
         try:
-            data_str = self.stats_input.text()
-            if not data_str:
+            dataset = self.current_dataset()
+            if dataset is None:
                 QMessageBox.warning(self, "输入错误", "请先输入数据")
                 return
 
-            # 解析输入数据
-            data = [float(x) for x in data_str.split(",")]
-            min_value = min(data)
+            min_value = engine.statistic("min", dataset.values)
 
             # 显示结果
-            self.current_expression = f"Min({data_str}) = {min_value}"
+            self.current_expression = f"Min({dataset.label}) = {min_value}"
             self.expression_input.setText(self.current_expression)
             self.update_input_latex_display()
             self.update_result_latex_display(str(min_value))
@@ -718,9 +747,8 @@ class CalculatorApp(QMainWindow):
                     var_name = 'x'
 
                 var = sp.Symbol(var_name)
-                expr = parse_expr(self.current_expression, 
-                                  local_dict={'x': self.x, 'y': self.y, 'z': self.z},
-                                  transformations=self.transformations)
+                expr = self.parse_expression(self.current_expression,
+                                             {'x': self.x, 'y': self.y, 'z': self.z})
                 derivative = sp.diff(expr, var)
 
                 result = f"∂({self.current_expression})/∂{var_name} = {derivative}"
@@ -755,21 +783,58 @@ class CalculatorApp(QMainWindow):
             var2_name = var2_name if var2_name else 'y'
             var2 = sp.Symbol(var2_name)
 
+            # 积分限留空时计算不定积分，内层的积分限可以含外层变量
+            limits1_text, ok3 = QInputDialog.getText(
+                self, "二重积分", f"{var1_name}的积分限 a, b? (可以含{var2_name}，留空为不定积分)")
+            if not ok3:
+                return
+            limits1 = engine.split_limits(limits1_text)
+            limits2 = None
+            if limits1 is not None:
+                limits2_text, ok4 = QInputDialog.getText(self, "二重积分", f"{var2_name}的积分限 a, b?")
+                if not ok4:
+                    return
+                limits2 = engine.split_limits(limits2_text)
+                if limits2 is None:
+                    QMessageBox.warning(self, "输入错误", f"请输入{var2_name}的积分限")
+                    return
+
             # 解析表达式
-            expr = parse_expr(self.current_expression,
-                             local_dict={'x': self.x, 'y': self.y, 'z': self.z},
-                             transformations=self.transformations)
+            local_dict = {'x': self.x, 'y': self.y, 'z': self.z}
+            expr = self.parse_expression(self.current_expression, local_dict)
 
-            # 计算二重积分 (无界积分)
-            double_integral = sp.integrate(sp.integrate(expr, var1), var2)
+            expression_text = self.current_expression
 
-            result = f"∬{self.current_expression} d{var1_name}d{var2_name} = {double_integral} + C"
-            self.expression_input.setText(result)
-            self.current_expression = result
-            self.update_input_latex_display()
+            if limits1 is not None:
+                bounds1 = tuple(self.parse_expression(text, local_dict) for text in limits1)
+                bounds2 = tuple(self.parse_expression(text, local_dict) for text in limits2)
+                integral_text = (f"∬{expression_text} d{var1_name}d{var2_name}, "
+                                 f"{var1_name}: [{', '.join(limits1)}], {var2_name}: [{', '.join(limits2)}]")
 
-            # 添加到历史
-            self.add_to_history(result)
+                def show_definite(index, value):
+                    result = self.format_definite_integral(integral_text, index, value)
+                    self.expression_input.setText(result)
+                    self.current_expression = result
+                    self.update_input_latex_display()
+                    self.add_to_history(result)
+
+                args = (expr, var1, var2, bounds1, bounds2)
+                self.run_race("二重积分", show_definite, [(engine.double_integrate_exact, args),
+                                                         (engine.ndouble_integrate, args)])
+                return
+
+            def show_result(double_integral):
+                result = f"∬{expression_text} d{var1_name}d{var2_name} = {double_integral} + C"
+                self.expression_input.setText(result)
+                self.current_expression = result
+                self.update_input_latex_display()
+
+                # 添加到历史
+                self.add_to_history(result)
+
+            # 计算二重积分 (无界积分)
+            self.run_in_background("二重积分", show_result,
+                                   engine.double_integrate, expr, var1, var2)
         except Exception as e:
             QMessageBox.critical(self, "二重积分错误", f"错误: {str(e)}")
 
@@ -854,18 +919,12 @@ class CalculatorApp(QMainWindow):
     def calculate_gcd(self):
         """计算最大公约数"""
         try:
-            data_str = self.stats_input.text()
-            if not data_str:
+            dataset = self.current_dataset()
+            if dataset is None:
                 QMessageBox.warning(self, "输入错误", "请先输入数据")
                 return
 
-            # 解析输入数据
-            data = [int(x) for x in data_str.split(",")]
-
-            # 使用sympy计算最大公约数
-            gcd_result = data[0]
-            for i in range(1, len(data)):
-                gcd_result = sp.gcd(gcd_result, data[i])
+            gcd_result = engine.statistic("gcd", dataset.values)
 
             # 显示结果
             result = f"GCD: {gcd_result}"
@@ -881,18 +940,12 @@ class CalculatorApp(QMainWindow):
     def calculate_lcm(self):
         """计算最小公倍数"""
         try:
-            data_str = self.stats_input.text()
-            if not data_str:
+            dataset = self.current_dataset()
+            if dataset is None:
                 QMessageBox.warning(self, "输入错误", "请先输入数据")
                 return
 
-            # 解析输入数据
-            data = [int(x) for x in data_str.split(",")]
-
-            # 使用sympy计算最小公倍数
-            lcm_result = data[0]
-            for i in range(1, len(data)):
-                lcm_result = sp.lcm(lcm_result, data[i])
+            lcm_result = engine.statistic("lcm", dataset.values)
 
             # 显示结果
             result = f"LCM: {lcm_result}"
@@ -908,14 +961,12 @@ class CalculatorApp(QMainWindow):
     def calculate_max(self):
         """计算最大值"""
         try:
-            data_str = self.stats_input.text()
-            if not data_str:
+            dataset = self.current_dataset()
+            if dataset is None:
                 QMessageBox.warning(self, "输入错误", "请先输入数据")
                 return
 
-            # 解析输入数据
-            data = [float(x) for x in data_str.split(",")]
-            max_value = max(data)
+            max_value = engine.statistic("max", dataset.values)
 
             # 显示结果
             result = f"Max: {max_value}"
@@ -931,14 +982,12 @@ class CalculatorApp(QMainWindow):
     def calculate_min(self):
         """计算最小值"""
         try:
-            data_str = self.stats_input.text()
-            if not data_str:
+            dataset = self.current_dataset()
+            if dataset is None:
                 QMessageBox.warning(self, "输入错误", "请先输入数据")
                 return
 
-            # 解析输入数据
-            data = [float(x) for x in data_str.split(",")]
-            min_value = min(data)
+            min_value = engine.statistic("min", dataset.values)
 
             # 显示结果
             result = f"Min: {min_value}"
@@ -1033,21 +1082,20 @@ class CalculatorApp(QMainWindow):
         self.expression_input.returnPressed.connect(self.calculate)
         display_splitter.addWidget(self.expression_input)
 
-        # 输入LaTeX显示
-        self.input_latex_view = QWebEngineView()
-        display_splitter.addWidget(self.input_latex_view)
-
-        # 结果LaTeX显示
-        self.result_latex_view = QWebEngineView()
-        display_splitter.addWidget(self.result_latex_view)
+        # LaTeX显示，输入和结果是同一页面中的两个区域
+        if self.renderer == "mathjax":
+            from PySide6.QtWebEngineWidgets import QWebEngineView
+            self.web_view = QWebEngineView()
+            display_splitter.addWidget(self.web_view)
+            self.latex_view = MathJaxView(self.web_view)
+        else:
+            from mathtext_view import MathTextView
+            self.latex_view = MathTextView()
+            display_splitter.addWidget(self.latex_view)
 
-        display_splitter.setSizes([50, 150, 150])
+        display_splitter.setSizes([50, 300])
         self.main_layout.addWidget(display_splitter)
 
-        # 初始化显示为空
-        self.input_latex_view.setHtml("<html><body></body></html>")
-        self.result_latex_view.setHtml("<html><body></body></html>")
-
     def create_tabs(self):
         """创建所有标签页"""
         self.create_basic_tab()
@@ -1061,47 +1109,32 @@ class CalculatorApp(QMainWindow):
         self.create_graph_tab()
 
     def update_input_latex_display(self):
+        """请求更新输入预览（防抖后执行）"""
+        self.input_preview.request(self.build_input_latex)
+
+    def build_input_latex(self):
         """将输入内容直接以latex形式展示，并高亮选中内容"""
         text = self.expression_input.text()
         sel_start = self.expression_input.selectionStart()
         sel_len = len(self.expression_input.selectedText())
 
-        # 处理常用的LaTeX替换，使用改进的方法
-        latex_text = self.convert_to_latex_improved(text)
+        # 如果表达式为空，不显示任何LaTeX内容
+        if not text:
+            return ("clear", "")
 
         if sel_len > 0:
-            # 获取LaTeX形式的选中文本，使用改进的方法
+            # 选中部分前后分别转换，避免用原文位置去切分转换后的LaTeX
+            before = self.convert_to_latex_improved(text[:sel_start])
             selected_latex = self.convert_to_latex_improved(text[sel_start:sel_start+sel_len])
+            after = self.convert_to_latex_improved(text[sel_start+sel_len:])
 
             # 高亮选中内容
-            highlighted = (
-                latex_text[:sel_start] +
-                "<mark>" + selected_latex + "</mark>" +
-                latex_text[sel_start+sel_len:]
-            )
+            highlighted = before + "\\bbox[yellow]{" + selected_latex + "}" + after
         else:
-            highlighted = latex_text
+            # 处理常用的LaTeX替换，使用改进的方法
+            highlighted = self.convert_to_latex_improved(text)
 
-        # 如果表达式为空，不显示任何LaTeX内容
-        if not text:
-            self.input_latex_view.setHtml("<html><body></body></html>")
-            return
-
-        # 展示LaTeX内容
-        latex_html = f"""
-        <html>
-        <head>
-            <script src="https://polyfill.io/v3/polyfill.min.js?features=es6"></script>
-            <script id="MathJax-script" async src="https://cdn.jsdelivr.net/npm/mathjax@3/es5/tex-mml-chtml.js"></script>
-        </head>
-        <body>
-            <div style="font-size: 24px; text-align: center; padding: 20px;">
-                $${highlighted}$$
-            </div>
-        </body>
-        </html>
-        """
-        self.input_latex_view.setHtml(latex_html)
+        return ("latex", highlighted)
 
     def convert_to_latex(self, text):
         """将计算器表达式转换为LaTeX格式"""
@@ -1168,23 +1201,10 @@ class CalculatorApp(QMainWindow):
         """以latex形式展示结果（sympy代码生成）"""
         # 如果结果为空，不显示任何LaTeX内容
         if not latex_str:
-            self.result_latex_view.setHtml("<html><body></body></html>")
+            self.latex_view.clear("result")
             return
 
-        latex_html = f"""
-        <html>
-        <head>
-            <script src="https://polyfill.io/v3/polyfill.min.js?features=es6"></script>
-            <script id="MathJax-script" async src="https://cdn.jsdelivr.net/npm/mathjax@3/es5/tex-mml-chtml.js"></script>
-        </head>
-        <body>
-            <div style="font-size: 24px; text-align: center; padding: 20px; color: green;">
-                $${latex_str}$$
-            </div>
-        </body>
-        </html>
-        """
-        self.result_latex_view.setHtml(latex_html)
+        self.latex_view.set_latex("result", latex_str)
 
     def toggle_angle_mode(self):
         """切换角度制和弧度制"""
@@ -1311,7 +1331,10 @@ class CalculatorApp(QMainWindow):
             ("Median", self.calculate_median),
             ("Mode", self.calculate_mode),
             ("Standard Deviation", self.calculate_std),
-            ("Variance", self.calculate_variance)
+            ("Variance", self.calculate_variance),
+            ("Summary", self.calculate_summary),
+            ("Quantiles", self.calculate_quantiles),
+            ("Top-k", self.calculate_top_k)
         ]
         for idx, (text, handler) in enumerate(stats_buttons):
             btn = QPushButton(text)
@@ -1322,7 +1345,7 @@ class CalculatorApp(QMainWindow):
 
         self.stats_input = QLineEdit()
         self.stats_input.setPlaceholderText("Enter comma-separated numbers")
-        grid_layout.addWidget(self.stats_input, 4, 0, 1, 2)
+        grid_layout.addWidget(self.stats_input, 5, 0, 1, 2)
 
     def create_matrix_tab(self):
         tab = QWidget()
@@ -1333,7 +1356,7 @@ class CalculatorApp(QMainWindow):
         grid_layout.addWidget(label, 0, 0, 1, 2)
 
         self.matrix_input = QLineEdit()
-        self.matrix_input.setPlaceholderText("Enter matrix: [[1,2],[3,4]]")
+        self.matrix_input.setPlaceholderText("Enter matrix: [[1,2],[3,4]], a name (A, Ans) or A @ B")
         grid_layout.addWidget(self.matrix_input, 1, 0, 1, 2)
 
         matrix_buttons = [
@@ -1341,7 +1364,10 @@ class CalculatorApp(QMainWindow):
             ("Matrix Multiplication", self.matrix_multiplication),
             ("Determinant", self.matrix_determinant),
             ("Inverse", self.matrix_inverse),
-            ("Transpose", self.matrix_transpose)
+            ("Transpose", self.matrix_transpose),
+            ("Condition Number", self.matrix_condition),
+            ("RREF", self.matrix_rref),
+            ("Evaluate", self.matrix_evaluate)
         ]
         for idx, (text, handler) in enumerate(matrix_buttons):
             btn = QPushButton(text)
@@ -1391,13 +1417,28 @@ class CalculatorApp(QMainWindow):
 
         # 函数输入框
         self.function_input = QLineEdit()
-        self.function_input.setPlaceholderText("Enter function of x, e.g., sin(x), x^2")
+        self.function_input.setPlaceholderText(
+            "Enter f(x), e.g. sin(x), an implicit curve x^2 + y^2 = 1, a parametric curve (cos(t), sin(t)), "
+            "or f(x, y) for Surface/Contour/Heatmap")
         layout.addWidget(self.function_input)
 
-        # 绘图按钮
+        # 绘图按钮和显示方式（Curve为f(x)的曲线，其余为f(x, y)）
+        plot_layout = QHBoxLayout()
         plot_btn = QPushButton("Plot Function")
         plot_btn.clicked.connect(self.plot_function)
-        layout.addWidget(plot_btn)
+        plot_layout.addWidget(plot_btn)
+        add_curve_btn = QPushButton("Add Curve")
+        add_curve_btn.clicked.connect(self.add_curve)
+        plot_layout.addWidget(add_curve_btn)
+        remove_curve_btn = QPushButton("Remove Curve")
+        remove_curve_btn.clicked.connect(self.remove_curve)
+        plot_layout.addWidget(remove_curve_btn)
+        self.plot_mode = QComboBox()
+        self.plot_mode.addItems(["Curve", "Surface", "Contour", "Heatmap"])
+        # 切换显示方式时复用缓存的网格，不重新计算
+        self.plot_mode.currentIndexChanged.connect(self.on_plot_mode_changed)
+        plot_layout.addWidget(self.plot_mode)
+        layout.addLayout(plot_layout)
 
         # 范围设置
         range_layout = QHBoxLayout()
@@ -1417,12 +1458,40 @@ class CalculatorApp(QMainWindow):
         self.ymax_input = QLineEdit("10")
         range_layout.addWidget(self.ymax_input)
 
+        # 参数曲线的参数范围，可以是 2*pi 这样的表达式
+        range_layout.addWidget(QLabel("t min:"))
+        self.tmin_input = QLineEdit("0")
+        range_layout.addWidget(self.tmin_input)
+
+        range_layout.addWidget(QLabel("t max:"))
+        self.tmax_input = QLineEdit("2*pi")
+        range_layout.addWidget(self.tmax_input)
+
+        # 只改变坐标范围，各曲线只补上缺少的部分
+        apply_range_btn = QPushButton("Apply Range")
+        apply_range_btn.clicked.connect(self.apply_plot_range)
+        range_layout.addWidget(apply_range_btn)
+
         layout.addLayout(range_layout)
 
-        # 显示绘图区域
+        # 图中的曲线，勾选框控制显示和隐藏
+        self.curve_list = QListWidget()
+        self.curve_list.setMaximumHeight(80)
+        self.curve_list.itemChanged.connect(self.on_curve_item_changed)
+        layout.addWidget(self.curve_list)
+
+        # 显示绘图区域（matplotlib在创建绘图页时才导入）
+        from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+        from matplotlib.figure import Figure
+        from plotting import KernelCache, InteractivePlot, SurfacePlot
         self.graph_canvas = FigureCanvas(Figure(figsize=(5, 4), dpi=100))
         layout.addWidget(self.graph_canvas)
 
+        # 拖动平移、滚轮缩放，平移时复用编译好的函数并只重绘曲线
+        self.kernel_cache = KernelCache()
+        self.interactive_plot = InteractivePlot(self.graph_canvas)
+        self.surface_plot = SurfacePlot(self.graph_canvas)
+
     def create_control_buttons(self):
         control_layout = QHBoxLayout()
         self.main_layout.addLayout(control_layout)
@@ -1652,74 +1721,30 @@ class CalculatorApp(QMainWindow):
             self.update_input_latex_display_with_cursor()
 
     def update_input_latex_display_with_cursor(self):
-        """更新输入显示并显示光标位置"""
+        """请求更新带光标的输入预览（防抖后执行）"""
+        self.input_preview.request(self.build_input_latex_with_cursor)
+
+    def build_input_latex_with_cursor(self):
+        """生成输入显示内容并显示光标位置"""
         try:
             text = self.expression_input.text()
             cursor_pos = self.expression_input.cursorPosition()
 
             if not text:
-                self.input_latex_view.setHtml("<html><body></body></html>")
-                return
+                return ("clear", "")
 
-            # 转换为LaTeX格式
-            latex_text = self.convert_to_latex_improved(text)
-
-            # 在光标位置插入一个竖线符号
-            if cursor_pos < len(text):
-                cursor_char = text[cursor_pos]
-                latex_cursor_char = self.convert_to_latex_improved(cursor_char)
-                latex_text_with_cursor = (
-                    self.convert_to_latex_improved(text[:cursor_pos]) +
-                    "\\color{red}|" +  # 插入红色竖线作为光标
-                    self.convert_to_latex_improved(text[cursor_pos:])
-                )
-            else:
-                # 光标在文本末尾
-                latex_text_with_cursor = latex_text + "\\color{red}|"
+            # 在光标位置插入一个红色竖线作为光标
+            latex_text_with_cursor = (
+                self.convert_to_latex_improved(text[:cursor_pos]) +
+                "{\\color{red}|}" +
+                self.convert_to_latex_improved(text[cursor_pos:])
+            )
         except Exception as e:
             # 如果发生任何错误，显示友好的错误提示
             print(f"LaTeX rendering error: {str(e)}")
-            error_html = """
-            <html>
-            <body>
-                <div style="font-size: 16px; text-align: center; padding: 20px; color: #666;">
-                    数学表达式显示正在处理中...
-                </div>
-            </body>
-            </html>
-            """
-            self.input_latex_view.setHtml(error_html)
-            return
+            return ("text", "数学表达式显示正在处理中...")
 
-        try:
-            # 展示LaTeX内容
-            latex_html = f"""
-            <html>
-            <head>
-                <script src="https://polyfill.io/v3/polyfill.min.js?features=es6"></script>
-                <script id="MathJax-script" async src="https://cdn.jsdelivr.net/npm/mathjax@3/es5/tex-mml-chtml.js"></script>
-            </head>
-            <body>
-                <div style="font-size: 24px; text-align: center; padding: 20px;">
-                    $${latex_text_with_cursor}$$
-                </div>
-            </body>
-            </html>
-            """
-            self.input_latex_view.setHtml(latex_html)
-        except Exception as e:
-            # 如果展示LaTeX出错，显示友好的错误提示
-            print(f"LaTeX display error: {str(e)}")
-            error_html = """
-            <html>
-            <body>
-                <div style="font-size: 16px; text-align: center; padding: 20px; color: #666;">
-                    数学表达式显示正在处理中...
-                </div>
-            </body>
-            </html>
-            """
-            self.input_latex_view.setHtml(error_html)
+        return ("latex", latex_text_with_cursor)
 
     def convert_trig_to_radians(self, expression):
         """在角度制模式下将三角函数的参数从角度转换为弧度"""
@@ -1756,26 +1781,11 @@ class CalculatorApp(QMainWindow):
             if expression_to_calculate.endswith('='):
                 expression_to_calculate = expression_to_calculate[:-1]
 
-            # 在角度制模式下处理三角函数
-            if self.angle_mode == "DEG":
-                # 替换三角函数调用，添加角度转弧度的转换
-                if 'sin(' in expression_to_calculate:
-                    expression_to_calculate = expression_to_calculate.replace('sin(', 'sin(pi/180*')
-                if 'cos(' in expression_to_calculate:
-                    expression_to_calculate = expression_to_calculate.replace('cos(', 'cos(pi/180*')
-                if 'tan(' in expression_to_calculate:
-                    expression_to_calculate = expression_to_calculate.replace('tan(', 'tan(pi/180*')
-                # 反三角函数结果需要从弧度转为角度
-                if 'asin(' in expression_to_calculate:
-                    expression_to_calculate = expression_to_calculate.replace('asin(', '(180/pi)*asin(')
-                if 'acos(' in expression_to_calculate:
-                    expression_to_calculate = expression_to_calculate.replace('acos(', '(180/pi)*acos(')
-                if 'atan(' in expression_to_calculate:
-                    expression_to_calculate = expression_to_calculate.replace('atan(', '(180/pi)*atan(')
-
-            expr = parse_expr(expression_to_calculate.replace('×', '*').replace('÷', '/'),
-                              local_dict={'x': self.x, 'y': self.y},
-                              transformations=self.transformations)
+            # 在角度制模式下处理三角函数（角度转弧度，反三角函数结果转为角度）
+            expression_to_calculate = engine.apply_angle_mode(expression_to_calculate, self.angle_mode)
+
+            expr = self.parse_expression(expression_to_calculate.replace('×', '*').replace('÷', '/'),
+                                         {'x': self.x, 'y': self.y})
             result = expr
             latex_result = sp.latex(result)
             self.update_result_latex_display(latex_result)
@@ -1793,14 +1803,16 @@ class CalculatorApp(QMainWindow):
             if not self.current_expression:
                 return
 
-            expr = parse_expr(self.current_expression,
-                              local_dict={'x': self.x, 'y': self.y},
-                              transformations=self.transformations)
-            result = operation(expr)
-            self.current_expression = str(result)
-            self.expression_input.setText(self.current_expression)
-            self.update_input_latex_display()
-            self.update_result_latex_display("")
+            expr = self.parse_expression(self.current_expression,
+                                         {'x': self.x, 'y': self.y})
+
+            def show_result(result):
+                self.current_expression = str(result)
+                self.expression_input.setText(self.current_expression)
+                self.update_input_latex_display()
+                self.update_result_latex_display("")
+
+            self.run_in_background("Operation", show_result, engine.apply_operation, operation, expr)
         except Exception as e:
             QMessageBox.critical(self, "Operation Error", f"Error: {str(e)}")
 
@@ -1811,22 +1823,29 @@ class CalculatorApp(QMainWindow):
                 QMessageBox.warning(self, "Input Error", "Please enter an equation first")
                 return
 
-            expr = parse_expr(self.current_expression,
-                              local_dict={'x': self.x, 'y': self.y},
-                              transformations=self.transformations)
-            solutions = sp.solve(expr, self.x)
-
-            if solutions:
-                if len(solutions) == 1:
-                    self.current_expression = f"x = {solutions[0]}"
+            expr = self.parse_expression(self.current_expression,
+                                         {'x': self.x, 'y': self.y})
+
+            def show_result(index, solutions):
+                # 符号解（下标0）是精确解，数值解是近似解
+                sign, tag = ("=", "Exact") if index == 0 else ("≈", "Approximate")
+                if solutions:
+                    if len(solutions) == 1:
+                        self.current_expression = f"{tag}: x {sign} {solutions[0]}"
+                    else:
+                        self.current_expression = f"{tag} solutions: " + ", ".join([f"x {sign} {s}" for s in solutions])
+                elif index == 0:
+                    self.current_expression = "No solution found"
                 else:
-                    self.current_expression = "Solutions: " + ", ".join([f"x = {s}" for s in solutions])
-            else:
-                self.current_expression = "No solution found"
+                    self.current_expression = "No solution found (numeric search)"
 
-            self.expression_input.setText(self.current_expression)
-            self.update_input_latex_display()
-            self.update_result_latex_display("")
+                self.expression_input.setText(self.current_expression)
+                self.update_input_latex_display()
+                self.update_result_latex_display("")
+
+            # 符号解与数值解同时计算，显示先完成的一个
+            self.run_race("Solve", show_result, [(engine.solve_exact, (expr, self.x)),
+                                                  (numeric_solve.solve, (expr, self.x))])
         except Exception as e:
             QMessageBox.critical(self, "Solve Error", f"Error: {str(e)}")
 
@@ -1837,20 +1856,24 @@ class CalculatorApp(QMainWindow):
                 QMessageBox.warning(self, "Input Error", "Please enter a polynomial first")
                 return
 
-            expr = parse_expr(self.current_expression,
-                              local_dict={'x': self.x, 'y': self.y},
-                              transformations=self.transformations)
-            roots = sp.roots(expr, self.x)
+            expr = self.parse_expression(self.current_expression,
+                                         {'x': self.x, 'y': self.y})
 
-            if roots:
-                root_str = ", ".join([f"{k} (multiplicity {v})" for k, v in roots.items()])
-                self.current_expression = f"Roots: {root_str}"
-            else:
-                self.current_expression = "No roots found or not a polynomial"
+            def show_result(index, roots):
+                tag = "Exact" if index == 0 else "Approximate"
+                if roots:
+                    root_str = ", ".join([f"{k} (multiplicity {v})" for k, v in roots.items()])
+                    self.current_expression = f"{tag} roots: {root_str}"
+                else:
+                    self.current_expression = "No roots found or not a polynomial"
 
-            self.expression_input.setText(self.current_expression)
-            self.update_input_latex_display()
-            self.update_result_latex_display("")
+                self.expression_input.setText(self.current_expression)
+                self.update_input_latex_display()
+                self.update_result_latex_display("")
+
+            # 高次多项式没有根式解时，伴随矩阵求出的数值根胜出
+            self.run_race("Roots", show_result, [(engine.roots, (expr, self.x)),
+                                                  (numeric_solve.roots, (expr, self.x))])
         except Exception as e:
             QMessageBox.critical(self, "Roots Error", f"Error: {str(e)}")
 
@@ -1861,9 +1884,8 @@ class CalculatorApp(QMainWindow):
                 QMessageBox.warning(self, "Input Error", "Please enter an expression first")
                 return
 
-            expr = parse_expr(self.current_expression,
-                              local_dict={'x': self.x, 'y': self.y},
-                              transformations=self.transformations)
+            expr = self.parse_expression(self.current_expression,
+                                         {'x': self.x, 'y': self.y})
             derivative = sp.diff(expr, self.x)
             self.current_expression = f"d/dx {self.current_expression} = {derivative}"
             self.expression_input.setText(self.current_expression)
@@ -1879,14 +1901,37 @@ class CalculatorApp(QMainWindow):
                 QMessageBox.warning(self, "Input Error", "Please enter an expression first")
                 return
 
-            expr = parse_expr(self.current_expression,
-                              local_dict={'x': self.x, 'y': self.y},
-                              transformations=self.transformations)
-            integral = sp.integrate(expr, self.x)
-            self.current_expression = f"∫{self.current_expression}dx = {integral} + C"
-            self.expression_input.setText(self.current_expression)
-            self.update_input_latex_display()
-            self.update_result_latex_display("")
+            # 定积分的输入格式为 "表达式, a, b"（a、b可以是oo、-oo）
+            parts = [part.strip() for part in self.current_expression.rsplit(",", 2)]
+            if len(parts) == 3:
+                expression_text, lower_text, upper_text = parts
+                expr = self.parse_expression(expression_text, {'x': self.x, 'y': self.y})
+                lower, upper = (self.parse_expression(text.replace('∞', 'oo'), {'x': self.x, 'y': self.y})
+                                for text in (lower_text, upper_text))
+                integral_text = f"∫[{lower_text}, {upper_text}] {expression_text} dx"
+
+                def show_definite(index, result):
+                    self.current_expression = self.format_definite_integral(integral_text, index, result)
+                    self.expression_input.setText(self.current_expression)
+                    self.update_input_latex_display()
+                    self.update_result_latex_display("")
+
+                # 符号积分与Gauss–Kronrod数值积分同时计算，显示先完成的一个
+                self.run_race("Integral", show_definite, [(engine.integrate_exact, (expr, self.x, lower, upper)),
+                                                          (engine.nintegrate, (expr, self.x, lower, upper))])
+                return
+
+            expr = self.parse_expression(self.current_expression,
+                                         {'x': self.x, 'y': self.y})
+            expression_text = self.current_expression
+
+            def show_result(integral):
+                self.current_expression = f"∫{expression_text}dx = {integral} + C"
+                self.expression_input.setText(self.current_expression)
+                self.update_input_latex_display()
+                self.update_result_latex_display("")
+
+            self.run_in_background("Integral", show_result, engine.integrate, expr, self.x)
         except Exception as e:
             QMessageBox.critical(self, "Integral Error", f"Error: {str(e)}")
 
@@ -1900,9 +1945,7 @@ class CalculatorApp(QMainWindow):
             # 假设用户输入格式为 "表达式, x->a"
             if "," in self.current_expression:
                 expr_str, limit_str = self.current_expression.split(",", 1)
-                expr = parse_expr(expr_str,
-                                  local_dict={'x': self.x, 'y': self.y},
-                                  transformations=self.transformations)
+                expr = self.parse_expression(expr_str, {'x': self.x, 'y': self.y})
 
                 # 解析极限表达式
                 if "->" in limit_str:
@@ -1910,8 +1953,15 @@ class CalculatorApp(QMainWindow):
                     var = var.strip()
                     point = point.strip()
 
-                    limit = sp.limit(expr, sp.Symbol(var), parse_expr(point))
-                    self.current_expression = f"lim_{{{var}->{point}}} {expr_str} = {limit}"
+                    def show_result(limit):
+                        self.current_expression = f"lim_{{{var}->{point}}} {expr_str} = {limit}"
+                        self.expression_input.setText(self.current_expression)
+                        self.update_input_latex_display()
+                        self.update_result_latex_display("")
+
+                    self.run_in_background("Limit", show_result, engine.limit,
+                                           expr, sp.Symbol(var), parse_expr(point))
+                    return
                 else:
                     self.current_expression = "Invalid limit format. Use: expr, x->a"
             else:
@@ -1933,15 +1983,19 @@ class CalculatorApp(QMainWindow):
             # 假设用户输入格式为 "表达式, x, a, n"
             parts = self.current_expression.split(",")
             if len(parts) >= 3:
-                expr = parse_expr(parts[0].strip(),
-                                  local_dict={'x': self.x, 'y': self.y},
-                                  transformations=self.transformations)
+                expr = self.parse_expression(parts[0].strip(), {'x': self.x, 'y': self.y})
                 var = sp.Symbol(parts[1].strip())
                 a = parse_expr(parts[2].strip())
                 n = 4 if len(parts) < 4 else int(parts[3].strip())
 
-                series = sp.series(expr, var, a, n).removeO()
-                self.current_expression = f"Taylor series of {parts[0].strip()} around {var}={a} (order {n}): {series}"
+                def show_result(series):
+                    self.current_expression = f"Taylor series of {parts[0].strip()} around {var}={a} (order {n}): {series}"
+                    self.expression_input.setText(self.current_expression)
+                    self.update_input_latex_display()
+                    self.update_result_latex_display("")
+
+                self.run_in_background("Taylor Series", show_result, engine.taylor_series, expr, var, a, n)
+                return
             else:
                 self.current_expression = "Enter: expr, x, a, [n] (n defaults to 4)"
 
@@ -1959,58 +2013,165 @@ class CalculatorApp(QMainWindow):
                 QMessageBox.warning(self, "Input Error", "Please enter a function first")
                 return
 
-            # 验证并解析x范围
-            try:
-                x_min = float(self.xmin_input.text())
-                x_max = float(self.xmax_input.text())
-                y_min = float(self.ymin_input.text())
-                y_max = float(self.ymax_input.text())
-            except ValueError:
-                raise ValueError("Range values must be numbers")
-
-            if x_min >= x_max:
-                raise ValueError("x min must be less than x max")
-
-            if y_min >= y_max:
-                raise ValueError("y min must be less than y max")
-
-            # 使用SymPy解析函数
-            expr = parse_expr(func_str,
-                              local_dict={'x': self.x},
-                              transformations=self.transformations)
-
-            # 转换为可计算的lambda函数
-            f = sp.lambdify(self.x, expr, modules=['numpy'])
-
-            # 生成x值
-            x_vals = np.linspace(x_min, x_max, 400)
-            y_vals = f(x_vals)
-
-            # 清除图形并绘制新图
-            fig = self.graph_canvas.figure
-            fig.clear()
-
-            ax = fig.add_subplot(111)
-            ax.plot(x_vals, y_vals)
-            ax.grid(True)
-            ax.set_xlabel('x')
-            ax.set_ylabel('f(x)')
-            ax.set_title(f'Plot of {func_str}')
-            ax.set_xlim(x_min, x_max)
-            ax.set_ylim(y_min, y_max)
-
-            fig.tight_layout()
-            self.graph_canvas.draw()
+            x_min, x_max, y_min, y_max = self.plot_range()
+
+            mode = self.plot_mode.currentText()
+            if mode != "Curve":
+                # 使用SymPy解析函数
+                expr = self.parse_expression(func_str, {'x': self.x, 'y': self.y})
+                # f(x, y)：x、y范围内的网格一次性计算并缓存，切换显示方式时不重新计算
+                variables = (self.x, self.y)
+                f = self.kernel_cache.get(expr, variables)
+                self.interactive_plot.release()
+                self.curve_list.clear()
+                self.surface_plot.plot((expr, variables), f, mode.lower(), (x_min, x_max), (y_min, y_max),
+                                       title=f'{mode} of {func_str}')
+                return
+
+            # 自适应采样并绘图，之后可拖动平移、滚轮缩放
+            curve = self.make_curve(func_str)
+            self.interactive_plot.plot(curve, x_min, x_max, y_min, y_max, title=f'Plot of {func_str}', label=func_str)
+            self.curve_list.clear()
+            self.add_curve_item(func_str)
+
+        except Exception as e:
+            self.interactive_plot.show_message(f"Error: {str(e)}")
+            self.curve_list.clear()
+            QMessageBox.critical(self, "Plot Error", f"Error: {str(e)}")
+
+    def plot_range(self):
+        """读取并检查绘图范围，返回 (x_min, x_max, y_min, y_max)"""
+        try:
+            x_min = float(self.xmin_input.text())
+            x_max = float(self.xmax_input.text())
+            y_min = float(self.ymin_input.text())
+            y_max = float(self.ymax_input.text())
+        except ValueError:
+            raise ValueError("Range values must be numbers")
+
+        if x_min >= x_max:
+            raise ValueError("x min must be less than x max")
+
+        if y_min >= y_max:
+            raise ValueError("y min must be less than y max")
+        return x_min, x_max, y_min, y_max
+
+    def make_curve(self, func_str):
+        """按输入创建曲线：f(x)、隐函数曲线 lhs = rhs 或参数曲线 (x(t), y(t))"""
+        from plotting import Curve, ParametricCurve, ImplicitCurve
+        variables = {'x': self.x, 'y': self.y}
+        text = func_str.strip()
+
+        if text.count("=") == 1:
+            # 隐函数 lhs = rhs，画 lhs - rhs 的零点
+            lhs, rhs = text.split("=")
+            expr = self.parse_expression(lhs, variables) - self.parse_expression(rhs, variables)
+            if not expr.free_symbols <= {self.x, self.y}:
+                raise ValueError("An implicit curve can only use x and y")
+            return ImplicitCurve(self.kernel_cache.get(expr, (self.x, self.y)), func_str)
+
+        components = self.parametric_components(text)
+        if components is not None:
+            x_expr, y_expr = (self.parse_expression(part, {'t': self.t}) for part in components)
+            if not (x_expr.free_symbols | y_expr.free_symbols) <= {self.t}:
+                raise ValueError("A parametric curve can only use t")
+            t_min, t_max = self.parameter_range()
+            return ParametricCurve(self.kernel_cache.get(x_expr, self.t), self.kernel_cache.get(y_expr, self.t),
+                                   t_min, t_max, func_str)
+
+        expr = self.parse_expression(func_str, variables)
+        if self.y in expr.free_symbols:
+            raise ValueError("f(x, y) needs Surface, Contour or Heatmap mode, or an equation such as f(x, y) = 0")
+        # 转换为可计算的lambda函数，同一表达式只编译一次
+        return Curve(self.kernel_cache.get(expr, self.x), func_str)
+
+    @staticmethod
+    def parametric_components(text):
+        """(x(t), y(t)) 形式时返回两个分量的文本，否则返回None"""
+        if not (text.startswith("(") and text.endswith(")")):
+            return None
+        parts, depth, start = [], 0, 1
+        for i, char in enumerate(text[1:-1], start=1):
+            if char in "([{":
+                depth += 1
+            elif char in ")]}":
+                depth -= 1
+                if depth < 0:
+                    # 如 (x + 1)*(x - 1)，外层括号不是一对
+                    return None
+            elif char == "," and depth == 0:
+                parts.append(text[start:i])
+                start = i + 1
+        parts.append(text[start:-1])
+        return parts if len(parts) == 2 else None
+
+    def parameter_range(self):
+        """读取并检查参数曲线的t范围"""
+        try:
+            t_min = float(self.parse_expression(self.tmin_input.text(), {}).evalf())
+            t_max = float(self.parse_expression(self.tmax_input.text(), {}).evalf())
+        except (TypeError, ValueError, SyntaxError):
+            raise ValueError("t range values must be numbers")
+        if t_min >= t_max:
+            raise ValueError("t min must be less than t max")
+        return t_min, t_max
+
+    def add_curve(self):
+        """在当前图中添加一条曲线，只对新曲线采样"""
+        try:
+            func_str = self.function_input.text()
+            if not func_str:
+                QMessageBox.warning(self, "Input Error", "Please enter a function first")
+                return
 
+            curve = self.make_curve(func_str)
+            if self.interactive_plot.ax is None:
+                self.curve_list.clear()
+                self.interactive_plot.setup_axes(*self.plot_range(), title="Curves")
+            if func_str not in self.interactive_plot.curves:
+                self.add_curve_item(func_str)
+            self.interactive_plot.add_curve(func_str, curve)
         except Exception as e:
-            fig = self.graph_canvas.figure
-            fig.clear()
-            ax = fig.add_subplot(111)
-            ax.text(0.5, 0.5, f"Error: {str(e)}", ha='center', va='center', transform=ax.transAxes)
-            fig.tight_layout()
-            self.graph_canvas.draw()
             QMessageBox.critical(self, "Plot Error", f"Error: {str(e)}")
 
+    def add_curve_item(self, key):
+        """在曲线列表中添加一个可勾选的项"""
+        item = QListWidgetItem(key)
+        item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+        item.setCheckState(Qt.Checked)
+        self.curve_list.blockSignals(True)
+        self.curve_list.addItem(item)
+        self.curve_list.blockSignals(False)
+
+    def remove_curve(self):
+        """删除曲线列表中选中的曲线，其他曲线不需要重新采样"""
+        item = self.curve_list.currentItem()
+        if item is None:
+            QMessageBox.warning(self, "Input Error", "Please select a curve first")
+            return
+        self.interactive_plot.remove_curve(item.text())
+        self.curve_list.takeItem(self.curve_list.row(item))
+
+    def on_curve_item_changed(self, item):
+        """勾选框切换曲线的显示和隐藏"""
+        if item.text() in self.interactive_plot.curves:
+            self.interactive_plot.set_visible(item.text(), item.checkState() == Qt.Checked)
+
+    def apply_plot_range(self):
+        """只改变坐标范围，平移时各曲线只对新露出的部分采样"""
+        try:
+            if self.interactive_plot.ax is None:
+                self.plot_function()
+                return
+            self.interactive_plot.set_view(*self.plot_range())
+        except Exception as e:
+            QMessageBox.critical(self, "Plot Error", f"Error: {str(e)}")
+
+    def on_plot_mode_changed(self):
+        """切换显示方式后重新绘制当前函数"""
+        if self.function_input.text():
+            self.plot_function()
+
     def show_graph_tab(self):
         """显示绘图标签页"""
         for i in range(self.tab_widget.count()):
@@ -2109,8 +2270,10 @@ class CalculatorApp(QMainWindow):
             "Kalculate User Guide:\n\n"
             "1. Basic Calculations: Use the Basic tab for arithmetic operations\n"
             "2. Algebra: Solve equations, factor, expand expressions\n"
-            "3. Calculus: Compute derivatives, integrals, limits, and Taylor series\n"
-            "4. Graphing: Enter a function of x in the Graph tab to plot it"
+            "3. Calculus: Compute derivatives, integrals, limits, and Taylor series; "
+            "enter f(x), a, b for a definite integral (exact if possible, otherwise numeric with an error estimate)\n"
+            "4. Graphing: Enter f(x) in the Graph tab to plot it, an equation such as x^2 + y^2 = 1 "
+            "for an implicit curve, (x(t), y(t)) for a parametric curve, or f(x, y) with Surface/Contour/Heatmap mode"
             "5. History: Double-click any history item to reuse it"
             "6. Use the input box at the top to edit expressions directly"
         )
@@ -2118,14 +2281,12 @@ class CalculatorApp(QMainWindow):
     def calculate_mean(self):
         """计算平均值"""
         try:
-            data_str = self.stats_input.text()
-            if not data_str:
+            dataset = self.current_dataset()
+            if dataset is None:
                 QMessageBox.warning(self, "Input Error", "Please enter data first")
                 return
 
-            # 解析输入数据
-            data = [float(x) for x in data_str.split(",")]
-            mean_value = np.mean(data)
+            mean_value = dataset.summary().mean
 
             # 显示结果
             self.current_expression = f"Mean: {mean_value}"
@@ -2138,14 +2299,12 @@ class CalculatorApp(QMainWindow):
     def calculate_median(self):
         """计算中位数"""
         try:
-            data_str = self.stats_input.text()
-            if not data_str:
+            dataset = self.current_dataset()
+            if dataset is None:
                 QMessageBox.warning(self, "Input Error", "Please enter data first")
                 return
 
-            # 解析输入数据
-            data = [float(x) for x in data_str.split(",")]
-            median_value = np.median(data)
+            (median_value,), _ = self.dataset_quantiles(dataset, [0.5])
 
             # 显示结果
             self.current_expression = f"Median: {median_value}"
@@ -2158,18 +2317,12 @@ class CalculatorApp(QMainWindow):
     def calculate_mode(self):
         """计算众数"""
         try:
-            data_str = self.stats_input.text()
-            if not data_str:
+            dataset = self.current_dataset()
+            if dataset is None:
                 QMessageBox.warning(self, "Input Error", "Please enter data first")
                 return
 
-            # 解析输入数据
-            data = [float(x) for x in data_str.split(",")]
-
-            # 使用NumPy计算众数
-            unique_values, counts = np.unique(data, return_counts=True)
-            mode_indices = np.argwhere(counts == np.max(counts)).flatten()
-            mode_values = unique_values[mode_indices]
+            mode_values = self.dataset_frequencies(dataset).mode()
 
             # 显示结果
             if len(mode_values) == 1:
@@ -2187,14 +2340,12 @@ class CalculatorApp(QMainWindow):
     def calculate_std(self):
         """计算标准差"""
         try:
-            data_str = self.stats_input.text()
-            if not data_str:
+            dataset = self.current_dataset()
+            if dataset is None:
                 QMessageBox.warning(self, "Input Error", "Please enter data first")
                 return
 
-            # 解析输入数据
-            data = [float(x) for x in data_str.split(",")]
-            std_value = np.std(data)
+            std_value = dataset.summary().std
 
             # 显示结果
             self.current_expression = f"Standard Deviation: {std_value}"
@@ -2207,14 +2358,12 @@ class CalculatorApp(QMainWindow):
     def calculate_variance(self):
         """计算方差"""
         try:
-            data_str = self.stats_input.text()
-            if not data_str:
+            dataset = self.current_dataset()
+            if dataset is None:
                 QMessageBox.warning(self, "Input Error", "Please enter data first")
                 return
 
-            # 解析输入数据
-            data = [float(x) for x in data_str.split(",")]
-            variance_value = np.var(data)
+            variance_value = dataset.summary().variance
 
             # 显示结果
             self.current_expression = f"Variance: {variance_value}"
@@ -2224,115 +2373,194 @@ class CalculatorApp(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "Variance Error", f"Error: {str(e)}")
 
-    def matrix_addition(self):
-        """矩阵加法"""
+    def setup_matrix_workspace(self):
+        """矩阵工作区和File > Matrix菜单"""
+        self._matrices = None
+        if hasattr(self.ui, "menuFile"):
+            matrix_menu = self.ui.menuFile.addMenu("Matrix")
+            matrix_menu.addAction("Load...", self.load_matrix)
+            matrix_menu.addAction("Save...", self.save_matrix)
+            matrix_menu.addAction("Evaluate", self.matrix_evaluate)
+            matrix_menu.addAction("RREF", self.matrix_rref)
+            matrix_menu.addAction("Workspace", self.show_matrix_workspace)
+
+            # 精确模式：按钮操作的矩阵先转换为整数/有理数矩阵（exact(...)），行列式、逆矩阵都是精确结果
+            exact_action = matrix_menu.addAction("Exact Mode")
+            exact_action.setCheckable(True)
+            exact_action.setChecked(self.settings.value("matrix/exact", False, type=bool))
+            exact_action.toggled.connect(lambda checked: self.settings.setValue("matrix/exact", checked))
+
+    @property
+    def matrices(self):
+        """矩阵工作区，第一次使用时才导入（matrix_workspace会导入SciPy），不影响启动时间"""
+        if self._matrices is None:
+            from matrix_workspace import MatrixWorkspace
+            self._matrices = MatrixWorkspace()
+        return self._matrices
+
+    def matrix_operands(self, count):
+        """从输入框读取矩阵表达式（多个用';'分隔），只需要一个且输入为空时使用上一个结果Ans"""
+        text = self.current_expression.strip()
+        if not text and count == 1:
+            from matrix_workspace import ANSWER
+            return [ANSWER]
+        operands = [item.strip() for item in text.split(";")]
+        if len(operands) != count or not all(operands):
+            raise ValueError("Enter two matrices separated by ';'" if count == 2 else "Please enter a matrix")
+        if self.exact_matrix_mode():
+            operands = [f"exact({operand})" for operand in operands]
+        return operands
+
+    def exact_matrix_mode(self):
+        return self.settings.value("matrix/exact", False, type=bool)
+
+    def run_matrix(self, expression):
+        """在后台线程中计算矩阵表达式（numpy/SciPy计算时释放GIL，界面不会卡住），可以取消"""
+        request_id = self.evaluator.submit_thread(self.matrices.compute, expression, title=f"Matrix: {expression}")
+        self.pending_job = (request_id, "Matrix", lambda result: self.show_matrix_result(expression, *result), None, None)
+
+    def show_matrix_result(self, expression, name, value):
+        """保存矩阵计算结果为Ans，输入框中只显示结果的名字"""
+        import matrix_workspace
+        self.matrices.store(name, value)
+        summary = f"{name}: {matrix_workspace.describe(value)}"
+        self.add_to_history(f"{expression} → {summary}")
+        self.statusBar().showMessage(summary)
+        self.current_expression = name
+        self.expression_input.setText(name)
+        self.update_input_latex_display()
+        self.latex_view.set_text("result", summary)
+
+    def matrix_evaluate(self):
+        """计算矩阵表达式，如 C = A @ inv(B)"""
         try:
-            if not self.current_expression:
-                QMessageBox.warning(self, "Input Error", "Please enter matrices")
+            if not self.current_expression.strip():
+                QMessageBox.warning(self, "Input Error", "Please enter a matrix expression")
                 return
+            self.run_matrix(self.current_expression)
+        except Exception as e:
+            QMessageBox.critical(self, "Matrix Error", f"Error: {str(e)}")
 
-            # 解析输入的矩阵
-            matrices = self.current_expression.split(";")
-            if len(matrices) != 2:
-                QMessageBox.warning(self, "Input Error", "Enter two matrices separated by ';'")
+    def load_matrix(self):
+        """从.npy（内存映射）或.csv文件载入矩阵到工作区"""
+        import matrix_workspace
+        file_path, _ = QFileDialog.getOpenFileName(
+            self, "Load Matrix", "", "Matrix Files (*.npy *.npz *.mtx *.csv *.tsv *.txt);;All Files (*)"
+        )
+        if not file_path:
+            return
+        try:
+            default_name = os.path.splitext(os.path.basename(file_path))[0]
+            name, ok = QInputDialog.getText(self, "Load Matrix", "Name:", text=default_name)
+            if not ok:
                 return
+            name = self.matrices.load(file_path, name.strip() or None)
+            summary = f"{name}: {matrix_workspace.describe(self.matrices.get(name))}"
+            self.add_to_history(f"load {os.path.basename(file_path)} → {summary}")
+            self.statusBar().showMessage(summary)
+        except Exception as e:
+            QMessageBox.critical(self, "Load Matrix Error", f"Error: {str(e)}")
+
+    def save_matrix(self):
+        """把工作区中的矩阵保存为.npy/.csv文件（稀疏矩阵为.npz/.mtx）"""
+        import sparse_support
+        names = self.matrices.names()
+        if not names:
+            QMessageBox.warning(self, "Save Matrix", "The matrix workspace is empty")
+            return
+        name, ok = QInputDialog.getItem(self, "Save Matrix", "Matrix:", names, 0, False)
+        if not ok:
+            return
+        extension = ".npz" if sparse_support.is_sparse(self.matrices.get(name)) else ".npy"
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "Save Matrix", name + extension,
+            "NumPy Files (*.npy);;CSV Files (*.csv);;Sparse Matrix Files (*.npz *.mtx)"
+        )
+        if not file_path:
+            return
+        try:
+            self.matrices.save(name, file_path)
+            self.statusBar().showMessage(f"{name} → {file_path}")
+        except Exception as e:
+            QMessageBox.critical(self, "Save Matrix Error", f"Error: {str(e)}")
 
-            mat1 = np.array(eval(matrices[0]))
-            mat2 = np.array(eval(matrices[1]))
-            result = mat1 + mat2
+    def show_matrix_workspace(self):
+        """列出工作区中的矩阵"""
+        import matrix_workspace
+        lines = [f"{name}: {matrix_workspace.describe(self.matrices.get(name))}" for name in self.matrices.names()]
+        QMessageBox.information(self, "Matrix Workspace", "\n".join(lines) or "The matrix workspace is empty")
 
-            # 显示结果
-            self.current_expression = f"{mat1} + {mat2} = {result}"
-            self.expression_input.setText(self.current_expression)
-            self.update_input_latex_display()
-            self.update_result_latex_display("")
+    def matrix_addition(self):
+        """矩阵加法"""
+        try:
+            first, second = self.matrix_operands(2)
+            self.run_matrix(f"({first}) + ({second})")
         except Exception as e:
             QMessageBox.critical(self, "Matrix Addition Error", f"Error: {str(e)}")
 
     def matrix_multiplication(self):
         """矩阵乘法"""
         try:
-            if not self.current_expression:
-                QMessageBox.warning(self, "Input Error", "Please enter matrices")
-                return
-
-            # 解析输入的矩阵
-            matrices = self.current_expression.split(";")
-            if len(matrices) != 2:
-                QMessageBox.warning(self, "Input Error", "Enter two matrices separated by ';'")
-                return
-
-            mat1 = np.array(eval(matrices[0]))
-            mat2 = np.array(eval(matrices[1]))
-            result = mat1 @ mat2  # 矩阵乘法
-
-            # 显示结果
-            self.current_expression = f"{mat1} * {mat2} = {result}"
-            self.expression_input.setText(self.current_expression)
-            self.update_input_latex_display()
-            self.update_result_latex_display("")
+            first, second = self.matrix_operands(2)
+            self.run_matrix(f"({first}) @ ({second})")
         except Exception as e:
             QMessageBox.critical(self, "Matrix Multiplication Error", f"Error: {str(e)}")
 
     def matrix_determinant(self):
         """计算矩阵行列式"""
         try:
-            if not self.current_expression:
-                QMessageBox.warning(self, "Input Error", "Please enter a matrix")
-                return
-
-            # 解析输入的矩阵
-            matrix = np.array(eval(self.current_expression))
-            det = np.linalg.det(matrix)
-
-            # 显示结果
-            self.current_expression = f"det({matrix}) = {det}"
-            self.expression_input.setText(self.current_expression)
-            self.update_input_latex_display()
-            self.update_result_latex_display("")
+            # 以 (符号, log|det|) 的形式显示，大矩阵的行列式不会溢出；精确模式下给出精确值
+            operand, = self.matrix_operands(1)
+            self.run_matrix(f"det({operand})" if self.exact_matrix_mode() else f"slogdet({operand})")
         except Exception as e:
             QMessageBox.critical(self, "Determinant Error", f"Error: {str(e)}")
 
     def matrix_inverse(self):
-        """计算矩阵逆"""
+        """计算矩阵逆，稀疏矩阵改为求解 Ax=b"""
+        import sparse_support
         try:
-            if not self.current_expression:
-                QMessageBox.warning(self, "Input Error", "Please enter a matrix")
-                return
+            operand, = self.matrix_operands(1)
+            # 计算在后台进行，已知是逆矩阵过大的稀疏矩阵时直接改为求解 Ax=b
+            value = self.matrices.get(operand) if operand in self.matrices else None
+            if sparse_support.is_sparse(value) and not sparse_support.dense_inverse_allowed(value):
+                raise sparse_support.DenseInverseRefused()
+            self.run_matrix(f"inv({operand})")
+        except sparse_support.DenseInverseRefused as e:
+            rhs, ok = QInputDialog.getText(self, "Solve Ax=b", f"{str(e)}\n\nb =", text="b")
+            if ok and rhs.strip():
+                try:
+                    self.run_matrix(f"solve({operand}, {rhs.strip()})")
+                except Exception as e:
+                    QMessageBox.critical(self, "Solve Error", f"Error: {str(e)}")
+        except Exception as e:
+            QMessageBox.critical(self, "Inverse Error", f"Error: {str(e)}")
 
-            # 解析输入的矩阵
-            matrix = np.array(eval(self.current_expression))
-            inv = np.linalg.inv(matrix)
+    def matrix_condition(self):
+        """计算矩阵的条件数（与行列式、逆矩阵共用同一个分解）"""
+        try:
+            operand, = self.matrix_operands(1)
+            self.run_matrix(f"cond({operand})")
+        except Exception as e:
+            QMessageBox.critical(self, "Condition Number Error", f"Error: {str(e)}")
 
-            # 显示结果
-            self.current_expression = f"inv({matrix}) = {inv}"
-            self.expression_input.setText(self.current_expression)
-            self.update_input_latex_display()
-            self.update_result_latex_display("")
+    def matrix_rref(self):
+        """行最简形（总是精确计算）"""
+        try:
+            operand, = self.matrix_operands(1)
+            self.run_matrix(f"rref({operand})")
         except Exception as e:
-            QMessageBox.critical(self, "Inverse Error", f"Error: {str(e)}")
+            QMessageBox.critical(self, "RREF Error", f"Error: {str(e)}")
 
     def matrix_transpose(self):
         """计算矩阵转置"""
         try:
-            if not self.current_expression:
-                QMessageBox.warning(self, "Input Error", "Please enter a matrix")
-                return
-
-            # 解析输入的矩阵
-            matrix = np.array(eval(self.current_expression))
-            trans = matrix.T
-
-            # 显示结果
-            self.current_expression = f"trans({matrix}) = {trans}"
-            self.expression_input.setText(self.current_expression)
-            self.update_input_latex_display()
-            self.update_result_latex_display("")
+            operand, = self.matrix_operands(1)
+            self.run_matrix(f"({operand}).T")
         except Exception as e:
             QMessageBox.critical(self, "Transpose Error", f"Error: {str(e)}")
 
-
 if __name__ == "__main__":
+    renderer = choose_renderer(sys.argv)
     app = QApplication(sys.argv)
-    calculator = CalculatorApp()
+    calculator = CalculatorApp(renderer)
     sys.exit(app.exec())
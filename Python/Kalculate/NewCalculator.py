@@ -1,5 +1,4 @@
 import sys
-import numpy as np
 import sympy as sp
 from sympy.parsing.sympy_parser import parse_expr, standard_transformations, implicit_multiplication_application
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
@@ -7,33 +6,36 @@ from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                               QListWidget, QMenuBar, QMenu, QGridLayout,
                               QLineEdit, QMessageBox, QFileDialog, QSplitter,
                               QSizePolicy, QInputDialog)
-from PySide6.QtCore import Qt, Signal, Slot, QFile
-from PySide6.QtWebEngineWidgets import QWebEngineView
+from PySide6.QtCore import Qt, Signal, Slot
 from PySide6.QtGui import QIcon
-from PySide6.QtUiTools import QUiLoader
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-import matplotlib
-matplotlib.use('Qt5Agg')
 
-class CalculatorApp(QMainWindow):
+import engine
+import fastpath
+import numeric_solve
+from parse_cache import ParseCache
+from latex_view import choose_renderer, create_latex_view, effective_renderer
+from calculator_mixin import CalculatorMixin
+from ui_loader import load_ui
+
+class CalculatorApp(CalculatorMixin, QMainWindow):
     """基于qtUI.ui的科学计算器应用"""
 
-    def __init__(self):
+    def __init__(self, renderer=None):
         super().__init__()
 
-        # 加载UI文件
-        loader = QUiLoader()
-        qtui = QFile(".\\Python/Kalculate/qtUI.ui")
-        qtui.open(QFile.ReadOnly)
-        self.ui = loader.load(qtui)
-        self.setCentralWidget(self.ui)
+        # 公式渲染方式，需要在加载UI文件之前确定
+        self.renderer = effective_renderer(renderer or choose_renderer(sys.argv))
+
+        # 加载界面（优先使用预生成的ui_qtUI.py）
+        self.ui = load_ui(self)
 
         # 初始化符号变量
         self.x, self.y, self.z = sp.symbols('x y z')
         self.current_expression = ""
         self.history = []
+        self.dataset = None
         self.transformations = standard_transformations + (implicit_multiplication_application,)
+        self.parse_cache = ParseCache(maxsize=256)
 
         # 角度制设置，默认为弧度制
         self.angle_mode = "RAD" 
@@ -52,6 +54,9 @@ class CalculatorApp(QMainWindow):
         # 连接UI元素和信号
         self.setup_ui_connections()
 
+        # 后台计算引擎
+        self.setup_evaluator()
+
         # 显示主窗口
         self.show()
 
@@ -66,7 +71,6 @@ class CalculatorApp(QMainWindow):
         self.stats_input = self.ui.lineEdit_num
 
         # LaTeX显示视图初始化
-        self.web_view = self.ui.webEngineView
         self.init_latex_display()
 
         # 连接所有标签页的切换信号
@@ -75,22 +79,36 @@ class CalculatorApp(QMainWindow):
         # 连接所有按钮
         self.connect_all_buttons()
 
+        # 统计菜单：数据导入（File > CSV File > Import）、汇总统计、百分位数、出现次数最多的数值和数值表
+        if hasattr(self.ui, "actionImport"):
+            self.ui.actionImport.triggered.connect(self.import_dataset)
+        if hasattr(self.ui, "actionStatistics"):
+            self.ui.actionStatistics.triggered.connect(self.calculate_summary)
+        if hasattr(self.ui, "menuFile"):
+            self.ui.menuFile.addAction("Quantiles", self.calculate_quantiles)
+            self.ui.menuFile.addAction("Top Values", self.calculate_top_k)
+            self.ui.menuFile.addAction("Table...", self.show_table)
+
+    def setup_evaluator(self):
+        """初始化后台计算引擎，Options菜单中增加计算精度的设置"""
+        super().setup_evaluator()
+        if hasattr(self.ui, "menuOptions"):
+            self.ui.menuOptions.addAction("计算精度...", self.set_calculation_digits)
+
+    def calculation_digits(self):
+        """数值计算的有效数字位数（默认15位，超过15位时快速路径使用mpmath）"""
+        return self.settings.value("calculator/digits", fastpath.FLOAT_DIGITS, type=int)
+
+    def set_calculation_digits(self):
+        """设置数值计算的有效数字位数"""
+        digits, ok = QInputDialog.getInt(self, "计算精度", "有效数字位数:", self.calculation_digits(), 1, 1000)
+        if ok:
+            self.settings.setValue("calculator/digits", digits)
+
     def init_latex_display(self):
-        """初始化LaTeX显示"""
-        empty_html = """
-        <html>
-        <head>
-            <script src="https://polyfill.io/v3/polyfill.min.js?features=es6"></script>
-            <script id="MathJax-script" async src="https://cdn.jsdelivr.net/npm/mathjax@3/es5/tex-mml-chtml.js"></script>
-        </head>
-        <body>
-            <div style="font-size: 24px; text-align: center; padding: 20px;">
-                <p>输入表达式进行计算</p>
-            </div>
-        </body>
-        </html>
-        """
-        self.web_view.setHtml(empty_html)
+        """初始化LaTeX显示，页面和MathJax只加载这一次"""
+        self.latex_view = create_latex_view(self.ui.webEngineView, self.renderer, slots=("result",))
+        self.latex_view.set_text("result", "输入表达式进行计算")
 
     def connect_all_buttons(self):
         """连接所有按钮"""
@@ -190,6 +208,12 @@ class CalculatorApp(QMainWindow):
                 self.calculate_std()
             elif text == 'σ²':  # 方差
                 self.calculate_variance()
+            elif text == 'Summary':  # 汇总统计
+                self.calculate_summary()
+            elif text == 'Quantiles':  # 百分位数
+                self.calculate_quantiles()
+            elif text == 'Top-k':  # 出现次数最多的数值
+                self.calculate_top_k()
             elif text == 'gcd':  # 最大公约数
                 self.calculate_gcd()
             elif text == 'lcm':  # 最小公倍数
@@ -517,43 +541,39 @@ class CalculatorApp(QMainWindow):
             # 替换显示符号为sympy可识别的符号
             expression = expression.replace('×', '*').replace('÷', '/')
 
-            # 在角度制模式下处理三角函数
-            if self.angle_mode == "DEG":
-                # 替换三角函数调用，添加角度转弧度的转换
-                if 'sin(' in expression:
-                    expression = expression.replace('sin(', 'sin(pi/180*')
-                if 'cos(' in expression:
-                    expression = expression.replace('cos(', 'cos(pi/180*')
-                if 'tan(' in expression:
-                    expression = expression.replace('tan(', 'tan(pi/180*')
-                # 反三角函数结果需要从弧度转为角度
-                if 'asin(' in expression:
-                    expression = expression.replace('asin(', '(180/pi)*asin(')
-                if 'acos(' in expression:
-                    expression = expression.replace('acos(', '(180/pi)*acos(')
-                if 'atan(' in expression:
-                    expression = expression.replace('atan(', '(180/pi)*atan(')
-
-            # 解析并计算表达式
-            expr = parse_expr(expression, 
-                             local_dict={'x': self.x, 'y': self.y, 'z': self.z, 'pi': sp.pi, 'E': sp.E, 'I': sp.I},
-                             transformations=self.transformations)
-
-            # 使用sympy进行计算
-            result = expr.evalf()
-
-            # 保存结果，以便后续使用
-            self.last_answer = result
-
-            # 转换为LaTeX格式显示
-            latex_result = sp.latex(result)
-            self.update_result_latex_display(latex_result)
+            # 在角度制模式下处理三角函数（角度转弧度，反三角函数结果转为角度）
+            expression = engine.apply_angle_mode(expression, self.angle_mode)
+            expression_text = self.current_expression
+            digits = self.calculation_digits()
 
-            # 添加到历史记录
-            history_item = f"{self.current_expression} = {result}"
-            self.add_to_history(history_item)
+            def show_result(result):
+                # 保存结果，以便后续使用
+                self.last_answer = result
+
+                # 转换为LaTeX格式显示
+                latex_result = sp.latex(result)
+                self.update_result_latex_display(latex_result)
 
-            return result
+                # 添加到历史记录
+                history_item = f"{expression_text} = {result}"
+                self.add_to_history(history_item)
+
+            # 纯数值表达式直接在界面线程中计算，不经过SymPy解析和后台进程
+            try:
+                result = fastpath.evaluate(expression, digits)
+            except fastpath.NotNumeric:
+                pass
+            else:
+                self.evaluator.cancel()
+                self.pending_job = None
+                self.statusBar().showMessage("完成: 计算")
+                show_result(result)
+                return
+
+            # 含有符号或需要精确计算的表达式由SymPy在后台进程中计算
+            expr = self.parse_expression(expression,
+                                         {'x': self.x, 'y': self.y, 'z': self.z, 'pi': sp.pi, 'E': sp.E, 'I': sp.I})
+            self.run_in_background("计算", show_result, engine.evaluate, expr, "RAD", digits)
         except Exception as e:
             error_msg = str(e)
             self.update_result_latex_display(f"\text{{Error: {error_msg}}}")
@@ -562,20 +582,7 @@ class CalculatorApp(QMainWindow):
 
     def update_result_latex_display(self, latex_str):
         """以LaTeX格式显示结果"""
-        latex_html = f"""
-        <html>
-        <head>
-            <script src="https://polyfill.io/v3/polyfill.min.js?features=es6"></script>
-            <script id="MathJax-script" async src="https://cdn.jsdelivr.net/npm/mathjax@3/es5/tex-mml-chtml.js"></script>
-        </head>
-        <body>
-            <div style="font-size: 24px; text-align: center; padding: 20px; color: green;">
-                $${latex_str}$$
-            </div>
-        </body>
-        </html>
-        """
-        self.web_view.setHtml(latex_html)
+        self.latex_view.set_latex("result", latex_str)
 
     def on_expression_changed(self, text):
         """处理表达式输入变化"""
@@ -653,9 +660,8 @@ class CalculatorApp(QMainWindow):
                 QMessageBox.warning(self, "输入错误", "请先输入表达式")
                 return
 
-            expr = parse_expr(self.current_expression, 
-                             local_dict={'x': self.x, 'y': self.y, 'z': self.z},
-                             transformations=self.transformations)
+            expr = self.parse_expression(self.current_expression,
+                                         {'x': self.x, 'y': self.y, 'z': self.z})
             derivative = sp.diff(expr, self.x)
 
             result = f"d/dx {self.current_expression} = {derivative}"
@@ -685,9 +691,8 @@ class CalculatorApp(QMainWindow):
                     var_name = 'x'
 
                 var = sp.Symbol(var_name)
-                expr = parse_expr(self.current_expression, 
-                                 local_dict={'x': self.x, 'y': self.y, 'z': self.z},
-                                 transformations=self.transformations)
+                expr = self.parse_expression(self.current_expression,
+                                             {'x': self.x, 'y': self.y, 'z': self.z})
                 derivative = sp.diff(expr, var)
 
                 result = f"∂({self.current_expression})/∂{var_name} = {derivative}"
@@ -710,21 +715,49 @@ class CalculatorApp(QMainWindow):
                 QMessageBox.warning(self, "输入错误", "请先输入表达式")
                 return
 
-            expr = parse_expr(self.current_expression, 
-                             local_dict={'x': self.x, 'y': self.y, 'z': self.z},
-                             transformations=self.transformations)
-            integral = sp.integrate(expr, self.x)
+            # 积分限留空时计算不定积分
+            limits_text, ok = QInputDialog.getText(self, "积分", "积分限 a, b? (留空为不定积分)")
+            if not ok:
+                return
+            limits = engine.split_limits(limits_text)
 
-            result = f"∫{self.current_expression} dx = {integral} + C"
-            self.expression_input.setText(result)
-            self.current_expression = result
+            local_dict = {'x': self.x, 'y': self.y, 'z': self.z}
+            expr = self.parse_expression(self.current_expression, local_dict)
+            expression_text = self.current_expression
 
-            # 显示LaTeX结果
-            latex_result = sp.latex(integral) + " + C"
-            self.update_result_latex_display(latex_result)
+            if limits is not None:
+                lower, upper = (self.parse_expression(text, local_dict) for text in limits)
+                integral_text = f"∫[{limits[0]}, {limits[1]}] {expression_text} dx"
 
-            # 添加到历史记录
-            self.add_to_history(result)
+                def show_definite(index, value):
+                    result = self.format_definite_integral(integral_text, index, value)
+                    if index == 0:
+                        latex_result = sp.latex(value)
+                    else:
+                        latex_result = rf"\approx {value[0]:.15g} \pm {value[1]:.1e}"
+                    self.expression_input.setText(result)
+                    self.current_expression = result
+                    self.update_result_latex_display(latex_result)
+                    self.add_to_history(result)
+
+                # 符号积分与Gauss–Kronrod数值积分同时计算，显示先完成的一个
+                self.run_race("积分计算", show_definite, [(engine.integrate_exact, (expr, self.x, lower, upper)),
+                                                        (engine.nintegrate, (expr, self.x, lower, upper))])
+                return
+
+            def show_result(integral):
+                result = f"∫{expression_text} dx = {integral} + C"
+                self.expression_input.setText(result)
+                self.current_expression = result
+
+                # 显示LaTeX结果
+                latex_result = sp.latex(integral) + " + C"
+                self.update_result_latex_display(latex_result)
+
+                # 添加到历史记录
+                self.add_to_history(result)
+
+            self.run_in_background("积分计算", show_result, engine.integrate, expr, self.x)
         except Exception as e:
             QMessageBox.critical(self, "积分计算错误", f"错误: {str(e)}")
 
@@ -750,24 +783,65 @@ class CalculatorApp(QMainWindow):
             var2_name = var2_name if var2_name else 'y'
             var2 = sp.Symbol(var2_name)
 
+            # 积分限留空时计算不定积分，内层的积分限可以含外层变量
+            limits1_text, ok3 = QInputDialog.getText(
+                self, "二重积分", f"{var1_name}的积分限 a, b? (可以含{var2_name}，留空为不定积分)")
+            if not ok3:
+                return
+            limits1 = engine.split_limits(limits1_text)
+            limits2 = None
+            if limits1 is not None:
+                limits2_text, ok4 = QInputDialog.getText(self, "二重积分", f"{var2_name}的积分限 a, b?")
+                if not ok4:
+                    return
+                limits2 = engine.split_limits(limits2_text)
+                if limits2 is None:
+                    QMessageBox.warning(self, "输入错误", f"请输入{var2_name}的积分限")
+                    return
+
             # 解析表达式
-            expr = parse_expr(self.current_expression,
-                             local_dict={'x': self.x, 'y': self.y, 'z': self.z},
-                             transformations=self.transformations)
+            local_dict = {'x': self.x, 'y': self.y, 'z': self.z}
+            expr = self.parse_expression(self.current_expression, local_dict)
 
-            # 计算二重积分 (无界积分)
-            double_integral = sp.integrate(sp.integrate(expr, var1), var2)
+            expression_text = self.current_expression
 
-            result = f"∬{self.current_expression} d{var1_name}d{var2_name} = {double_integral} + C"
-            self.expression_input.setText(result)
-            self.current_expression = result
+            if limits1 is not None:
+                bounds1 = tuple(self.parse_expression(text, local_dict) for text in limits1)
+                bounds2 = tuple(self.parse_expression(text, local_dict) for text in limits2)
+                integral_text = (f"∬{expression_text} d{var1_name}d{var2_name}, "
+                                 f"{var1_name}: [{', '.join(limits1)}], {var2_name}: [{', '.join(limits2)}]")
 
-            # 显示LaTeX结果
-            latex_result = sp.latex(double_integral) + " + C"
-            self.update_result_latex_display(latex_result)
+                def show_definite(index, value):
+                    result = self.format_definite_integral(integral_text, index, value)
+                    if index == 0:
+                        latex_result = sp.latex(value)
+                    else:
+                        latex_result = rf"\approx {value[0]:.15g} \pm {value[1]:.1e}"
+                    self.expression_input.setText(result)
+                    self.current_expression = result
+                    self.update_result_latex_display(latex_result)
+                    self.add_to_history(result)
+
+                args = (expr, var1, var2, bounds1, bounds2)
+                self.run_race("二重积分计算", show_definite, [(engine.double_integrate_exact, args),
+                                                           (engine.ndouble_integrate, args)])
+                return
 
-            # 添加到历史记录
-            self.add_to_history(result)
+            def show_result(double_integral):
+                result = f"∬{expression_text} d{var1_name}d{var2_name} = {double_integral} + C"
+                self.expression_input.setText(result)
+                self.current_expression = result
+
+                # 显示LaTeX结果
+                latex_result = sp.latex(double_integral) + " + C"
+                self.update_result_latex_display(latex_result)
+
+                # 添加到历史记录
+                self.add_to_history(result)
+
+            # 计算二重积分 (无界积分)
+            self.run_in_background("二重积分计算", show_result,
+                                   engine.double_integrate, expr, var1, var2)
         except Exception as e:
             QMessageBox.critical(self, "二重积分计算错误", f"错误: {str(e)}")
 
@@ -778,20 +852,21 @@ class CalculatorApp(QMainWindow):
                 QMessageBox.warning(self, "输入错误", "请先输入表达式")
                 return
 
-            expr = parse_expr(self.current_expression,
-                             local_dict={'x': self.x, 'y': self.y, 'z': self.z},
-                             transformations=self.transformations)
-            result = operation(expr)
+            expr = self.parse_expression(self.current_expression,
+                                         {'x': self.x, 'y': self.y, 'z': self.z})
 
-            self.expression_input.setText(str(result))
-            self.current_expression = str(result)
+            def show_result(result):
+                self.expression_input.setText(str(result))
+                self.current_expression = str(result)
 
-            # 显示LaTeX结果
-            latex_result = sp.latex(result)
-            self.update_result_latex_display(latex_result)
+                # 显示LaTeX结果
+                latex_result = sp.latex(result)
+                self.update_result_latex_display(latex_result)
 
-            # 添加到历史记录
-            self.add_to_history(f"{self.current_expression} = {result}")
+                # 添加到历史记录
+                self.add_to_history(f"{self.current_expression} = {result}")
+
+            self.run_in_background("操作", show_result, engine.apply_operation, operation, expr)
         except Exception as e:
             QMessageBox.critical(self, "操作错误", f"错误: {str(e)}")
 
@@ -809,44 +884,46 @@ class CalculatorApp(QMainWindow):
                     var_name = 'x'
 
                 var = sp.Symbol(var_name)
-                expr = parse_expr(self.current_expression, 
-                                 local_dict={'x': self.x, 'y': self.y, 'z': self.z},
-                                 transformations=self.transformations)
-                solutions = sp.solve(expr, var)
-
-                if solutions:
-                    if len(solutions) == 1:
-                        result = f"{var_name} = {solutions[0]}"
+                expr = self.parse_expression(self.current_expression,
+                                             {'x': self.x, 'y': self.y, 'z': self.z})
+
+                def show_result(index, solutions):
+                    # 符号解（下标0）是精确解，数值解是近似解
+                    sign, tag = ("=", "精确解") if index == 0 else ("≈", "近似解")
+                    if solutions:
+                        if len(solutions) == 1:
+                            result = f"{tag}: {var_name} {sign} {solutions[0]}"
+                        else:
+                            result = f"{tag}: {var_name} {sign} {solutions}"
                     else:
-                        result = f"{var_name} = {solutions}"
-                else:
-                    result = "无解"
+                        result = "无解" if index == 0 else "无解（数值搜索）"
 
-                self.expression_input.setText(result)
-                self.current_expression = result
+                    self.expression_input.setText(result)
+                    self.current_expression = result
 
-                # 显示LaTeX结果
-                latex_result = f"{var_name} = {sp.latex(solutions)}"
-                self.update_result_latex_display(latex_result)
+                    # 显示LaTeX结果
+                    relation = "=" if index == 0 else r"\approx"
+                    latex_result = f"{var_name} {relation} {sp.latex(solutions)}"
+                    self.update_result_latex_display(latex_result)
 
-                # 添加到历史记录
-                self.add_to_history(f"解方程 {self.current_expression}: {result}")
+                    # 添加到历史记录
+                    self.add_to_history(f"解方程 {self.current_expression}: {result}")
+
+                # 符号解与数值解同时计算，显示先完成的一个
+                self.run_race("解方程", show_result, [(engine.solve_exact, (expr, var)),
+                                                      (numeric_solve.solve, (expr, var))])
         except Exception as e:
             QMessageBox.critical(self, "解方程错误", f"错误: {str(e)}")
 
     def calculate_mean(self):
         """计算平均值"""
         try:
-            data_str = self.stats_input.text()
-            if not data_str:
+            dataset = self.current_dataset()
+            if dataset is None:
                 QMessageBox.warning(self, "输入错误", "请先输入数据")
                 return
 
-            # 解析数据
-            data = [float(x) for x in data_str.split(",")]
-
-            # 使用sympy计算平均值
-            mean_value = sum(data) / len(data)
+            mean_value = dataset.summary().mean
 
             result = f"Mean: {mean_value}"
             self.expression_input.setText(result)
@@ -863,21 +940,12 @@ class CalculatorApp(QMainWindow):
     def calculate_median(self):
         """计算中位数"""
         try:
-            data_str = self.stats_input.text()
-            if not data_str:
+            dataset = self.current_dataset()
+            if dataset is None:
                 QMessageBox.warning(self, "输入错误", "请先输入数据")
                 return
 
-            # 解析数据
-            data = [float(x) for x in data_str.split(",")]
-
-            # 使用sympy计算中位数
-            sorted_data = sorted(data)
-            n = len(sorted_data)
-            if n % 2 == 0:
-                median_value = (sorted_data[n//2 - 1] + sorted_data[n//2]) / 2
-            else:
-                median_value = sorted_data[n//2]
+            (median_value,), _ = self.dataset_quantiles(dataset, [0.5])
 
             result = f"Median: {median_value}"
             self.expression_input.setText(result)
@@ -894,16 +962,12 @@ class CalculatorApp(QMainWindow):
     def calculate_std(self):
         """计算标准差"""
         try:
-            data_str = self.stats_input.text()
-            if not data_str:
+            dataset = self.current_dataset()
+            if dataset is None:
                 QMessageBox.warning(self, "输入错误", "请先输入数据")
                 return
 
-            # 解析数据
-            data = [float(x) for x in data_str.split(",")]
-
-            # 使用numpy计算标准差
-            std_value = np.std(data)
+            std_value = dataset.summary().std
 
             result = f"Std: {std_value}"
             self.expression_input.setText(result)
@@ -920,16 +984,12 @@ class CalculatorApp(QMainWindow):
     def calculate_variance(self):
         """计算方差"""
         try:
-            data_str = self.stats_input.text()
-            if not data_str:
+            dataset = self.current_dataset()
+            if dataset is None:
                 QMessageBox.warning(self, "输入错误", "请先输入数据")
                 return
 
-            # 解析数据
-            data = [float(x) for x in data_str.split(",")]
-
-            # 使用numpy计算方差
-            var_value = np.var(data)
+            var_value = dataset.summary().variance
 
             result = f"Variance: {var_value}"
             self.expression_input.setText(result)
@@ -946,18 +1006,12 @@ class CalculatorApp(QMainWindow):
     def calculate_gcd(self):
         """计算最大公约数"""
         try:
-            data_str = self.stats_input.text()
-            if not data_str:
+            dataset = self.current_dataset()
+            if dataset is None:
                 QMessageBox.warning(self, "输入错误", "请先输入数据")
                 return
 
-            # 解析数据
-            data = [int(float(x)) for x in data_str.split(",")]
-
-            # 使用sympy计算最大公约数
-            gcd_result = data[0]
-            for i in range(1, len(data)):
-                gcd_result = sp.gcd(gcd_result, data[i])
+            gcd_result = engine.statistic("gcd", dataset.values)
 
             result = f"GCD: {gcd_result}"
             self.expression_input.setText(result)
@@ -974,18 +1028,12 @@ class CalculatorApp(QMainWindow):
     def calculate_lcm(self):
         """计算最小公倍数"""
         try:
-            data_str = self.stats_input.text()
-            if not data_str:
+            dataset = self.current_dataset()
+            if dataset is None:
                 QMessageBox.warning(self, "输入错误", "请先输入数据")
                 return
 
-            # 解析数据
-            data = [int(float(x)) for x in data_str.split(",")]
-
-            # 使用sympy计算最小公倍数
-            lcm_result = data[0]
-            for i in range(1, len(data)):
-                lcm_result = sp.lcm(lcm_result, data[i])
+            lcm_result = engine.statistic("lcm", dataset.values)
 
             result = f"LCM: {lcm_result}"
             self.expression_input.setText(result)
@@ -1002,14 +1050,12 @@ class CalculatorApp(QMainWindow):
     def calculate_max(self):
         """计算最大值"""
         try:
-            data_str = self.stats_input.text()
-            if not data_str:
+            dataset = self.current_dataset()
+            if dataset is None:
                 QMessageBox.warning(self, "输入错误", "请先输入数据")
                 return
 
-            # 解析数据
-            data = [float(x) for x in data_str.split(",")]
-            max_value = max(data)
+            max_value = engine.statistic("max", dataset.values)
 
             result = f"Max: {max_value}"
             self.expression_input.setText(result)
@@ -1026,14 +1072,12 @@ class CalculatorApp(QMainWindow):
     def calculate_min(self):
         """计算最小值"""
         try:
-            data_str = self.stats_input.text()
-            if not data_str:
+            dataset = self.current_dataset()
+            if dataset is None:
                 QMessageBox.warning(self, "输入错误", "请先输入数据")
                 return
 
-            # 解析数据
-            data = [float(x) for x in data_str.split(",")]
-            min_value = min(data)
+            min_value = engine.statistic("min", dataset.values)
 
             result = f"Min: {min_value}"
             self.expression_input.setText(result)
@@ -1089,8 +1133,9 @@ class CalculatorApp(QMainWindow):
 
 # 应用入口
 def main():
+    renderer = choose_renderer(sys.argv)
     app = QApplication(sys.argv)
-    calculator = CalculatorApp()
+    calculator = CalculatorApp(renderer)
     sys.exit(app.exec())
 
 if __name__ == "__main__":
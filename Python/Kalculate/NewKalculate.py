@@ -1,36 +1,40 @@
 import sys
-import numpy as np
 import sympy as sp
 from sympy.parsing.sympy_parser import parse_expr, standard_transformations, implicit_multiplication_application
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                               QHBoxLayout, QTabWidget, QPushButton, QLabel,
                               QListWidget, QMenuBar, QMenu, QGridLayout,
                               QLineEdit, QMessageBox, QFileDialog, QSplitter,
-                              QSizePolicy)
+                              QSizePolicy, QInputDialog)
 from PySide6.QtCore import Qt, Signal, Slot
-from PySide6.QtWebEngineWidgets import QWebEngineView
 from PySide6.QtGui import QIcon
-from PySide6.QtUiTools import QUiLoader
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-import matplotlib
-matplotlib.use('Qt5Agg')
-
-class CalculatorApp(QMainWindow):
-    def __init__(self):
+
+import engine
+import numeric_solve
+from parse_cache import ParseCache
+from latex_view import choose_renderer, create_latex_view, effective_renderer
+from preview import PreviewScheduler
+from calculator_mixin import CalculatorMixin
+from ui_loader import load_ui
+
+class CalculatorApp(CalculatorMixin, QMainWindow):
+    def __init__(self, renderer=None):
         super().__init__()
         self.setWindowTitle("Kalculate")
 
-        # 加载UI文件
-        loader = QUiLoader()
-        self.ui = loader.load("qtUI.ui", self)
-        self.setCentralWidget(self.ui)
+        # 公式渲染方式，需要在加载UI文件之前确定
+        self.renderer = effective_renderer(renderer or choose_renderer(sys.argv))
+
+        # 加载界面（优先使用预生成的ui_qtUI.py）
+        self.ui = load_ui(self)
 
         # 初始化符号变量
         self.x, self.y = sp.symbols('x y')
         self.current_expression = ""
         self.history = []
+        self.dataset = None
         self.transformations = standard_transformations + (implicit_multiplication_application,)
+        self.parse_cache = ParseCache(maxsize=256)
 
         # 角度制设置，默认为弧度制
         self.angle_mode = "RAD"  # 可选值："DEG"(角度制) 或 "RAD"(弧度制)
@@ -52,6 +56,27 @@ class CalculatorApp(QMainWindow):
         # 连接信号
         self.connect_signals()
 
+        # 后台计算引擎
+        self.setup_evaluator()
+
+        # 输入预览调度
+        self.setup_preview()
+
+    def setup_preview(self):
+        """初始化输入预览调度器，防抖时间可通过QSettings的preview/delay_ms修改"""
+        delay_ms = self.settings.value("preview/delay_ms", 80, type=int)
+        self.input_preview = PreviewScheduler(self.show_input_preview, delay_ms=delay_ms, parent=self)
+
+    def show_input_preview(self, content):
+        """显示预览内容，content为 (类型, 文本)"""
+        kind, text = content
+        if kind == "latex":
+            self.latex_view.set_latex("input", text)
+        elif kind == "text":
+            self.latex_view.set_text("input", text)
+        else:
+            self.latex_view.clear("input")
+
     def setup_ui(self):
         """设置UI元素"""
         # 输入框
@@ -59,8 +84,7 @@ class CalculatorApp(QMainWindow):
         self.expression_input.setPlaceholderText("输入表达式...")
 
         # LaTeX显示视图
-        self.web_view = self.ui.webEngineView
-        self.web_view.setHtml("<html><body></body></html>")
+        self.latex_view = create_latex_view(self.ui.webEngineView, self.renderer)
 
         # 连接按钮信号
         self.connect_tab_buttons()
@@ -71,6 +95,16 @@ class CalculatorApp(QMainWindow):
         # 连接标签页切换信号
         self.ui.tabWidget.currentChanged.connect(self.on_tab_changed)
 
+        # 统计菜单：数据导入（File > CSV File > Import）、汇总统计、百分位数、出现次数最多的数值和数值表
+        if hasattr(self.ui, "actionImport"):
+            self.ui.actionImport.triggered.connect(self.import_dataset)
+        if hasattr(self.ui, "actionStatistics"):
+            self.ui.actionStatistics.triggered.connect(self.calculate_summary)
+        if hasattr(self.ui, "menuFile"):
+            self.ui.menuFile.addAction("Quantiles", self.calculate_quantiles)
+            self.ui.menuFile.addAction("Top Values", self.calculate_top_k)
+            self.ui.menuFile.addAction("Table...", self.show_table)
+
     def connect_tab_buttons(self):
         """连接所有标签页中的按钮"""
         # 基本标签页
@@ -438,9 +472,15 @@ class CalculatorApp(QMainWindow):
             self.calculate_median()
         elif text == 'σ':  # 标准差
             self.calculate_std()
+        elif text == 'Summary':  # 汇总统计
+            self.calculate_summary()
+        elif text == 'Quantiles':  # 百分位数
+            self.calculate_quantiles()
+        elif text == 'Top-k':  # 出现次数最多的数值
+            self.calculate_top_k()
         # 集合操作
-        elif text in ['∩', '∪', '\', '⊂', '⊃', '⊆', '⊇', '∈']:
-            if text == '\':  # 差集
+        elif text in ['∩', '∪', '\\', '⊂', '⊃', '⊆', '⊇', '∈']:
+            if text == '\\':  # 差集
                 self.add_to_expression('\\')  # 在Python字符串中，\表示一个反斜杠
             else:
                 self.add_to_expression(text)
@@ -474,45 +514,22 @@ class CalculatorApp(QMainWindow):
         self.update_latex_display()
 
     def update_latex_display(self):
-        """更新LaTeX显示"""
+        """请求更新LaTeX显示（防抖后执行，连续输入时只解析最后一次）"""
+        self.input_preview.request(self.build_latex_display)
+
+    def build_latex_display(self):
+        """生成输入的LaTeX显示内容"""
         if not self.current_expression:
-            self.web_view.setHtml("<html><body></body></html>")
-            return
+            return ("clear", "")
 
         try:
             # 尝试使用sympy将表达式转换为LaTeX
-            expr = parse_expr(self.current_expression, 
-                              local_dict={'x': self.x, 'y': self.y},
-                              transformations=self.transformations)
-            latex_text = sp.latex(expr)
-
-            # 构建HTML
-            html = f"""
-            <html>
-            <head>
-                <script src="https://polyfill.io/v3/polyfill.min.js?features=es6"></script>
-                <script id="MathJax-script" async src="https://cdn.jsdelivr.net/npm/mathjax@3/es5/tex-mml-chtml.js"></script>
-            </head>
-            <body>
-                <div style="font-size: 24px; text-align: center; padding: 20px;">
-                    $${latex_text}$$
-                </div>
-            </body>
-            </html>
-            """
-            self.web_view.setHtml(html)
+            expr = self.parse_expression(self.current_expression,
+                                         {'x': self.x, 'y': self.y})
+            return ("latex", sp.latex(expr))
         except Exception as e:
             # 如果解析失败，直接显示原始表达式
-            html = f"""
-            <html>
-            <body>
-                <div style="font-size: 16px; text-align: center; padding: 20px;">
-                    {self.current_expression}
-                </div>
-            </body>
-            </html>
-            """
-            self.web_view.setHtml(html)
+            return ("text", self.current_expression)
 
     def add_to_expression(self, text):
         """向表达式添加文本"""
@@ -575,9 +592,8 @@ class CalculatorApp(QMainWindow):
                 return
 
             # 解析并计算表达式
-            expr = parse_expr(self.current_expression,
-                              local_dict={'x': self.x, 'y': self.y},
-                              transformations=self.transformations)
+            expr = self.parse_expression(self.current_expression,
+                                         {'x': self.x, 'y': self.y})
             result = expr
 
             # 更新显示
@@ -596,20 +612,7 @@ class CalculatorApp(QMainWindow):
         if not latex_str:
             return
 
-        html = f"""
-        <html>
-        <head>
-            <script src="https://polyfill.io/v3/polyfill.min.js?features=es6"></script>
-            <script id="MathJax-script" async src="https://cdn.jsdelivr.net/npm/mathjax@3/es5/tex-mml-chtml.js"></script>
-        </head>
-        <body>
-            <div style="font-size: 24px; text-align: center; padding: 20px; color: green;">
-                $${latex_str}$$
-            </div>
-        </body>
-        </html>
-        """
-        self.web_view.setHtml(html)
+        self.latex_view.set_latex("result", latex_str)
 
     def add_to_history(self, item):
         """添加计算历史"""
@@ -624,13 +627,15 @@ class CalculatorApp(QMainWindow):
             if not self.current_expression:
                 return
 
-            expr = parse_expr(self.current_expression,
-                              local_dict={'x': self.x, 'y': self.y},
-                              transformations=self.transformations)
-            result = operation(expr)
-            self.current_expression = str(result)
-            self.expression_input.setText(self.current_expression)
-            self.update_latex_display()
+            expr = self.parse_expression(self.current_expression,
+                                         {'x': self.x, 'y': self.y})
+
+            def show_result(result):
+                self.current_expression = str(result)
+                self.expression_input.setText(self.current_expression)
+                self.update_latex_display()
+
+            self.run_in_background("操作", show_result, engine.apply_operation, operation, expr)
 
         except Exception as e:
             QMessageBox.critical(self, "操作错误", f"错误: {str(e)}")
@@ -645,29 +650,31 @@ class CalculatorApp(QMainWindow):
             # 检查是否含有等号
             if "=" in self.current_expression:
                 left, right = self.current_expression.split("=", 1)
-                expr = parse_expr(f"({left})-({right})",
-                                 local_dict={'x': self.x, 'y': self.y},
-                                 transformations=self.transformations)
+                expr = self.parse_expression(f"({left})-({right})",
+                                             {'x': self.x, 'y': self.y})
             else:
-                expr = parse_expr(self.current_expression,
-                                 local_dict={'x': self.x, 'y': self.y},
-                                 transformations=self.transformations)
-
-            # 解方程
-            solutions = sp.solve(expr, self.x)
-
-            if solutions:
-                if len(solutions) == 1:
-                    result = f"x = {solutions[0]}"
+                expr = self.parse_expression(self.current_expression,
+                                             {'x': self.x, 'y': self.y})
+
+            def show_result(index, solutions):
+                # 符号解（下标0）是精确解，数值解是近似解
+                sign, tag = ("=", "精确解") if index == 0 else ("≈", "近似解")
+                if solutions:
+                    if len(solutions) == 1:
+                        result = f"{tag}: x {sign} {solutions[0]}"
+                    else:
+                        result = f"{tag}: " + ", ".join([f"x {sign} {s}" for s in solutions])
                 else:
-                    result = "解: " + ", ".join([f"x = {s}" for s in solutions])
-            else:
-                result = "未找到解"
+                    result = "未找到解" if index == 0 else "未找到解（数值搜索）"
 
-            # 更新显示
-            self.current_expression = result
-            self.expression_input.setText(result)
-            self.update_latex_display()
+                # 更新显示
+                self.current_expression = result
+                self.expression_input.setText(result)
+                self.update_latex_display()
+
+            # 符号解与数值解同时计算，显示先完成的一个
+            self.run_race("解方程", show_result, [(engine.solve_exact, (expr, self.x)),
+                                                  (numeric_solve.solve, (expr, self.x))])
 
         except Exception as e:
             QMessageBox.critical(self, "解方程错误", f"错误: {str(e)}")
@@ -679,9 +686,8 @@ class CalculatorApp(QMainWindow):
                 QMessageBox.warning(self, "输入错误", "请先输入表达式")
                 return
 
-            expr = parse_expr(self.current_expression,
-                             local_dict={'x': self.x, 'y': self.y},
-                             transformations=self.transformations)
+            expr = self.parse_expression(self.current_expression,
+                                         {'x': self.x, 'y': self.y})
             derivative = sp.diff(expr, self.x)
 
             # 更新显示
@@ -710,9 +716,8 @@ class CalculatorApp(QMainWindow):
             variable = self.x if var == QMessageBox.StandardButton.Yes else self.y
             var_name = 'x' if var == QMessageBox.StandardButton.Yes else 'y'
 
-            expr = parse_expr(self.current_expression,
-                             local_dict={'x': self.x, 'y': self.y},
-                             transformations=self.transformations)
+            expr = self.parse_expression(self.current_expression,
+                                         {'x': self.x, 'y': self.y})
             partial = sp.diff(expr, variable)
 
             # 更新显示
@@ -731,16 +736,39 @@ class CalculatorApp(QMainWindow):
                 QMessageBox.warning(self, "输入错误", "请先输入表达式")
                 return
 
-            expr = parse_expr(self.current_expression,
-                             local_dict={'x': self.x, 'y': self.y},
-                             transformations=self.transformations)
-            integral = sp.integrate(expr, self.x)
+            # 积分限留空时计算不定积分
+            limits_text, ok = QInputDialog.getText(self, "积分", "积分限 a, b? (留空为不定积分)")
+            if not ok:
+                return
+            limits = engine.split_limits(limits_text)
 
-            # 更新显示
-            result = f"∫{self.current_expression} dx = {integral} + C"
-            self.current_expression = result
-            self.expression_input.setText(result)
-            self.update_latex_display()
+            expr = self.parse_expression(self.current_expression,
+                                         {'x': self.x, 'y': self.y})
+            expression_text = self.current_expression
+
+            if limits is not None:
+                lower, upper = (self.parse_expression(text, {'x': self.x, 'y': self.y}) for text in limits)
+                integral_text = f"∫[{limits[0]}, {limits[1]}] {expression_text} dx"
+
+                def show_definite(index, value):
+                    result = self.format_definite_integral(integral_text, index, value)
+                    self.current_expression = result
+                    self.expression_input.setText(result)
+                    self.update_latex_display()
+
+                # 符号积分与Gauss–Kronrod数值积分同时计算，显示先完成的一个
+                self.run_race("计算积分", show_definite, [(engine.integrate_exact, (expr, self.x, lower, upper)),
+                                                        (engine.nintegrate, (expr, self.x, lower, upper))])
+                return
+
+            def show_result(integral):
+                # 更新显示
+                result = f"∫{expression_text} dx = {integral} + C"
+                self.current_expression = result
+                self.expression_input.setText(result)
+                self.update_latex_display()
+
+            self.run_in_background("计算积分", show_result, engine.integrate, expr, self.x)
 
         except Exception as e:
             QMessageBox.critical(self, "计算积分错误", f"错误: {str(e)}")
@@ -752,17 +780,51 @@ class CalculatorApp(QMainWindow):
                 QMessageBox.warning(self, "输入错误", "请先输入表达式")
                 return
 
-            expr = parse_expr(self.current_expression,
-                             local_dict={'x': self.x, 'y': self.y},
-                             transformations=self.transformations)
-            # 先对x积分，再对y积分
-            integral = sp.integrate(sp.integrate(expr, self.x), self.y)
+            # 积分限留空时计算不定积分，x的积分限可以含y
+            limits_x_text, ok = QInputDialog.getText(self, "二重积分", "x的积分限 a, b? (可以含y，留空为不定积分)")
+            if not ok:
+                return
+            limits_x = engine.split_limits(limits_x_text)
+            limits_y = None
+            if limits_x is not None:
+                limits_y_text, ok = QInputDialog.getText(self, "二重积分", "y的积分限 a, b?")
+                if not ok:
+                    return
+                limits_y = engine.split_limits(limits_y_text)
+                if limits_y is None:
+                    QMessageBox.warning(self, "输入错误", "请输入y的积分限")
+                    return
+
+            expr = self.parse_expression(self.current_expression,
+                                         {'x': self.x, 'y': self.y})
+            expression_text = self.current_expression
+
+            if limits_x is not None:
+                bounds_x = tuple(self.parse_expression(text, {'x': self.x, 'y': self.y}) for text in limits_x)
+                bounds_y = tuple(self.parse_expression(text, {'x': self.x, 'y': self.y}) for text in limits_y)
+                integral_text = f"∬{expression_text} dxdy, x: [{', '.join(limits_x)}], y: [{', '.join(limits_y)}]"
+
+                def show_definite(index, value):
+                    result = self.format_definite_integral(integral_text, index, value)
+                    self.current_expression = result
+                    self.expression_input.setText(result)
+                    self.update_latex_display()
+
+                args = (expr, self.x, self.y, bounds_x, bounds_y)
+                self.run_race("计算二重积分", show_definite, [(engine.double_integrate_exact, args),
+                                                           (engine.ndouble_integrate, args)])
+                return
 
-            # 更新显示
-            result = f"∬{self.current_expression} dxdy = {integral} + C"
-            self.current_expression = result
-            self.expression_input.setText(result)
-            self.update_latex_display()
+            def show_result(integral):
+                # 更新显示
+                result = f"∬{expression_text} dxdy = {integral} + C"
+                self.current_expression = result
+                self.expression_input.setText(result)
+                self.update_latex_display()
+
+            # 先对x积分，再对y积分
+            self.run_in_background("计算二重积分", show_result,
+                                   engine.double_integrate, expr, self.x, self.y)
 
         except Exception as e:
             QMessageBox.critical(self, "计算二重积分错误", f"错误: {str(e)}")
@@ -770,16 +832,12 @@ class CalculatorApp(QMainWindow):
     def calculate_mean(self):
         """计算平均值"""
         try:
-            data_str = self.stats_input.text()
-            if not data_str:
+            dataset = self.current_dataset()
+            if dataset is None:
                 QMessageBox.warning(self, "输入错误", "请先输入数据")
                 return
 
-            # 解析数据
-            data = [float(x) for x in data_str.split(",")]
-
-            # 使用sympy计算平均值
-            mean_value = sp.stats.mean(data)
+            mean_value = dataset.summary().mean
 
             # 更新显示
             result = f"平均值: {mean_value}"
@@ -793,16 +851,12 @@ class CalculatorApp(QMainWindow):
     def calculate_median(self):
         """计算中位数"""
         try:
-            data_str = self.stats_input.text()
-            if not data_str:
+            dataset = self.current_dataset()
+            if dataset is None:
                 QMessageBox.warning(self, "输入错误", "请先输入数据")
                 return
 
-            # 解析数据
-            data = [float(x) for x in data_str.split(",")]
-
-            # 使用sympy计算中位数
-            median_value = sp.stats.median(data)
+            (median_value,), _ = self.dataset_quantiles(dataset, [0.5])
 
             # 更新显示
             result = f"中位数: {median_value}"
@@ -816,16 +870,12 @@ class CalculatorApp(QMainWindow):
     def calculate_std(self):
         """计算标准差"""
         try:
-            data_str = self.stats_input.text()
-            if not data_str:
+            dataset = self.current_dataset()
+            if dataset is None:
                 QMessageBox.warning(self, "输入错误", "请先输入数据")
                 return
 
-            # 解析数据
-            data = [float(x) for x in data_str.split(",")]
-
-            # 使用sympy计算标准差
-            std_value = sp.stats.standard_deviation(data)
+            std_value = dataset.summary().std
 
             # 更新显示
             result = f"标准差: {std_value}"
@@ -838,8 +888,9 @@ class CalculatorApp(QMainWindow):
 
 # 主应用程序入口
 def main():
+    renderer = choose_renderer(sys.argv)
     app = QApplication(sys.argv)
-    calculator = CalculatorApp()
+    calculator = CalculatorApp(renderer)
     calculator.show()
     sys.exit(app.exec())
 
@@ -0,0 +1,115 @@
+"""批量计算命令行工具（不需要界面）
+
+输入文件每行一个任务：可以是一个表达式（按 --op 指定的操作处理），也可以是一个JSON对象，
+例如 {"op": "integrate", "expr": "x*sin(x)", "var": "x"}。空行和以#开头的行会被跳过。
+结果按完成顺序以JSONL格式输出，每行包含行号、状态（ok/error/timeout）、结果和耗时。
+
+用法：
+    python batch.py expressions.txt -o results.jsonl --workers 4 --timeout 10
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+import engine
+from workers import WorkerPool
+
+
+def read_tasks(lines, default_op, angle_mode):
+    """逐行读取任务，返回 (行号, 任务) 的迭代器"""
+    for number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        if line.startswith('{'):
+            try:
+                task = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield number, {"op": "invalid", "error": f"JSON格式错误: {e}"}
+                continue
+        else:
+            task = {"op": default_op, "expr": line}
+        task.setdefault("angle_mode", angle_mode)
+        yield number, task
+
+
+def run_batch(tasks, output, workers=2, timeout=None, max_pending=None):
+    """把任务分发到进程池执行，结果写入output；返回各状态的数量"""
+    pool = WorkerPool(size=workers, default_timeout=timeout)
+    max_pending = max_pending or workers * 4
+    submitted = {}
+    counts = {"ok": 0, "error": 0, "timeout": 0}
+    tasks = iter(tasks)
+    exhausted = False
+
+    def write(number, status, payload, started):
+        record = {"line": number, "status": status, "elapsed": round(time.monotonic() - started, 4)}
+        if status == "ok":
+            record.update(payload)
+        elif status == "error":
+            record["error"] = payload
+        counts[status] += 1
+        output.write(json.dumps(record, ensure_ascii=False) + "\n")
+        output.flush()
+
+    try:
+        while True:
+            # 只保持有限数量的任务在队列中，输入文件再大也不会占用太多内存
+            while not exhausted and len(submitted) < max_pending:
+                try:
+                    number, task = next(tasks)
+                except StopIteration:
+                    exhausted = True
+                    break
+                if task.get("op") == "invalid":
+                    write(number, "error", task["error"], time.monotonic())
+                    continue
+                request_id = pool.submit(engine.run, task, timeout=task.get("timeout", timeout))
+                submitted[request_id] = (number, time.monotonic())
+
+            if exhausted and not submitted:
+                break
+
+            events = pool.poll()
+            for request_id, status, payload in events:
+                number, started = submitted.pop(request_id)
+                write(number, "ok" if status == "done" else status, payload, started)
+            if not events:
+                time.sleep(0.005)
+    finally:
+        pool.shutdown()
+    return counts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Kalculate批量计算")
+    parser.add_argument("input", help="任务文件，每行一个表达式或JSON对象；-表示标准输入")
+    parser.add_argument("-o", "--output", default="-", help="结果文件（JSONL），默认输出到标准输出")
+    parser.add_argument("--op", default="evaluate", choices=sorted(engine.OPERATIONS),
+                        help="纯表达式行使用的操作")
+    parser.add_argument("--angle", default="RAD", choices=["RAD", "DEG"], help="角度制或弧度制")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2, help="工作进程数")
+    parser.add_argument("--timeout", type=float, default=30.0, help="单个任务的超时时间（秒），0表示不限制")
+    args = parser.parse_args(argv)
+
+    source = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    output = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    started = time.monotonic()
+    try:
+        counts = run_batch(read_tasks(source, args.op, args.angle), output,
+                           workers=args.workers, timeout=args.timeout or None)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if output is not sys.stdout:
+            output.close()
+
+    print(f"完成 {sum(counts.values())} 项：成功 {counts['ok']}，出错 {counts['error']}，"
+          f"超时 {counts['timeout']}，用时 {time.monotonic() - started:.1f} 秒", file=sys.stderr)
+    return 0 if counts["error"] == 0 and counts["timeout"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,61 @@
+"""精确行列式基准测试
+
+随机整数矩阵（元素在 ±max_entry 之间），比较 exact_matrix 的Bareiss、多模（CRT）行列式
+与 sp.Matrix(...).det() 的耗时，并检查三者结果一致。SymPy在较大的矩阵上很慢，超过 --sympy-max 时跳过。
+
+    python benchmarks/exact_det_benchmark.py --sizes 10 20 40 80 --max-entry 1000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+APP_DIR = os.path.dirname(BENCHMARK_DIR)
+sys.path.insert(0, APP_DIR)
+
+import exact_matrix  # noqa: E402
+
+
+def timed(func, *args):
+    """返回 (结果, 耗时毫秒)"""
+    started = time.perf_counter()
+    result = func(*args)
+    return result, (time.perf_counter() - started) * 1000
+
+
+def sympy_det(rows):
+    import sympy as sp
+    return int(sp.Matrix(rows).det())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="精确行列式基准测试")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 20, 40, 80])
+    parser.add_argument("--max-entry", type=int, default=1000)
+    parser.add_argument("--sympy-max", type=int, default=40, help="超过该大小时不运行SymPy")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    print(f"{'n':>4} {'bareiss ms':>12} {'modular ms':>12} {'sympy ms':>12} {'digits':>8}")
+    for n in args.sizes:
+        rows = [[rng.randint(-args.max_entry, args.max_entry) for _ in range(n)] for _ in range(n)]
+        bareiss, bareiss_ms = timed(exact_matrix.bareiss_det, rows)
+        modular, modular_ms = timed(exact_matrix.modular_det, rows)
+        if bareiss != modular:
+            raise RuntimeError(f"n={n}: Bareiss与多模行列式不一致")
+
+        sympy_column = "skipped"
+        if n <= args.sympy_max:
+            reference, sympy_ms = timed(sympy_det, rows)
+            if reference != bareiss:
+                raise RuntimeError(f"n={n}: 与SymPy的结果不一致")
+            sympy_column = f"{sympy_ms:.1f}"
+        print(f"{n:>4} {bareiss_ms:>12.1f} {modular_ms:>12.1f} {sympy_column:>12} {len(str(abs(bareiss))):>8}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+"""数值快速路径基准测试
+
+随机生成 "a+b*c/d-sin(t)" 形式的纯数值表达式，比较 parse_expr + evalf + latex（SymPy路径）
+与 fastpath.evaluate + latex 的平均耗时，并检查两者结果一致、有多少输入被交给了SymPy。
+--with-constants 时t写成pi的倍数，这些输入都应该交给SymPy（见fastpath的说明）。
+
+    python benchmarks/fastpath_benchmark.py --count 500
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+APP_DIR = os.path.dirname(BENCHMARK_DIR)
+sys.path.insert(0, APP_DIR)
+
+import sympy as sp  # noqa: E402
+from sympy.parsing.sympy_parser import parse_expr  # noqa: E402
+
+import fastpath  # noqa: E402
+
+
+def random_expression(rng, with_constants):
+    a, b, c, d = (round(rng.uniform(-100, 100), rng.randint(0, 4)) for _ in range(4))
+    t = f"{rng.randint(1, 11)}*pi/{rng.randint(2, 12)}" if with_constants else round(rng.uniform(-10, 10), 3)
+    return f"{a}+{b}*{c}/{d or 1}-sin({t})"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="数值快速路径基准测试")
+    parser.add_argument("--count", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--with-constants", action="store_true")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    texts = [random_expression(rng, args.with_constants) for _ in range(args.count)]
+
+    started = time.perf_counter()
+    reference = [parse_expr(text).evalf(fastpath.FLOAT_DIGITS) for text in texts]
+    for value in reference:
+        sp.latex(value)
+    sympy_us = (time.perf_counter() - started) / len(texts) * 1e6
+
+    fastpath.compile_expression.cache_clear()
+    fallbacks = 0
+    started = time.perf_counter()
+    results = []
+    for text in texts:
+        try:
+            value = fastpath.evaluate(text)
+        except fastpath.NotNumeric:
+            fallbacks += 1
+            value = parse_expr(text).evalf(fastpath.FLOAT_DIGITS)
+        sp.latex(value)
+        results.append(value)
+    fast_us = (time.perf_counter() - started) / len(texts) * 1e6
+
+    mismatches = [text for text, value, expected in zip(texts, results, reference) if str(value) != str(expected)]
+    print(f"inputs: {len(texts)}, sent to SymPy: {fallbacks}, mismatches: {len(mismatches)}")
+    print(f"sympy: {sympy_us:.0f} us/expr, fastpath: {fast_us:.0f} us/expr ({sympy_us / fast_us:.1f}x)")
+    for text in mismatches[:10]:
+        print(f"  mismatch: {text}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,119 @@
+"""启动时间基准测试
+
+多次启动 launcher.py（设置KALCULATE_STARTUP_BENCHMARK，窗口显示后立即退出），统计：
+  - wall_ms:   从启动Python进程到窗口显示的总时间（包含解释器启动）
+  - splash_ms / import_ms / window_ms: 进程内从launcher开始计时到各阶段完成的时间
+可选 --importtime 用 python -X importtime 列出累计耗时最多的导入。
+结果追加到 startup_history.jsonl，便于比较不同版本。
+
+    python benchmarks/startup_benchmark.py --runs 5 --renderer mathtext --offscreen
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+APP_DIR = os.path.dirname(BENCHMARK_DIR)
+LAUNCHER = os.path.join(APP_DIR, "launcher.py")
+HISTORY_FILE = os.path.join(BENCHMARK_DIR, "startup_history.jsonl")
+
+
+def run_once(app, renderer, env, extra_args=()):
+    """启动一次，返回 (总耗时毫秒, 进程内计时, stderr)"""
+    command = [sys.executable, *extra_args, LAUNCHER, app, f"--renderer={renderer}"]
+    started = time.perf_counter()
+    process = subprocess.run(command, cwd=APP_DIR, env=env, capture_output=True, text=True)
+    wall_ms = (time.perf_counter() - started) * 1000
+    if process.returncode != 0:
+        raise RuntimeError(f"启动失败:\n{process.stderr}")
+
+    timings = None
+    for line in process.stdout.splitlines():
+        if line.startswith("{"):
+            timings = json.loads(line)
+    if timings is None:
+        raise RuntimeError(f"没有读到启动耗时:\n{process.stdout}\n{process.stderr}")
+    return wall_ms, timings, process.stderr
+
+
+def top_imports(stderr, count=15):
+    """解析 -X importtime 的输出，返回累计耗时最多的模块"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        parts = line[len("import time:"):].split("|")
+        try:
+            cumulative = int(parts[1])
+        except ValueError:
+            continue
+        rows.append((cumulative, parts[2].strip()))
+    rows.sort(reverse=True)
+    return [{"module": name, "cumulative_ms": round(us / 1000, 1)} for us, name in rows[:count]]
+
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=APP_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Kalculate启动时间基准测试")
+    parser.add_argument("--app", default="Kalculate", choices=["Kalculate", "NewKalculate", "NewCalculator"])
+    parser.add_argument("--renderer", default="mathtext", choices=["mathjax", "mathtext"])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--offscreen", action="store_true", help="不显示窗口（QT_QPA_PLATFORM=offscreen）")
+    parser.add_argument("--importtime", action="store_true", help="额外运行一次 -X importtime")
+    parser.add_argument("--no-history", action="store_true", help="不写入startup_history.jsonl")
+    args = parser.parse_args(argv)
+
+    env = dict(os.environ, KALCULATE_STARTUP_BENCHMARK="1")
+    if args.offscreen:
+        env["QT_QPA_PLATFORM"] = "offscreen"
+
+    # 第一次运行会生成.pyc等，不计入结果
+    run_once(args.app, args.renderer, env)
+    walls, windows = [], []
+    for _ in range(args.runs):
+        wall_ms, timings, _ = run_once(args.app, args.renderer, env)
+        walls.append(wall_ms)
+        windows.append(timings["window_ms"])
+        print(f"wall {wall_ms:7.1f} ms  splash {timings['splash_ms']:7.1f} ms  "
+              f"import {timings['import_ms']:7.1f} ms  window {timings['window_ms']:7.1f} ms")
+
+    record = {
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "app": args.app,
+        "renderer": args.renderer,
+        "runs": args.runs,
+        "wall_ms_median": round(statistics.median(walls), 1),
+        "wall_ms_min": round(min(walls), 1),
+        "window_ms_median": round(statistics.median(windows), 1),
+    }
+    if args.importtime:
+        _, _, stderr = run_once(args.app, args.renderer, env, extra_args=("-X", "importtime"))
+        record["top_imports"] = top_imports(stderr)
+        for item in record["top_imports"]:
+            print(f"{item['cumulative_ms']:9.1f} ms  {item['module']}")
+
+    print(f"中位数: 总耗时 {record['wall_ms_median']} ms，窗口显示 {record['window_ms_median']} ms")
+    if not args.no_history:
+        with open(HISTORY_FILE, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
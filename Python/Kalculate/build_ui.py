@@ -0,0 +1,41 @@
+"""从qtUI.ui生成ui_qtUI.py，修改qtUI.ui后需要重新运行
+
+    python build_ui.py
+
+生成的模块不直接导入QtWebEngineWidgets，而是由 latex_view.web_view_class() 决定webEngineView的类型，
+这样轻量（mathtext）模式下也可以使用预生成的界面。
+"""
+import os
+import shutil
+import subprocess
+import sys
+
+from ui_loader import UI_DIR, UI_FILE, ui_source_hash
+
+OUTPUT_FILE = os.path.join(UI_DIR, "ui_qtUI.py")
+WEB_ENGINE_IMPORT = "from PySide6.QtWebEngineWidgets import QWebEngineView\n"
+WEB_ENGINE_REPLACEMENT = ("from latex_view import web_view_class\n"
+                          "QWebEngineView = web_view_class()\n")
+
+
+def main():
+    uic = shutil.which("pyside6-uic")
+    if uic is None:
+        print("找不到pyside6-uic，请先安装PySide6", file=sys.stderr)
+        return 1
+    code = subprocess.run([uic, UI_FILE], check=True, capture_output=True, text=True).stdout
+
+    if WEB_ENGINE_IMPORT not in code:
+        print("生成的代码中没有找到QWebEngineView的导入", file=sys.stderr)
+        return 1
+    code = code.replace(WEB_ENGINE_IMPORT, WEB_ENGINE_REPLACEMENT)
+    code += f"\n\nUI_SOURCE_SHA256 = \"{ui_source_hash()}\"\n"
+
+    with open(OUTPUT_FILE, "w", encoding="utf-8", newline="\r\n") as f:
+        f.write(code)
+    print(f"已生成 {OUTPUT_FILE}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,387 @@
+"""三个计算器窗口（Kalculate、NewKalculate、NewCalculator）共用的功能
+
+CalculatorMixin 提供后台计算（结果缓存、竞速、预热）、统计数据集（导入、汇总统计、百分位数、
+出现次数最多的数值）、数值表和定积分结果的格式化。各窗口的 CalculatorApp 继承
+CalculatorMixin 和 QMainWindow，并提供 ui、renderer、expression_input、add_to_history 等。
+"""
+import os
+import time
+
+import sympy as sp
+from PySide6.QtCore import Qt, QSettings
+from PySide6.QtWidgets import QApplication, QFileDialog, QInputDialog, QMessageBox, QPushButton
+
+import datasets
+import engine
+import frequencies
+import numeric_solve
+import quantiles
+import streaming_stats
+import tables
+from evaluator import EvaluationEngine
+from result_cache import ResultCache
+from table_view import TableDialog
+
+
+class CalculatorMixin:
+    """计算器窗口共用的方法"""
+
+    # 定积分结果的前缀（精确值, 近似值）
+    DEFINITE_LABELS = ("精确值", "近似值")
+
+    def parse_expression(self, text, local_dict):
+        """解析表达式，所有操作共享同一个解析缓存"""
+        return self.parse_cache.parse(text, local_dict, self.transformations, self.angle_mode)
+
+    def setup_evaluator(self):
+        """初始化后台计算引擎、状态栏和取消按钮"""
+        self.evaluator = EvaluationEngine(self)
+        self.pending_job = None
+
+        self.cancel_button = QPushButton("取消计算")
+        self.cancel_button.setVisible(False)
+        self.cancel_button.clicked.connect(self.evaluator.cancel)
+        self.statusBar().addPermanentWidget(self.cancel_button)
+
+        self.evaluator.statusChanged.connect(self.statusBar().showMessage)
+        self.evaluator.busyChanged.connect(self.cancel_button.setVisible)
+        self.evaluator.resultReady.connect(self.on_job_finished)
+        self.evaluator.errorOccurred.connect(self.on_job_failed)
+
+        # 持久化结果缓存，可在Options菜单中关闭
+        self.settings = QSettings("RSRepository", "Kalculate")
+        cache_enabled = self.settings.value("result_cache/enabled", True, type=bool)
+        self.result_cache = ResultCache(enabled=cache_enabled)
+        if hasattr(self.ui, "menuOptions"):
+            cache_action = self.ui.menuOptions.addAction("缓存计算结果")
+            cache_action.setCheckable(True)
+            cache_action.setChecked(cache_enabled)
+            cache_action.toggled.connect(self.set_result_cache_enabled)
+
+            # 轻量公式显示不加载QtWebEngine，重启后生效
+            renderer_action = self.ui.menuOptions.addAction("轻量公式显示（重启后生效）")
+            renderer_action.setCheckable(True)
+            renderer_action.setChecked(self.renderer == "mathtext")
+            renderer_action.toggled.connect(self.set_lightweight_renderer)
+
+            # 精确分位数需要把数据整体排序（partition），关闭后使用KLL草图
+            exact_action = self.ui.menuOptions.addAction("精确分位数")
+            exact_action.setCheckable(True)
+            exact_action.setChecked(self.settings.value("stats/exact_quantiles", True, type=bool))
+            exact_action.toggled.connect(lambda checked: self.settings.setValue("stats/exact_quantiles", checked))
+
+    def set_lightweight_renderer(self, enabled):
+        """保存下次启动使用的公式渲染方式"""
+        self.settings.setValue("display/renderer", "mathtext" if enabled else "mathjax")
+
+    def set_result_cache_enabled(self, enabled):
+        """开启或关闭持久化结果缓存"""
+        self.result_cache.enabled = enabled
+        self.settings.setValue("result_cache/enabled", enabled)
+
+    def run_in_background(self, title, callback, func, *args, timeout=None):
+        """在后台进程中执行耗时计算，完成后在界面线程中调用callback(result)"""
+        # 之前算过的结果直接从缓存中取出
+        found, result = self.result_cache.get(func, args)
+        if found:
+            self.evaluator.cancel()
+            self.pending_job = None
+            self.statusBar().showMessage(f"完成: {title} (缓存)")
+            try:
+                callback(result)
+            except Exception as e:
+                QMessageBox.critical(self, f"{title}错误", f"错误: {str(e)}")
+            return
+
+        request_id = self.evaluator.submit(func, *args, title=title, timeout=timeout)
+        self.pending_job = (request_id, title, callback, func, args)
+
+    def run_race(self, title, callback, calls, timeout=None):
+        """同时执行几种算法（如符号解和数值解），先完成的胜出，完成后调用callback(胜出的下标, 结果)"""
+        # 缓存按calls的顺序查找，精确解优先
+        for index, (func, args) in enumerate(calls):
+            found, result = self.result_cache.get(func, args)
+            if found:
+                self.evaluator.cancel()
+                self.pending_job = None
+                self.statusBar().showMessage(f"完成: {title} (缓存)")
+                try:
+                    callback(index, result)
+                except Exception as e:
+                    QMessageBox.critical(self, f"{title}错误", f"错误: {str(e)}")
+                return
+
+        def finished(payload):
+            index, result = payload
+            func, args = calls[index]
+            self.result_cache.put(func, args, result)
+            callback(index, result)
+
+        request_id = self.evaluator.race(calls, title=title, timeout=timeout, hold=numeric_solve.SYMBOLIC_HEAD_START)
+        self.pending_job = (request_id, title, finished, None, None)
+
+    def on_job_finished(self, request_id, result):
+        """后台计算完成"""
+        if not self.pending_job or self.pending_job[0] != request_id:
+            return
+        _, title, callback, func, args = self.pending_job
+        self.pending_job = None
+        # 竞速的结果由run_race的回调按胜出的算法缓存
+        if func is not None:
+            self.result_cache.put(func, args, result)
+        try:
+            callback(result)
+        except Exception as e:
+            QMessageBox.critical(self, f"{title}错误", f"错误: {str(e)}")
+
+    def on_job_failed(self, request_id, message):
+        """后台计算出错或超时"""
+        if not self.pending_job or self.pending_job[0] != request_id:
+            return
+        title = self.pending_job[1]
+        self.pending_job = None
+        QMessageBox.critical(self, f"{title}错误", f"错误: {message}")
+
+    def closeEvent(self, event):
+        """关闭窗口时结束后台进程"""
+        self.evaluator.shutdown()
+        self.result_cache.close()
+        super().closeEvent(event)
+
+    def warm_up_tasks(self):
+        """窗口显示后在空闲时依次执行的预热任务"""
+        tasks = [
+            lambda: self.evaluator.warm_up(engine.warm_up),
+            lambda: self.parse_expression("x + 1", {'x': self.x}),
+        ]
+        if hasattr(self.latex_view, "warm_up"):
+            tasks.append(self.latex_view.warm_up)
+        return tasks
+
+    def current_dataset(self):
+        """返回当前统计数据集，只有输入框内容变化时才重新解析；导入的文件数据保留到输入框被修改为止"""
+        stats_input = getattr(self, "stats_input", None)
+        text = stats_input.text() if stats_input is not None else ""
+        if self.dataset is not None and (stats_input is None or text == self.dataset.text):
+            return self.dataset
+        if not text.strip():
+            return None
+        self.dataset = datasets.from_text(text)
+        return self.dataset
+
+    def choose_data_column(self, file_path):
+        """多列数据文件让用户选择要统计的列，返回 (是否确定, 列号)"""
+        names = datasets.column_names(file_path)
+        if len(names) <= 1:
+            return True, None
+        name, ok = QInputDialog.getItem(self, "选择数据列", "选择数据列:", names, 0, False)
+        return ok, (names.index(name) if ok else None)
+
+    def choose_data_file(self, title):
+        """选择要逐块统计的数据文件，返回 (文件路径, 列号)，取消时返回None"""
+        file_path, _ = QFileDialog.getOpenFileName(self, title, "", datasets.FILE_FILTER)
+        if not file_path:
+            return None
+        ok, column = self.choose_data_column(file_path)
+        return (file_path, column) if ok else None
+
+    def import_dataset(self):
+        """导入统计数据文件（CSV/TSV/空白分隔文本或.npy），导入后各统计按钮直接使用已解析的数据"""
+        file_path, _ = QFileDialog.getOpenFileName(
+            self, "导入数据", "", datasets.FILE_FILTER
+        )
+        if not file_path:
+            return
+        try:
+            # 多列文件先选择要统计的列
+            ok, column = self.choose_data_column(file_path)
+            if not ok:
+                return
+
+            self.statusBar().showMessage(f"正在导入: {file_path}")
+            QApplication.setOverrideCursor(Qt.WaitCursor)
+            try:
+                dataset = datasets.load_dataset(file_path, column)
+            finally:
+                QApplication.restoreOverrideCursor()
+            if dataset.count == 0:
+                QMessageBox.warning(self, "导入错误", "文件中没有数据")
+                return
+
+            # 输入框显示数据集的描述，内容不变时不会重新解析
+            dataset.text = dataset.label
+            self.dataset = dataset
+            if getattr(self, "stats_input", None) is not None:
+                self.stats_input.setText(dataset.text)
+            self.statusBar().showMessage(f"已导入 {dataset.label}")
+        except Exception as e:
+            QMessageBox.critical(self, "导入错误", f"错误: {str(e)}")
+
+    def calculate_summary(self):
+        """汇总统计（单次遍历）；没有数据时可以选择文件，在后台逐块统计而不载入内存"""
+        try:
+            dataset = self.current_dataset()
+            if dataset is not None:
+                self.show_summary(dataset.label, dataset.summary())
+                return
+
+            chosen = self.choose_data_file("汇总统计")
+            if chosen is None:
+                return
+            file_path, column = chosen
+
+            # 大文件可能需要较长时间，超时时间可通过QSettings的stats/file_timeout修改
+            timeout = self.settings.value("stats/file_timeout", 3600, type=int)
+            label = os.path.basename(file_path)
+            self.run_in_background("汇总统计", lambda stats: self.show_summary(label, stats),
+                                   streaming_stats.summarize_file, file_path, column,
+                                   os.stat(file_path).st_mtime_ns, timeout=timeout)
+        except Exception as e:
+            QMessageBox.critical(self, "汇总统计错误", f"错误: {str(e)}")
+
+    def show_summary(self, label, stats):
+        """显示汇总统计结果"""
+        result = f"Summary({label}): n={stats.count}, x̅={stats.mean:.10g}, σ={stats.std:.10g}"
+        self.current_expression = result
+        self.expression_input.setText(result)
+        self.add_to_history(result)
+        QMessageBox.information(self, "汇总统计", streaming_stats.format_summary(stats))
+
+    def dataset_quantiles(self, dataset, qs):
+        """按设置计算精确分位数或近似分位数（KLL草图），返回 (分位数列表, 近似误差或None)"""
+        exact = self.settings.value("stats/exact_quantiles", True, type=bool)
+        epsilon = self.settings.value("stats/quantile_error", quantiles.DEFAULT_EPSILON, type=float)
+        return dataset.quantiles(qs, exact, epsilon)
+
+    def calculate_quantiles(self):
+        """百分位数（默认p50/p90/p99）和四分位距；没有数据时可以选择文件，在后台边读取边构建草图"""
+        try:
+            text, ok = QInputDialog.getText(self, "百分位数", "百分位数（逗号分隔）:", text="50, 90, 99")
+            if not ok:
+                return
+            qs = quantiles.parse_percentiles(text)
+
+            # 最后两项用于计算四分位距
+            dataset = self.current_dataset()
+            if dataset is not None:
+                values, error = self.dataset_quantiles(dataset, qs + [0.25, 0.75])
+                self.show_quantiles(dataset.label, qs, values, error)
+                return
+
+            chosen = self.choose_data_file("百分位数")
+            if chosen is None:
+                return
+            file_path, column = chosen
+            epsilon = self.settings.value("stats/quantile_error", quantiles.DEFAULT_EPSILON, type=float)
+            timeout = self.settings.value("stats/file_timeout", 3600, type=int)
+            label = os.path.basename(file_path)
+            self.run_in_background(
+                "百分位数",
+                lambda sketch: self.show_quantiles(label, qs, sketch.quantiles(qs + [0.25, 0.75]), sketch.epsilon),
+                quantiles.sketch_file, file_path, column, epsilon, os.stat(file_path).st_mtime_ns, timeout=timeout)
+        except Exception as e:
+            QMessageBox.critical(self, "百分位数错误", f"错误: {str(e)}")
+
+    def show_quantiles(self, label, qs, values, error):
+        """显示百分位数和四分位距，values的最后两项为p25和p75"""
+        iqr = values[-1] - values[-2]
+        items = ", ".join(f"p{q * 100:g}={value:.10g}" for q, value in zip(qs, values))
+        result = f"Quantiles({label}): {items}, IQR={iqr:.10g}"
+        self.current_expression = result
+        self.expression_input.setText(result)
+        self.add_to_history(result)
+        QMessageBox.information(self, "百分位数",
+                                quantiles.format_quantiles(qs, values[:-2], error) + f"\n四分位距: {iqr:.10g}")
+
+    def dataset_frequencies(self, dataset):
+        """按设置统计出现次数：不同数值不超过stats/max_exact_distinct个时精确计数，否则为近似的top-k"""
+        max_exact = self.settings.value("stats/max_exact_distinct", frequencies.MAX_EXACT, type=int)
+        capacity = self.settings.value("stats/heavy_hitters", frequencies.DEFAULT_CAPACITY, type=int)
+        return dataset.frequencies(max_exact, capacity)
+
+    def calculate_top_k(self):
+        """出现次数最多的k个数值及其计数；没有数据时可以选择文件，在后台逐块统计"""
+        try:
+            k, ok = QInputDialog.getInt(self, "出现次数最多的数值", "显示前几个:", 10, 1, 1000)
+            if not ok:
+                return
+
+            dataset = self.current_dataset()
+            if dataset is not None:
+                self.show_top_k(dataset.label, self.dataset_frequencies(dataset), k)
+                return
+
+            chosen = self.choose_data_file("出现次数最多的数值")
+            if chosen is None:
+                return
+            file_path, column = chosen
+            max_exact = self.settings.value("stats/max_exact_distinct", frequencies.MAX_EXACT, type=int)
+            capacity = self.settings.value("stats/heavy_hitters", frequencies.DEFAULT_CAPACITY, type=int)
+            timeout = self.settings.value("stats/file_timeout", 3600, type=int)
+            label = os.path.basename(file_path)
+            self.run_in_background("出现次数最多的数值", lambda counter: self.show_top_k(label, counter, k),
+                                   frequencies.count_file, file_path, column, max_exact, capacity,
+                                   os.stat(file_path).st_mtime_ns, timeout=timeout)
+        except Exception as e:
+            QMessageBox.critical(self, "Top-k错误", f"错误: {str(e)}")
+
+    def show_top_k(self, label, counter, k):
+        """显示出现次数最多的k个数值"""
+        top = counter.top_k(k)
+        items = ", ".join(f"{value:.10g}×{count}" for value, count, _ in top)
+        result = f"Top{k}({label}): {items}"
+        self.current_expression = result
+        self.expression_input.setText(result)
+        self.add_to_history(result)
+        QMessageBox.information(self, "出现次数最多的数值",
+                                frequencies.format_top_k(top, counter.total, counter.error_bound()))
+
+    def show_table(self):
+        """Table模式：表达式只编译一次，对各变量的取值范围（或导入的数据列）向量化计算，结果显示在表格中"""
+        try:
+            text = engine.normalize(self.current_expression)
+            if not text:
+                QMessageBox.warning(self, "输入错误", "请先输入表达式")
+                return
+            expr = self.parse_expression(engine.apply_angle_mode(text, self.angle_mode), self.table_symbols())
+            names = [symbol.name for symbol in tables.free_variables(expr)]
+            if not names:
+                raise ValueError("表达式中没有变量")
+
+            # 多个变量时计算所有组合（网格），data表示导入的数据列
+            specs = {}
+            for name in names:
+                default = self.settings.value(f"table/{name}", "-10:10:0.01")
+                spec, ok = QInputDialog.getText(
+                    self, "Table", f"{name} 的取值（start:stop:step、start:stop:n=点数、数值列表或data）:", text=default
+                )
+                if not ok:
+                    return
+                specs[name] = spec
+                self.settings.setValue(f"table/{name}", spec)
+
+            dataset = self.current_dataset()
+            started = time.perf_counter()
+            table = tables.sweep(expr, specs, dataset.values if dataset is not None else None)
+            elapsed = time.perf_counter() - started
+
+            self.table_dialog = TableDialog(table, f"Table: {text}", self)
+            self.table_dialog.show()
+            self.statusBar().showMessage(f"Table: {table.rows}行 ({elapsed * 1000:.0f} ms)")
+        except Exception as e:
+            QMessageBox.critical(self, "Table错误", f"错误: {str(e)}")
+
+    def table_symbols(self):
+        """数值表的表达式中可以使用的变量（窗口定义的x、y、z）"""
+        return {name: getattr(self, name) for name in ("x", "y", "z") if hasattr(self, name)}
+
+    def format_definite_integral(self, integral_text, index, value):
+        """定积分竞速的结果：符号积分（下标0）是精确值，数值积分给出误差估计"""
+        exact_label, approximate_label = self.DEFINITE_LABELS
+        if index == 0:
+            # 精确值是数字时附上它的数值
+            numeric = sp.N(value)
+            show_numeric = numeric.is_Float and not value.is_Integer and numeric != value
+            approximation = f" ≈ {numeric}" if show_numeric else ""
+            return f"{exact_label}: {integral_text} = {value}{approximation}"
+        return f"{approximate_label}: {integral_text} ≈ {value[0]:.15g} ± {value[1]:.1e}"
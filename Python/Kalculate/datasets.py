@@ -0,0 +1,213 @@
+"""统计数据集的加载（不依赖Qt）
+
+数据只解析一次，保存为一维float64数组，之后各个统计按钮都直接使用这个数组。
+文本文件（CSV/TSV/空白分隔）按块读取，逐块转换后追加到按倍数增长的numpy缓冲区，不会产生百万级的Python列表；
+.npy文件以内存映射方式打开，不读入内存。
+"""
+import itertools
+import os
+
+import numpy as np
+
+from frequencies import DEFAULT_CAPACITY, MAX_EXACT, FrequencyCounter
+from quantiles import DEFAULT_EPSILON, EXACT_LIMIT, KLLSketch, exact_quantiles, k_for_epsilon
+from streaming_stats import RunningStats
+
+TEXT_EXTENSIONS = (".csv", ".tsv", ".txt", ".dat")
+CHUNK_LINES = 100000
+FILE_FILTER = "数据文件 (*.csv *.tsv *.txt *.dat *.npy);;所有文件 (*)"
+
+
+class Dataset:
+    """一组数值数据
+
+    values 为一维float64数组（.npy文件为只读内存映射），source 为来源（文件路径或"输入"），
+    text 为生成该数据集的输入框内容，用于判断输入是否变化。
+    """
+
+    def __init__(self, values, source="输入", text=None):
+        self.values = values
+        self.source = source
+        self.text = text
+        self._summary = None
+        self._sketch = None
+        self._frequencies = None
+
+    @property
+    def count(self):
+        return int(self.values.size)
+
+    @property
+    def label(self):
+        """用于显示的简短描述"""
+        if self.text is not None and len(self.text) <= 60 and self.source == "输入":
+            return self.text
+        return f"{os.path.basename(self.source)}: {self.count} 个数据"
+
+    def summary(self):
+        """单次遍历得到的汇总统计量（RunningStats），第一次使用时计算并缓存"""
+        if self._summary is None:
+            self._summary = RunningStats.from_array(self.values)
+        return self._summary
+
+    def quantile_sketch(self, epsilon=DEFAULT_EPSILON):
+        """KLL分位数草图，第一次使用时构建并缓存（精度改变时重新构建）"""
+        if self._sketch is None or self._sketch.k != k_for_epsilon(epsilon):
+            self._sketch = KLLSketch.from_array(self.values, epsilon)
+        return self._sketch
+
+    def quantiles(self, qs, exact=True, epsilon=DEFAULT_EPSILON):
+        """分位数，返回 (结果列表, 近似误差)
+
+        exact为True且数据量不超过EXACT_LIMIT时计算精确值（近似误差为None），否则查询KLL草图。
+        """
+        if exact and self.count <= EXACT_LIMIT:
+            return exact_quantiles(self.values, qs), None
+        sketch = self.quantile_sketch(epsilon)
+        return sketch.quantiles(qs), sketch.epsilon
+
+    def frequencies(self, max_exact=MAX_EXACT, capacity=DEFAULT_CAPACITY):
+        """各数值的出现次数（FrequencyCounter），第一次使用时统计并缓存（参数改变时重新统计）"""
+        counter = self._frequencies
+        if counter is None or (counter.max_exact, counter.capacity) != (max_exact, capacity):
+            self._frequencies = FrequencyCounter.from_array(self.values, max_exact=max_exact, capacity=capacity)
+        return self._frequencies
+
+
+class GrowableBuffer:
+    """容量按倍数增长的一维float64缓冲区"""
+
+    def __init__(self, capacity=1024):
+        self.data = np.empty(capacity, dtype=float)
+        self.size = 0
+
+    def append(self, chunk):
+        needed = self.size + chunk.size
+        if needed > self.data.size:
+            capacity = max(needed, self.data.size * 2)
+            data = np.empty(capacity, dtype=float)
+            data[:self.size] = self.data[:self.size]
+            self.data = data
+        self.data[self.size:needed] = chunk
+        self.size = needed
+
+    def array(self):
+        """返回实际数据（多余的容量被释放）"""
+        return self.data[:self.size].copy()
+
+
+def parse_text(text):
+    """把 "1, 2, 3" 或 "1 2 3" 形式的数据解析为数组"""
+    items = text.replace(',', ' ').replace(';', ' ').split()
+    return np.array(items, dtype=float)
+
+
+def from_text(text):
+    """由输入框内容创建数据集"""
+    return Dataset(parse_text(text), "输入", text)
+
+
+def detect_delimiter(line):
+    """根据第一行判断分隔符，None表示空白分隔"""
+    if '\t' in line:
+        return '\t'
+    if ',' in line:
+        return ','
+    if ';' in line:
+        return ';'
+    return None
+
+
+def is_header(line, delimiter):
+    """第一行中有不是数值的字段时视为表头"""
+    for field in line.split(delimiter):
+        field = field.strip()
+        if not field:
+            continue
+        try:
+            float(field)
+        except ValueError:
+            return True
+    return False
+
+
+def column_names(path):
+    """返回数据文件各列的名称（没有表头时为"第1列"等），单列文件返回只有一项的列表"""
+    if path.lower().endswith(".npy"):
+        shape = np.load(path, mmap_mode="r").shape
+        count = shape[1] if len(shape) == 2 else 1
+        return [f"第{i + 1}列" for i in range(count)]
+
+    with open(path, encoding="utf-8-sig") as f:
+        first = next((line for line in f if line.strip() and not line.lstrip().startswith('#')), "")
+    delimiter = detect_delimiter(first)
+    fields = [field.strip() for field in first.split(delimiter)]
+    if is_header(first, delimiter):
+        return [field or f"第{i + 1}列" for i, field in enumerate(fields)]
+    return [f"第{i + 1}列" for i in range(len(fields))]
+
+
+def iter_text_chunks(path, column=None, chunk_lines=CHUNK_LINES):
+    """按块读取文本数据文件，每次返回一个一维数组
+
+    column为None时读取文件中所有数值，否则只读取指定列（从0开始），没有这一列的行被跳过。第一行不是数值时视为表头跳过。
+    """
+    with open(path, encoding="utf-8-sig") as f:
+        lines = (line for line in f if line.strip() and not line.lstrip().startswith('#'))
+        first = next(lines, None)
+        if first is None:
+            return
+        delimiter = detect_delimiter(first)
+        if not is_header(first, delimiter):
+            lines = itertools.chain([first], lines)
+
+        while True:
+            block = list(itertools.islice(lines, chunk_lines))
+            if not block:
+                break
+            if column is None:
+                text = "".join(block)
+                if delimiter is not None:
+                    text = text.replace(delimiter, ' ')
+                yield np.array(text.split(), dtype=float)
+            else:
+                # 字段不够的行（参差不齐的行）与空字段一样视为缺失值跳过
+                rows = (line.split(delimiter) for line in block)
+                fields = [row[column].strip() for row in rows if len(row) > column]
+                yield np.array([field for field in fields if field], dtype=float)
+
+
+def iter_chunks(path, column=None, chunk_lines=CHUNK_LINES):
+    """按块返回任意支持格式的数据文件内容（.npy文件按内存映射分块）"""
+    if path.lower().endswith(".npy"):
+        values = load_npy(path, column)
+        for start in range(0, values.size, chunk_lines):
+            yield np.asarray(values[start:start + chunk_lines], dtype=float)
+        return
+    yield from iter_text_chunks(path, column, chunk_lines)
+
+
+def load_npy(path, column=None):
+    """以内存映射方式打开.npy文件，返回一维数组"""
+    values = np.load(path, mmap_mode="r")
+    if values.ndim > 1:
+        values = values[:, column] if column is not None else values.reshape(-1)
+    if values.dtype != np.float64:
+        values = values.astype(float)
+    return values
+
+
+def load_dataset(path, column=None, chunk_lines=CHUNK_LINES):
+    """加载数据文件为数据集"""
+    if path.lower().endswith(".npy"):
+        return Dataset(load_npy(path, column), path)
+
+    # 读取的同时累加汇总统计量，之后不需要再遍历一次
+    buffer = GrowableBuffer()
+    summary = RunningStats()
+    for chunk in iter_text_chunks(path, column, chunk_lines):
+        buffer.append(chunk)
+        summary.update(chunk)
+    dataset = Dataset(buffer.array(), path)
+    dataset._summary = summary
+    return dataset
@@ -0,0 +1,311 @@
+"""不依赖界面的计算引擎
+
+既可以在界面中直接调用或交给后台进程（函数都可以被序列化到子进程），也可以在服务器上批量使用（见batch.py）。
+各函数既接受SymPy表达式，也接受表达式字符串；字符串按计算器的输入规则解析（隐式乘法、×÷、角度制）。
+"""
+import ast
+import math
+
+import numpy as np
+import sympy as sp
+from sympy.parsing.sympy_parser import standard_transformations, implicit_multiplication_application
+
+import numeric_solve
+import quadrature
+from frequencies import FrequencyCounter
+from parse_cache import ParseCache
+
+TRANSFORMATIONS = standard_transformations + (implicit_multiplication_application,)
+
+x, y, z = sp.symbols('x y z')
+DEFAULT_LOCALS = {'x': x, 'y': y, 'z': z, 'pi': sp.pi, 'E': sp.E, 'I': sp.I}
+
+# 每个进程一个解析缓存
+_parse_cache = ParseCache(maxsize=256)
+
+
+def normalize(text):
+    """去掉末尾的等号，并把显示符号替换为SymPy可识别的符号"""
+    text = text.strip()
+    if text.endswith('='):
+        text = text[:-1].strip()
+    return text.replace('×', '*').replace('÷', '/').replace('^', '**')
+
+
+def apply_angle_mode(text, angle_mode):
+    """角度制下把三角函数的参数从角度换算为弧度，反三角函数的结果换算为角度"""
+    if angle_mode != "DEG":
+        return text
+    # 先处理反三角函数，避免asin(中的sin(被重复替换
+    for func in ('asin', 'acos', 'atan'):
+        text = text.replace(f'{func}(', f'(180/pi)*{func.upper()}(')
+    for func in ('sin', 'cos', 'tan'):
+        text = text.replace(f'{func}(', f'{func}(pi/180*')
+    for func in ('asin', 'acos', 'atan'):
+        text = text.replace(f'{func.upper()}(', f'{func}(')
+    return text
+
+
+def parse(text, angle_mode="RAD", local_dict=None):
+    """把计算器输入解析为SymPy表达式；含一个等号时解析为方程"""
+    text = apply_angle_mode(normalize(text), angle_mode)
+    local_dict = local_dict or DEFAULT_LOCALS
+    if text.count('=') == 1:
+        left, right = text.split('=')
+        return sp.Eq(_parse_cache.parse(left, local_dict, TRANSFORMATIONS, angle_mode),
+                     _parse_cache.parse(right, local_dict, TRANSFORMATIONS, angle_mode))
+    return _parse_cache.parse(text, local_dict, TRANSFORMATIONS, angle_mode)
+
+
+def _expr(value, angle_mode="RAD"):
+    if isinstance(value, str):
+        return parse(value, angle_mode)
+    return sp.sympify(value)
+
+
+def _symbol(value):
+    if value is None:
+        return x
+    if isinstance(value, str):
+        return DEFAULT_LOCALS.get(value) or sp.Symbol(value)
+    return value
+
+
+def evaluate(expr, angle_mode="RAD", digits=15):
+    """数值求值，保留digits位有效数字"""
+    return _expr(expr, angle_mode).evalf(digits)
+
+
+def simplify(expr, angle_mode="RAD"):
+    """化简（不求数值）"""
+    return sp.simplify(_expr(expr, angle_mode))
+
+
+def apply_operation(operation, expr):
+    """应用SymPy操作，如factor、expand、simplify等"""
+    return operation(_expr(expr))
+
+
+def solve(expr, var=None):
+    """解方程，表达式不是方程时视为 expr = 0"""
+    return sp.solve(_expr(expr), _symbol(var))
+
+
+def solve_exact(expr, var=None):
+    """符号解方程；只能得到CRootOf（没有根式解）时抛出异常，与数值解竞速时让数值解胜出"""
+    solutions = solve(expr, var)
+    if any(sp.sympify(solution).has(sp.CRootOf) for solution in solutions):
+        raise ValueError("没有根式解")
+    return solutions
+
+
+def roots(expr, var=None):
+    """多项式的根及重数；找不到全部的根（如五次以上的一般多项式）时抛出异常"""
+    expr = _expr(expr)
+    if isinstance(expr, sp.Eq):
+        expr = expr.lhs - expr.rhs
+    poly = sp.Poly(expr, _symbol(var))
+    found = sp.roots(poly)
+    if sum(found.values()) < poly.degree():
+        raise ValueError("找不到全部的根")
+    return found
+
+
+def nsolve(expr, var=None):
+    """数值解方程（见numeric_solve）"""
+    return numeric_solve.solve(_expr(expr), _symbol(var))
+
+
+def diff(expr, var=None, order=1):
+    """求导"""
+    return sp.diff(_expr(expr), _symbol(var), int(order))
+
+
+def integrate(expr, var=None, lower=None, upper=None):
+    """积分，给出上下限时为定积分"""
+    var = _symbol(var)
+    if lower is None or upper is None:
+        return sp.integrate(_expr(expr), var)
+    return sp.integrate(_expr(expr), (var, _expr(lower), _expr(upper)))
+
+
+def integrate_exact(expr, var=None, lower=None, upper=None):
+    """符号积分；结果中还有算不出的积分时抛出异常，与数值积分竞速时让数值积分胜出"""
+    return _closed_form(integrate(expr, var, lower, upper))
+
+
+def nintegrate(expr, var=None, lower=0, upper=1):
+    """数值定积分（见quadrature），返回 (积分值, 误差估计)"""
+    return quadrature.integrate(_expr(expr), _symbol(var), _expr(lower), _expr(upper))
+
+
+def double_integrate(expr, var1, var2, limits1=None, limits2=None):
+    """二重积分，先对var1积分再对var2积分；给出积分限 (下限, 上限) 时为定积分，var1的积分限可以含var2"""
+    var1, var2 = _symbol(var1), _symbol(var2)
+    if limits1 is None or limits2 is None:
+        return sp.integrate(sp.integrate(_expr(expr), var1), var2)
+    return sp.integrate(_expr(expr), (var1, *map(_expr, limits1)), (var2, *map(_expr, limits2)))
+
+
+def double_integrate_exact(expr, var1, var2, limits1=None, limits2=None):
+    """符号二重积分；算不出时抛出异常"""
+    return _closed_form(double_integrate(expr, var1, var2, limits1, limits2))
+
+
+def ndouble_integrate(expr, var1, var2, limits1, limits2):
+    """数值二重定积分（见quadrature），返回 (积分值, 误差估计)"""
+    return quadrature.double_integrate(_expr(expr), _symbol(var1), *map(_expr, limits1),
+                                       _symbol(var2), *map(_expr, limits2))
+
+
+def _closed_form(result):
+    if result.has(sp.Integral) or result.has(sp.nan):
+        raise ValueError("找不到闭合形式")
+    return result
+
+
+def split_limits(text):
+    """把 "a, b" 形式的积分限分为上下限的文本，∞可以写作oo或∞；text为空时返回None（不定积分）"""
+    text = text.strip()
+    if not text:
+        return None
+    parts = [part.strip().replace('∞', 'oo') for part in text.split(',')]
+    if len(parts) != 2 or not all(parts):
+        raise ValueError("积分限的格式为: 下限, 上限")
+    return parts
+
+
+def limit(expr, var, point, direction="+"):
+    """极限"""
+    return sp.limit(_expr(expr), _symbol(var), _expr(point), direction)
+
+
+def taylor_series(expr, var, point, order):
+    """泰勒展开（去掉余项）"""
+    return sp.series(_expr(expr), _symbol(var), _expr(point), int(order)).removeO()
+
+
+def series(expr, var=None, point=0, order=6):
+    """泰勒展开，参数带默认值的版本"""
+    return taylor_series(expr, var, point, order)
+
+
+def parse_numbers(data):
+    """把 "1, 2, 3" 或 "1 2 3" 形式的数据解析为浮点数数组"""
+    if isinstance(data, str):
+        return np.array(data.replace(',', ' ').split(), dtype=float)
+    return np.asarray(data, dtype=float)
+
+
+def statistic(name, data):
+    """计算一个统计量：mean、median、mode、std、variance、min、max、sum、count、gcd、lcm"""
+    values = parse_numbers(data)
+    if values.size == 0:
+        raise ValueError("没有数据")
+
+    if name == "mean":
+        return float(np.mean(values))
+    if name == "median":
+        return float(np.median(values))
+    if name == "mode":
+        return FrequencyCounter.from_array(values, max_exact=math.inf).mode()
+    if name == "std":
+        return float(np.std(values))
+    if name == "variance":
+        return float(np.var(values))
+    if name == "min":
+        return float(np.min(values))
+    if name == "max":
+        return float(np.max(values))
+    if name == "sum":
+        return float(np.sum(values))
+    if name == "count":
+        return int(values.size)
+    if name in ("gcd", "lcm"):
+        integers = [int(value) for value in values.tolist()]
+        return math.gcd(*integers) if name == "gcd" else math.lcm(*integers)
+    raise ValueError(f"未知的统计量: {name}")
+
+
+def stats(data):
+    """常用统计量汇总"""
+    values = parse_numbers(data)
+    return {name: statistic(name, values)
+            for name in ("count", "mean", "median", "std", "variance", "min", "max")}
+
+
+def parse_matrix(text):
+    """解析 [[1, 2], [3, 4]] 形式的矩阵（只接受字面量，不执行代码）"""
+    if not isinstance(text, str):
+        return np.asarray(text, dtype=float)
+    return np.array(ast.literal_eval(text.strip()), dtype=float)
+
+
+def matrix(operation, *matrices):
+    """矩阵运算：add、multiply、det、inv、transpose、rank"""
+    arrays = [parse_matrix(item) for item in matrices]
+    if operation in ("add", "multiply"):
+        if len(arrays) != 2:
+            raise ValueError("需要两个矩阵")
+        return arrays[0] + arrays[1] if operation == "add" else arrays[0] @ arrays[1]
+    if len(arrays) != 1:
+        raise ValueError("需要一个矩阵")
+    mat = arrays[0]
+    if operation == "det":
+        return float(np.linalg.det(mat))
+    if operation == "inv":
+        return np.linalg.inv(mat)
+    if operation == "transpose":
+        return mat.T
+    if operation == "rank":
+        return int(np.linalg.matrix_rank(mat))
+    raise ValueError(f"未知的矩阵运算: {operation}")
+
+
+def warm_up():
+    """预热：导入SymPy并解析一次表达式，在工作进程启动后调用"""
+    parse("sin(x) + x**2")
+
+
+# 批量任务中可以使用的操作
+OPERATIONS = {
+    "evaluate": lambda task: evaluate(task["expr"], task.get("angle_mode", "RAD")),
+    "simplify": lambda task: simplify(task["expr"], task.get("angle_mode", "RAD")),
+    "solve": lambda task: solve(task["expr"], task.get("var")),
+    "nsolve": lambda task: nsolve(task["expr"], task.get("var")),
+    "diff": lambda task: diff(task["expr"], task.get("var"), task.get("order", 1)),
+    "integrate": lambda task: integrate(task["expr"], task.get("var"), task.get("lower"), task.get("upper")),
+    "nintegrate": lambda task: nintegrate(task["expr"], task.get("var"), task.get("lower", "0"), task.get("upper", "1")),
+    "limit": lambda task: limit(task["expr"], task.get("var"), task.get("point", "0"), task.get("direction", "+")),
+    "series": lambda task: series(task["expr"], task.get("var"), task.get("point", "0"), task.get("order", 6)),
+    "stats": lambda task: stats(task["data"]),
+    "statistic": lambda task: statistic(task["name"], task["data"]),
+    "matrix": lambda task: matrix(task["name"], *task["matrices"]),
+}
+
+
+def to_jsonable(value):
+    """把结果转换为可以写入JSON的形式"""
+    if isinstance(value, dict):
+        return {key: to_jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_jsonable(item) for item in value]
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, (bool, int, float, str)) or value is None:
+        return value
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
+
+
+def run(task):
+    """执行一个任务（字典，op为操作名），返回可以写入JSON的结果"""
+    op = task.get("op", "evaluate")
+    if op not in OPERATIONS:
+        raise ValueError(f"未知的操作: {op}")
+    result = OPERATIONS[op](task)
+    output = {"result": to_jsonable(result)}
+    if isinstance(result, sp.Basic):
+        output["latex"] = sp.latex(result)
+    return output
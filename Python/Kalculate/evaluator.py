@@ -0,0 +1,196 @@
+"""把 WorkerPool 接入Qt事件循环：在界面线程中轮询结果并通过信号通知界面"""
+import time
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from workers import ThreadTasks, WorkerPool
+
+
+class EvaluationEngine(QObject):
+    """后台计算引擎
+
+    同一时间只关心最新的一次请求：提交新请求时会取消尚未完成的旧请求，
+    旧请求即使已经算完也不会再发出结果信号。
+    race() 把同一个问题的几种算法（如符号解和数值解）同时交给不同的工作进程，先成功完成的胜出，其余的被取消。
+    submit_thread() 在后台线程中执行需要主进程中数据的计算（如矩阵工作区），取消时只丢弃结果。
+    """
+
+    resultReady = Signal(int, object)    # (请求编号, 结果)
+    errorOccurred = Signal(int, str)     # (请求编号, 错误信息)
+    statusChanged = Signal(str)          # 状态栏文字
+    busyChanged = Signal(bool)
+
+    def __init__(self, parent=None, workers=2, timeout=60.0, poll_interval=30):
+        super().__init__(parent)
+        self.pool = WorkerPool(size=workers, default_timeout=timeout)
+        self.threads = ThreadTasks()
+        self.latest_id = None
+        self.latest_title = ""
+        self.started_at = 0.0
+        self._last_reported = -1
+        # 竞速中的请求：{工作进程中的请求编号: 下标}
+        self.racing = None
+        self.race_hold_until = 0.0
+        self.race_held = None
+        self.race_errors = []
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(poll_interval)
+        self.timer.timeout.connect(self._poll)
+
+    @property
+    def busy(self):
+        return self.latest_id is not None
+
+    def submit(self, func, *args, title="", timeout=None, **kwargs):
+        """提交计算任务，返回请求编号"""
+        # 旧请求的结果不会再被展示，直接取消以释放工作进程；warm_up的任务不取消，否则要重新启动进程
+        self._cancel_current()
+        return self._start(self.pool.submit(func, *args, timeout=timeout, **kwargs), title)
+
+    def submit_thread(self, func, *args, title="", **kwargs):
+        """在后台线程中执行计算（没有超时），返回请求编号"""
+        self._cancel_current()
+        return self._start(self.threads.submit(func, *args, **kwargs), title)
+
+    def _start(self, request_id, title):
+        was_busy = self.busy
+        self.latest_id = request_id
+        self.latest_title = title
+        self.started_at = time.monotonic()
+        self._last_reported = -1
+
+        self.statusChanged.emit(f"正在计算: {title}")
+        if not was_busy:
+            self.busyChanged.emit(True)
+        if not self.timer.isActive():
+            self.timer.start()
+        return self.latest_id
+
+    def race(self, calls, title="", timeout=None, hold=0.0):
+        """同时执行多个计算，第一个成功完成的结果胜出，其余的被取消；返回请求编号
+
+        calls为 [(func, args), ...]，按优先级排列。开始后hold秒内只接受calls[0]的结果（例如让精确解优先），
+        之后谁先完成用谁。resultReady发出 (请求编号, (胜出的下标, 结果))，全部出错或超时才发出errorOccurred。
+        """
+        (func, args), others = calls[0], calls[1:]
+        request_id = self.submit(func, *args, title=title, timeout=timeout)
+        self.racing = {request_id: 0}
+        for index, (func, args) in enumerate(others, start=1):
+            self.racing[self.pool.submit(func, *args, timeout=timeout)] = index
+        self.race_hold_until = self.started_at + hold
+        self.race_held = None
+        self.race_errors = []
+        return request_id
+
+    def _race_event(self, request_id, status, payload):
+        """竞速中的一个计算完成、出错或超时"""
+        index = self.racing.pop(request_id)
+        if status == "done":
+            # 优先的计算都已结束（出错或超时）或者等待时间已过时直接胜出
+            if time.monotonic() >= self.race_hold_until or all(other > index for other in self.racing.values()):
+                self._race_won(index, payload)
+                return
+            # 优先的计算还在进行，先保留结果
+            if self.race_held is None or index < self.race_held[0]:
+                self.race_held = (index, payload)
+            return
+
+        self.race_errors.append(payload if status == "error" else "计算超时，已终止")
+        if self.race_held is not None and (index == 0 or not self.racing):
+            self._race_won(*self.race_held)
+        elif not self.racing:
+            title = self.latest_title
+            request_id = self.latest_id
+            self.racing = None
+            self._finish()
+            self.statusChanged.emit(f"出错: {title}")
+            self.errorOccurred.emit(request_id, "; ".join(self.race_errors))
+
+    def _race_won(self, index, payload):
+        for request_id in self.racing:
+            self.pool.cancel(request_id)
+        title = self.latest_title
+        request_id = self.latest_id
+        elapsed = time.monotonic() - self.started_at
+        self.racing = None
+        self._finish()
+        self.statusChanged.emit(f"完成: {title} ({elapsed:.2f}s)")
+        self.resultReady.emit(request_id, (index, payload))
+
+    def cancel(self):
+        """取消当前请求"""
+        if self.latest_id is None:
+            return
+        self._cancel_current()
+        self.statusChanged.emit(f"已取消: {self.latest_title}")
+        self._finish()
+
+    def _cancel_current(self):
+        """取消当前请求（包括竞速中的其他计算）在工作进程中的任务"""
+        for request_id in self.racing or ():
+            self.pool.cancel(request_id)
+        self.racing = None
+        if self.latest_id is not None:
+            self._tasks(self.latest_id).cancel(self.latest_id)
+
+    def _tasks(self, request_id):
+        """请求所在的任务池（后台线程的请求编号为负数）"""
+        return self.threads if request_id < 0 else self.pool
+
+    def _idle(self):
+        return not self.pool.pending() and not self.threads.pending()
+
+    def _finish(self):
+        self.latest_id = None
+        if self._idle():
+            self.timer.stop()
+        self.busyChanged.emit(False)
+
+    def _poll(self):
+        for request_id, status, payload in self.pool.poll() + self.threads.poll():
+            if self.racing is not None and request_id in self.racing:
+                self._race_event(request_id, status, payload)
+                continue
+            if request_id != self.latest_id:
+                continue
+
+            title = self.latest_title
+            elapsed = time.monotonic() - self.started_at
+            self._finish()
+            if status == "done":
+                self.statusChanged.emit(f"完成: {title} ({elapsed:.2f}s)")
+                self.resultReady.emit(request_id, payload)
+            elif status == "timeout":
+                self.statusChanged.emit(f"超时: {title}")
+                self.errorOccurred.emit(request_id, f"计算超时（{elapsed:.1f}秒），已终止")
+            else:
+                self.statusChanged.emit(f"出错: {title}")
+                self.errorOccurred.emit(request_id, payload)
+
+        if self.racing is not None and self.race_held is not None and time.monotonic() >= self.race_hold_until:
+            self._race_won(*self.race_held)
+
+        if self.latest_id is not None:
+            # 每秒更新一次已用时间
+            seconds = int(time.monotonic() - self.started_at)
+            if seconds != self._last_reported and seconds > 0:
+                self._last_reported = seconds
+                self.statusChanged.emit(f"正在计算: {self.latest_title} ({seconds}s)")
+        elif self._idle():
+            self.timer.stop()
+
+    def warm_up(self, func, *args):
+        """让每个工作进程先执行一次func（如导入SymPy），第一次真正计算时不用再等进程启动"""
+        self.pool.start()
+        for _ in range(self.pool.size):
+            self.pool.submit(func, *args)
+        if not self.timer.isActive():
+            self.timer.start()
+
+    def shutdown(self):
+        """关闭所有工作进程"""
+        self.timer.stop()
+        self.latest_id = None
+        self.racing = None
+        self.pool.shutdown()
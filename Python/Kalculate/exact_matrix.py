@@ -0,0 +1,366 @@
+"""精确（整数/有理数）矩阵运算（不依赖Qt）
+
+ExactMatrix 的元素是Fraction。所有算法都先把每一行乘以分母的最小公倍数变成整数矩阵，然后使用无分数算法：
+  - 行列式：Bareiss消元（每一步的除法都是整除，中间结果不会膨胀）；
+    较大的矩阵改为在多个31位素数下用numpy求行列式，再用中国剩余定理合并（Hadamard界保证结果唯一）
+  - RREF、逆矩阵、解方程组：无分数Gauss–Jordan消元，最后才做一次除法
+比通用的 sp.Matrix(...).det() 快得多，见 benchmarks/exact_det_benchmark.py。
+"""
+import math
+from fractions import Fraction
+
+import numpy as np
+
+MODULAR_MIN_SIZE = 50
+PRIME_BITS = 31
+
+
+class ExactMatrix:
+    """元素为Fraction的矩阵"""
+
+    # 让numpy数组与ExactMatrix运算时交给ExactMatrix处理
+    __array_ufunc__ = None
+
+    def __init__(self, rows):
+        self.rows = [[Fraction(item) for item in row] for row in rows]
+        self.shape = (len(self.rows), len(self.rows[0]) if self.rows else 0)
+
+    @classmethod
+    def from_value(cls, value):
+        """由ExactMatrix、numpy数组（包括稀疏矩阵）、嵌套列表或数值创建，一维数据视为列向量"""
+        if isinstance(value, ExactMatrix):
+            return value
+        if isinstance(value, (list, tuple)) and value and all(isinstance(row, (list, tuple)) for row in value):
+            # 嵌套列表不经过numpy，避免大整数被转换成浮点数
+            if len({len(row) for row in value}) != 1:
+                raise ValueError("矩阵各行的长度必须相同")
+            return cls([[_to_fraction(item) for item in row] for row in value])
+        if hasattr(value, "toarray"):
+            value = value.toarray()
+        array = np.asarray(value)
+        if array.ndim == 0:
+            array = array.reshape(1, 1)
+        elif array.ndim == 1:
+            array = array.reshape(-1, 1)
+        elif array.ndim != 2:
+            raise ValueError("需要二维矩阵")
+        return cls([[_to_fraction(item) for item in row] for row in array.tolist()])
+
+    def to_array(self):
+        return np.array([[float(item) for item in row] for row in self.rows])
+
+    @property
+    def T(self):
+        return ExactMatrix(list(map(list, zip(*self.rows))))
+
+    def _elementwise(self, other, func):
+        other = ExactMatrix.from_value(other)
+        if other.shape != self.shape:
+            raise ValueError(f"矩阵形状不一致: {self.shape} 和 {other.shape}")
+        return ExactMatrix([[func(a, b) for a, b in zip(row_a, row_b)]
+                            for row_a, row_b in zip(self.rows, other.rows)])
+
+    def __add__(self, other):
+        return self._elementwise(other, lambda a, b: a + b)
+
+    def __radd__(self, other):
+        return ExactMatrix.from_value(other) + self
+
+    def __sub__(self, other):
+        return self._elementwise(other, lambda a, b: a - b)
+
+    def __rsub__(self, other):
+        return ExactMatrix.from_value(other) - self
+
+    def __neg__(self):
+        return ExactMatrix([[-item for item in row] for row in self.rows])
+
+    def __pos__(self):
+        return self
+
+    def __mul__(self, other):
+        if _is_number(other):
+            factor = _to_fraction(other)
+            return ExactMatrix([[item * factor for item in row] for row in self.rows])
+        return self._elementwise(other, lambda a, b: a * b)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if not _is_number(other):
+            raise ValueError("矩阵只能除以数")
+        return self * (1 / _to_fraction(other))
+
+    def __matmul__(self, other):
+        other = ExactMatrix.from_value(other)
+        if self.shape[1] != other.shape[0]:
+            raise ValueError(f"矩阵形状不能相乘: {self.shape} 和 {other.shape}")
+        columns = list(zip(*other.rows))
+        return ExactMatrix([[sum(a * b for a, b in zip(row, column)) for column in columns]
+                            for row in self.rows])
+
+    def __rmatmul__(self, other):
+        return ExactMatrix.from_value(other) @ self
+
+    def __pow__(self, exponent):
+        """方阵的整数次幂（负数次幂使用逆矩阵）"""
+        if not isinstance(exponent, int):
+            raise ValueError("精确矩阵只支持整数次幂")
+        if self.shape[0] != self.shape[1]:
+            raise ValueError("矩阵必须是方阵")
+        base = inverse(self) if exponent < 0 else self
+        result = identity(self.shape[0])
+        for _ in range(abs(exponent)):
+            result = result @ base
+        return result
+
+    def diagonal(self):
+        return [self.rows[i][i] for i in range(min(self.shape))]
+
+    def __str__(self):
+        return "[" + ", ".join("[" + ", ".join(str(item) for item in row) + "]" for row in self.rows) + "]"
+
+
+def _is_number(value):
+    return isinstance(value, (int, float, Fraction, np.integer, np.floating))
+
+
+def _to_fraction(value):
+    """浮点数按十进制表示转换（0.1 -> 1/10），整数和分数保持精确"""
+    if isinstance(value, (float, np.floating)):
+        if not math.isfinite(value):
+            raise ValueError("精确矩阵中不能有inf或nan")
+        return Fraction(repr(float(value)))
+    if isinstance(value, np.integer):
+        return Fraction(int(value))
+    return Fraction(value)
+
+
+def identity(n):
+    return ExactMatrix([[int(i == j) for j in range(n)] for i in range(n)])
+
+
+def integer_rows(matrix):
+    """每一行乘以该行分母的最小公倍数，返回 (整数行列表, 各行的乘数)"""
+    rows, scales = [], []
+    for row in matrix.rows:
+        scale = math.lcm(*(item.denominator for item in row)) if row else 1
+        rows.append([int(item * scale) for item in row])
+        scales.append(scale)
+    return rows, scales
+
+
+def bareiss_det(rows):
+    """整数矩阵的Bareiss行列式，所有除法都是整除"""
+    a = [row[:] for row in rows]
+    n = len(a)
+    if n == 0:
+        return 1
+    sign, previous = 1, 1
+    for k in range(n - 1):
+        if a[k][k] == 0:
+            swap = next((i for i in range(k + 1, n) if a[i][k] != 0), None)
+            if swap is None:
+                return 0
+            a[k], a[swap] = a[swap], a[k]
+            sign = -sign
+        pivot, pivot_row = a[k][k], a[k]
+        for i in range(k + 1, n):
+            row, factor = a[i], a[i][k]
+            for j in range(k + 1, n):
+                row[j] = (pivot * row[j] - factor * pivot_row[j]) // previous
+        previous = pivot
+    return sign * a[n - 1][n - 1]
+
+
+def _is_prime(n):
+    """确定性Miller–Rabin（对小于3.2×10⁹的数，底数2、3、5、7足够）"""
+    if n < 2:
+        return False
+    for p in (2, 3, 5, 7):
+        if n % p == 0:
+            return n == p
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for base in (2, 3, 5, 7):
+        x = pow(base, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def _primes():
+    """从2³¹往下依次给出素数"""
+    candidate = (1 << PRIME_BITS) - 1
+    while True:
+        if _is_prime(candidate):
+            yield candidate
+        candidate -= 2
+
+
+def _det_mod(a, p):
+    """模p的行列式（a为已经模p的int64数组，原地消元）
+
+    p < 2³¹，因此 factor·a[k, j] < 2⁶²，再减去一个小于p的数也不会溢出int64，每次消元只需要取一次模。
+    """
+    n = a.shape[0]
+    det = 1
+    for k in range(n):
+        nonzero = np.flatnonzero(a[k:, k])
+        if nonzero.size == 0:
+            return 0
+        pivot_index = k + nonzero[0]
+        if pivot_index != k:
+            a[[k, pivot_index]] = a[[pivot_index, k]]
+            det = -det
+        pivot = int(a[k, k])
+        det = det * pivot % p
+        factors = a[k + 1:, k] * pow(pivot, -1, p) % p
+        a[k + 1:, k:] = (a[k + 1:, k:] - factors[:, None] * a[k, k:]) % p
+    return det % p
+
+
+def hadamard_bits(rows):
+    """Hadamard界 |det| ≤ ∏‖row‖ 的以2为底的对数"""
+    bits = 0.0
+    for row in rows:
+        norm_squared = sum(item * item for item in row)
+        if norm_squared == 0:
+            return None
+        bits += math.log2(norm_squared) / 2
+    return bits
+
+
+def modular_det(rows):
+    """多模行列式：在足够多的素数下求行列式，用中国剩余定理合并"""
+    bits = hadamard_bits(rows)
+    if bits is None:
+        return 0
+    try:
+        base = np.array(rows, dtype=np.int64)
+    except OverflowError:
+        base = None
+    residue, modulus = 0, 1
+    for p in _primes():
+        if base is not None:
+            reduced = base % p
+        else:
+            reduced = np.array([[item % p for item in row] for row in rows], dtype=np.int64)
+        r = _det_mod(reduced, p)
+        # 增量CRT：求 x ≡ residue (mod modulus)，x ≡ r (mod p)
+        t = (r - residue) * pow(modulus, -1, p) % p
+        residue += modulus * t
+        modulus *= p
+        if modulus.bit_length() > bits + 2:
+            break
+    return residue - modulus if residue > modulus // 2 else residue
+
+
+def det(matrix, method=None):
+    """精确行列式，method为 "bareiss"、"modular" 或 None（按大小自动选择）"""
+    matrix = ExactMatrix.from_value(matrix)
+    if matrix.shape[0] != matrix.shape[1]:
+        raise ValueError("矩阵必须是方阵")
+    rows, scales = integer_rows(matrix)
+    if method is None:
+        method = "modular" if matrix.shape[0] >= MODULAR_MIN_SIZE else "bareiss"
+    value = modular_det(rows) if method == "modular" else bareiss_det(rows)
+    return Fraction(value, math.prod(scales))
+
+
+def _fraction_free_rref(rows, columns=None):
+    """无分数Gauss–Jordan消元，只在前columns列中选主元
+
+    返回 (整数矩阵, 主元列, 最后一个主元)；消元结束后每个主元行的主元都等于最后一个主元，
+    因此除以它就得到RREF。
+    """
+    a = [row[:] for row in rows]
+    m = len(a)
+    columns = len(a[0]) if columns is None and a else (columns or 0)
+    previous, r, pivots = 1, 0, []
+    for c in range(columns):
+        if r == m:
+            break
+        swap = next((i for i in range(r, m) if a[i][c] != 0), None)
+        if swap is None:
+            continue
+        a[r], a[swap] = a[swap], a[r]
+        pivot, pivot_row = a[r][c], a[r]
+        for i in range(m):
+            if i == r:
+                continue
+            row, factor = a[i], a[i][c]
+            a[i] = [(pivot * x - factor * y) // previous for x, y in zip(row, pivot_row)]
+        previous = pivot
+        pivots.append(c)
+        r += 1
+    return a, pivots, previous
+
+
+def rref(matrix):
+    """行最简形，返回 (ExactMatrix, 主元列)"""
+    matrix = ExactMatrix.from_value(matrix)
+    rows, _ = integer_rows(matrix)
+    a, pivots, last = _fraction_free_rref(rows)
+    result = [[Fraction(x, last) for x in row] for row in a[:len(pivots)]]
+    result += [[Fraction(0)] * matrix.shape[1] for _ in range(matrix.shape[0] - len(pivots))]
+    return ExactMatrix(result), pivots
+
+
+def rank(matrix):
+    return len(rref(matrix)[1])
+
+
+def solve(matrix, rhs):
+    """精确求解 AX=B（B可以有多列），无解或有无穷多解时抛出ValueError"""
+    matrix = ExactMatrix.from_value(matrix)
+    rhs = ExactMatrix.from_value(rhs)
+    n = matrix.shape[1]
+    if rhs.shape[0] != matrix.shape[0]:
+        raise ValueError(f"矩阵形状不一致: {matrix.shape} 和 {rhs.shape}")
+    augmented = ExactMatrix([row_a + row_b for row_a, row_b in zip(matrix.rows, rhs.rows)])
+    rows, _ = integer_rows(augmented)
+    a, pivots, last = _fraction_free_rref(rows, n)
+
+    # 系数部分全为0而右边不为0的行表示无解
+    for row in a[len(pivots):]:
+        if any(row[n:]):
+            raise ValueError("方程组无解")
+    if len(pivots) < n:
+        raise ValueError("方程组有无穷多解")
+    return ExactMatrix([[Fraction(x, last) for x in row[n:]] for row in a[:n]])
+
+
+def norm_1(matrix):
+    """1-范数（列绝对值之和的最大值）"""
+    return max((sum(abs(item) for item in column) for column in zip(*matrix.rows)), default=Fraction(0))
+
+
+def cond(matrix):
+    """1-范数条件数 ‖A‖₁·‖A⁻¹‖₁，奇异矩阵为inf"""
+    matrix = ExactMatrix.from_value(matrix)
+    if matrix.shape[0] != matrix.shape[1]:
+        raise ValueError("矩阵必须是方阵")
+    try:
+        inverse_norm = norm_1(inverse(matrix))
+    except ValueError:
+        return math.inf
+    return norm_1(matrix) * inverse_norm
+
+
+def inverse(matrix):
+    matrix = ExactMatrix.from_value(matrix)
+    if matrix.shape[0] != matrix.shape[1]:
+        raise ValueError("矩阵必须是方阵")
+    try:
+        return solve(matrix, identity(matrix.shape[0]))
+    except ValueError:
+        raise ValueError("矩阵是奇异的") from None
@@ -0,0 +1,220 @@
+"""矩阵分解缓存（不依赖Qt）
+
+同一个矩阵（按对象身份区分）只做一次O(n³)分解，行列式、逆矩阵、求解和条件数都使用同一个分解：
+  - 对称正定矩阵：Cholesky（scipy.linalg.cho_factor）
+  - 其他方阵：LU（scipy.linalg.lu_factor）
+  - 行数多于列数的矩阵：QR（最小二乘解）
+  - 行数少于列数的矩阵：numpy.linalg.lstsq（最小范数解，QR的R不是方阵，不能回代）
+  - 稀疏矩阵：稀疏LU（见sparse_support.py）
+行列式以 (符号, log|det|) 的形式给出，不会因为数值过大或过小而溢出成inf/0。
+没有安装SciPy时稠密方阵直接使用numpy.linalg的函数（不缓存分解）。
+"""
+import math
+import threading
+import weakref
+from collections import OrderedDict
+from typing import NamedTuple
+
+import numpy as np
+
+import sparse_support
+
+try:
+    import scipy.linalg as scipy_linalg
+except ImportError:
+    scipy_linalg = None
+
+
+# 不超过这个大小的矩阵给出精确的条件数，更大的矩阵只给出估计值
+COND_EXACT_MAX = 1000
+
+
+class ConditionEstimate(float):
+    """LAPACK估计的1-范数条件数（通常在精确值的几倍之内），显示时标明是估计值"""
+
+    def __str__(self):
+        return f"≈ {float(self):.6g} (1-norm estimate)"
+
+
+class LogDeterminant(NamedTuple):
+    """slogdet形式的行列式：det = sign · exp(logabs)"""
+    sign: float
+    logabs: float
+
+    def value(self):
+        """行列式的值，超出浮点数范围时为±inf或0"""
+        if self.sign == 0:
+            return 0.0
+        if self.logabs > 709:
+            return self.sign * math.inf
+        return self.sign * math.exp(self.logabs)
+
+    def __str__(self):
+        if self.sign == 0:
+            return "det = 0"
+        exponent = self.logabs / math.log(10)
+        mantissa = 10 ** (exponent - math.floor(exponent))
+        return (f"sign = {self.sign:g}, log|det| = {self.logabs:.10g} "
+                f"(det ≈ {self.sign * mantissa:.6g}e{math.floor(exponent):+d})")
+
+
+def _permutation_parity(pivots):
+    """LAPACK行交换序列的符号"""
+    swaps = np.count_nonzero(pivots != np.arange(pivots.size))
+    return -1.0 if swaps % 2 else 1.0
+
+
+def _is_symmetric(matrix):
+    return np.allclose(matrix, matrix.T, rtol=1e-12, atol=0)
+
+
+class Factorization:
+    """一个矩阵的分解，kind为 cholesky、lu、qr、lstsq、sparse_lu 或 numpy（没有SciPy时）"""
+
+    def __init__(self, matrix):
+        self.shape = matrix.shape
+        if sparse_support.is_sparse(matrix):
+            self.kind = "sparse_lu"
+            self.factors = sparse_support.splu(matrix)
+            return
+
+        matrix = np.asarray(matrix, dtype=float)
+        if matrix.ndim != 2:
+            raise ValueError("需要二维矩阵")
+        self.norm_1 = float(np.abs(matrix).sum(axis=0).max()) if matrix.size else 0.0
+        # 直接保存矩阵时保存副本：缓存的分解引用原矩阵的话，矩阵永远不会被释放，缓存项也不会被删除
+        if matrix.shape[0] < matrix.shape[1]:
+            self.kind = "lstsq"
+            self.factors = matrix.copy()
+        elif matrix.shape[0] > matrix.shape[1]:
+            self.kind = "qr"
+            self.factors = np.linalg.qr(matrix)
+        elif scipy_linalg is None:
+            self.kind = "numpy"
+            self.factors = matrix.copy()
+        else:
+            self.kind, self.factors = self._factor_square(matrix)
+
+    @staticmethod
+    def _factor_square(matrix):
+        if _is_symmetric(matrix):
+            try:
+                return "cholesky", scipy_linalg.cho_factor(matrix, check_finite=False)
+            except np.linalg.LinAlgError:
+                pass
+        return "lu", scipy_linalg.lu_factor(matrix, check_finite=False)
+
+    def _require_square(self):
+        if self.shape[0] != self.shape[1]:
+            raise ValueError("矩阵必须是方阵")
+
+    def slogdet(self):
+        """(符号, log|det|)"""
+        self._require_square()
+        if self.kind == "sparse_lu":
+            return LogDeterminant(*sparse_support.lu_slogdet(self.factors))
+        if self.kind == "numpy":
+            sign, logabs = np.linalg.slogdet(self.factors)
+            return LogDeterminant(float(sign), float(logabs))
+        if self.kind == "cholesky":
+            diagonal = np.diag(self.factors[0])
+            return LogDeterminant(1.0, float(2 * np.sum(np.log(diagonal))))
+
+        lu, pivots = self.factors
+        diagonal = np.diag(lu)
+        if np.any(diagonal == 0):
+            return LogDeterminant(0.0, -math.inf)
+        sign = _permutation_parity(pivots) * float(np.prod(np.sign(diagonal)))
+        return LogDeterminant(sign, float(np.sum(np.log(np.abs(diagonal)))))
+
+    def solve(self, rhs):
+        """求解 Ax=b（行数多于列数时为最小二乘解，少于列数时为最小范数解）"""
+        if sparse_support.is_sparse(rhs):
+            rhs = rhs.toarray()
+        rhs = np.asarray(rhs, dtype=float)
+        if self.kind == "sparse_lu":
+            return self.factors.solve(rhs)
+        if self.kind == "numpy":
+            return np.linalg.solve(self.factors, rhs)
+        if self.kind == "lstsq":
+            return np.linalg.lstsq(self.factors, rhs, rcond=None)[0]
+        if self.kind == "cholesky":
+            return scipy_linalg.cho_solve(self.factors, rhs, check_finite=False)
+        if self.kind == "lu":
+            if self.slogdet().sign == 0:
+                raise ValueError("矩阵是奇异的")
+            return scipy_linalg.lu_solve(self.factors, rhs, check_finite=False)
+
+        q, r = self.factors
+        projected = q.T @ rhs
+        if scipy_linalg is not None:
+            return scipy_linalg.solve_triangular(r, projected, check_finite=False)
+        return np.linalg.solve(r, projected)
+
+    def inverse(self):
+        self._require_square()
+        if self.kind == "sparse_lu":
+            raise sparse_support.DenseInverseRefused()
+        if self.kind == "numpy":
+            return np.linalg.inv(self.factors)
+        return self.solve(np.eye(self.shape[0]))
+
+    def cond(self):
+        """1-范数条件数 ‖A‖₁·‖A⁻¹‖₁
+
+        n不超过COND_EXACT_MAX时用缓存的分解求出逆矩阵，得到精确值；
+        更大的矩阵用LAPACK的gecon/pocon估计（只需O(n²)），返回ConditionEstimate。
+        """
+        self._require_square()
+        if self.kind == "sparse_lu":
+            raise ValueError("稀疏矩阵不支持条件数")
+        if self.kind == "numpy":
+            return float(np.linalg.cond(self.factors, 1))
+        if self.slogdet().sign == 0:
+            return math.inf
+        if self.shape[0] <= COND_EXACT_MAX:
+            return self.norm_1 * float(np.abs(self.inverse()).sum(axis=0).max())
+        if self.kind == "cholesky":
+            pocon, = scipy_linalg.get_lapack_funcs(("pocon",), (self.factors[0],))
+            rcond, _ = pocon(self.factors[0], self.norm_1, uplo="L" if self.factors[1] else "U")
+        else:
+            gecon, = scipy_linalg.get_lapack_funcs(("gecon",), (self.factors[0],))
+            rcond, _ = gecon(self.factors[0], self.norm_1, norm="1")
+        return math.inf if rcond == 0 else ConditionEstimate(1 / rcond)
+
+
+class FactorizationCache:
+    """按矩阵对象身份缓存分解结果，最多保留maxsize个，矩阵被释放时对应的分解也被删除
+
+    矩阵工作区在后台线程中计算，缓存的读写加锁；分解本身在锁外进行。
+    """
+
+    def __init__(self, maxsize=8):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def get(self, matrix):
+        key = id(matrix)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry[0]() is matrix:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        factorization = Factorization(matrix)
+        with self.lock:
+            self.entries[key] = (weakref.ref(matrix, lambda _, key=key: self.entries.pop(key, None)), factorization)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+        return factorization
+
+    def clear(self):
+        self.entries.clear()
+
+    def stats(self):
+        return {"size": len(self.entries), "hits": self.hits, "misses": self.misses}
@@ -0,0 +1,246 @@
+"""纯数值表达式的快速求值（不依赖Qt）
+
+像 2+3*4、sin(pi/6)/3 这样只含数字、pi、E、I和常用函数的表达式，不经过 parse_expr → SymPy表达式树 → evalf，
+而是把Python的AST编译成嵌套的闭包（按文本缓存），直接用float/complex计算；需要超过15位有效数字时使用mpmath。
+整数和整数之间的除法、乘方保持精确（int/Fraction），最后才转换成浮点数。
+遇到符号、隐式乘法、阶乘等SymPy语法，或者除以0、溢出、实数参数得到复数结果等需要SymPy处理的情况时抛出NotNumeric，
+调用方改用SymPy计算。浮点数算不准的情况也交给SymPy：
+  - 函数的参数含pi或E（sin(pi)、tan(pi/2)、E**(I*pi)，角度制下的sin(180)），SymPy能化简出精确值；
+  - 加减法的结果比操作数小得多（1e20+1-1e20），有效数字已经抵消，SymPy的evalf会提高精度重算。
+
+    fastpath.evaluate("2+3*4")        # Float(14.0000000000000)
+"""
+import ast
+import cmath
+import math
+import operator
+from fractions import Fraction
+from functools import lru_cache
+
+import mpmath
+import sympy as sp
+
+FLOAT_DIGITS = 15
+MAX_POWER_BITS = 100_000
+# 加减法的结果小于操作数的这个比例时认为有效数字抵消
+CANCELLATION = 1e-2
+CONSTANTS = ("pi", "E")
+
+
+class NotNumeric(ValueError):
+    """表达式不能用快速路径计算，需要交给SymPy"""
+
+
+def _real_function(real, complex_):
+    """实数参数用math计算（定义域之外交给SymPy），复数参数用cmath"""
+    def func(*args):
+        if any(isinstance(arg, complex) for arg in args):
+            return complex_(*args)
+        try:
+            return real(*(float(arg) for arg in args))
+        except ValueError:
+            raise NotNumeric("超出实数定义域") from None
+    return func
+
+
+def _float_log(value, base=None):
+    if base is None:
+        return _real_function(math.log, cmath.log)(value)
+    return _real_function(math.log, cmath.log)(value, base)
+
+
+_FLOAT_FUNCTIONS = {
+    "sin": _real_function(math.sin, cmath.sin),
+    "cos": _real_function(math.cos, cmath.cos),
+    "tan": _real_function(math.tan, cmath.tan),
+    "asin": _real_function(math.asin, cmath.asin),
+    "acos": _real_function(math.acos, cmath.acos),
+    "atan": _real_function(math.atan, cmath.atan),
+    "sinh": _real_function(math.sinh, cmath.sinh),
+    "cosh": _real_function(math.cosh, cmath.cosh),
+    "tanh": _real_function(math.tanh, cmath.tanh),
+    "asinh": _real_function(math.asinh, cmath.asinh),
+    "acosh": _real_function(math.acosh, cmath.acosh),
+    "atanh": _real_function(math.atanh, cmath.atanh),
+    "exp": _real_function(math.exp, cmath.exp),
+    "sqrt": _real_function(math.sqrt, cmath.sqrt),
+    "log": _float_log,
+    "ln": _float_log,
+    "Abs": abs,
+    "abs": abs,
+}
+
+
+def _mp_function(func):
+    """mpmath函数；实数参数得到复数结果时交给SymPy（分支的选取可能不同）"""
+    def wrapper(*args):
+        args = [_mp_number(arg) for arg in args]
+        result = func(*args)
+        if isinstance(result, mpmath.mpc) and not any(isinstance(arg, mpmath.mpc) for arg in args):
+            raise NotNumeric("超出实数定义域")
+        return result
+    return wrapper
+
+
+def _mp_log(value, base=None):
+    if base is None:
+        return _mp_function(mpmath.log)(value)
+    return _mp_function(mpmath.log)(value, base)
+
+
+_MP_FUNCTIONS = {
+    name: _mp_function(getattr(mpmath, name))
+    for name in ("sin", "cos", "tan", "asin", "acos", "atan", "sinh", "cosh", "tanh",
+                 "asinh", "acosh", "atanh", "exp", "sqrt")
+}
+_MP_FUNCTIONS.update(log=_mp_log, ln=_mp_log, Abs=_mp_function(mpmath.fabs), abs=_mp_function(mpmath.fabs))
+
+
+def _mp_number(value):
+    if isinstance(value, Fraction):
+        return mpmath.mpf(value.numerator) / value.denominator
+    if isinstance(value, complex):
+        return mpmath.mpc(value)
+    if isinstance(value, (mpmath.mpf, mpmath.mpc)):
+        return value
+    return mpmath.mpf(value)
+
+
+def _is_exact(value):
+    return isinstance(value, (int, Fraction))
+
+
+def _divide(left, right, inexact):
+    if _is_exact(left) and _is_exact(right):
+        return Fraction(left, right)
+    return inexact(left) / inexact(right)
+
+
+def _power(base, exponent, inexact):
+    if _is_exact(base) and isinstance(exponent, int):
+        # 避免 10**10**10 这样的精确整数计算占满内存，交给SymPy
+        if abs(base) > 1 and abs(exponent) * math.log2(abs(base)) > MAX_POWER_BITS:
+            raise NotNumeric("整数乘方过大")
+        return Fraction(base) ** exponent if exponent < 0 else base ** exponent
+    result = inexact(base) ** inexact(exponent)
+    # 负实数的分数次方：浮点数得到带舍入误差的复数（如 (-1)**0.5 的实部为6e-17），交给SymPy
+    if isinstance(result, (complex, mpmath.mpc)) and not isinstance(base, (complex, mpmath.mpc)) \
+            and not isinstance(exponent, (complex, mpmath.mpc)):
+        raise NotNumeric("实数的乘方得到复数")
+    return result
+
+
+def _compile(node, backend):
+    """把AST节点编译成无参数的闭包"""
+    if isinstance(node, ast.Expression):
+        return _compile(node.body, backend)
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        value = node.value
+        if backend == "mp" and isinstance(value, float):
+            # 按十进制文本在当前精度下转换，0.1不会先变成二进制浮点数
+            text = repr(value)
+            return lambda: mpmath.mpf(text)
+        return lambda: value
+    if isinstance(node, ast.Name):
+        if node.id == "pi":
+            return (lambda: +mpmath.mp.pi) if backend == "mp" else (lambda: math.pi)
+        if node.id == "E":
+            return (lambda: +mpmath.mp.e) if backend == "mp" else (lambda: math.e)
+        if node.id == "I":
+            return (lambda: mpmath.mpc(0, 1)) if backend == "mp" else (lambda: 1j)
+        raise NotNumeric(f"含有符号: {node.id}")
+
+    inexact = _mp_number if backend == "mp" else lambda value: value
+    if isinstance(node, ast.BinOp):
+        left, right = _compile(node.left, backend), _compile(node.right, backend)
+        if isinstance(node.op, ast.Add):
+            return lambda: _binary(operator.add, left(), right(), inexact)
+        if isinstance(node.op, ast.Sub):
+            return lambda: _binary(operator.sub, left(), right(), inexact)
+        if isinstance(node.op, ast.Mult):
+            return lambda: _binary(operator.mul, left(), right(), inexact)
+        if isinstance(node.op, ast.Div):
+            return lambda: _divide(left(), right(), inexact)
+        if isinstance(node.op, ast.Pow):
+            # E**x 与 exp(x) 相同
+            if isinstance(node.left, ast.Name) and node.left.id == "E" and _mentions_constant(node.right):
+                raise NotNumeric("指数含pi或E，交给SymPy化简")
+            return lambda: _power(left(), right(), inexact)
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+        operand = _compile(node.operand, backend)
+        if isinstance(node.op, ast.USub):
+            return lambda: -operand()
+        return operand
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and not node.keywords:
+        functions = _MP_FUNCTIONS if backend == "mp" else _FLOAT_FUNCTIONS
+        func = functions.get(node.func.id)
+        if func is None or not 1 <= len(node.args) <= (2 if node.func.id in ("log", "ln") else 1):
+            raise NotNumeric(f"不支持的函数: {node.func.id}")
+        if any(_mentions_constant(arg) for arg in node.args):
+            raise NotNumeric("函数的参数含pi或E，交给SymPy化简")
+        args = [_compile(arg, backend) for arg in node.args]
+        return lambda: func(*(arg() for arg in args))
+    raise NotNumeric(f"不支持的语法: {type(node).__name__}")
+
+
+def _mentions_constant(node):
+    return any(isinstance(child, ast.Name) and child.id in CONSTANTS for child in ast.walk(node))
+
+
+def _binary(op, left, right, inexact):
+    if _is_exact(left) and _is_exact(right):
+        return op(left, right)
+    result = op(inexact(left), inexact(right))
+    if op is not operator.mul and abs(result) < CANCELLATION * max(abs(left), abs(right)):
+        raise NotNumeric("加减法的有效数字抵消，交给SymPy")
+    return result
+
+
+@lru_cache(maxsize=256)
+def compile_expression(text, backend="float"):
+    """把表达式文本编译为闭包，backend为 "float" 或 "mp"；不是纯数值表达式时抛出NotNumeric"""
+    try:
+        tree = ast.parse(text.strip(), mode="eval")
+    except SyntaxError:
+        # 隐式乘法（2pi）、阶乘（5!）等SymPy语法
+        raise NotNumeric("需要SymPy解析") from None
+    return _compile(tree, backend)
+
+
+def to_sympy(value, digits=FLOAT_DIGITS):
+    """转换为与 evalf(digits) 相同形式的SymPy数值"""
+    if _is_exact(value):
+        return sp.Rational(value.numerator, value.denominator).evalf(digits)
+    if isinstance(value, (complex, mpmath.mpc)):
+        real, imag = sp.Float(value.real, digits), sp.Float(value.imag, digits)
+        return real if imag == 0 else real + imag * sp.I
+    return sp.Float(value, digits)
+
+
+def evaluate(text, digits=FLOAT_DIGITS):
+    """计算纯数值表达式，返回SymPy数值；需要SymPy时抛出NotNumeric
+
+    精确的整数/有理数结果与 parse_expr(text).evalf(digits) 完全相同；浮点结果恰好在舍入的分界附近时
+    （如 asin(0.3)），最后一位有效数字可能相差1。
+    """
+    if digits <= FLOAT_DIGITS:
+        func = compile_expression(text, "float")
+        try:
+            value = func()
+        except (ZeroDivisionError, OverflowError):
+            raise NotNumeric("需要SymPy处理") from None
+        if isinstance(value, float) and not math.isfinite(value):
+            raise NotNumeric("结果不是有限数")
+        if isinstance(value, complex) and not cmath.isfinite(value):
+            raise NotNumeric("结果不是有限数")
+        return to_sympy(value, digits)
+
+    func = compile_expression(text, "mp")
+    with mpmath.workdps(digits + 5):
+        try:
+            value = func()
+        except ZeroDivisionError:
+            raise NotNumeric("需要SymPy处理") from None
+        if isinstance(value, (mpmath.mpf, mpmath.mpc)) and not mpmath.isfinite(value):
+            raise NotNumeric("结果不是有限数")
+        return to_sympy(value, digits)
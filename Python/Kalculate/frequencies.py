@@ -0,0 +1,226 @@
+"""数值出现次数的流式统计（不依赖Qt）
+
+FrequencyCounter 先用哈希表精确计数；不同数值的个数超过 max_exact 后转为有界内存的近似模式：
+  - SpaceSaving 保留出现次数最多的 capacity 个候选值，每个候选值的计数最多多算 N/capacity；
+  - CountMinSketch 给出任意数值出现次数的上界（以 1-δ 的概率最多多算 εN），用来收紧候选值的计数。
+结果都以 (数值, 计数, 计数下界) 的形式返回，精确模式下计数和下界相同。
+"""
+import heapq
+import math
+
+import numpy as np
+
+MAX_EXACT = 1_000_000
+DEFAULT_CAPACITY = 1000
+
+
+def chunk_counts(values):
+    """一个数据块中各数值的出现次数（只对该块排序，内存与块大小相关）"""
+    values = np.asarray(values, dtype=float).ravel()
+    values = values[~np.isnan(values)]
+    return np.unique(values, return_counts=True)
+
+
+class SpaceSaving:
+    """可合并的Space-Saving摘要：保留计数最大的capacity个数值
+
+    counts 是计数的上界，counts - errors 是下界；所有被丢弃的数值的计数都不超过 min_count()。
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self.keys = np.empty(0)
+        self.counts = np.empty(0, dtype=np.int64)
+        self.errors = np.empty(0, dtype=np.int64)
+        self.total = 0
+
+    def min_count(self):
+        """未被保留的数值计数的上界"""
+        return int(self.counts.min()) if self.keys.size >= self.capacity else 0
+
+    def update(self, keys, counts):
+        """合并一组 (数值, 精确计数)，keys须已排序且不重复（np.unique的结果）"""
+        counts = np.asarray(counts, dtype=np.int64)
+        if keys.size == 0:
+            return
+        self.total += int(counts.sum())
+
+        # 这一组本身也只保留capacity个，被丢弃部分的最大计数作为它们的误差
+        extra_min = 0
+        if keys.size > self.capacity:
+            order = np.argsort(counts, kind="stable")[::-1]
+            extra_min = int(counts[order[self.capacity]])
+            kept = np.sort(order[:self.capacity])
+            keys, counts = keys[kept], counts[kept]
+        extra_errors = np.zeros(keys.size, dtype=np.int64)
+
+        own_min = self.min_count()
+        merged = np.union1d(self.keys, keys)
+
+        merged_counts = np.full(merged.size, own_min + extra_min, dtype=np.int64)
+        merged_errors = merged_counts.copy()
+        self_index = np.searchsorted(merged, self.keys)
+        extra_index = np.searchsorted(merged, keys)
+        merged_counts[self_index] += self.counts - own_min
+        merged_errors[self_index] += self.errors - own_min
+        merged_counts[extra_index] += counts - extra_min
+        merged_errors[extra_index] += extra_errors - extra_min
+
+        if merged.size > self.capacity:
+            order = np.argsort(merged_counts, kind="stable")[::-1][:self.capacity]
+            order.sort()
+            merged, merged_counts, merged_errors = merged[order], merged_counts[order], merged_errors[order]
+        self.keys, self.counts, self.errors = merged, merged_counts, merged_errors
+
+    def top(self, k):
+        """计数最大的k个：[(数值, 计数上界, 计数下界), ...]"""
+        order = np.lexsort((self.keys, -self.counts))[:k]
+        return [(float(self.keys[i]), int(self.counts[i]), int(self.counts[i] - self.errors[i])) for i in order]
+
+
+class CountMinSketch:
+    """Count-Min草图：width = ⌈e/ε⌉，depth = ⌈ln(1/δ)⌉，估计值以1-δ的概率最多多算εN"""
+
+    def __init__(self, epsilon=1e-4, delta=1e-3, seed=0):
+        self.epsilon = epsilon
+        self.delta = delta
+        self.width = 1 << max(4, math.ceil(math.log2(math.e / epsilon)))
+        self.depth = max(1, math.ceil(math.log(1 / delta)))
+        self.table = np.zeros((self.depth, self.width), dtype=np.int64)
+        rng = np.random.default_rng(seed)
+        self._multipliers = rng.integers(1, 2 ** 63, size=self.depth, dtype=np.uint64) | np.uint64(1)
+        self._shift = np.uint64(64 - int(math.log2(self.width)))
+        self.total = 0
+
+    def _indexes(self, keys):
+        """各行的哈希位置（对float64的二进制表示做乘法移位哈希）"""
+        bits = np.ascontiguousarray(keys, dtype=float).view(np.uint64)
+        return [((bits * multiplier) >> self._shift).astype(np.intp) for multiplier in self._multipliers]
+
+    def update(self, keys, counts):
+        counts = np.asarray(counts, dtype=np.int64)
+        self.total += int(counts.sum())
+        for row, index in enumerate(self._indexes(keys)):
+            self.table[row] += np.bincount(index, weights=counts, minlength=self.width).astype(np.int64)
+
+    def estimate(self, keys):
+        """出现次数的估计值（上界）"""
+        keys = np.atleast_1d(np.asarray(keys, dtype=float))
+        rows = [self.table[row][index] for row, index in enumerate(self._indexes(keys))]
+        return np.min(rows, axis=0)
+
+    def error_bound(self):
+        return math.ceil(self.epsilon * self.total)
+
+
+class FrequencyCounter:
+    """出现次数统计：不同数值不多时精确计数，超过max_exact后转为Space-Saving + Count-Min"""
+
+    def __init__(self, max_exact=MAX_EXACT, capacity=DEFAULT_CAPACITY, epsilon=1e-4, delta=1e-3):
+        self.max_exact = max_exact
+        self.capacity = capacity
+        self.epsilon = epsilon
+        self.delta = delta
+        self.counts = {}
+        self.total = 0
+        self.space_saving = None
+        self.count_min = None
+
+    @classmethod
+    def from_array(cls, values, chunk_size=1 << 20, **options):
+        counter = cls(**options)
+        for start in range(0, len(values), chunk_size):
+            counter.update(values[start:start + chunk_size])
+        return counter
+
+    @classmethod
+    def from_chunks(cls, chunks, **options):
+        counter = cls(**options)
+        for chunk in chunks:
+            counter.update(chunk)
+        return counter
+
+    @property
+    def exact(self):
+        return self.space_saving is None
+
+    def update(self, values):
+        """加入一个数据块（NaN被忽略）"""
+        keys, counts = chunk_counts(values)
+        if keys.size == 0:
+            return
+        self.total += int(counts.sum())
+        if not self.exact:
+            self.space_saving.update(keys, counts)
+            self.count_min.update(keys, counts)
+            return
+
+        table = self.counts
+        for key, count in zip(keys.tolist(), counts.tolist()):
+            table[key] = table.get(key, 0) + count
+        if len(table) > self.max_exact:
+            self._switch_to_approximate()
+
+    def _switch_to_approximate(self):
+        """哈希表过大时把已有计数转入Space-Saving和Count-Min，释放哈希表"""
+        keys = np.fromiter(self.counts.keys(), dtype=float, count=len(self.counts))
+        counts = np.fromiter(self.counts.values(), dtype=np.int64, count=len(self.counts))
+        order = np.argsort(keys)
+        keys, counts = keys[order], counts[order]
+        self.space_saving = SpaceSaving(self.capacity)
+        self.space_saving.update(keys, counts)
+        self.count_min = CountMinSketch(self.epsilon, self.delta)
+        self.count_min.update(keys, counts)
+        self.counts = {}
+
+    def error_bound(self):
+        """近似模式下计数最多多算的次数，精确模式为0"""
+        if self.exact:
+            return 0
+        return min(self.space_saving.min_count(), self.count_min.error_bound())
+
+    def top_k(self, k=10):
+        """出现次数最多的k个数值：[(数值, 计数, 计数下界), ...]"""
+        if self.total == 0:
+            raise ValueError("没有数据")
+        if self.exact:
+            items = heapq.nsmallest(k, self.counts.items(), key=lambda item: (-item[1], item[0]))
+            return [(value, count, count) for value, count in items]
+
+        results = []
+        for value, upper, lower in self.space_saving.top(self.capacity):
+            # Count-Min的估计也是上界，取两者中较小的
+            upper = min(upper, int(self.count_min.estimate(value)[0]))
+            results.append((value, upper, min(lower, upper)))
+        results.sort(key=lambda item: (-item[1], item[0]))
+        return results[:k]
+
+    def mode(self):
+        """众数（出现次数最多的所有数值），近似模式下只返回计数最大的一个"""
+        if self.total == 0:
+            raise ValueError("没有数据")
+        if not self.exact:
+            return [self.top_k(1)[0][0]]
+        best = max(self.counts.values())
+        return sorted(value for value, count in self.counts.items() if count == best)
+
+
+def format_top_k(items, total, error_bound=0):
+    """格式化 top-k 结果"""
+    lines = []
+    for value, count, lower in items:
+        share = count / total * 100
+        if count == lower:
+            lines.append(f"{value:.10g}: {count} 次 ({share:.3g}%)")
+        else:
+            lines.append(f"{value:.10g}: {lower}~{count} 次 (≤{share:.3g}%)")
+    if error_bound:
+        lines.append(f"（近似值，计数最多多算 {error_bound} 次）")
+    return "\n".join(lines)
+
+
+def count_file(path, column=None, max_exact=MAX_EXACT, capacity=DEFAULT_CAPACITY, modified=None):
+    """逐块读取数据文件并统计出现次数，modified只用于区分文件版本（结果缓存的键）"""
+    import datasets
+    return FrequencyCounter.from_chunks(datasets.iter_chunks(path, column),
+                                        max_exact=max_exact, capacity=capacity)
@@ -0,0 +1,216 @@
+"""LaTeX显示：只加载一次的MathJax页面
+
+页面和MathJax只在启动时加载一次，之后每次更新只通过runJavaScript把新的公式交给MathJax，
+只重新排版发生变化的节点。
+优先使用本地的 mathjax/tex-svg-full.js（SVG输出不需要字体文件，full版本包含全部TeX扩展，可完全离线），
+找不到时才退回到CDN。
+
+也可以选择不依赖QtWebEngine的轻量显示（mathtext_view.MathTextView），见 choose_renderer()。
+"""
+import json
+import os
+import sys
+
+from PySide6.QtCore import QUrl, QSettings
+
+MATHJAX_CDN = "https://cdn.jsdelivr.net/npm/mathjax@3/es5/tex-svg-full.js"
+
+# 公式渲染方式：mathjax（QtWebEngine）或 mathtext（matplotlib，轻量）
+RENDERERS = ("mathjax", "mathtext")
+DEFAULT_RENDERER = "mathjax"
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<style>
+    body { margin: 0; font-size: 24px; text-align: center; }
+    .slot { padding: 20px; }
+    .slot:empty { display: none; }
+    .text { font-size: 16px; color: #666; }
+    #result { color: green; }
+</style>
+<script>
+    var ready = false;
+    var queued = {};
+
+    function draw(id, tex, isText) {
+        var node = document.getElementById(id);
+        if (!node) { return; }
+        if (isText || !tex) {
+            node.className = isText ? "slot text" : "slot";
+            node.textContent = tex || "";
+            return;
+        }
+        node.className = "slot";
+        node.replaceChildren(MathJax.tex2svg(tex, {display: true}));
+    }
+
+    // 由Python端调用；MathJax还没准备好时先记下最新的内容
+    function kalcRender(id, tex, isText) {
+        if (!ready && !isText) {
+            queued[id] = tex;
+            return;
+        }
+        delete queued[id];
+        draw(id, tex, isText);
+    }
+
+    window.MathJax = {
+        svg: {fontCache: 'global'},
+        startup: {
+            typeset: false,
+            pageReady: function () {
+                return MathJax.startup.defaultPageReady().then(function () {
+                    ready = true;
+                    for (var id in queued) { draw(id, queued[id], false); }
+                    queued = {};
+                });
+            }
+        }
+    };
+</script>
+<script id="MathJax-script" async src="%(script)s"></script>
+</head>
+<body>
+%(slots)s
+</body>
+</html>
+"""
+
+
+def find_local_mathjax():
+    """查找本地MathJax，返回tex-svg-full.js所在目录，找不到时返回None"""
+    candidates = [
+        os.environ.get("KALCULATE_MATHJAX", ""),
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "mathjax"),
+    ]
+    for directory in candidates:
+        for sub in ("", "es5"):
+            if directory and os.path.isfile(os.path.join(directory, sub, "tex-svg-full.js")):
+                return os.path.join(directory, sub)
+    return None
+
+
+class MathJaxView:
+    """在QWebEngineView中显示若干个公式区域（如输入和结果）"""
+
+    def __init__(self, web_view, slots=("input", "result")):
+        self.web_view = web_view
+        self.slots = slots
+        self.loaded = False
+        self.queued = {}
+
+        local_dir = find_local_mathjax()
+        if local_dir:
+            script = "tex-svg-full.js"
+            base_url = QUrl.fromLocalFile(local_dir + os.sep)
+        else:
+            script = MATHJAX_CDN
+            base_url = QUrl()
+        self.offline = local_dir is not None
+
+        slots_html = "\n".join(f'<div id="{name}" class="slot"></div>' for name in slots)
+        self.web_view.loadFinished.connect(self.on_load_finished)
+        self.web_view.setHtml(PAGE_TEMPLATE % {"script": script, "slots": slots_html}, base_url)
+
+    def on_load_finished(self, ok):
+        """页面加载完成后，执行加载期间积压的更新"""
+        self.loaded = True
+        for script in self.queued.values():
+            self.web_view.page().runJavaScript(script)
+        self.queued.clear()
+
+    def _render(self, slot, content, is_text):
+        script = f"kalcRender({json.dumps(slot)}, {json.dumps(content)}, {'true' if is_text else 'false'});"
+        if self.loaded:
+            self.web_view.page().runJavaScript(script)
+        else:
+            # 同一区域只保留最新的一次更新
+            self.queued[slot] = script
+
+    def set_latex(self, slot, latex):
+        """在指定区域显示LaTeX公式"""
+        self._render(slot, latex or "", False)
+
+    def set_text(self, slot, text):
+        """在指定区域显示普通文字（如提示或错误信息）"""
+        self._render(slot, text or "", True)
+
+    def clear(self, slot=None):
+        """清空指定区域，不指定时清空全部"""
+        for name in ([slot] if slot else self.slots):
+            self._render(name, "", False)
+
+
+def choose_renderer(argv=None):
+    """确定公式渲染方式
+
+    优先级：命令行 --renderer=mathtext > 环境变量KALCULATE_RENDERER > QSettings的display/renderer。
+    选择mathjax时在这里导入QtWebEngineWidgets（必须在创建QApplication之前），
+    导入失败则改用mathtext；选择mathtext时完全不导入QtWebEngine。
+    """
+    renderer = None
+    for arg in (argv or []):
+        if arg.startswith("--renderer="):
+            renderer = arg.split("=", 1)[1]
+    if renderer is None:
+        renderer = os.environ.get("KALCULATE_RENDERER")
+    if renderer is None:
+        renderer = QSettings("RSRepository", "Kalculate").value("display/renderer", DEFAULT_RENDERER)
+    if renderer not in RENDERERS:
+        renderer = DEFAULT_RENDERER
+
+    if renderer == "mathjax":
+        try:
+            import PySide6.QtWebEngineWidgets
+        except (ImportError, OSError, RuntimeError):
+            renderer = "mathtext"
+    return renderer
+
+
+def effective_renderer(renderer):
+    """实际可用的渲染方式：QtWebEngineWidgets没有在创建QApplication之前导入时，mathjax模式不可用"""
+    if renderer == "mathjax" and "PySide6.QtWebEngineWidgets" not in sys.modules:
+        return "mathtext"
+    return renderer
+
+
+def web_view_class():
+    """预生成的界面模块用：已导入QtWebEngine（mathjax模式）时返回QWebEngineView，否则返回占位控件"""
+    module = sys.modules.get("PySide6.QtWebEngineWidgets")
+    if module is not None:
+        return module.QWebEngineView
+    from PySide6.QtWidgets import QWidget
+
+    class WebViewPlaceholder(QWidget):
+        """mathtext模式下webEngineView的占位控件，之后由create_latex_view替换"""
+
+        def setUrl(self, url):
+            pass
+
+    return WebViewPlaceholder
+
+
+def create_latex_view(placeholder, renderer, slots=("input", "result")):
+    """在ui文件中的webEngineView位置创建公式显示
+
+    mathtext模式下没有导入QtWebEngine，QUiLoader会把webEngineView创建成普通QWidget，
+    这里用MathTextView替换掉它；mathjax模式下占位控件不是QWebEngineView时也一样。
+    """
+    web_engine = sys.modules.get("PySide6.QtWebEngineWidgets")
+    if renderer == "mathjax" and web_engine is not None and isinstance(placeholder, web_engine.QWebEngineView):
+        return MathJaxView(placeholder, slots)
+
+    from mathtext_view import MathTextView
+    view = MathTextView(slots, parent=placeholder.parentWidget())
+    view.setObjectName(placeholder.objectName())
+    view.setSizePolicy(placeholder.sizePolicy())
+    view.setMinimumSize(placeholder.minimumSize())
+    view.setMaximumSize(placeholder.maximumSize())
+    layout = placeholder.parentWidget().layout() if placeholder.parentWidget() else None
+    if layout is not None:
+        layout.replaceWidget(placeholder, view)
+    placeholder.hide()
+    placeholder.deleteLater()
+    return view
@@ -0,0 +1,91 @@
+"""快速启动入口
+
+先只导入QtWidgets并显示启动画面，再导入计算器模块（SymPy等重量级依赖在这时才加载），
+窗口显示后在事件循环空闲时依次执行预热任务（启动工作进程、预解析表达式、预渲染公式）。
+
+    python launcher.py [Kalculate|NewKalculate|NewCalculator] [--renderer=mathtext]
+
+设置环境变量 KALCULATE_STARTUP_BENCHMARK=1 时，窗口显示后输出一行JSON格式的启动耗时并退出
+（见 benchmarks/startup_benchmark.py）。
+"""
+import time
+
+STARTED_AT = time.perf_counter()
+
+import importlib
+import json
+import os
+import sys
+
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtWidgets import QApplication, QSplashScreen
+from PySide6.QtGui import QPixmap, QColor
+
+from latex_view import choose_renderer
+
+APPS = ("Kalculate", "NewKalculate", "NewCalculator")
+DEFAULT_APP = "Kalculate"
+
+
+def elapsed_ms():
+    return round((time.perf_counter() - STARTED_AT) * 1000, 1)
+
+
+def show_splash():
+    """显示一个不依赖图片文件的简单启动画面"""
+    pixmap = QPixmap(360, 120)
+    pixmap.fill(QColor("#2b2b2b"))
+    splash = QSplashScreen(pixmap)
+    splash.showMessage("Kalculate 正在启动...", Qt.AlignCenter, QColor("white"))
+    splash.show()
+    return splash
+
+
+def run_warm_up(tasks):
+    """每次事件循环空闲时执行一个预热任务，避免界面长时间无响应"""
+    if not tasks:
+        return
+    task = tasks.pop(0)
+    try:
+        task()
+    except Exception as e:
+        print(f"预热失败: {str(e)}")
+    QTimer.singleShot(0, lambda: run_warm_up(tasks))
+
+
+def main(argv=None):
+    argv = sys.argv if argv is None else argv
+    app_name = next((arg for arg in argv[1:] if arg in APPS), DEFAULT_APP)
+    benchmark = bool(os.environ.get("KALCULATE_STARTUP_BENCHMARK"))
+    timings = {}
+
+    # QtWebEngine（如果需要）必须在创建QApplication之前导入
+    renderer = choose_renderer(argv)
+    app = QApplication(argv)
+    splash = show_splash()
+    app.processEvents()
+    timings["splash_ms"] = elapsed_ms()
+
+    # 启动画面显示之后才导入计算器模块，SymPy等在这里加载
+    module = importlib.import_module(app_name)
+    timings["import_ms"] = elapsed_ms()
+
+    window = module.CalculatorApp(renderer)
+    window.show()
+    splash.finish(window)
+    app.processEvents()
+    timings["window_ms"] = elapsed_ms()
+
+    if benchmark:
+        timings.update({"app": app_name, "renderer": renderer})
+        print(json.dumps(timings), flush=True)
+        window.close()
+        return 0
+
+    if hasattr(window, "warm_up_tasks"):
+        QTimer.singleShot(0, lambda: run_warm_up(window.warm_up_tasks()))
+    return app.exec()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,138 @@
+"""轻量公式显示：用matplotlib mathtext把LaTeX渲染成图片，放在QLabel中
+
+不需要QtWebEngine（完整的Chromium），启动更快、内存占用小得多。
+mathtext只支持TeX的一个子集，遇到不支持的写法时直接显示LaTeX源码。
+"""
+import io
+import re
+from collections import OrderedDict
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QPixmap
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QSizePolicy
+
+# mathtext不支持的MathJax扩展，渲染前去掉
+UNSUPPORTED_PATTERNS = [
+    (re.compile(r"\\bbox\[[^\]]*\]"), ""),
+    (re.compile(r"\\color\{[^}]*\}"), ""),
+    (re.compile(r"\\displaystyle"), ""),
+]
+
+SLOT_COLORS = {"result": "green"}
+
+
+def to_mathtext(latex):
+    """把sp.latex的输出转换为mathtext可以处理的形式"""
+    for pattern, replacement in UNSUPPORTED_PATTERNS:
+        latex = pattern.sub(replacement, latex)
+    return latex.replace("\n", " ")
+
+
+class PixmapCache:
+    """渲染结果的LRU缓存，键为 (公式, 颜色, 字号, dpi)"""
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        pixmap = self.entries.get(key)
+        if pixmap is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return pixmap
+
+    def put(self, key, pixmap):
+        self.entries[key] = pixmap
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
+
+
+class MathTextView(QWidget):
+    """与MathJaxView接口相同的公式显示控件，每个区域是一个QLabel"""
+
+    def __init__(self, slots=("input", "result"), parent=None, font_size=20, cache_size=128):
+        super().__init__(parent)
+        self.slots = slots
+        self.font_size = font_size
+        self.cache = PixmapCache(cache_size)
+        self.offline = True
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(4, 4, 4, 4)
+        self.labels = {}
+        for name in slots:
+            label = QLabel(self)
+            label.setAlignment(Qt.AlignCenter)
+            label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
+            label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+            layout.addWidget(label)
+            self.labels[name] = label
+        # 当前显示的内容，相同时不重复渲染
+        self.current = {}
+
+    def render_pixmap(self, latex, color):
+        """渲染公式，返回QPixmap；mathtext无法解析时抛出ValueError"""
+        ratio = self.devicePixelRatioF()
+        dpi = int(100 * ratio)
+        key = (latex, color, self.font_size, dpi)
+        pixmap = self.cache.get(key)
+        if pixmap is not None:
+            return pixmap
+
+        # matplotlib在第一次渲染时才导入，不拖慢启动
+        from matplotlib.figure import Figure
+        figure = Figure(figsize=(0.01, 0.01))
+        figure.text(0, 0, f"${to_mathtext(latex)}$", fontsize=self.font_size, color=color)
+        buffer = io.BytesIO()
+        figure.savefig(buffer, dpi=dpi, format="png", transparent=True,
+                       bbox_inches="tight", pad_inches=0.05)
+
+        pixmap = QPixmap()
+        pixmap.loadFromData(buffer.getvalue(), "PNG")
+        pixmap.setDevicePixelRatio(ratio)
+        self.cache.put(key, pixmap)
+        return pixmap
+
+    def warm_up(self):
+        """预先导入matplotlib并渲染一次，使第一次显示公式时不卡顿"""
+        self.render_pixmap("x", "black")
+
+    def set_latex(self, slot, latex):
+        """在指定区域显示LaTeX公式"""
+        label = self.labels.get(slot)
+        if label is None or self.current.get(slot) == ("latex", latex):
+            return
+        self.current[slot] = ("latex", latex)
+
+        if not latex:
+            label.clear()
+            return
+        try:
+            label.setPixmap(self.render_pixmap(latex, SLOT_COLORS.get(slot, "black")))
+        except (ValueError, RuntimeError) as e:
+            # mathtext不支持的写法（如矩阵环境），显示源码
+            print(f"mathtext rendering error: {str(e)}")
+            label.setText(latex)
+
+    def set_text(self, slot, text):
+        """在指定区域显示普通文字（如提示或错误信息）"""
+        label = self.labels.get(slot)
+        if label is None or self.current.get(slot) == ("text", text):
+            return
+        self.current[slot] = ("text", text)
+        label.setText(text or "")
+
+    def clear(self, slot=None):
+        """清空指定区域，不指定时清空全部"""
+        for name in ([slot] if slot else self.slots):
+            if name in self.labels:
+                self.current[name] = ("latex", "")
+                self.labels[name].clear()
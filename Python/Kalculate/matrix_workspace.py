@@ -0,0 +1,269 @@
+"""矩阵工作区（不依赖Qt）
+
+矩阵以numpy数组的形式按名字保存（A、B、Ans……），可以从.npy（内存映射）或.csv文件载入、保存为.npy/.csv，
+并在表达式中按名字引用。表达式只允许有限的语法（名字、数字、矩阵字面量、+ - * / @ **、.T 和白名单中的函数），
+由AST逐个节点计算，不使用eval，结果保存在工作区中，不会转换成字符串再解析。
+安装了SciPy时，非零元素很少的大矩阵自动以稀疏格式保存（见sparse_support.py）。
+exact(A) 把矩阵转换为整数/有理数的精确矩阵，之后的det、inv、solve、rref等都按精确算法计算（见exact_matrix.py）。
+
+    workspace.evaluate("C = A @ inv(B)")   # 结果保存为C和Ans
+"""
+import ast
+import operator
+import os
+import re
+
+import numpy as np
+
+import datasets
+import exact_matrix
+import sparse_support
+from exact_matrix import ExactMatrix
+from factorizations import ConditionEstimate, Factorization, FactorizationCache, LogDeterminant
+
+ANSWER = "Ans"
+NAME_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+PREVIEW_ITEMS = 16
+
+BINARY_OPERATORS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.MatMult: operator.matmul,
+    ast.Pow: operator.pow,
+}
+
+UNARY_OPERATORS = {
+    ast.USub: operator.neg,
+    ast.UAdd: operator.pos,
+}
+
+
+def _rank(a):
+    if isinstance(a, ExactMatrix):
+        return exact_matrix.rank(a)
+    if sparse_support.is_sparse(a):
+        raise ValueError("稀疏矩阵不支持rank")
+    return int(np.linalg.matrix_rank(a))
+
+
+def _trace(a):
+    if isinstance(a, ExactMatrix):
+        return sum(a.diagonal())
+    return float(a.diagonal().sum())
+
+
+def _norm(a):
+    if isinstance(a, ExactMatrix):
+        a = a.to_array()
+    if sparse_support.is_sparse(a):
+        return sparse_support.norm(a)
+    return float(np.linalg.norm(a))
+
+
+# 表达式中可以调用的函数
+FUNCTIONS = {
+    "transpose": lambda a: a.T,
+    "rank": _rank,
+    "trace": _trace,
+    "norm": _norm,
+    "eye": lambda n: np.eye(int(n)),
+    "zeros": lambda rows, cols=None: np.zeros((int(rows), int(rows if cols is None else cols))),
+    "ones": lambda rows, cols=None: np.ones((int(rows), int(rows if cols is None else cols))),
+    "exact": ExactMatrix.from_value,
+    "numeric": lambda a: a.to_array() if isinstance(a, ExactMatrix) else a,
+    "rref": lambda a: exact_matrix.rref(a)[0],
+}
+
+# 需要矩阵分解的函数，由工作区的分解缓存计算（见factorizations.py）
+FACTORIZED_FUNCTIONS = ("det", "slogdet", "inv", "solve", "cond")
+
+
+def load_csv(path):
+    """读取CSV/TSV/空白分隔的二维数据，第一行不是数值时视为表头跳过"""
+    with open(path, encoding="utf-8-sig") as f:
+        first = f.readline()
+    delimiter = datasets.detect_delimiter(first)
+    skiprows = 1 if datasets.is_header(first, delimiter) else 0
+    return np.loadtxt(path, delimiter=delimiter, skiprows=skiprows, ndmin=2, encoding="utf-8-sig")
+
+
+def load_matrix(path):
+    """载入矩阵文件，.npy以只读内存映射方式打开，.npz/.mtx为稀疏矩阵"""
+    lower = path.lower()
+    if lower.endswith(sparse_support.SPARSE_EXTENSIONS):
+        value = sparse_support.load(path)
+    elif lower.endswith(".npy"):
+        value = np.load(path, mmap_mode="r")
+    else:
+        value = load_csv(path)
+    return sparse_support.choose_format(value)
+
+
+def describe(value):
+    """矩阵的简短描述（形状和类型），较小的矩阵附带内容"""
+    if isinstance(value, (LogDeterminant, ConditionEstimate)):
+        return str(value)
+    if np.isscalar(value):
+        return f"{value:.10g}" if isinstance(value, float) else str(value)
+    if isinstance(value, tuple):
+        return "(" + ", ".join(describe(item) for item in value) + ")"
+    shape = "×".join(str(size) for size in value.shape) or "1"
+    if isinstance(value, ExactMatrix):
+        text = f"{shape} 精确矩阵"
+        if value.shape[0] * value.shape[1] <= PREVIEW_ITEMS:
+            text += " " + str(value)
+        return text
+    if sparse_support.is_sparse(value):
+        return f"{shape} 稀疏({value.format.upper()}) {value.nnz}个非零元素 ({sparse_support.density(value):.3%})"
+    text = f"{shape} {value.dtype}"
+    if value.size <= PREVIEW_ITEMS:
+        text += " " + np.array2string(np.asarray(value), separator=", ").replace("\n", "")
+    return text
+
+
+class MatrixWorkspace:
+    """按名字保存的矩阵"""
+
+    def __init__(self):
+        self.arrays = {}
+        self.factorizations = FactorizationCache()
+        self.functions = dict(FUNCTIONS, det=self.det, slogdet=self.slogdet, inv=self.inv,
+                              solve=self.solve, cond=self.cond)
+
+    def __contains__(self, name):
+        return name in self.arrays
+
+    def names(self):
+        return sorted(self.arrays)
+
+    def get(self, name):
+        try:
+            return self.arrays[name]
+        except KeyError:
+            raise ValueError(f"未定义的矩阵: {name}") from None
+
+    def set(self, name, value):
+        if not NAME_PATTERN.match(name) or name in FUNCTIONS or name in FACTORIZED_FUNCTIONS:
+            raise ValueError(f"不能用作矩阵名: {name}")
+        self.arrays[name] = value
+
+    def remove(self, name):
+        self.arrays.pop(name, None)
+
+    def load(self, path, name=None):
+        """载入文件并保存为name（默认为文件名），返回使用的名字"""
+        if name is None:
+            stem = os.path.splitext(os.path.basename(path))[0]
+            name = re.sub(r"\W", "_", stem)
+            if not NAME_PATTERN.match(name):
+                name = "M_" + name
+        self.set(name, load_matrix(path))
+        return name
+
+    def save(self, name, path):
+        """保存为.npy或.csv文件"""
+        value = self.get(name)
+        if isinstance(value, ExactMatrix):
+            if path.lower().endswith(".npy"):
+                np.save(path, value.to_array())
+            else:
+                # 保留分数形式（如 1/3），可以再用 exact() 处理
+                delimiter = "\t" if path.lower().endswith(".tsv") else ","
+                with open(path, "w", encoding="utf-8") as f:
+                    f.writelines(delimiter.join(str(item) for item in row) + "\n" for row in value.rows)
+        elif sparse_support.is_sparse(value):
+            if not path.lower().endswith(sparse_support.SPARSE_EXTENSIONS):
+                raise ValueError("稀疏矩阵请保存为.npz或.mtx文件")
+            sparse_support.save(value, path)
+        elif path.lower().endswith(".npy"):
+            np.save(path, value)
+        else:
+            delimiter = "\t" if path.lower().endswith(".tsv") else ","
+            np.savetxt(path, np.atleast_2d(value), delimiter=delimiter)
+
+    def slogdet(self, matrix):
+        """行列式 (符号, log|det|)，与inv、solve、cond共用同一个分解；精确矩阵直接给出精确行列式"""
+        if isinstance(matrix, ExactMatrix):
+            return exact_matrix.det(matrix)
+        return self.factorizations.get(matrix).slogdet()
+
+    def det(self, matrix):
+        if isinstance(matrix, ExactMatrix):
+            return exact_matrix.det(matrix)
+        return self.slogdet(matrix).value()
+
+    def inv(self, matrix):
+        if isinstance(matrix, ExactMatrix):
+            return exact_matrix.inverse(matrix)
+        if sparse_support.is_sparse(matrix):
+            # 稠密结果不太大时转换为稠密矩阵求逆，否则拒绝
+            if not sparse_support.dense_inverse_allowed(matrix):
+                raise sparse_support.DenseInverseRefused()
+            return Factorization(matrix.toarray()).inverse()
+        return self.factorizations.get(matrix).inverse()
+
+    def solve(self, matrix, rhs):
+        if isinstance(matrix, ExactMatrix) or isinstance(rhs, ExactMatrix):
+            return exact_matrix.solve(matrix, rhs)
+        return self.factorizations.get(matrix).solve(rhs)
+
+    def cond(self, matrix):
+        if isinstance(matrix, ExactMatrix):
+            return exact_matrix.cond(matrix)
+        return self.factorizations.get(matrix).cond()
+
+    def evaluate(self, text):
+        """计算表达式，支持 "名字 = 表达式"；结果保存为Ans（以及指定的名字），返回 (名字, 结果)"""
+        name, value = self.compute(text)
+        self.store(name, value)
+        return name, value
+
+    def compute(self, text):
+        """计算表达式但不保存结果，返回 (名字, 结果)；界面在后台线程中调用，完成后再用store保存"""
+        tree = ast.parse(text.strip(), mode="exec")
+        if len(tree.body) != 1:
+            raise ValueError("一次只能计算一个表达式")
+        statement = tree.body[0]
+        if isinstance(statement, ast.Assign):
+            if len(statement.targets) != 1 or not isinstance(statement.targets[0], ast.Name):
+                raise ValueError("只能给一个名字赋值")
+            name = statement.targets[0].id
+            node = statement.value
+        elif isinstance(statement, ast.Expr):
+            name = ANSWER
+            node = statement.value
+        else:
+            raise ValueError("不支持的语句")
+
+        return name, sparse_support.choose_format(self._eval(node))
+
+    def store(self, name, value):
+        """保存计算结果为Ans（以及指定的名字）"""
+        if name != ANSWER:
+            self.set(name, value)
+        self.set(ANSWER, value)
+
+    def _eval(self, node):
+        if isinstance(node, ast.Constant) and isinstance(node.value, (int, float, complex)):
+            return node.value
+        if isinstance(node, ast.Name):
+            return self.get(node.id)
+        if isinstance(node, ast.List):
+            return np.array(ast.literal_eval(node), dtype=float)
+        if isinstance(node, ast.BinOp) and type(node.op) in BINARY_OPERATORS:
+            return BINARY_OPERATORS[type(node.op)](self._eval(node.left), self._eval(node.right))
+        if isinstance(node, ast.UnaryOp) and type(node.op) in UNARY_OPERATORS:
+            return UNARY_OPERATORS[type(node.op)](self._eval(node.operand))
+        if isinstance(node, ast.Attribute) and node.attr == "T":
+            return self._eval(node.value).T
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and not node.keywords:
+            func = self.functions.get(node.func.id)
+            if func is None:
+                raise ValueError(f"未知的函数: {node.func.id}")
+            if node.func.id == "exact" and len(node.args) == 1 and isinstance(node.args[0], ast.List):
+                # 矩阵字面量直接按Python整数读入，超过2⁵³的整数也不会丢失精度
+                return func(ast.literal_eval(node.args[0]))
+            return func(*[self._eval(arg) for arg in node.args])
+        raise ValueError(f"不支持的表达式: {ast.unparse(node)}")
@@ -0,0 +1,256 @@
+"""方程的数值解（不依赖Qt）
+
+sp.solve / sp.roots 在超越方程上可能算很久甚至卡死，对高次多项式只能给出CRootOf，这里给出近似解：
+  - 数值系数的多项式：有理系数时先做无平方分解（精确地得到重数），每个因子求伴随矩阵的特征值（numpy），
+    再用mpmath在更高精度下做牛顿迭代修正；浮点系数时按距离把特征值分组作为重根；
+  - 其他方程：在区间上向量化扫描，所有变号的区间同时二分，排除极点和跳跃间断后再用 mpmath.findroot
+    （sp.nsolve 使用的求解器）修正；|f|的局部极小值（可能是偶数重根）作为起点多次调用findroot，
+    没有实根时再从几个复数起点出发。总时间不超过time_budget。
+界面在后台进程中让它与符号求解同时运行（EvaluationEngine.race），显示先完成的一个，并标明是精确解还是近似解。
+
+    numeric_solve.solve(sp.cos(x) - x, x)      # [0.739085133215161]
+"""
+import math
+import time
+
+import mpmath
+import numpy as np
+import sympy as sp
+
+from plotting import evaluate_function
+
+TIME_BUDGET = 5.0
+# 数值解至少等待符号解这么多秒，简单的方程仍然显示精确解
+SYMBOLIC_HEAD_START = 1.0
+SCAN_INTERVAL = (-100.0, 100.0)
+SCAN_POINTS = 200_001
+BISECTION_STEPS = 60
+POLISH_STEPS = 8
+CLUSTER_TOLERANCE = 1e-4
+# |f|的局部极小值只有比附近（两侧各TOUCH_WINDOW个扫描点内）最大的|f|小得多时才可能是偶数重根，
+# 否则只是舍入误差造成的平台（如 exp(x) - 2 在x很小时）
+TOUCH_WINDOW = 64
+TOUCH_RATIO = 1e-2
+# 相距不超过这么多个扫描点的极小值合并为一个，离变号区间求出的根这么近的也跳过
+TOUCH_MERGE_POINTS = 8
+MAX_TOUCH_STARTS = 100
+EXTRA_DIGITS = 15
+COMPLEX_STARTS = [complex(radius * math.cos(angle), radius * math.sin(angle))
+                  for radius in (1.0, 4.0) for angle in (0.5, 1.5, 2.5)]
+
+
+def _equation(expr):
+    """方程 lhs = rhs 转换为 lhs - rhs"""
+    expr = sp.sympify(expr)
+    if isinstance(expr, sp.Eq):
+        return expr.lhs - expr.rhs
+    return expr
+
+
+def _to_sympy(value, digits):
+    """mpmath或Python数值转换为SymPy数值，可以忽略的虚部（或实部）去掉"""
+    value = complex(value)
+    real, imag = value.real, value.imag
+    if abs(imag) <= 1e-12 * max(1.0, abs(real)):
+        return sp.Float(real, digits)
+    if abs(real) <= 1e-12 * abs(imag):
+        return sp.Float(imag, digits) * sp.I
+    return sp.Float(real, digits) + sp.Float(imag, digits) * sp.I
+
+
+def is_numeric_polynomial(expr, var):
+    """是否为var的多项式，且系数都是数值"""
+    return expr.is_polynomial(var) and expr.free_symbols <= {var}
+
+
+def _companion_roots(coeffs):
+    """伴随矩阵的特征值（coeffs为从高次到低次的系数）"""
+    coeffs = np.asarray(coeffs, dtype=complex)
+    n = len(coeffs) - 1
+    companion = np.zeros((n, n), dtype=complex)
+    companion[0, :] = -coeffs[1:] / coeffs[0]
+    companion[1:, :-1] = np.eye(n - 1)
+    return np.linalg.eigvals(companion)
+
+
+def _clusters(values, tolerance=CLUSTER_TOLERANCE):
+    """把相距很近的特征值分为一组（重根的特征值会分裂成一圈），返回 [(平均值, 个数)]"""
+    remaining = list(values)
+    clusters = []
+    while remaining:
+        center = remaining.pop()
+        members = [center] + [value for value in remaining if abs(value - center) <= tolerance * max(1.0, abs(center))]
+        remaining = [value for value in remaining if abs(value - center) > tolerance * max(1.0, abs(center))]
+        clusters.append((sum(members) / len(members), len(members)))
+    return clusters
+
+
+def polynomial_roots(expr, var, digits=15):
+    """数值系数多项式的全部根，返回 {根: 重数}（与sp.roots的格式相同）"""
+    poly = sp.Poly(_equation(expr), var)
+    if poly.degree() < 1:
+        return {}
+    if not poly.get_domain().is_Exact:
+        return _simple_roots(poly, digits, cluster=True)
+    # 无平方分解后每个因子只有单根，重根不会让特征值分裂成一圈
+    roots = {}
+    for factor, multiplicity in poly.sqf_list()[1]:
+        for root in _simple_roots(factor, digits):
+            roots[root] = roots.get(root, 0) + multiplicity
+    return roots
+
+
+def _simple_roots(poly, digits, cluster=False):
+    """伴随矩阵的特征值加牛顿迭代，cluster为True时把相距很近的特征值当作重根，返回 {根: 重数}"""
+    coeffs = poly.all_coeffs()
+    with mpmath.workdps(digits + EXTRA_DIGITS):
+        mp_coeffs = [mpmath.mpc(*(mpmath.mpf(sp.Float(part, digits + EXTRA_DIGITS)) for part in coeff.as_real_imag()))
+                     for coeff in coeffs]
+        # 先去掉x=0的根，避免伴随矩阵中出现大片的0
+        zeros = 0
+        while len(coeffs) - zeros > 1 and coeffs[len(coeffs) - 1 - zeros] == 0:
+            zeros += 1
+        roots = {}
+        if zeros:
+            roots[sp.Integer(0)] = zeros
+        if len(coeffs) - zeros > 1:
+            eigenvalues = _companion_roots([complex(coeff) for coeff in coeffs[:len(coeffs) - zeros]])
+            groups = _clusters(eigenvalues) if cluster else [(value, 1) for value in eigenvalues]
+            for center, multiplicity in groups:
+                # 重根用修正的牛顿法 z -= m p/p'，仍然是二次收敛
+                z = mpmath.mpc(center)
+                for _ in range(POLISH_STEPS):
+                    value, derivative = mpmath.polyval(mp_coeffs, z, derivative=True)
+                    if derivative == 0:
+                        break
+                    step = multiplicity * value / derivative
+                    z -= step
+                    if abs(step) <= mpmath.eps * max(1, abs(z)):
+                        break
+                root = _to_sympy(z, digits)
+                roots[root] = roots.get(root, 0) + multiplicity
+    return roots
+
+
+def _bisect(f, a, b, fa, steps=BISECTION_STEPS):
+    """对所有变号的区间同时二分，返回 (a, b, f(a), f(b))"""
+    for _ in range(steps):
+        mid = (a + b) / 2
+        fm = evaluate_function(f, mid)
+        with np.errstate(invalid="ignore"):
+            left = (fa > 0) != (fm > 0)
+        b = np.where(left, mid, b)
+        a, fa = np.where(left, a, mid), np.where(left, fa, fm)
+    return a, b, fa, evaluate_function(f, b)
+
+
+def _candidates(f, interval, points=SCAN_POINTS):
+    """扫描区间，返回 (变号区间求出的近似根, |f|局部极小值的位置)"""
+    x = np.linspace(*interval, points)
+    y = evaluate_function(f, x)
+    # 连续几个扫描点都恰好为0时是下溢（如 exp(-x**2) 在|x|较大时），不是根
+    zero = np.pad(y == 0, 1)
+    exact = x[zero[1:-1] & ~zero[:-2] & ~zero[2:]]
+
+    with np.errstate(invalid="ignore"):
+        changes = np.flatnonzero(((y[:-1] > 0) != (y[1:] > 0)) & np.isfinite(y[:-1]) & np.isfinite(y[1:]))
+    changes = changes[(y[changes] != 0) & (y[changes + 1] != 0)]
+    a, b, fa, fb = _bisect(f, x[changes], x[changes + 1], y[changes])
+    # 极点和跳跃两侧也会变号，二分后|f|不会变小
+    with np.errstate(invalid="ignore"):
+        root = np.abs(fa) + np.abs(fb) < np.abs(y[changes]) + np.abs(y[changes + 1])
+    brackets = (a[root] + b[root]) / 2
+
+    roots = np.concatenate([exact, brackets])
+    return roots, _touching_starts(x, y, roots)
+
+
+def _touching_starts(x, y, roots):
+    """不变号的|f|局部极小值（附近可能有偶数重根，如 sin(x)**2），返回求根的起点"""
+    magnitude = np.abs(y)
+    with np.errstate(invalid="ignore"):
+        minima = np.flatnonzero((magnitude[1:-1] < magnitude[:-2]) & (magnitude[1:-1] <= magnitude[2:])) + 1
+    minima = minima[(y[minima - 1] > 0) == (y[minima + 1] > 0)]
+
+    # 与附近|f|的大小相比不够小的极小值是舍入误差造成的
+    scale = np.pad(np.where(np.isfinite(magnitude), magnitude, 0.0), TOUCH_WINDOW)
+    windows = np.lib.stride_tricks.sliding_window_view(scale, 2 * TOUCH_WINDOW + 1)
+    minima = minima[magnitude[minima] <= TOUCH_RATIO * windows[minima].max(axis=1)]
+
+    # 相邻的极小值只保留|f|最小的一个
+    step = x[1] - x[0]
+    groups = np.split(minima, np.flatnonzero(np.diff(minima) > TOUCH_MERGE_POINTS) + 1)
+    starts = x[[group[np.argmin(magnitude[group])] for group in groups if group.size]]
+
+    # 已经由变号区间求出的根附近不再重复求根
+    if roots.size and starts.size:
+        nearest = np.abs(starts[:, None] - roots[None, :]).min(axis=1)
+        starts = starts[nearest > TOUCH_MERGE_POINTS * step]
+    return starts
+
+
+def _unique(values, digits):
+    """去掉重复的根，实根在前并按大小排序"""
+    result = []
+    for value in sorted(values, key=lambda v: (abs(complex(v).imag) > 0, complex(v).real, complex(v).imag)):
+        if not result or abs(complex(value) - complex(result[-1])) > 10 ** (2 - digits) * max(1.0, abs(complex(value))):
+            result.append(value)
+    return [_to_sympy(value, digits) for value in result]
+
+
+def numeric_roots(expr, var, interval=SCAN_INTERVAL, time_budget=TIME_BUDGET, digits=15):
+    """一般方程在区间内的实根（没有实根时尝试复根），返回近似解的列表"""
+    expr = _equation(expr)
+    deadline = time.monotonic() + time_budget
+    f = sp.lambdify(var, expr, modules=["numpy"])
+    f_mp = sp.lambdify(var, expr, modules=["mpmath"])
+    brackets, starts = _candidates(f, interval)
+
+    def polish(start, solver="secant"):
+        try:
+            return mpmath.findroot(f_mp, start, solver=solver)
+        except (ValueError, ZeroDivisionError, TypeError, OverflowError):
+            return None
+
+    roots = []
+    with mpmath.workdps(digits + 5):
+        # 变号区间已经二分到机器精度，只需要在更高精度下修正
+        for start in brackets:
+            if time.monotonic() > deadline:
+                break
+            root = polish(mpmath.mpf(float(start)))
+            roots.append(float(start) if root is None else root)
+        # 不变号的局部极小值按|f|从小到大尝试，最多MAX_TOUCH_STARTS个
+        starts = sorted(starts, key=lambda s: abs(evaluate_function(f, np.array([s]))[0]))
+        for start in starts[:MAX_TOUCH_STARTS]:
+            if time.monotonic() > deadline:
+                break
+            # 偶数重根附近割线法只有线性收敛，用针对重根的牛顿法
+            root = polish(mpmath.mpf(float(start)), "mnewton")
+            if root is not None and interval[0] <= complex(root).real <= interval[1]:
+                roots.append(root)
+        if not roots:
+            for start in COMPLEX_STARTS:
+                if time.monotonic() > deadline:
+                    break
+                root = polish(mpmath.mpc(start))
+                if root is not None:
+                    roots.append(root)
+    return _unique(roots, digits)
+
+
+def solve(expr, var, time_budget=TIME_BUDGET, digits=15):
+    """数值解方程，表达式不是方程时视为 expr = 0；返回各个不同的近似解"""
+    expr = _equation(expr)
+    if is_numeric_polynomial(expr, var):
+        return sorted(polynomial_roots(expr, var, digits),
+                      key=lambda root: (not root.is_real, *(float(part) for part in root.as_real_imag())))
+    return numeric_roots(expr, var, time_budget=time_budget, digits=digits)
+
+
+def roots(expr, var, digits=15):
+    """多项式的近似根及重数（数值版的sp.roots）"""
+    expr = _equation(expr)
+    if not is_numeric_polynomial(expr, var):
+        raise ValueError("不是数值系数的多项式")
+    return polynomial_roots(expr, var, digits)
@@ -0,0 +1,54 @@
+"""表达式解析缓存
+
+parse_expr 每次调用都要分词、应用转换规则并构造表达式树，输入框每次变化和每个按钮都会重复解析同一个字符串。
+SymPy表达式是不可变的，所以解析结果可以安全地在各个操作之间共享。
+"""
+from collections import OrderedDict
+
+from sympy.parsing.sympy_parser import parse_expr, standard_transformations
+
+
+class ParseCache:
+    """以表达式文本、角度制和local_dict内容为键的LRU解析缓存"""
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def make_key(self, text, local_dict, transformations, angle_mode):
+        """构造缓存键，local_dict按名称排序以保证顺序无关"""
+        items = tuple(sorted((local_dict or {}).items(), key=lambda item: item[0]))
+        return (text, angle_mode, items, tuple(transformations))
+
+    def parse(self, text, local_dict=None, transformations=standard_transformations, angle_mode="RAD"):
+        """解析表达式，命中缓存时直接返回之前的结果"""
+        key = self.make_key(text, local_dict, transformations, angle_mode)
+        try:
+            expr = self.entries[key]
+        except KeyError:
+            pass
+        else:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return expr
+
+        self.misses += 1
+        # parse_expr可能会修改传入的字典，这里传一个副本
+        expr = parse_expr(text, local_dict=dict(local_dict or {}), transformations=transformations)
+        self.entries[key] = expr
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+        return expr
+
+    def clear(self):
+        """清空缓存和计数"""
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self):
+        """返回命中/未命中次数和当前大小"""
+        return {"hits": self.hits, "misses": self.misses,
+                "size": len(self.entries), "maxsize": self.maxsize}
@@ -0,0 +1,850 @@
+"""函数绘图的自适应采样（不依赖Qt）
+
+固定的 np.linspace 采样在陡峭或振荡的地方不够用，在平滑的地方又浪费点数，在极点处还会画出竖直的连线。
+adaptive_sample 从较粗的均匀网格开始，每一轮对所有待细分的区间一次性（向量化）计算中点，
+中点与线性插值相差超过容差（按视图高度换算）的区间继续二分，直到收敛、达到最小宽度或用完点数预算。
+细分到最小宽度仍无法收敛的区间视为间断点，在那里插入NaN使曲线断开。
+
+parametric_sample 用同样的二分方法对参数曲线 (x(t), y(t)) 采样，坐标按视图大小归一化，
+弦长或中点偏差过大的区间继续二分，因此点大致按弧长（屏幕上的长度）均匀分布。
+implicit_contour 画隐函数 f(x, y) = 0：先在粗网格上计算，只把可能含有零点的格子细分，
+最后对所有格子一次性（向量化）执行marching squares，得到的线段之间用NaN隔开。
+
+InteractivePlot 在画布上提供拖动平移和滚轮缩放，可以同时显示多条曲线（函数、参数曲线、隐函数）：
+每条曲线分别缓存自己的函数和采样结果，添加或显示一条曲线只对它采样；拖动时函数曲线只对新露出的x范围采样，
+并用blitting只重绘曲线。
+
+SurfacePlot 把二元函数f(x, y)画成曲面、等高线图或热图：同一个lambdify的函数在meshgrid上一次性计算，
+网格按点数预算确定大小并缓存，切换显示方式、改颜色或旋转曲面都不会重新计算；曲面只画按步长抽取后的网格。
+"""
+import math
+import time
+from collections import OrderedDict, deque
+
+import numpy as np
+import sympy as sp
+
+
+def evaluate_function(f, x, *more):
+    """批量计算f(x)（多元函数为f(x, y, ...)，各数组形状相同），复数结果和inf都转换为NaN"""
+    with np.errstate(all="ignore"):
+        try:
+            y = np.asarray(f(x, *more))
+        except (TypeError, ValueError, ZeroDivisionError, OverflowError):
+            # 无法向量化时逐点计算
+            points = zip(x.ravel(), *(array.ravel() for array in more))
+            y = np.array([_evaluate_point(f, *point) for point in points], dtype=object).reshape(x.shape)
+
+    if np.iscomplexobj(y):
+        real = y.real
+        # 虚部可以忽略时取实部，否则该点在实数范围内无定义
+        y = np.where(np.abs(y.imag) <= 1e-12 * (1 + np.abs(real)), real, np.nan)
+    if y.dtype == object:
+        y = np.array([_to_real(value) for value in np.broadcast_to(y, x.shape).ravel()],
+                     dtype=float).reshape(x.shape)
+
+    # 常数函数lambdify后返回标量
+    y = np.array(np.broadcast_to(y, x.shape), dtype=float)
+    y[~np.isfinite(y)] = np.nan
+    return y
+
+
+def _evaluate_point(f, *values):
+    try:
+        return f(*values)
+    except (TypeError, ValueError, ZeroDivisionError, OverflowError):
+        return np.nan
+
+
+def _to_real(value):
+    try:
+        value = complex(value)
+    except (TypeError, ValueError):
+        return np.nan
+    if abs(value.imag) > 1e-12 * (1 + abs(value.real)):
+        return np.nan
+    return value.real
+
+
+def estimate_y_range(y):
+    """未给出y范围时，用有限值的5%和95%分位数估计视图高度"""
+    finite = y[np.isfinite(y)]
+    if finite.size == 0:
+        return -1.0, 1.0
+    low, high = np.percentile(finite, [5, 95])
+    if high - low <= 0:
+        return low - 1.0, high + 1.0
+    return low, high
+
+
+def _interval_error(y0, y1, ym, y_min, y_max):
+    """中点与两端线性插值的偏差；端点与中点有的有定义有的没有时返回inf，以便定位定义域边界"""
+    with np.errstate(invalid="ignore"):
+        error = np.abs(ym - (y0 + y1) / 2)
+
+    finite = np.isfinite(np.stack([y0, y1, ym]))
+    some_finite = finite.any(axis=0)
+    all_finite = finite.all(axis=0)
+    error[some_finite & ~all_finite] = np.inf
+    error[~some_finite] = 0.0
+
+    # 三个点都在视图同一侧之外时不需要细分
+    with np.errstate(invalid="ignore"):
+        above = (y0 > y_max) & (y1 > y_max) & (ym > y_max)
+        below = (y0 < y_min) & (y1 < y_min) & (ym < y_min)
+    error[all_finite & (above | below)] = 0.0
+    return error
+
+
+def adaptive_sample(f, x_min, x_max, y_min=None, y_max=None, initial_points=65,
+                    max_points=4000, tolerance=1e-3, max_depth=14):
+    """自适应采样函数f，返回 (x, y)，间断处插入NaN
+
+    tolerance 为允许的线性插值误差占视图高度的比例（例如半个像素对应 0.5 / 画布像素高度），
+    max_points 为点数预算，max_depth 限制每个初始区间最多二分的次数。
+    """
+    x = np.linspace(x_min, x_max, initial_points)
+    y = evaluate_function(f, x)
+    if y_min is None or y_max is None:
+        y_min, y_max = estimate_y_range(y)
+    tol = tolerance * (y_max - y_min)
+    min_width = (x_max - x_min) / (initial_points - 1) / 2 ** max_depth
+
+    # 每个区间的误差估计，初始区间都需要检查
+    score = np.full(len(x) - 1, np.inf)
+    while True:
+        candidates = np.flatnonzero((score > tol) & (np.diff(x) > 2 * min_width))
+        budget = max_points - len(x)
+        if candidates.size == 0 or budget <= 0:
+            break
+        if candidates.size > budget:
+            # 点数不够时优先细分误差最大的区间
+            worst = np.argsort(score[candidates])[::-1][:budget]
+            candidates = np.sort(candidates[worst])
+
+        mids = (x[candidates] + x[candidates + 1]) / 2
+        y_mids = evaluate_function(f, mids)
+        error = _interval_error(y[candidates], y[candidates + 1], y_mids, y_min, y_max)
+
+        x = np.insert(x, candidates + 1, mids)
+        y = np.insert(y, candidates + 1, y_mids)
+        # 被细分的区间变成两个子区间，都沿用这次的误差
+        counts = np.ones(len(score), dtype=int)
+        counts[candidates] = 2
+        score[candidates] = error
+        score = np.repeat(score, counts)
+
+    # 已经细分到最小宽度仍不收敛的区间是间断点（如极点或跳跃），在中间插入NaN；
+    # 两端都在视图同一侧之外的区间（如正好落在采样点上的极点旁边）不需要断开
+    with np.errstate(invalid="ignore"):
+        jumps = np.abs(np.diff(y))
+        outside = ((y[:-1] > y_max) & (y[1:] > y_max)) | ((y[:-1] < y_min) & (y[1:] < y_min))
+    breaks = np.flatnonzero((score > tol) & (np.diff(x) <= 2 * min_width) & (jumps > tol) & ~outside)
+    if breaks.size:
+        # 最后一次二分的两个子区间沿用同一个误差，相邻的候选中只保留跳跃最大的一个
+        groups = np.split(breaks, np.flatnonzero(np.diff(breaks) > 1) + 1)
+        breaks = np.array([group[np.argmax(jumps[group])] for group in groups])
+        x = np.insert(x, breaks + 1, (x[breaks] + x[breaks + 1]) / 2)
+        y = np.insert(y, breaks + 1, np.nan)
+    return x, y
+
+
+def _parametric_error(x0, y0, x1, y1, xm, ym, view, tolerance, max_length):
+    """参数曲线区间的误差：中点偏离弦中点的距离除以tolerance，与两个子区间的弦长除以max_length取大者
+
+    返回 (左子区间, 右子区间) 的误差。坐标按视图大小归一化；端点与中点有的有定义有的没有时为inf，以便定位定义域边界。
+    """
+    x_min, x_max, y_min, y_max = view
+    u0, um, u1 = [(value - x_min) / (x_max - x_min) for value in (x0, xm, x1)]
+    v0, vm, v1 = [(value - y_min) / (y_max - y_min) for value in (y0, ym, y1)]
+    with np.errstate(invalid="ignore"):
+        deviation = np.hypot(um - (u0 + u1) / 2, vm - (v0 + v1) / 2) / tolerance
+        left = np.maximum(deviation, np.hypot(um - u0, vm - v0) / max_length)
+        right = np.maximum(deviation, np.hypot(u1 - um, v1 - vm) / max_length)
+
+        finite = np.isfinite(np.stack([u0, um, u1, v0, vm, v1]))
+        some_finite = finite.any(axis=0)
+        all_finite = finite.all(axis=0)
+        # 三个点都在视图同一侧之外时不需要细分
+        outside = ((u0 < 0) & (um < 0) & (u1 < 0)) | ((u0 > 1) & (um > 1) & (u1 > 1)) | \
+                  ((v0 < 0) & (vm < 0) & (v1 < 0)) | ((v0 > 1) & (vm > 1) & (v1 > 1))
+    for error in (left, right):
+        error[some_finite & ~all_finite] = np.inf
+        error[~some_finite | (all_finite & outside)] = 0.0
+    return left, right
+
+
+def parametric_sample(fx, fy, t_min, t_max, x_min, x_max, y_min, y_max, initial_points=129,
+                      max_points=16000, tolerance=1e-3, max_length=None, max_depth=14):
+    """按弧长自适应采样参数曲线 (fx(t), fy(t))，返回 (x, y)，间断处插入NaN
+
+    tolerance 为允许的中点偏差占视图大小的比例，max_length 为相邻两点之间允许的最大距离（同样按视图大小归一化，
+    默认为8倍tolerance），所以曲线走得快的地方点也多，密集的曲线（如李萨如图形）不会画成折线。
+    """
+    view = (x_min, x_max, y_min, y_max)
+    if max_length is None:
+        max_length = 8 * tolerance
+    t = np.linspace(t_min, t_max, initial_points)
+    x, y = evaluate_function(fx, t), evaluate_function(fy, t)
+    min_width = (t_max - t_min) / (initial_points - 1) / 2 ** max_depth
+
+    score = np.full(len(t) - 1, np.inf)
+    while True:
+        candidates = np.flatnonzero((score > 1) & (np.diff(t) > 2 * min_width))
+        budget = max_points - len(t)
+        if candidates.size == 0 or budget <= 0:
+            break
+        if candidates.size > budget:
+            worst = np.argsort(score[candidates])[::-1][:budget]
+            candidates = np.sort(candidates[worst])
+
+        mids = (t[candidates] + t[candidates + 1]) / 2
+        x_mids, y_mids = evaluate_function(fx, mids), evaluate_function(fy, mids)
+        left, right = _parametric_error(x[candidates], y[candidates], x[candidates + 1], y[candidates + 1],
+                                        x_mids, y_mids, view, tolerance, max_length)
+
+        t = np.insert(t, candidates + 1, mids)
+        x = np.insert(x, candidates + 1, x_mids)
+        y = np.insert(y, candidates + 1, y_mids)
+        # 插入后第j个被细分的区间的左半部分位于 candidates[j] + j
+        counts = np.ones(len(score), dtype=int)
+        counts[candidates] = 2
+        score = np.repeat(score, counts)
+        lefts = candidates + np.arange(len(candidates))
+        score[lefts] = left
+        score[lefts + 1] = right
+
+    # 细分到最小宽度后两点仍然相距很远的区间是间断点，在中间插入NaN（两端都在视图同一侧之外时不需要）
+    with np.errstate(invalid="ignore"):
+        length = np.hypot(np.diff(x) / (x_max - x_min), np.diff(y) / (y_max - y_min))
+        outside = ((x[:-1] < x_min) & (x[1:] < x_min)) | ((x[:-1] > x_max) & (x[1:] > x_max)) | \
+                  ((y[:-1] < y_min) & (y[1:] < y_min)) | ((y[:-1] > y_max) & (y[1:] > y_max))
+    breaks = np.flatnonzero((score > 1) & (np.diff(t) <= 2 * min_width) & (length > max_length) & ~outside)
+    if breaks.size:
+        x = np.insert(x, breaks + 1, np.nan)
+        y = np.insert(y, breaks + 1, np.nan)
+    return x, y
+
+
+# marching squares的线段表：格子的四个角 c0=(x0, y0)、c1=(x1, y0)、c2=(x1, y1)、c3=(x0, y1)，
+# 第i位表示ci处f > 0；边 e0=c0c1、e1=c1c2、e2=c2c3、e3=c3c0。每种情况最多两条线段，-1表示没有
+_EDGE_START = np.array([0, 1, 2, 3])
+_EDGE_END = np.array([1, 2, 3, 0])
+_SEGMENTS = np.full((16, 2, 2), -1)
+for _case, _pairs in {1: [(3, 0)], 2: [(0, 1)], 3: [(3, 1)], 4: [(1, 2)], 5: [(3, 0), (1, 2)],
+                      6: [(0, 2)], 7: [(3, 2)], 8: [(2, 3)], 9: [(0, 2)], 10: [(0, 1), (2, 3)],
+                      11: [(1, 2)], 12: [(1, 3)], 13: [(0, 1)], 14: [(3, 0)]}.items():
+    _SEGMENTS[_case, :len(_pairs)] = _pairs
+
+IMPLICIT_INITIAL_CELLS = 64
+IMPLICIT_REFINE_FACTOR = 4
+IMPLICIT_MAX_CELLS = 1_000_000
+CONTINUITY_STEPS = 2
+
+
+def _cell_cases(values):
+    """每个格子的情况编号（0~15），有角没有定义的格子为0"""
+    with np.errstate(invalid="ignore"):
+        positive = values > 0
+    cases = positive @ np.array([1, 2, 4, 8])
+    cases[~np.isfinite(values).all(axis=1)] = 0
+    return cases
+
+
+def _cell_corners(x0, y0, width, height):
+    """各格子四个角（c0~c3）的坐标，形状为 (格子数, 4)"""
+    return (np.stack([x0, x0 + width, x0 + width, x0], axis=1),
+            np.stack([y0, y0, y0 + height, y0 + height], axis=1))
+
+
+def _continuous_cells(f, x0, y0, width, height, values, steps=CONTINUITY_STEPS):
+    """检查格子边上的变号是不是连续函数的零点，返回每个格子是否可信
+
+    极点（如 tan(x) - y）和跳跃间断处两侧也会变号。在每条变号的边上二分steps次：
+    真正的零点附近f接近线性，区间两端的|f|之和随区间长度一起减小；极点处反而变大，跳跃处保持不变。
+    """
+    start, end = values[:, _EDGE_START], values[:, _EDGE_END]
+    with np.errstate(invalid="ignore"):
+        cell, edge = np.nonzero(((start > 0) != (end > 0)) & np.isfinite(start) & np.isfinite(end))
+    corner_x, corner_y = _cell_corners(x0, y0, width, height)
+    xa, ya, fa = corner_x[cell, _EDGE_START[edge]], corner_y[cell, _EDGE_START[edge]], start[cell, edge]
+    xb, yb, fb = corner_x[cell, _EDGE_END[edge]], corner_y[cell, _EDGE_END[edge]], end[cell, edge]
+    total = np.abs(fa) + np.abs(fb)
+    for _ in range(steps):
+        xm, ym = (xa + xb) / 2, (ya + yb) / 2
+        fm = evaluate_function(f, xm, ym)
+        with np.errstate(invalid="ignore"):
+            in_first_half = (fa > 0) != (fm > 0)
+        xb, yb, fb = np.where(in_first_half, xm, xb), np.where(in_first_half, ym, yb), np.where(in_first_half, fm, fb)
+        xa, ya, fa = np.where(in_first_half, xa, xm), np.where(in_first_half, ya, ym), np.where(in_first_half, fa, fm)
+
+    with np.errstate(invalid="ignore"):
+        root = np.abs(fa) + np.abs(fb) < 0.5 * total
+    continuous = np.ones(len(values), dtype=bool)
+    continuous[cell[~root]] = False
+    return continuous
+
+
+def marching_squares(x0, y0, width, height, values):
+    """对一批大小相同的格子执行marching squares
+
+    x0、y0为各格子左下角的坐标，values为 (格子数, 4) 的四个角的函数值（顺序为c0~c3）。
+    返回 (线段数, 2, 2) 的线段端点。
+    """
+    cases = _cell_cases(values)
+    # 鞍点（对角两个角同号）按中心的平均值决定连接方式
+    saddle = (cases == 5) | (cases == 10)
+    center_positive = values.mean(axis=1) > 0
+    cases = np.where(saddle & center_positive, 15 - cases, cases)
+
+    corner_x, corner_y = _cell_corners(x0, y0, width, height)
+    start, end = values[:, _EDGE_START], values[:, _EDGE_END]
+    # 没有零点的边得到NaN，不会被用到
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = start / (start - end)
+        edge_x = corner_x[:, _EDGE_START] + ratio * (corner_x[:, _EDGE_END] - corner_x[:, _EDGE_START])
+        edge_y = corner_y[:, _EDGE_START] + ratio * (corner_y[:, _EDGE_END] - corner_y[:, _EDGE_START])
+
+    segments = []
+    for slot in range(2):
+        pairs = _SEGMENTS[cases, slot]
+        index = np.flatnonzero(pairs[:, 0] >= 0)
+        a, b = pairs[index, 0], pairs[index, 1]
+        segments.append(np.stack([np.stack([edge_x[index, a], edge_y[index, a]], axis=1),
+                                  np.stack([edge_x[index, b], edge_y[index, b]], axis=1)], axis=1))
+    return np.concatenate(segments)
+
+
+def _refine_cells(f, x0, y0, width, height, factor):
+    """把每个格子分成 factor×factor 个小格子，一次性计算所有小格子的角，返回 (x0, y0, values)"""
+    steps = np.arange(factor + 1) / factor
+    X = np.broadcast_to(x0[:, None, None] + width * steps[None, None, :], (len(x0), factor + 1, factor + 1))
+    Y = np.broadcast_to(y0[:, None, None] + height * steps[None, :, None], (len(x0), factor + 1, factor + 1))
+    Z = evaluate_function(f, np.ascontiguousarray(X), np.ascontiguousarray(Y))
+    return _grid_cells(X, Y, Z)
+
+
+def _grid_cells(X, Y, Z):
+    """网格（最后两维为 y, x）中各格子的左下角和四个角的值"""
+    values = np.stack([Z[..., :-1, :-1], Z[..., :-1, 1:], Z[..., 1:, 1:], Z[..., 1:, :-1]], axis=-1)
+    return X[..., :-1, :-1].ravel(), Y[..., :-1, :-1].ravel(), values.reshape(-1, 4)
+
+
+def implicit_contour(f, x_min, x_max, y_min, y_max, resolution=256, initial_cells=IMPLICIT_INITIAL_CELLS,
+                     factor=IMPLICIT_REFINE_FACTOR, max_cells=IMPLICIT_MAX_CELLS):
+    """画 f(x, y) = 0 的曲线，返回 (x, y)，每条线段之间用NaN隔开
+
+    先在 initial_cells×initial_cells 的网格上计算，之后每一级只把可能含有零点的格子（四个角异号，或者最小的|f|
+    比角之间的差还小）分成 factor×factor 个小格子，直到每个方向上的格子数达到resolution，或者小格子数超过max_cells。
+    不与零点集相交的格子不会细分，所以计算量与曲线长度成正比，而不是与网格面积成正比。
+    在粗网格的格子中完全看不到符号变化的小闭合曲线和只与零相切的曲线（如 (x**2 + y**2 - 1)**2 = 0）可能画不出来。
+    """
+    X, Y = np.meshgrid(np.linspace(x_min, x_max, initial_cells + 1), np.linspace(y_min, y_max, initial_cells + 1))
+    x0, y0, values = _grid_cells(X, Y, evaluate_function(f, X, Y))
+    width = (x_max - x_min) / initial_cells
+    height = (y_max - y_min) / initial_cells
+
+    cells = initial_cells
+    while cells < resolution:
+        cases = _cell_cases(values)
+        with np.errstate(invalid="ignore"):
+            near = np.abs(values).min(axis=1) < values.max(axis=1) - values.min(axis=1)
+        active = np.flatnonzero(((cases != 0) & (cases != 15)) | near)
+        if active.size * factor ** 2 > max_cells:
+            break
+        x0, y0, values = _refine_cells(f, x0[active], y0[active], width, height, factor)
+        width /= factor
+        height /= factor
+        cells *= factor
+
+    # 只保留有符号变化的格子，去掉跨过极点或跳跃间断的格子
+    cases = _cell_cases(values)
+    crossing = np.flatnonzero((cases != 0) & (cases != 15))
+    x0, y0, values = x0[crossing], y0[crossing], values[crossing]
+    keep = _continuous_cells(f, x0, y0, width, height, values)
+    segments = marching_squares(x0[keep], y0[keep], width, height, values[keep])
+
+    separators = np.full((len(segments), 1), np.nan)
+    x = np.hstack([segments[:, :, 0], separators]).ravel()
+    y = np.hstack([segments[:, :, 1], separators]).ravel()
+    return x, y
+
+
+class KernelCache:
+    """lambdify结果的LRU缓存，键为 (表达式, 自变量)"""
+
+    def __init__(self, maxsize=32):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+
+    def get(self, expr, var):
+        """返回表达式对应的numpy函数，没有时编译并缓存"""
+        key = (expr, var)
+        kernel = self.entries.get(key)
+        if kernel is not None:
+            self.entries.move_to_end(key)
+            return kernel
+        kernel = sp.lambdify(var, expr, modules=["numpy"])
+        self.entries[key] = kernel
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+        return kernel
+
+    def clear(self):
+        self.entries.clear()
+
+
+class Curve:
+    """图中的一条曲线：lambdify后的函数、采样结果（按x排序）和已经采样的范围 [x_lo, x_hi]"""
+
+    # 平移时的处理：extend只对新露出的部分采样，keep不需要重新采样，resample对整个视图重新采样
+    on_pan = "extend"
+    ylabel = "f(x)"
+
+    def __init__(self, kernel, label):
+        self.kernel = kernel
+        self.label = label
+        self.visible = True
+        self.line = None
+        self.invalidate()
+
+    def invalidate(self):
+        """丢掉采样结果，下次显示时重新采样"""
+        self.xs = np.empty(0)
+        self.ys = np.empty(0)
+        self.x_lo = self.x_hi = 0.0
+
+    def covers(self, x_min, x_max):
+        """已有的采样与可见范围是否相交（相交时只需要补上缺少的部分）"""
+        return self.xs.size > 0 and self.x_lo <= x_max and self.x_hi >= x_min
+
+    def sample(self, view, tolerance, max_points):
+        """对整个视图 (x_min, x_max, y_min, y_max) 采样"""
+        x_min, x_max, y_min, y_max = view
+        self.xs, self.ys = adaptive_sample(self.kernel, x_min, x_max, y_min, y_max,
+                                           tolerance=tolerance, max_points=max_points)
+        self.x_lo, self.x_hi = x_min, x_max
+
+
+class ParametricCurve(Curve):
+    """参数曲线 (x(t), y(t))，t在固定的范围内：平移时不需要重新采样，放大后按新的容差重新采样"""
+
+    on_pan = "keep"
+    ylabel = "y"
+
+    def __init__(self, kernel_x, kernel_y, t_min, t_max, label):
+        super().__init__(kernel_x, label)
+        self.kernel_y = kernel_y
+        self.t_range = (t_min, t_max)
+
+    def sample(self, view, tolerance, max_points):
+        # 参数曲线往往比函数曲线长得多，点数预算放宽到4倍
+        self.xs, self.ys = parametric_sample(self.kernel, self.kernel_y, *self.t_range, *view,
+                                             tolerance=tolerance, max_points=4 * max_points)
+        self.x_lo, self.x_hi = view[0], view[1]
+
+
+class ImplicitCurve(Curve):
+    """隐函数曲线 f(x, y) = 0：只计算视图中的部分，视图改变后重新计算"""
+
+    on_pan = "resample"
+    ylabel = "y"
+
+    def sample(self, view, tolerance, max_points):
+        # 最细的格子约为两个像素（tolerance对应半个像素）
+        self.xs, self.ys = implicit_contour(self.kernel, *view, resolution=int(0.25 / tolerance))
+        self.x_lo, self.x_hi = view[0], view[1]
+
+
+class InteractivePlot:
+    """可拖动平移、滚轮缩放的多曲线函数图像
+
+    每条曲线（Curve）有自己的函数、采样结果和覆盖的范围。添加、显示一条曲线时只对这条曲线采样，删除和隐藏不需要采样；
+    参数曲线（ParametricCurve）平移时不需要采样，隐函数曲线（ImplicitCurve）只计算视图中的部分，平移后重新计算；
+    平移时每条可见曲线只对新露出的部分调用adaptive_sample；放大或竖直移动后误差容限变化，才对可见曲线重新采样。
+    拖动过程中只恢复背景并重绘曲线和坐标轴线（blitting），松开鼠标后再完整重绘一次以更新刻度和网格。
+    """
+
+    def __init__(self, canvas, zoom_factor=1.2):
+        self.canvas = canvas
+        self.zoom_factor = zoom_factor
+        self.ax = None
+        self.title = ""
+        self.curves = OrderedDict()
+        self.background = None
+        self.drag = None
+        self.frame_times = deque(maxlen=60)
+
+        canvas.mpl_connect("draw_event", self.on_draw)
+        canvas.mpl_connect("button_press_event", self.on_press)
+        canvas.mpl_connect("motion_notify_event", self.on_motion)
+        canvas.mpl_connect("button_release_event", self.on_release)
+        canvas.mpl_connect("scroll_event", self.on_scroll)
+
+    def plot(self, kernel, x_min, x_max, y_min, y_max, title="", label=None):
+        """绘制新函数（去掉其他曲线），label为曲线的名字，默认与标题相同
+
+        kernel为lambdify后的f(x)，也可以直接传入Curve（如ParametricCurve、ImplicitCurve）。
+        """
+        self.curves.clear()
+        self.setup_axes(x_min, x_max, y_min, y_max, title)
+        self.add_curve(label or title, kernel)
+        self.ax.set_ylabel(self.curves[label or title].ylabel)
+
+    def setup_axes(self, x_min, x_max, y_min, y_max, title=""):
+        """重新创建坐标轴，已有的曲线在新的范围内重新采样"""
+        self.title = title
+        figure = self.canvas.figure
+        figure.clear()
+
+        self.ax = figure.add_subplot(111)
+        self.ax.grid(True)
+        self.ax.set_xlabel('x')
+        self.ax.set_ylabel('f(x)')
+        self.ax.set_title(title)
+        self.ax.set_xlim(x_min, x_max)
+        self.ax.set_ylim(y_min, y_max)
+        # 曲线和坐标轴线不参与普通重绘，由blitting单独绘制
+        self.x_axis = self.ax.axhline(0, color="black", linewidth=0.8, animated=True)
+        self.y_axis = self.ax.axvline(0, color="black", linewidth=0.8, animated=True)
+        for curve in self.curves.values():
+            self._create_line(curve)
+            curve.invalidate()
+
+        self.resample()
+        self.update_legend()
+        figure.tight_layout()
+        self.canvas.draw_idle()
+
+    def _create_line(self, curve):
+        (curve.line,) = self.ax.plot([], [], animated=True, label=curve.label)
+        curve.line.set_visible(curve.visible)
+
+    def add_curve(self, key, kernel, label=None):
+        """添加一条曲线（key已存在时替换），只对这条曲线采样；kernel为f(x)或Curve"""
+        if self.ax is None:
+            raise ValueError("还没有坐标轴")
+        self.remove_curve(key, redraw=False)
+        curve = kernel if isinstance(kernel, Curve) else Curve(kernel, label or key)
+        self._create_line(curve)
+        self.curves[key] = curve
+        self.sample(curve)
+        self.update_legend()
+        self.canvas.draw_idle()
+
+    def remove_curve(self, key, redraw=True):
+        """删除一条曲线，其他曲线不需要重新采样"""
+        curve = self.curves.pop(key, None)
+        if curve is None:
+            return
+        if curve.line is not None and curve.line.axes is not None:
+            curve.line.remove()
+        if redraw and self.ax is not None:
+            self.update_legend()
+            self.canvas.draw_idle()
+
+    def set_visible(self, key, visible):
+        """显示或隐藏一条曲线；隐藏的曲线在平移时不采样，重新显示时只补上缺少的部分"""
+        curve = self.curves[key]
+        curve.visible = visible
+        curve.line.set_visible(visible)
+        if visible and self.ax is not None:
+            x_min, x_max = self.ax.get_xlim()
+            if curve.on_pan == "extend" and curve.covers(x_min, x_max):
+                self.extend_curve(curve)
+            else:
+                self.sample(curve)
+        self.update_legend()
+        self.canvas.draw_idle()
+
+    def visible_curves(self):
+        return [curve for curve in self.curves.values() if curve.visible]
+
+    def update_legend(self):
+        """多于一条可见曲线时显示图例"""
+        legend = self.ax.get_legend()
+        if legend is not None:
+            legend.remove()
+        visible = self.visible_curves()
+        if len(visible) > 1:
+            self.ax.legend(handles=[curve.line for curve in visible], loc="upper right")
+
+    def release(self):
+        """画布交给其他绘图（如SurfacePlot）使用，不再响应拖动和重绘事件"""
+        self.ax = None
+        self.drag = None
+        self.background = None
+        self.curves.clear()
+
+    def show_message(self, text):
+        """清空图像并显示一段文字（如错误信息）"""
+        self.ax = None
+        self.drag = None
+        self.curves.clear()
+        figure = self.canvas.figure
+        figure.clear()
+        ax = figure.add_subplot(111)
+        ax.text(0.5, 0.5, text, ha='center', va='center', transform=ax.transAxes)
+        figure.tight_layout()
+        self.canvas.draw_idle()
+
+    def sampling_options(self):
+        """按当前画布大小确定采样容差（半个像素）和点数预算"""
+        width, height = self.canvas.get_width_height()
+        return 0.5 / max(height, 100), max(1000, 8 * width)
+
+    def sample(self, curve):
+        """对一条曲线的整个可见范围采样"""
+        tolerance, max_points = self.sampling_options()
+        curve.sample((*self.ax.get_xlim(), *self.ax.get_ylim()), tolerance, max_points)
+        curve.line.set_data(curve.xs, curve.ys)
+
+    def resample(self):
+        """对所有可见曲线的整个可见范围重新采样，隐藏的曲线等到显示时再采样"""
+        for curve in self.curves.values():
+            if curve.visible:
+                self.sample(curve)
+            else:
+                curve.invalidate()
+
+    def _sample_range(self, curve, start, end):
+        """对一段新露出的范围采样，点数预算按宽度比例分配"""
+        x_min, x_max = self.ax.get_xlim()
+        y_min, y_max = self.ax.get_ylim()
+        tolerance, max_points = self.sampling_options()
+        fraction = (end - start) / (x_max - x_min)
+        return adaptive_sample(curve.kernel, start, end, y_min, y_max,
+                               initial_points=max(3, int(64 * fraction) + 1),
+                               max_points=max(16, int(max_points * fraction)),
+                               tolerance=tolerance)
+
+    def extend(self):
+        """平移后更新可见曲线：函数曲线只对还没有采样的部分采样（与原来的范围不相交时整个重新采样），
+        参数曲线不变，隐函数曲线重新计算视图中的部分"""
+        x_min, x_max = self.ax.get_xlim()
+        for curve in self.visible_curves():
+            if curve.on_pan == "keep" and curve.xs.size:
+                continue
+            if curve.on_pan == "extend" and curve.covers(x_min, x_max):
+                self.extend_curve(curve)
+            else:
+                self.sample(curve)
+
+    def set_view(self, x_min, x_max, y_min, y_max):
+        """改变坐标范围：y范围变化或放大时重新采样，否则各曲线只补上新露出的部分"""
+        (old_x_min, old_x_max), old_y = self.ax.get_xlim(), self.ax.get_ylim()
+        self.ax.set_xlim(x_min, x_max)
+        self.ax.set_ylim(y_min, y_max)
+        if (y_min, y_max) != tuple(old_y) or x_max - x_min < old_x_max - old_x_min:
+            self.resample()
+        else:
+            self.extend()
+        self.canvas.draw_idle()
+
+    def extend_curve(self, curve):
+        """只对可见范围中还没有采样的部分采样，并丢掉离视图太远的点"""
+        x_min, x_max = self.ax.get_xlim()
+        width = x_max - x_min
+        if x_min < curve.x_lo:
+            xs, ys = self._sample_range(curve, x_min, curve.x_lo)
+            # 新区间的最后一个点就是原来的第一个点
+            curve.xs = np.concatenate([xs[:-1], curve.xs])
+            curve.ys = np.concatenate([ys[:-1], curve.ys])
+            curve.x_lo = x_min
+        if x_max > curve.x_hi:
+            xs, ys = self._sample_range(curve, curve.x_hi, x_max)
+            curve.xs = np.concatenate([curve.xs, xs[1:]])
+            curve.ys = np.concatenate([curve.ys, ys[1:]])
+            curve.x_hi = x_max
+
+        # 只保留视图左右各一个视图宽度内的点
+        start, end = np.searchsorted(curve.xs, [x_min - width, x_max + width])
+        if start > 0 or end < len(curve.xs):
+            curve.xs = curve.xs[start:end]
+            curve.ys = curve.ys[start:end]
+            curve.x_lo = max(curve.x_lo, curve.xs[0]) if len(curve.xs) else x_min
+            curve.x_hi = min(curve.x_hi, curve.xs[-1]) if len(curve.xs) else x_min
+        curve.line.set_data(curve.xs, curve.ys)
+
+    def on_draw(self, event):
+        """完整重绘后保存背景，并画上曲线"""
+        if self.ax is None:
+            return
+        self.background = self.canvas.copy_from_bbox(self.canvas.figure.bbox)
+        self.draw_animated()
+
+    def draw_animated(self):
+        for artist in (self.x_axis, self.y_axis):
+            self.ax.draw_artist(artist)
+        for curve in self.visible_curves():
+            self.ax.draw_artist(curve.line)
+
+    def blit(self):
+        """恢复背景，只重绘曲线部分"""
+        if self.background is None:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self.background)
+        self.draw_animated()
+        self.canvas.blit(self.ax.bbox)
+        self.frame_times.append(time.perf_counter())
+
+    def fps(self):
+        """最近拖动的帧率"""
+        if len(self.frame_times) < 2:
+            return 0.0
+        elapsed = self.frame_times[-1] - self.frame_times[0]
+        return (len(self.frame_times) - 1) / elapsed if elapsed > 0 else 0.0
+
+    def on_press(self, event):
+        if self.ax is None or event.inaxes is not self.ax or event.button != 1:
+            return
+        self.drag = (event.x, event.y, self.ax.get_xlim(), self.ax.get_ylim(),
+                     self.ax.transData.inverted())
+        self.frame_times.clear()
+        # 拖动期间的背景不带网格，网格会在松开后按新的刻度重绘
+        self.ax.grid(False)
+        self.canvas.draw()
+
+    def on_motion(self, event):
+        if self.drag is None or event.x is None:
+            return
+        press_x, press_y, (x_min, x_max), (y_min, y_max), inverse = self.drag
+        start = inverse.transform((press_x, press_y))
+        current = inverse.transform((event.x, event.y))
+        dx, dy = start - current
+        self.ax.set_xlim(x_min + dx, x_max + dx)
+        self.ax.set_ylim(y_min + dy, y_max + dy)
+        self.extend()
+        self.blit()
+
+    def on_release(self, event):
+        if self.drag is None:
+            return
+        y_limits = self.drag[3]
+        self.drag = None
+        # 竖直方向移动后视图外的部分可能没有细分，重新采样
+        if self.ax.get_ylim() != y_limits:
+            self.resample()
+        self.ax.grid(True)
+        self.canvas.draw_idle()
+
+    def on_scroll(self, event):
+        """以鼠标位置为中心缩放"""
+        if self.ax is None or event.inaxes is not self.ax or self.drag is not None:
+            return
+        scale = 1 / self.zoom_factor if event.button == "up" else self.zoom_factor
+        x_min, x_max = self.ax.get_xlim()
+        y_min, y_max = self.ax.get_ylim()
+        cx, cy = event.xdata, event.ydata
+        self.ax.set_xlim(cx - (cx - x_min) * scale, cx + (x_max - cx) * scale)
+        self.ax.set_ylim(cy - (cy - y_min) * scale, cy + (y_max - cy) * scale)
+        if scale < 1:
+            # 放大后原来的点不够密，重新采样
+            self.resample()
+        else:
+            self.extend()
+        self.canvas.draw_idle()
+
+
+GRID_POINTS = 250_000
+SURFACE_POINTS = 10_000
+
+
+def grid_shape(x_min, x_max, y_min, y_max, max_points):
+    """按点数预算和范围的长宽比确定网格大小 (nx, ny)"""
+    ratio = (x_max - x_min) / (y_max - y_min)
+    nx = min(max(2, round(math.sqrt(max_points * ratio))), max_points // 2)
+    ny = max(2, max_points // nx)
+    return nx, ny
+
+
+def evaluate_grid(f, x_min, x_max, y_min, y_max, nx, ny):
+    """在 ny×nx 的网格上一次性计算f(x, y)，返回 (X, Y, Z)"""
+    X, Y = np.meshgrid(np.linspace(x_min, x_max, nx), np.linspace(y_min, y_max, ny))
+    return X, Y, evaluate_function(f, X, Y)
+
+
+def decimate(X, Y, Z, max_points):
+    """按相同的步长抽取行和列，使点数不超过max_points"""
+    step = max(1, math.ceil(math.sqrt(Z.size / max_points)))
+    return X[::step, ::step], Y[::step, ::step], Z[::step, ::step]
+
+
+class GridCache:
+    """网格计算结果的LRU缓存，键为 (函数的键, 范围, 网格大小)"""
+
+    def __init__(self, maxsize=8):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, f, x_min, x_max, y_min, y_max, nx, ny):
+        full_key = (key, x_min, x_max, y_min, y_max, nx, ny)
+        grid = self.entries.get(full_key)
+        if grid is not None:
+            self.hits += 1
+            self.entries.move_to_end(full_key)
+            return grid
+        self.misses += 1
+        grid = evaluate_grid(f, x_min, x_max, y_min, y_max, nx, ny)
+        self.entries[full_key] = grid
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+        return grid
+
+    def clear(self):
+        self.entries.clear()
+
+
+class SurfacePlot:
+    """二元函数的曲面（surface）、等高线（contour）和热图（heatmap）"""
+
+    MODES = ("surface", "contour", "heatmap")
+
+    def __init__(self, canvas, grid_points=GRID_POINTS, surface_points=SURFACE_POINTS):
+        self.canvas = canvas
+        self.grid_points = grid_points
+        self.surface_points = surface_points
+        self.cache = GridCache()
+
+    def plot(self, key, f, mode, x_range, y_range, title="", cmap="viridis"):
+        """绘制f(x, y)，key用于识别同一个函数（如 (表达式, 自变量)）"""
+        if mode not in self.MODES:
+            raise ValueError(f"未知的显示方式: {mode}")
+        (x_min, x_max), (y_min, y_max) = x_range, y_range
+        nx, ny = grid_shape(x_min, x_max, y_min, y_max, self.grid_points)
+        X, Y, Z = self.cache.get(key, f, x_min, x_max, y_min, y_max, nx, ny)
+        # 颜色范围用分位数估计，极点不会让其他部分变成同一种颜色
+        z_min, z_max = estimate_y_range(Z)
+
+        figure = self.canvas.figure
+        figure.clear()
+        if mode == "surface":
+            ax = figure.add_subplot(111, projection="3d")
+            Xs, Ys, Zs = decimate(X, Y, Z, self.surface_points)
+            margin = z_max - z_min
+            with np.errstate(invalid="ignore"):
+                Zs = np.where((Zs < z_min - margin) | (Zs > z_max + margin), np.nan, Zs)
+            artist = ax.plot_surface(Xs, Ys, Zs, cmap=cmap, vmin=z_min, vmax=z_max,
+                                     rstride=1, cstride=1, linewidth=0, antialiased=False)
+            ax.set_zlabel("f(x, y)")
+            figure.colorbar(artist, ax=ax, shrink=0.6)
+        elif mode == "contour":
+            ax = figure.add_subplot(111)
+            levels = np.linspace(z_min, z_max, 21)
+            artist = ax.contourf(X, Y, Z, levels=levels, cmap=cmap, extend="both")
+            ax.contour(X, Y, Z, levels=levels, colors="black", linewidths=0.4)
+            figure.colorbar(artist, ax=ax)
+        else:
+            ax = figure.add_subplot(111)
+            artist = ax.imshow(Z, extent=(x_min, x_max, y_min, y_max), origin="lower",
+                               aspect="auto", cmap=cmap, vmin=z_min, vmax=z_max)
+            figure.colorbar(artist, ax=ax)
+
+        ax.set_xlabel("x")
+        ax.set_ylabel("y")
+        ax.set_title(title)
+        figure.tight_layout()
+        self.canvas.draw_idle()
@@ -0,0 +1,80 @@
+"""输入预览调度：合并连续的更新请求
+
+输入框每次变化都会请求一次预览，但连续输入时大部分预览还没显示就已经过时了。
+PreviewScheduler 在防抖窗口内只保留最新的请求，窗口结束时才真正生成内容；
+内容和上一次显示的相同时跳过渲染。持续输入时每隔 max_wait_ms 至少刷新一次，避免预览一直不更新。
+"""
+import time
+
+from PySide6.QtCore import QObject, QTimer
+
+
+class PreviewScheduler(QObject):
+    """防抖、合并的预览调度器
+
+    request(build) 记录最新的生成函数，之前尚未执行的请求被丢弃。
+    build() 返回要显示的内容（需可比较），render(content) 负责实际显示。
+    """
+
+    def __init__(self, render, delay_ms=80, max_wait_ms=300, parent=None):
+        super().__init__(parent)
+        self.render = render
+        self.delay_ms = delay_ms
+        self.max_wait_ms = max_wait_ms
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.flush)
+
+        self.pending = None
+        self.first_request_time = None
+        self.last_content = None
+        self.has_content = False
+
+        # 统计：请求数、实际渲染数、被合并丢弃数、内容未变而跳过数
+        self.requested = 0
+        self.rendered = 0
+        self.dropped = 0
+        self.skipped = 0
+
+    def request(self, build):
+        """请求一次预览，在防抖窗口结束后执行"""
+        self.requested += 1
+        if self.pending is not None:
+            self.dropped += 1
+        else:
+            self.first_request_time = time.monotonic()
+        self.pending = build
+
+        # 连续输入时不无限推迟，等待时间不超过max_wait_ms
+        waited_ms = (time.monotonic() - self.first_request_time) * 1000
+        delay = max(0, min(self.delay_ms, self.max_wait_ms - waited_ms))
+        self.timer.start(int(delay))
+
+    def flush(self):
+        """立即执行最新的请求（如计算前需要预览是最新的）"""
+        self.timer.stop()
+        build = self.pending
+        self.pending = None
+        self.first_request_time = None
+        if build is None:
+            return
+
+        content = build()
+        if self.has_content and content == self.last_content:
+            self.skipped += 1
+            return
+        self.last_content = content
+        self.has_content = True
+        self.rendered += 1
+        self.render(content)
+
+    def stats(self):
+        """返回预览统计信息"""
+        return {
+            "requested": self.requested,
+            "rendered": self.rendered,
+            "dropped": self.dropped,
+            "skipped": self.skipped,
+            "render_ratio": self.rendered / self.requested if self.requested else 0.0,
+        }
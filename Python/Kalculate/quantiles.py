@@ -0,0 +1,176 @@
+"""分位数（不依赖Qt）
+
+KLLSketch 是 KLL（Karnin–Lang–Liberty）分位数草图：数据逐块加入，各层缓冲区满了以后排序、
+隔一个取一个升到上一层（权重加倍），内存只与精度有关（k 个左右的数值乘以层数）。
+可以在读取数据文件的同时构建，之后任意分位数（p50/p90/p99、四分位距等）都可以立即得到。
+数据能放进内存时用 exact_quantiles 计算精确值。
+"""
+import math
+
+import numpy as np
+
+DEFAULT_EPSILON = 0.01
+EXACT_LIMIT = 20_000_000
+COMMON_PERCENTILES = (50, 90, 99)
+
+
+def k_for_epsilon(epsilon):
+    """由期望的秩误差（如0.01表示±1%）估算所需的k（经验公式，约99%置信度）"""
+    return max(8, math.ceil((2.296 / epsilon) ** (1 / 0.9723)))
+
+
+class KLLSketch:
+    """KLL分位数草图，秩误差约为epsilon（相对于数据总数）"""
+
+    def __init__(self, epsilon=DEFAULT_EPSILON, k=None, seed=None):
+        self.k = k or k_for_epsilon(epsilon)
+        self.levels = [np.empty(0)]
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+        self._rng = np.random.default_rng(seed)
+        self._sorted = None
+
+    @classmethod
+    def from_array(cls, values, epsilon=DEFAULT_EPSILON, chunk_size=1 << 20):
+        """分块构建草图（可以是内存映射数组）"""
+        sketch = cls(epsilon)
+        for start in range(0, len(values), chunk_size):
+            sketch.update(values[start:start + chunk_size])
+        return sketch
+
+    @classmethod
+    def from_chunks(cls, chunks, epsilon=DEFAULT_EPSILON):
+        sketch = cls(epsilon)
+        for chunk in chunks:
+            sketch.update(chunk)
+        return sketch
+
+    @property
+    def epsilon(self):
+        """草图的近似秩误差"""
+        return 2.296 / self.k ** 0.9723
+
+    def capacity(self, level):
+        """第level层的容量，越高的层容量越大（最高层为k）"""
+        depth = len(self.levels) - level - 1
+        return max(2, math.ceil(self.k * (2 / 3) ** depth))
+
+    def size(self):
+        """草图中保存的数值个数"""
+        return sum(level.size for level in self.levels)
+
+    def update(self, values):
+        """加入一个数据块（NaN被忽略）"""
+        values = np.asarray(values, dtype=float).ravel()
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return
+        self.count += int(values.size)
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        self.levels[0] = np.concatenate((self.levels[0], values))
+        self._sorted = None
+        self._compress()
+
+    def merge(self, other):
+        """合并另一个草图"""
+        if other.count == 0:
+            return
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate((self.levels[level], items))
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._sorted = None
+        self._compress()
+
+    def _compress(self):
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if items.size > self.capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                items = np.sort(items)
+                # 奇数个时留下一个，其余排序后从随机起点隔一个取一个升到上一层
+                keep = items[:1] if items.size % 2 else items[:0]
+                paired = items[keep.size:]
+                promoted = paired[self._rng.integers(2)::2]
+                self.levels[level] = keep
+                self.levels[level + 1] = np.concatenate((self.levels[level + 1], promoted))
+            level += 1
+
+    def _weighted(self):
+        """排序后的数值和累计权重（查询时使用，数据不变时缓存）"""
+        if self._sorted is None:
+            items = np.concatenate(self.levels)
+            weights = np.concatenate([np.full(level.size, 2.0 ** depth)
+                                      for depth, level in enumerate(self.levels)])
+            order = np.argsort(items, kind="stable")
+            self._sorted = (items[order], np.cumsum(weights[order]))
+        return self._sorted
+
+    def quantiles(self, qs):
+        """多个分位数，qs为0到1之间的数"""
+        if self.count == 0:
+            raise ValueError("没有数据")
+        items, cumulative = self._weighted()
+        total = cumulative[-1]
+        results = []
+        for q in np.atleast_1d(qs):
+            if not 0 <= q <= 1:
+                raise ValueError("分位数必须在0到1之间")
+            if q == 0:
+                results.append(self.min)
+            elif q == 1:
+                results.append(self.max)
+            else:
+                index = int(np.searchsorted(cumulative, q * total, side="left"))
+                results.append(float(items[min(index, items.size - 1)]))
+        return results
+
+    def quantile(self, q):
+        return self.quantiles([q])[0]
+
+    def rank(self, value):
+        """小于等于value的数据所占比例（近似）"""
+        if self.count == 0:
+            raise ValueError("没有数据")
+        items, cumulative = self._weighted()
+        index = int(np.searchsorted(items, value, side="right"))
+        return float(cumulative[index - 1] / cumulative[-1]) if index else 0.0
+
+
+def exact_quantiles(values, qs):
+    """精确分位数（线性插值，与np.quantile相同），只对数据做一次partition"""
+    values = np.asarray(values, dtype=float)
+    if values.size == 0:
+        raise ValueError("没有数据")
+    return [float(value) for value in np.quantile(values, np.atleast_1d(qs))]
+
+
+def parse_percentiles(text):
+    """把 "50, 90, 99" 形式的百分位数解析为0到1之间的分位数"""
+    items = text.replace(',', ' ').split() or [str(p) for p in COMMON_PERCENTILES]
+    qs = [float(item) / 100 for item in items]
+    for q in qs:
+        if not 0 <= q <= 1:
+            raise ValueError("百分位数必须在0到100之间")
+    return qs
+
+
+def format_quantiles(qs, values, approximate_error=None):
+    """格式化分位数结果，包含四分位距"""
+    lines = [f"p{q * 100:g}: {value:.10g}" for q, value in zip(qs, values)]
+    if approximate_error is not None:
+        lines.append(f"（近似值，秩误差约 ±{approximate_error * 100:.2g}%）")
+    return "\n".join(lines)
+
+
+def sketch_file(path, column=None, epsilon=DEFAULT_EPSILON, modified=None):
+    """逐块读取数据文件并构建分位数草图，modified只用于区分文件版本（结果缓存的键）"""
+    import datasets
+    return KLLSketch.from_chunks(datasets.iter_chunks(path, column), epsilon)
@@ -0,0 +1,128 @@
+"""耗时符号计算结果的持久化缓存（sqlite）
+
+键为操作名和各参数规范化srepr的SHA-256；值为pickle后的结果。
+缓存记录了格式版本和SymPy版本，升级SymPy后旧结果会被整体清空。
+"""
+import hashlib
+import os
+import pickle
+import sqlite3
+import time
+
+import sympy as sp
+
+SCHEMA_VERSION = 1
+
+
+def default_cache_path():
+    """默认缓存文件位置，可通过环境变量KALCULATE_CACHE_DIR修改"""
+    directory = os.environ.get("KALCULATE_CACHE_DIR") or os.path.join(os.path.expanduser("~"), ".kalculate")
+    return os.path.join(directory, "results.sqlite3")
+
+
+def canonical_repr(value):
+    """把参数转换为稳定的字符串表示"""
+    if isinstance(value, sp.Basic):
+        return sp.srepr(value)
+    if callable(value):
+        # 函数按模块和名称区分，不能用默认repr（包含内存地址）
+        return f"{getattr(value, '__module__', '')}.{getattr(value, '__qualname__', repr(value))}"
+    if isinstance(value, (list, tuple)):
+        return "(" + ",".join(canonical_repr(item) for item in value) + ")"
+    return repr(value)
+
+
+class ResultCache:
+    """按最近使用时间淘汰的持久化结果缓存"""
+
+    def __init__(self, path=None, max_entries=2000, enabled=True):
+        self.path = path or default_cache_path()
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self.version = f"{SCHEMA_VERSION}/sympy-{sp.__version__}"
+        self.hits = 0
+        self.misses = 0
+        self.conn = None
+
+    def _connect(self):
+        if self.conn is not None:
+            return self.conn
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(self.path)
+        conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        conn.execute("CREATE TABLE IF NOT EXISTS results ("
+                     "key TEXT PRIMARY KEY, operation TEXT, value BLOB, last_used REAL)")
+        conn.execute("CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used)")
+
+        # 版本不一致时清空旧结果
+        row = conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        if row is None or row[0] != self.version:
+            conn.execute("DELETE FROM results")
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('version', ?)", (self.version,))
+        conn.commit()
+        self.conn = conn
+        return conn
+
+    def make_key(self, operation, args):
+        """根据操作名和参数生成缓存键"""
+        text = canonical_repr(operation) + "|" + "|".join(canonical_repr(arg) for arg in args)
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def get(self, operation, args):
+        """查找缓存，返回 (是否命中, 结果)"""
+        if not self.enabled:
+            return False, None
+        key = self.make_key(operation, args)
+        try:
+            conn = self._connect()
+            row = conn.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return False, None
+            value = pickle.loads(row[0])
+            conn.execute("UPDATE results SET last_used = ? WHERE key = ?", (time.time(), key))
+            conn.commit()
+        except (sqlite3.Error, pickle.UnpicklingError, AttributeError, ImportError, EOFError):
+            # 缓存损坏或不可用时按未命中处理
+            self.misses += 1
+            return False, None
+        self.hits += 1
+        return True, value
+
+    def put(self, operation, args, value):
+        """保存结果，超出容量时淘汰最久未使用的记录"""
+        if not self.enabled:
+            return
+        key = self.make_key(operation, args)
+        try:
+            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return
+        try:
+            conn = self._connect()
+            conn.execute("INSERT OR REPLACE INTO results (key, operation, value, last_used) VALUES (?, ?, ?, ?)",
+                         (key, canonical_repr(operation), data, time.time()))
+            count = conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+            if count > self.max_entries:
+                conn.execute("DELETE FROM results WHERE key IN ("
+                             "SELECT key FROM results ORDER BY last_used LIMIT ?)",
+                             (count - self.max_entries,))
+            conn.commit()
+        except sqlite3.Error:
+            pass
+
+    def clear(self):
+        """清空所有缓存结果"""
+        try:
+            conn = self._connect()
+            conn.execute("DELETE FROM results")
+            conn.commit()
+        except sqlite3.Error:
+            pass
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
@@ -0,0 +1,147 @@
+"""稀疏矩阵支持（可选依赖SciPy，不依赖Qt）
+
+非零元素比例低于 DENSITY_THRESHOLD 的大矩阵自动转换为CSR格式，运算时间和内存只与非零元素个数相关：
+乘法直接使用稀疏乘法，求解和行列式使用稀疏LU分解（SuperLU）。
+稀疏矩阵的逆一般是稠密的：稠密结果不超过 DENSE_INVERSE_MAX_BYTES 时转换为稠密矩阵求逆，否则拒绝计算，改为提示求解 Ax=b。
+没有安装SciPy时所有矩阵都保持稠密。SciPy在第一次需要时才导入，不影响程序的启动时间。
+"""
+import functools
+import math
+import sys
+
+import numpy as np
+
+DENSITY_THRESHOLD = 0.05
+# 元素少于这个数的矩阵（如 eye(100)、小的带状矩阵）稠密保存也只有几MB，不转换为稀疏格式
+MIN_SPARSE_SIZE = 1_000_000
+# 稠密逆矩阵（n²个float64）的内存上限，n约为4000
+DENSE_INVERSE_MAX_BYTES = 128 * 2 ** 20
+ROWS_PER_BLOCK = 1024
+SPARSE_EXTENSIONS = (".npz", ".mtx")
+
+
+class DenseInverseRefused(ValueError):
+    """稀疏大矩阵不计算稠密的逆矩阵"""
+
+    def __init__(self):
+        super().__init__("稀疏矩阵的逆矩阵一般是稠密的，这个矩阵太大，没有计算；请改用 solve(A, b) 求解 Ax=b")
+
+
+@functools.cache
+def _sparse():
+    """scipy.sparse（第一次调用时导入），没有安装SciPy时为None"""
+    try:
+        import scipy.sparse
+    except ImportError:
+        return None
+    return scipy.sparse
+
+
+def available():
+    return _sparse() is not None
+
+
+def is_sparse(value):
+    # 稀疏矩阵只能由scipy.sparse创建，还没有导入时不需要为了判断而导入
+    sparse = sys.modules.get("scipy.sparse")
+    return sparse is not None and sparse.issparse(value)
+
+
+def dense_inverse_allowed(value):
+    """稠密的逆矩阵是否在内存上限之内"""
+    return value.shape[0] * value.shape[1] * 8 <= DENSE_INVERSE_MAX_BYTES
+
+
+def density(value):
+    """非零元素所占比例（稠密数组按行块统计，内存映射数组不会整体读入）"""
+    if is_sparse(value):
+        return value.nnz / max(1, value.shape[0] * value.shape[1])
+    nonzero = sum(int(np.count_nonzero(value[start:start + ROWS_PER_BLOCK]))
+                  for start in range(0, value.shape[0], ROWS_PER_BLOCK))
+    return nonzero / max(1, value.size)
+
+
+def to_sparse(value):
+    """稠密二维数组按行块转换为CSR"""
+    sparse = _sparse()
+    blocks = [sparse.csr_array(np.asarray(value[start:start + ROWS_PER_BLOCK]))
+              for start in range(0, value.shape[0], ROWS_PER_BLOCK)]
+    return sparse.vstack(blocks, format="csr") if len(blocks) > 1 else blocks[0]
+
+
+def choose_format(value):
+    """按大小和非零元素比例选择稀疏（CSR）或稠密表示，非二维矩阵原样返回"""
+    if getattr(value, "ndim", 0) != 2:
+        return value
+    size = value.shape[0] * value.shape[1]
+    if is_sparse(value):
+        if size < MIN_SPARSE_SIZE or density(value) > DENSITY_THRESHOLD:
+            return value.toarray()
+        return _sparse().csr_array(value)
+    if size >= MIN_SPARSE_SIZE and available() and density(value) <= DENSITY_THRESHOLD:
+        return to_sparse(value)
+    return value
+
+
+def load(path):
+    """载入.npz（scipy.sparse.save_npz保存）或.mtx（Matrix Market）稀疏矩阵"""
+    sparse = _sparse()
+    if sparse is None:
+        raise ValueError("需要安装SciPy才能读取稀疏矩阵文件")
+    if path.lower().endswith(".mtx"):
+        import scipy.io
+        return sparse.csr_array(scipy.io.mmread(path))
+    return sparse.csr_array(sparse.load_npz(path))
+
+
+def save(value, path):
+    if path.lower().endswith(".mtx"):
+        import scipy.io
+        scipy.io.mmwrite(path, value)
+    else:
+        sparse = _sparse()
+        sparse.save_npz(path, sparse.csr_matrix(value))
+
+
+def _permutation_sign(permutation):
+    """置换的符号（按循环分解计算）"""
+    visited = np.zeros(permutation.size, dtype=bool)
+    sign = 1
+    for start in range(permutation.size):
+        if visited[start]:
+            continue
+        length = 0
+        index = start
+        while not visited[index]:
+            visited[index] = True
+            index = permutation[index]
+            length += 1
+        if length % 2 == 0:
+            sign = -sign
+    return sign
+
+
+def splu(value):
+    """稀疏LU分解（Pr·A·Pc = L·U），奇异矩阵抛出ValueError"""
+    if value.shape[0] != value.shape[1]:
+        raise ValueError("矩阵必须是方阵")
+    import scipy.sparse.linalg
+    try:
+        return scipy.sparse.linalg.splu(_sparse().csc_matrix(value))
+    except RuntimeError as e:
+        raise ValueError(f"矩阵是奇异的: {str(e)}") from None
+
+
+def lu_slogdet(lu):
+    """由稀疏LU分解得到 (符号, log|det|)"""
+    diagonal = lu.U.diagonal()
+    if np.any(diagonal == 0):
+        return 0.0, -math.inf
+    sign = _permutation_sign(lu.perm_r) * _permutation_sign(lu.perm_c)
+    sign *= int(np.prod(np.sign(diagonal)))
+    return float(sign), float(np.sum(np.log(np.abs(diagonal))))
+
+
+def norm(value):
+    import scipy.sparse.linalg
+    return float(scipy.sparse.linalg.norm(value))
@@ -0,0 +1,169 @@
+"""单次遍历的汇总统计（不依赖Qt）
+
+RunningStats 逐块累加数据，只保存计数、总和、均值、中心矩M2/M3/M4、最小值和最大值，
+内存占用与数据量无关。块内用numpy计算中心矩，块之间按Chan/Pébay公式合并，
+比直接累加 x、x²（先求和再相减）数值上更稳定。
+"""
+import math
+
+import numpy as np
+
+CHUNK_SIZE = 1 << 20
+
+
+class RunningStats:
+    """流式汇总统计量：count、sum、mean、variance/std、skewness、kurtosis、min、max"""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.m3 = 0.0
+        self.m4 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    @classmethod
+    def from_array(cls, values, chunk_size=CHUNK_SIZE):
+        """分块累加一个数组（可以是内存映射数组，不会整体复制）"""
+        stats = cls()
+        for start in range(0, len(values), chunk_size):
+            stats.update(values[start:start + chunk_size])
+        return stats
+
+    @classmethod
+    def from_chunks(cls, chunks):
+        """累加一系列数据块"""
+        stats = cls()
+        for chunk in chunks:
+            stats.update(chunk)
+        return stats
+
+    def update(self, values):
+        """加入一个数据块（或单个数值）"""
+        values = np.asarray(values, dtype=float).ravel()
+        if values.size == 0:
+            return
+        chunk = RunningStats()
+        chunk.count = int(values.size)
+        chunk.total = float(values.sum())
+        chunk.mean = chunk.total / chunk.count
+        deviations = values - chunk.mean
+        squares = deviations * deviations
+        chunk.m2 = float(squares.sum())
+        chunk.m3 = float((squares * deviations).sum())
+        chunk.m4 = float((squares * squares).sum())
+        chunk.min = float(values.min())
+        chunk.max = float(values.max())
+        self.merge(chunk)
+
+    def merge(self, other):
+        """合并另一个累加器（两部分数据的统计量合并为整体的统计量）"""
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.__dict__.update(other.__dict__)
+            return
+
+        n_a, n_b = self.count, other.count
+        n = n_a + n_b
+        delta = other.mean - self.mean
+        delta_n = delta / n
+
+        m2 = self.m2 + other.m2 + delta * delta_n * n_a * n_b
+        m3 = (self.m3 + other.m3
+              + delta * delta_n * delta_n * n_a * n_b * (n_a - n_b)
+              + 3 * delta_n * (n_a * other.m2 - n_b * self.m2))
+        m4 = (self.m4 + other.m4
+              + delta * delta_n ** 3 * n_a * n_b * (n_a * n_a - n_a * n_b + n_b * n_b)
+              + 6 * delta_n * delta_n * (n_a * n_a * other.m2 + n_b * n_b * self.m2)
+              + 4 * delta_n * (n_a * other.m3 - n_b * self.m3))
+
+        self.count = n
+        self.total += other.total
+        self.mean += delta_n * n_b
+        self.m2, self.m3, self.m4 = m2, m3, m4
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def _require_data(self):
+        if self.count == 0:
+            raise ValueError("没有数据")
+
+    @property
+    def variance(self):
+        """总体方差（与np.var相同）"""
+        self._require_data()
+        return self.m2 / self.count
+
+    @property
+    def sample_variance(self):
+        """样本方差（除以n-1）"""
+        self._require_data()
+        return self.m2 / (self.count - 1) if self.count > 1 else math.nan
+
+    @property
+    def std(self):
+        return math.sqrt(self.variance)
+
+    @property
+    def skewness(self):
+        """偏度（总体）"""
+        self._require_data()
+        if self.m2 == 0:
+            return math.nan
+        return math.sqrt(self.count) * self.m3 / self.m2 ** 1.5
+
+    @property
+    def kurtosis(self):
+        """超额峰度（正态分布为0）"""
+        self._require_data()
+        if self.m2 == 0:
+            return math.nan
+        return self.count * self.m4 / (self.m2 * self.m2) - 3.0
+
+    def as_dict(self):
+        """所有统计量"""
+        self._require_data()
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "mean": self.mean,
+            "std": self.std,
+            "variance": self.variance,
+            "sample_variance": self.sample_variance,
+            "skewness": self.skewness,
+            "kurtosis": self.kurtosis,
+            "min": self.min,
+            "max": self.max,
+        }
+
+
+SUMMARY_LABELS = (
+    ("count", "数量"),
+    ("sum", "总和"),
+    ("mean", "平均值"),
+    ("std", "标准差"),
+    ("variance", "方差"),
+    ("sample_variance", "样本方差"),
+    ("skewness", "偏度"),
+    ("kurtosis", "峰度"),
+    ("min", "最小值"),
+    ("max", "最大值"),
+)
+
+
+def format_summary(stats):
+    """把汇总统计量格式化为多行文本"""
+    values = stats.as_dict()
+    return "\n".join(f"{label}: {values[name]:.10g}" for name, label in SUMMARY_LABELS)
+
+
+def summarize_file(path, column=None, modified=None):
+    """逐块读取数据文件并计算汇总统计量，内存占用只与块大小有关
+
+    modified 不参与计算，只用于区分同一文件的不同版本（作为结果缓存键的一部分）。
+    """
+    import datasets
+    return RunningStats.from_chunks(datasets.iter_chunks(path, column))
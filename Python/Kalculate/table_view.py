@@ -0,0 +1,81 @@
+"""数值表窗口
+
+SweepTableModel 只在表格需要显示某个单元格时才格式化对应的数值，QTableView只请求可见的行，
+因此几百万行的表格也可以立即显示和滚动。
+"""
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+                               QTableView, QHeaderView, QFileDialog, QMessageBox)
+
+
+class SweepTableModel(QAbstractTableModel):
+    """tables.SweepTable 的只读模型"""
+
+    def __init__(self, table, parent=None):
+        super().__init__(parent)
+        self.table = table
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.table.rows
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.table.columns)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return f"{self.table.columns[index.column()][index.row()]:.10g}"
+        if role == Qt.TextAlignmentRole:
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.table.names[section]
+        return str(section + 1)
+
+
+class TableDialog(QDialog):
+    """显示数值表，可以导出为CSV或.npy"""
+
+    def __init__(self, table, title="Table", parent=None):
+        super().__init__(parent)
+        self.table = table
+        self.setWindowTitle(title)
+        self.resize(640, 480)
+
+        layout = QVBoxLayout(self)
+        self.view = QTableView()
+        self.view.setModel(SweepTableModel(table, self))
+        # 固定行高，表头不需要逐行计算高度
+        header = self.view.verticalHeader()
+        header.setSectionResizeMode(QHeaderView.Fixed)
+        header.setDefaultSectionSize(22)
+        self.view.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        layout.addWidget(self.view)
+
+        buttons = QHBoxLayout()
+        buttons.addWidget(QLabel(f"{table.rows}行"))
+        buttons.addStretch()
+        export_button = QPushButton("导出...")
+        export_button.clicked.connect(self.export)
+        buttons.addWidget(export_button)
+        close_button = QPushButton("关闭")
+        close_button.clicked.connect(self.close)
+        buttons.addWidget(close_button)
+        layout.addLayout(buttons)
+
+    def export(self):
+        """导出为CSV/TSV或.npy文件"""
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "导出数值表", "table.csv", "CSV文件 (*.csv);;TSV文件 (*.tsv);;NumPy文件 (*.npy)"
+        )
+        if not file_path:
+            return
+        try:
+            self.table.save(file_path)
+        except Exception as e:
+            QMessageBox.critical(self, "导出错误", f"错误: {str(e)}")
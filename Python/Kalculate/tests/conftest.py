@@ -0,0 +1,6 @@
+"""测试直接导入Python/Kalculate下的模块（与benchmarks相同，不需要安装）"""
+import os
+import sys
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, APP_DIR)
@@ -0,0 +1,57 @@
+"""batch：读取任务、JSONL格式的输入输出，以及单行任务的超时"""
+import io
+import json
+
+import batch
+
+
+def run_lines(lines, **kwargs):
+    output = io.StringIO()
+    counts = batch.run_batch(batch.read_tasks(lines, "evaluate", "RAD"), output, **kwargs)
+    records = sorted((json.loads(line) for line in output.getvalue().splitlines()), key=lambda record: record["line"])
+    return counts, records
+
+
+def test_read_tasks_skips_blank_and_comment_lines():
+    lines = ["# 注释\n", "\n", "1 + 1\n", '{"op": "diff", "expr": "x^2"}\n', "{bad json\n"]
+    tasks = list(batch.read_tasks(lines, "simplify", "DEG"))
+    assert tasks[0] == (3, {"op": "simplify", "expr": "1 + 1", "angle_mode": "DEG"})
+    assert tasks[1] == (4, {"op": "diff", "expr": "x^2", "angle_mode": "DEG"})
+    assert tasks[2][0] == 5 and tasks[2][1]["op"] == "invalid"
+
+
+def test_jsonl_round_trip():
+    lines = [
+        "2 + 3\n",
+        json.dumps({"op": "integrate", "expr": "2x", "lower": "0", "upper": "3"}) + "\n",
+        json.dumps({"op": "evaluate", "expr": "asin(0.5)", "angle_mode": "DEG"}) + "\n",
+        json.dumps({"op": "nosuch", "expr": "x"}) + "\n",
+        "{bad json\n",
+    ]
+    counts, records = run_lines(lines, workers=2)
+    assert counts == {"ok": 3, "error": 2, "timeout": 0}
+    assert [record["line"] for record in records] == [1, 2, 3, 4, 5]
+    assert records[0]["result"] == "5.00000000000000"
+    assert records[1]["result"] == "9" and records[1]["latex"] == "9"
+    assert records[2]["result"] == "30.0000000000000"
+    assert records[3]["status"] == "error" and "nosuch" in records[3]["error"]
+    assert records[4]["status"] == "error" and records[4]["error"].startswith("JSON格式错误")
+    assert all(record["elapsed"] >= 0 for record in records)
+
+
+def test_timeout_reported_for_single_line():
+    slow = {"op": "simplify", "expr": "(x+y+z)^40 - expand((x+y+z)^40)", "timeout": 0.2}
+    lines = ["1 + 1\n", json.dumps(slow) + "\n", "2 * 3\n"]
+    counts, records = run_lines(lines, workers=2)
+    assert counts == {"ok": 2, "error": 0, "timeout": 1}
+    assert [record["status"] for record in records] == ["ok", "timeout", "ok"]
+    assert "result" not in records[1]
+
+
+def test_main_writes_output_file(tmp_path):
+    source = tmp_path / "tasks.txt"
+    source.write_text("x^2 = 4\n", encoding="utf-8")
+    target = tmp_path / "results.jsonl"
+    assert batch.main([str(source), "-o", str(target), "--op", "solve", "--workers", "1"]) == 0
+    record = json.loads(target.read_text(encoding="utf-8"))
+    assert record == {"line": 1, "status": "ok", "elapsed": record["elapsed"], "result": ["-2", "2"]}
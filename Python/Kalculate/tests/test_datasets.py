@@ -0,0 +1,31 @@
+"""datasets：文本数据文件的读取"""
+import numpy as np
+
+import datasets
+
+
+def write(tmp_path, text, name="data.csv"):
+    path = tmp_path / name
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def test_column_skips_ragged_and_empty_rows(tmp_path):
+    path = write(tmp_path, "a,b,c\n1,2,3\n4,5\n6\n7,,9\n10,11,12\n")
+    np.testing.assert_array_equal(datasets.load_dataset(path, column=2).values, [3, 9, 12])
+    np.testing.assert_array_equal(datasets.load_dataset(path, column=1).values, [2, 5, 11])
+
+
+def test_all_values_without_column(tmp_path):
+    path = write(tmp_path, "# comment\n1 2\n3\n\n4 5 6\n", "data.txt")
+    dataset = datasets.load_dataset(path)
+    np.testing.assert_array_equal(dataset.values, [1, 2, 3, 4, 5, 6])
+    assert dataset.summary().mean == 3.5
+
+
+def test_chunks_match_single_read(tmp_path):
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=1000)
+    path = write(tmp_path, "x\n" + "\n".join(repr(float(v)) for v in values) + "\n")
+    for chunk_lines in (7, 1000, 5000):
+        np.testing.assert_array_equal(datasets.load_dataset(path, column=0, chunk_lines=chunk_lines).values, values)
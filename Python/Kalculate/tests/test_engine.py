@@ -0,0 +1,75 @@
+"""engine：角度制的替换顺序，以及批量任务可以使用的各个操作"""
+import math
+
+import pytest
+import sympy as sp
+
+import engine
+
+x = engine.x
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("sin(30)", "sin(pi/180*30)"),
+    ("asin(0.5)", "(180/pi)*asin(0.5)"),
+    ("atan(1) + tan(45)", "(180/pi)*atan(1) + tan(pi/180*45)"),
+    # asin(中的sin(不能再被替换
+    ("asin(sin(30))", "(180/pi)*asin(sin(pi/180*30))"),
+    ("acos(cos(x))", "(180/pi)*acos(cos(pi/180*x))"),
+])
+def test_apply_angle_mode_degrees(text, expected):
+    assert engine.apply_angle_mode(text, "DEG") == expected
+
+
+def test_apply_angle_mode_radians_unchanged():
+    assert engine.apply_angle_mode("asin(sin(30))", "RAD") == "asin(sin(30))"
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("sin(30)", 0.5), ("asin(0.5)", 30.0), ("asin(sin(30))", 30.0), ("atan(1)", 45.0), ("cos(60)×2", 1.0),
+])
+def test_evaluate_in_degrees(text, expected):
+    assert float(engine.evaluate(text, "DEG")) == pytest.approx(expected, rel=1e-12)
+
+
+def test_parse_normalizes_input():
+    assert engine.parse("2x^2 ÷ 4 =") == x ** 2 / 2
+    assert engine.parse("x^2 = 4") == sp.Eq(x ** 2, 4)
+
+
+@pytest.mark.parametrize("task, expected", [
+    ({"op": "evaluate", "expr": "asin(0.5)", "angle_mode": "DEG"}, "30.0000000000000"),
+    ({"op": "simplify", "expr": "sin(x)^2 + cos(x)^2"}, "1"),
+    ({"op": "solve", "expr": "x^2 = 4"}, ["-2", "2"]),
+    ({"op": "diff", "expr": "x^3", "order": 2}, "6*x"),
+    ({"op": "integrate", "expr": "2x", "lower": "0", "upper": "3"}, "9"),
+    ({"op": "limit", "expr": "sin(x)/x"}, "1"),
+    ({"op": "series", "expr": "exp(x)", "order": 3}, "x**2/2 + x + 1"),
+    ({"op": "statistic", "name": "gcd", "data": "12 18"}, 6),
+])
+def test_run_operations(task, expected):
+    assert engine.run(task)["result"] == expected
+
+
+def test_run_numeric_operations():
+    value, error = engine.run({"op": "nintegrate", "expr": "x^2"})["result"]
+    assert value == pytest.approx(1 / 3, rel=1e-12) and error < 1e-10
+    assert float(engine.run({"op": "nsolve", "expr": "cos(x) = x"})["result"][0]) == pytest.approx(0.739085133215161)
+    assert engine.run({"op": "matrix", "name": "det", "matrices": ["[[1, 2], [3, 4]]"]})["result"] == pytest.approx(-2)
+    stats = engine.run({"op": "stats", "data": "1, 2, 3, 4"})["result"]
+    assert stats["count"] == 4 and stats["std"] == pytest.approx(math.sqrt(1.25))
+
+
+def test_run_adds_latex_for_sympy_results():
+    assert engine.run({"op": "diff", "expr": "x^3"})["latex"] == "3 x^{2}"
+    assert "latex" not in engine.run({"op": "statistic", "name": "count", "data": "1 2"})
+
+
+def test_every_operation_is_tested():
+    assert set(engine.OPERATIONS) == {"evaluate", "simplify", "solve", "nsolve", "diff", "integrate", "nintegrate",
+                                      "limit", "series", "stats", "statistic", "matrix"}
+
+
+def test_unknown_operation():
+    with pytest.raises(ValueError):
+        engine.run({"op": "unknown", "expr": "x"})
@@ -0,0 +1,75 @@
+"""exact_matrix：Bareiss、多模行列式和无分数消元与SymPy的精确结果对比"""
+import random
+from fractions import Fraction
+
+import pytest
+import sympy as sp
+
+import exact_matrix
+from exact_matrix import ExactMatrix
+
+
+def random_rows(n, max_entry, seed, columns=None):
+    rng = random.Random(seed)
+    return [[rng.randint(-max_entry, max_entry) for _ in range(columns or n)] for _ in range(n)]
+
+
+def to_sympy(matrix):
+    return sp.Matrix([[sp.Rational(item.numerator, item.denominator) for item in row] for row in matrix.rows])
+
+
+@pytest.mark.parametrize("n, max_entry", [(1, 10), (4, 10), (12, 1000), (30, 10 ** 6), (8, 2 ** 70)])
+@pytest.mark.parametrize("method", ["bareiss", "modular"])
+def test_det_equals_sympy(n, max_entry, method):
+    rows = random_rows(n, max_entry, seed=n)
+    assert exact_matrix.det(rows, method) == sp.Matrix(rows).det()
+
+
+def test_det_methods_agree_on_large_matrix():
+    rows = random_rows(60, 100, seed=60)
+    assert exact_matrix.bareiss_det(rows) == exact_matrix.modular_det(rows)
+
+
+@pytest.mark.parametrize("method", ["bareiss", "modular"])
+def test_singular_and_rational_det(method):
+    singular = random_rows(6, 50, seed=6)
+    singular[5] = [2 * a - b for a, b in zip(singular[0], singular[1])]
+    assert exact_matrix.det(singular, method) == 0
+
+    rational = [[Fraction(1, i + j + 1) for j in range(5)] for i in range(5)]
+    assert exact_matrix.det(rational, method) == sp.Matrix(5, 5, lambda i, j: sp.Rational(1, i + j + 1)).det()
+
+
+def test_rref_rank_and_inverse_match_sympy():
+    rows = random_rows(5, 9, seed=7, columns=7)
+    rows[4] = [a + b for a, b in zip(rows[0], rows[1])]
+    matrix = ExactMatrix(rows)
+    reduced, pivots = exact_matrix.rref(matrix)
+    expected, expected_pivots = sp.Matrix(rows).rref()
+    assert to_sympy(reduced) == expected
+    assert tuple(pivots) == expected_pivots
+    assert exact_matrix.rank(matrix) == 4
+
+    square = ExactMatrix(random_rows(6, 20, seed=8))
+    assert to_sympy(exact_matrix.inverse(square)) == to_sympy(square).inv()
+
+
+def test_solve_matches_sympy():
+    a = ExactMatrix(random_rows(5, 30, seed=9))
+    b = ExactMatrix(random_rows(5, 30, seed=10, columns=2))
+    assert to_sympy(exact_matrix.solve(a, b)) == to_sympy(a).LUsolve(to_sympy(b))
+
+    singular = ExactMatrix([[1, 2], [2, 4]])
+    with pytest.raises(ValueError):
+        exact_matrix.solve(singular, [[1], [1]])
+    with pytest.raises(ValueError):
+        exact_matrix.solve(singular, [[1], [2]])
+    with pytest.raises(ValueError):
+        exact_matrix.inverse(singular)
+
+
+def test_cond_is_exact():
+    matrix = ExactMatrix([[1, 2], [3, 4]])
+    expected = to_sympy(matrix).norm(1) * to_sympy(matrix).inv().norm(1)
+    assert exact_matrix.cond(matrix) == expected
+    assert exact_matrix.cond([[1, 2], [2, 4]]) == float("inf")
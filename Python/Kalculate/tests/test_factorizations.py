@@ -0,0 +1,188 @@
+"""factorizations：分解缓存、slogdet的符号、最小二乘求解和条件数与numpy的结果对比"""
+import gc
+import math
+
+import numpy as np
+import pytest
+
+import factorizations
+from factorizations import ConditionEstimate, Factorization, FactorizationCache, LogDeterminant
+
+
+def random_matrix(n, seed, columns=None):
+    return np.random.default_rng(seed).normal(size=(n, columns or n))
+
+
+def spd_matrix(n, seed):
+    a = random_matrix(n, seed)
+    return a @ a.T + n * np.eye(n)
+
+
+def permutation_matrix(permutation):
+    return np.eye(len(permutation))[list(permutation)]
+
+
+def test_cache_hit_and_miss():
+    cache = FactorizationCache()
+    a = random_matrix(5, 0)
+    first = cache.get(a)
+    assert cache.get(a) is first
+    # 内容相同的另一个数组按身份区分，不命中
+    assert cache.get(a.copy()) is not first
+    assert cache.stats() == {"size": 1, "hits": 1, "misses": 2}
+
+
+def test_cache_entry_removed_when_matrix_collected():
+    cache = FactorizationCache()
+    matrices = [random_matrix(4, seed) for seed in range(3)] + [random_matrix(3, 0, 5)]
+    for matrix in matrices:
+        cache.get(matrix)
+    del matrix
+    assert cache.stats()["size"] == 4
+    del matrices[0]
+    gc.collect()
+    assert cache.stats()["size"] == 3
+    # 最小二乘的分解不引用原矩阵，同样会被删除
+    del matrices[-1]
+    gc.collect()
+    assert cache.stats()["size"] == 2
+
+
+def test_cache_evicts_least_recently_used():
+    cache = FactorizationCache(maxsize=2)
+    a, b, c = (random_matrix(3, seed) for seed in range(3))
+    cache.get(a)
+    cache.get(b)
+    cache.get(a)
+    cache.get(c)
+    assert cache.stats()["size"] == 2
+    misses = cache.misses
+    cache.get(a)
+    assert cache.misses == misses
+    cache.get(b)
+    assert cache.misses == misses + 1
+
+
+def test_cache_key_reused_after_collection():
+    """矩阵被释放后同一个id可能分给新的矩阵，不能返回旧的分解"""
+    cache = FactorizationCache()
+    for seed in range(20):
+        matrix = random_matrix(3, seed)
+        expected = np.linalg.slogdet(matrix)
+        assert cache.get(matrix).slogdet() == pytest.approx(tuple(expected))
+        del matrix
+
+
+def slogdet_cases():
+    cases = [random_matrix(n, seed) for n in (1, 2, 5, 30) for seed in range(4)]
+    cases += [permutation_matrix(p) for p in ((1, 0), (1, 2, 0), (0, 2, 1), (3, 2, 1, 0), (1, 0, 3, 2, 4))]
+    cases += [-np.eye(3), np.diag([2.0, -3.0, 0.5]), np.array([[0.0, 1.0], [1.0, 0.0]]) * 1e200]
+    cases += [spd_matrix(n, n) for n in (1, 4, 20)]
+    return cases
+
+
+@pytest.mark.parametrize("matrix", slogdet_cases())
+def test_slogdet_matches_numpy(matrix):
+    sign, logabs = Factorization(matrix).slogdet()
+    expected_sign, expected_logabs = np.linalg.slogdet(matrix)
+    assert sign == expected_sign
+    assert logabs == pytest.approx(expected_logabs, rel=1e-12, abs=1e-12)
+
+
+def test_slogdet_signs_of_permuted_matrices():
+    rng = np.random.default_rng(1)
+    base = spd_matrix(6, 1)
+    signs = set()
+    for _ in range(20):
+        matrix = base[rng.permutation(6)]
+        sign, _ = Factorization(matrix).slogdet()
+        assert sign == np.linalg.slogdet(matrix)[0]
+        signs.add(sign)
+    assert signs == {-1.0, 1.0}
+
+
+def test_kind_chosen_by_shape_and_symmetry():
+    assert Factorization(spd_matrix(4, 0)).kind == "cholesky"
+    assert Factorization(random_matrix(4, 0)).kind == "lu"
+    # 对称但不正定的矩阵退回LU
+    assert Factorization(np.diag([1.0, -1.0])).kind == "lu"
+    assert Factorization(random_matrix(5, 0, 3)).kind == "qr"
+    assert Factorization(random_matrix(3, 0, 5)).kind == "lstsq"
+
+
+@pytest.mark.filterwarnings("ignore:Diagonal number")
+def test_singular_matrix():
+    matrix = np.array([[1.0, 2.0], [2.0, 4.0]])
+    factorization = Factorization(matrix)
+    assert factorization.slogdet() == (0.0, -math.inf)
+    assert factorization.cond() == math.inf
+    with pytest.raises(ValueError):
+        factorization.solve(np.ones(2))
+
+
+def test_without_scipy(monkeypatch):
+    monkeypatch.setattr(factorizations, "scipy_linalg", None)
+    matrix = random_matrix(4, 2)
+    factorization = Factorization(matrix)
+    assert factorization.kind == "numpy"
+    assert factorization.slogdet() == pytest.approx(tuple(np.linalg.slogdet(matrix)))
+    np.testing.assert_allclose(factorization.inverse(), np.linalg.inv(matrix))
+
+
+@pytest.mark.parametrize("matrix", [random_matrix(6, 3), spd_matrix(6, 3)])
+def test_solve_and_inverse_square(matrix):
+    factorization = Factorization(matrix)
+    rhs = random_matrix(6, 4, 2)
+    np.testing.assert_allclose(factorization.solve(rhs), np.linalg.solve(matrix, rhs), rtol=1e-10)
+    np.testing.assert_allclose(factorization.inverse(), np.linalg.inv(matrix), rtol=1e-10, atol=1e-12)
+
+
+@pytest.mark.parametrize("rows, columns", [(8, 3), (3, 8), (1, 4)])
+def test_solve_non_square_matches_lstsq(rows, columns):
+    matrix = random_matrix(rows, 5, columns)
+    rhs = random_matrix(rows, 6, 1)
+    expected = np.linalg.lstsq(matrix, rhs, rcond=None)[0]
+    np.testing.assert_allclose(Factorization(matrix).solve(rhs), expected, rtol=1e-10, atol=1e-12)
+
+
+def test_non_square_has_no_determinant():
+    for matrix in (random_matrix(3, 0, 5), random_matrix(5, 0, 3)):
+        with pytest.raises(ValueError):
+            Factorization(matrix).slogdet()
+        with pytest.raises(ValueError):
+            Factorization(matrix).cond()
+
+
+def test_log_determinant_value_and_text():
+    assert LogDeterminant(-1.0, math.log(8)).value() == pytest.approx(-8)
+    assert LogDeterminant(1.0, 1000.0).value() == math.inf
+    assert LogDeterminant(-1.0, -1000.0).value() == -0.0
+    assert LogDeterminant(0.0, -math.inf).value() == 0.0
+    assert str(LogDeterminant(0.0, -math.inf)) == "det = 0"
+    assert "det ≈ -2.5e+300" in str(LogDeterminant(-1.0, math.log(2.5e300)))
+
+
+@pytest.mark.parametrize("matrix", [random_matrix(8, 7), spd_matrix(8, 7), np.diag([1e-6, 1.0, 1e6])])
+def test_cond_exact_at_or_below_limit(matrix):
+    assert matrix.shape[0] <= factorizations.COND_EXACT_MAX
+    value = Factorization(matrix).cond()
+    assert type(value) is float
+    assert value == pytest.approx(np.linalg.cond(matrix, 1), rel=1e-8)
+
+
+@pytest.mark.parametrize("matrix", [random_matrix(8, 7), spd_matrix(8, 7), np.diag([1e-6, 1.0, 1e6])])
+def test_cond_estimated_above_limit(monkeypatch, matrix):
+    monkeypatch.setattr(factorizations, "COND_EXACT_MAX", matrix.shape[0] - 1)
+    value = Factorization(matrix).cond()
+    assert isinstance(value, ConditionEstimate)
+    assert str(value).startswith("≈ ")
+    # LAPACK的1-范数估计不会超过精确值，通常在几倍之内
+    exact = np.linalg.cond(matrix, 1)
+    assert exact / 10 <= value <= exact * (1 + 1e-8)
+
+
+def test_cond_at_real_limit():
+    n = factorizations.COND_EXACT_MAX
+    below, above = random_matrix(n, 0), random_matrix(n + 1, 0)
+    assert type(Factorization(below).cond()) is float
+    assert isinstance(Factorization(above).cond(), ConditionEstimate)
@@ -0,0 +1,77 @@
+"""fastpath：快速路径的结果与 parse_expr(...).evalf() 对比"""
+import random
+
+import pytest
+import sympy as sp
+from sympy.parsing.sympy_parser import parse_expr
+
+import fastpath
+
+EXACT = ["2+3*4", "1/3", "2**100", "2**-3", "10/4", "-(3**2)", "(7-2)/(3*4)", "I**2", "1/(2+I)", "(1+2*I)**2"]
+FLOAT = ["sqrt(2)", "2**0.5", "log(8, 2)", "log(10)", "exp(1.5)", "sin(0.5)/3", "cos(2.5)**2 + sin(2.5)**2",
+         "atan(1.0)", "asin(0.3)", "sinh(1.2)", "abs(-3.5)", "7 - 2.5*3", "1e-5*3", "tan(1)", "3.0**40",
+         "pi", "E", "pi*2", "pi/6", "sqrt(1/4)", "2.5e300*3e-290", "exp(I*0.5)"]
+# 浮点数算不准（或需要SymPy语法）的输入必须交给SymPy
+NOT_NUMERIC = ["sin(pi)", "cos(pi/2)", "tan(pi/2)", "sin(pi/6)", "E**(I*pi)", "exp(I*pi)", "1e20+1-1e20",
+               "0.1+0.2-0.3", "x+1", "2x", "5!", "1/0", "sqrt(-4)", "floor(2.7)", "10.0**400"]
+# 负实数的分数次方用浮点数计算会得到带舍入误差的复数（如 6.12e-17 + 1.0*I），必须交给SymPy
+COMPLEX_POWERS = ["(-1)**0.5", "(-8)**(1/3)", "(-2.5)**1.5", "(-1/4)**0.5"]
+
+
+def close(value, expected, digits):
+    """在最后一位有效数字之内一致（用SymPy按足够的精度比较）"""
+    difference = sp.Abs(sp.N(value - expected, digits + 10))
+    return difference <= sp.Float(10, digits + 10) ** (1 - digits) * sp.Abs(expected)
+
+
+@pytest.mark.parametrize("text", EXACT)
+def test_exact_results_equal_sympy(text):
+    assert str(fastpath.evaluate(text)) == str(parse_expr(text).evalf(fastpath.FLOAT_DIGITS))
+
+
+@pytest.mark.parametrize("text", FLOAT)
+def test_float_results_match_sympy(text):
+    assert close(fastpath.evaluate(text), parse_expr(text).evalf(fastpath.FLOAT_DIGITS), fastpath.FLOAT_DIGITS)
+
+
+@pytest.mark.parametrize("text", NOT_NUMERIC)
+def test_sent_to_sympy(text):
+    with pytest.raises(fastpath.NotNumeric):
+        fastpath.evaluate(text)
+
+
+def test_random_expressions_match_sympy():
+    rng = random.Random(19)
+    for _ in range(300):
+        a, b, c, d = (round(rng.uniform(-100, 100), rng.randint(0, 4)) for _ in range(4))
+        text = f"{a}+{b}*{c}/{d or 1}-{rng.choice(['sin', 'cos', 'exp', 'atan'])}({round(rng.uniform(-5, 5), 3)})"
+        try:
+            value = fastpath.evaluate(text)
+        except fastpath.NotNumeric:
+            continue
+        assert close(value, parse_expr(text).evalf(fastpath.FLOAT_DIGITS), fastpath.FLOAT_DIGITS), text
+
+
+@pytest.mark.parametrize("text", ["1/3", "sqrt(2)", "exp(1)", "pi", "log(3)*atan(1/2)", "2**(1/2) + I/7"])
+def test_mpmath_backend_for_more_digits(text):
+    value = fastpath.evaluate(text, digits=40)
+    expected = parse_expr(text).evalf(40)
+    assert close(value, expected, 40)
+    assert not close(sp.N(expected, 15), expected, 40)
+
+
+def test_decimal_literals_are_exact_with_more_digits():
+    # SymPy把0.5读成15位的Float，快速路径按精确的十进制数计算
+    assert close(fastpath.evaluate("atan(0.5)", digits=40), parse_expr("atan(1/2)").evalf(40), 40)
+
+
+@pytest.mark.parametrize("digits", [fastpath.FLOAT_DIGITS, 40])
+@pytest.mark.parametrize("text", COMPLEX_POWERS)
+def test_complex_powers_of_reals_sent_to_sympy(text, digits):
+    with pytest.raises(fastpath.NotNumeric):
+        fastpath.evaluate(text, digits=digits)
+
+
+@pytest.mark.parametrize("text", ["(-2)**3", "(-2)**-2", "(-8.0)**2.0", "(2*I)**0.5", "(-1+0*I)**0.5"])
+def test_powers_with_real_or_complex_results_still_fast(text):
+    assert close(fastpath.evaluate(text), parse_expr(text).evalf(fastpath.FLOAT_DIGITS), fastpath.FLOAT_DIGITS)
@@ -0,0 +1,56 @@
+"""frequencies：精确计数与np.unique对比，近似模式的计数上下界"""
+import numpy as np
+import pytest
+
+import frequencies
+from frequencies import FrequencyCounter
+
+
+def true_counts(values):
+    keys, counts = np.unique(values, return_counts=True)
+    return dict(zip(keys.tolist(), counts.tolist()))
+
+
+def test_exact_top_k_matches_unique():
+    values = np.random.default_rng(14).integers(0, 50, size=100_000).astype(float)
+    counter = FrequencyCounter.from_array(values, chunk_size=7_000)
+    assert counter.exact and counter.error_bound() == 0
+    counts = true_counts(values)
+    expected = sorted(counts.items(), key=lambda item: (-item[1], item[0]))[:10]
+    assert [(value, count) for value, count, _ in counter.top_k(10)] == expected
+    assert counter.mode() == [expected[0][0]]
+
+
+def test_nan_ignored_and_ties():
+    counter = FrequencyCounter.from_array(np.array([2.0, 1.0, np.nan, 1.0, 2.0, 3.0]))
+    assert counter.total == 5
+    assert counter.mode() == [1.0, 2.0]
+    with pytest.raises(ValueError):
+        FrequencyCounter().top_k()
+
+
+def test_approximate_mode_bounds_true_counts():
+    rng = np.random.default_rng(15)
+    # 5个高频值混在大量只出现一两次的值中
+    heavy = np.repeat([1.5, 2.5, 3.5, 4.5, 5.5], [6000, 5000, 4000, 3000, 2000])
+    values = np.concatenate([heavy, rng.uniform(10, 11, size=200_000)])
+    rng.shuffle(values)
+    counter = FrequencyCounter.from_array(values, chunk_size=10_000, max_exact=1000, capacity=200)
+    assert not counter.exact
+
+    counts = true_counts(values)
+    top = counter.top_k(5)
+    assert [value for value, _, _ in top] == [1.5, 2.5, 3.5, 4.5, 5.5]
+    for value, upper, lower in counter.top_k(50):
+        assert lower <= counts[value] <= upper
+        assert upper - counts[value] <= counter.error_bound()
+    assert counter.error_bound() <= values.size / 200
+
+
+def test_count_file(tmp_path):
+    values = np.random.default_rng(16).integers(0, 5, size=2_000).astype(float)
+    path = tmp_path / "data.txt"
+    np.savetxt(path, values)
+    counter = frequencies.count_file(str(path))
+    assert counter.total == values.size
+    assert {value: count for value, count, _ in counter.top_k(5)} == true_counts(values)
@@ -0,0 +1,142 @@
+"""matrix_workspace：AST求值、赋值和Ans、禁止的语法，以及.npy/.csv文件的保存和载入"""
+import numpy as np
+import pytest
+
+import matrix_workspace
+from exact_matrix import ExactMatrix
+from matrix_workspace import ANSWER, MatrixWorkspace
+
+
+@pytest.fixture
+def workspace():
+    workspace = MatrixWorkspace()
+    workspace.evaluate("A = [[2, 1], [1, 3]]")
+    workspace.evaluate("B = [[1, 2], [3, 4]]")
+    return workspace
+
+
+def test_assignment_stores_name_and_answer():
+    workspace = MatrixWorkspace()
+    name, value = workspace.evaluate("C = [[1, 2], [3, 4]]")
+    assert name == "C"
+    np.testing.assert_array_equal(value, [[1, 2], [3, 4]])
+    assert workspace.get("C") is value and workspace.get(ANSWER) is value
+    assert workspace.names() == [ANSWER, "C"]
+
+
+def test_expression_stored_as_answer_only(workspace):
+    name, value = workspace.evaluate("A @ B")
+    assert name == ANSWER
+    np.testing.assert_array_equal(value, np.array([[2, 1], [1, 3]]) @ np.array([[1, 2], [3, 4]]))
+    assert workspace.names() == ["A", ANSWER, "B"]
+    # Ans可以在下一个表达式中使用
+    _, value = workspace.evaluate("Ans - A @ B")
+    np.testing.assert_array_equal(value, np.zeros((2, 2)))
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("A + B", lambda a, b: a + b),
+    ("2 * A - B / 4", lambda a, b: 2 * a - b / 4),
+    ("-A.T", lambda a, b: -a.T),
+    ("A ** 2", lambda a, b: a ** 2),
+    ("transpose(B) @ eye(2)", lambda a, b: b.T),
+    ("inv(A)", lambda a, b: np.linalg.inv(a)),
+    ("solve(A, ones(2, 1))", lambda a, b: np.linalg.solve(a, np.ones((2, 1)))),
+    ("zeros(2, 3) + 1", lambda a, b: np.ones((2, 3))),
+])
+def test_operators_and_functions(workspace, text, expected):
+    a, b = workspace.get("A"), workspace.get("B")
+    np.testing.assert_allclose(workspace.evaluate(text)[1], expected(a, b))
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("det(B)", -2.0), ("trace(B)", 5.0), ("rank(B)", 2), ("norm(eye(4))", 2.0), ("cond(eye(3))", 1.0),
+])
+def test_scalar_functions(workspace, text, expected):
+    assert workspace.evaluate(text)[1] == pytest.approx(expected)
+
+
+def test_exact_functions(workspace):
+    _, value = workspace.evaluate("inv(exact(B))")
+    assert isinstance(value, ExactMatrix)
+    assert str(workspace.evaluate("det(exact([[1, 2], [3, 4]]))")[1]) == "-2"
+    assert matrix_workspace.describe(workspace.evaluate("exact([[1, 2], [3, 4]]) / 3")[1]).startswith("2×2 精确矩阵")
+
+
+@pytest.mark.parametrize("text", [
+    "A.shape",
+    "A.T.__class__",
+    "__import__('os')",
+    "open('x')",
+    "eval('1')",
+    "A[0]",
+    "lambda: A",
+    "eye(n=3)",
+    "[x for x in A]",
+    "A if A else B",
+    "'text'",
+    "import os",
+    "A = B = eye(2)",
+    "A.x = 1",
+    "A; B",
+    "Q + 1",
+])
+def test_rejected_syntax(workspace, text):
+    answer = workspace.get(ANSWER)
+    with pytest.raises((ValueError, SyntaxError)):
+        workspace.evaluate(text)
+    # 出错时不修改已有的结果
+    assert workspace.get(ANSWER) is answer
+    assert workspace.names() == ["A", ANSWER, "B"]
+
+
+@pytest.mark.parametrize("name", ["det", "inv", "eye", "1x", "a-b", ""])
+def test_invalid_names(name):
+    with pytest.raises(ValueError):
+        MatrixWorkspace().set(name, np.eye(2))
+
+
+def test_compute_does_not_store(workspace):
+    name, value = workspace.compute("C = A + B")
+    assert name == "C" and "C" not in workspace
+    workspace.store(name, value)
+    assert workspace.get("C") is value and workspace.get(ANSWER) is value
+
+
+@pytest.mark.parametrize("filename", ["m.npy", "m.csv", "m.tsv", "m.txt"])
+def test_save_load_round_trip(tmp_path, filename):
+    workspace = MatrixWorkspace()
+    value = np.random.default_rng(0).normal(size=(5, 3))
+    workspace.set("M", value)
+    path = str(tmp_path / filename)
+    workspace.save("M", path)
+    name = workspace.load(path, "N")
+    assert name == "N"
+    np.testing.assert_allclose(workspace.get("N"), value, rtol=1e-15)
+
+
+def test_npy_loaded_as_memory_map(tmp_path):
+    path = str(tmp_path / "big.npy")
+    np.save(path, np.arange(12.0).reshape(3, 4))
+    workspace = MatrixWorkspace()
+    workspace.load(path)
+    assert isinstance(workspace.get("big"), np.memmap)
+    assert workspace.evaluate("trace(big)")[1] == 0 + 5 + 10
+
+
+def test_csv_header_skipped_and_default_names(tmp_path):
+    (tmp_path / "my-data.csv").write_text("a,b\n1,2\n3,4\n", encoding="utf-8")
+    (tmp_path / "2020.csv").write_text("1;2\n3;4\n", encoding="utf-8")
+    workspace = MatrixWorkspace()
+    assert workspace.load(str(tmp_path / "my-data.csv")) == "my_data"
+    np.testing.assert_array_equal(workspace.get("my_data"), [[1, 2], [3, 4]])
+    assert workspace.load(str(tmp_path / "2020.csv")) == "M_2020"
+
+
+def test_exact_matrix_saved_as_fractions(tmp_path):
+    workspace = MatrixWorkspace()
+    workspace.evaluate("E = exact([[1, 2], [3, 4]]) / 3")
+    workspace.save("E", str(tmp_path / "e.csv"))
+    assert (tmp_path / "e.csv").read_text(encoding="utf-8") == "1/3,2/3\n1,4/3\n"
+    workspace.save("E", str(tmp_path / "e.npy"))
+    np.testing.assert_allclose(np.load(tmp_path / "e.npy"), [[1 / 3, 2 / 3], [1, 4 / 3]])
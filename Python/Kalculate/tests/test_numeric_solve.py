@@ -0,0 +1,146 @@
+"""numeric_solve：近似根与numpy、SymPy和mpmath的结果对比"""
+import cmath
+import math
+import time
+
+import mpmath
+import numpy as np
+import pytest
+import sympy as sp
+
+import numeric_solve
+
+x = sp.Symbol('x')
+
+
+def as_complex(value):
+    return complex(sp.N(value))
+
+
+def assert_same_roots(actual, expected, tolerance=1e-10):
+    """两组根（不计顺序）一一对应，每个根的误差在tolerance之内"""
+    actual = sorted((as_complex(root) for root in actual), key=lambda z: (z.real, z.imag))
+    expected = sorted((complex(root) for root in expected), key=lambda z: (z.real, z.imag))
+    assert len(actual) == len(expected)
+    for a, e in zip(actual, expected):
+        assert abs(a - e) <= tolerance * max(1.0, abs(e))
+
+
+@pytest.mark.parametrize("expr, start", [
+    (sp.cos(x) - x, 0.7),
+    (sp.exp(-x) - x, 0.5),
+    (x * sp.exp(-x ** 2) - sp.Rational(1, 10), 0.1),
+    (x * sp.exp(-x ** 2) - sp.Rational(1, 10), 1.7),
+])
+def test_real_root_matches_findroot(expr, start):
+    with mpmath.workdps(30):
+        expected = mpmath.findroot(sp.lambdify(x, expr, "mpmath"), start)
+    roots = numeric_solve.solve(expr, x)
+    assert any(abs(as_complex(root) - complex(expected)) < 1e-13 for root in roots)
+
+
+def test_all_sign_changes_found():
+    roots = numeric_solve.solve(x * sp.exp(-x ** 2) - sp.Rational(1, 10), x)
+    assert len(roots) == 2
+
+
+def test_periodic_roots_in_scan_interval():
+    low, high = numeric_solve.SCAN_INTERVAL
+    expected = [k * math.pi for k in range(math.ceil(low / math.pi), math.floor(high / math.pi) + 1)]
+    assert_same_roots(numeric_solve.solve(sp.sin(x), x), expected)
+
+
+def test_poles_are_not_roots():
+    """tan(x)在π/2+kπ处变号，但那是极点，不是根"""
+    roots = [float(root) for root in numeric_solve.solve(sp.tan(x), x)]
+    assert all(abs(math.remainder(root, math.pi)) < 1e-10 for root in roots)
+    assert len(roots) == len(numeric_solve.solve(sp.sin(x), x))
+
+
+def test_even_multiplicity_roots():
+    """(sin(x)-1/2)²不变号，根由|f|的局部极小值找到"""
+    roots = numeric_solve.solve((sp.sin(x) - sp.Rational(1, 2)) ** 2, x)
+    assert len(roots) > 0
+    for root in roots:
+        assert abs(math.sin(float(root)) - 0.5) < 1e-7
+
+
+def test_complex_roots_when_no_real_root():
+    roots = numeric_solve.solve(sp.exp(x) + 1, x)
+    assert len(roots) == 1
+    assert abs(cmath.exp(as_complex(roots[0])) + 1) < 1e-12
+
+
+@pytest.mark.parametrize("expr", [
+    x ** 3 - 2 * x - 5,
+    x ** 2 + 1,
+    x ** 5 - x + 1,
+    3 * x ** 7 - 5 * x ** 4 + x - 11,
+])
+def test_polynomial_roots_match_numpy_and_nroots(expr):
+    roots = numeric_solve.solve(expr, x)
+    assert_same_roots(roots, sp.Poly(expr, x).nroots(n=20), 1e-13)
+    coeffs = [float(c) for c in sp.Poly(expr, x).all_coeffs()]
+    assert_same_roots(roots, np.roots(coeffs), 1e-8)
+
+
+def test_real_roots_listed_first():
+    roots = numeric_solve.solve(x ** 3 - 2 * x - 5, x)
+    assert roots[0].is_real
+    assert not roots[1].is_real and not roots[2].is_real
+
+
+@pytest.mark.parametrize("expr", [
+    (x - 1) ** 3 * (x + 2),
+    (x ** 2 - 2) ** 2 * (x - 3),
+    (x ** 2 + 1) ** 2 * x,
+])
+def test_multiplicities_match_sympy(expr):
+    expected = sp.roots(sp.expand(expr), x)
+    actual = numeric_solve.roots(sp.expand(expr), x)
+    assert sorted(actual.values()) == sorted(expected.values())
+    assert_same_roots(actual, [as_complex(root) for root in expected])
+    for root, multiplicity in actual.items():
+        matching = [m for e, m in expected.items() if abs(as_complex(e) - as_complex(root)) < 1e-10]
+        assert matching == [multiplicity]
+
+
+def test_float_coefficients_grouped_as_repeated_root():
+    assert numeric_solve.roots(x ** 2 - 2.0 * x + 1.0, x) == {sp.Float(1.0, 15): 2}
+
+
+def test_roots_rejects_non_polynomial():
+    with pytest.raises(ValueError):
+        numeric_solve.roots(sp.sin(x) - x, x)
+
+
+def test_equation_form():
+    assert_same_roots(numeric_solve.solve(sp.Eq(x ** 2, 2), x), [-math.sqrt(2), math.sqrt(2)], 1e-14)
+
+
+@pytest.mark.parametrize("expr", [sp.exp(x) - 2, sp.Eq(sp.exp(x), 2), sp.log(x) - 1])
+def test_rounding_plateaus_are_not_touching_roots(expr):
+    """exp(x) - 2 在x很小时|f|只有舍入误差的起伏，不应当作偶数重根的候选"""
+    f = sp.lambdify(x, numeric_solve._equation(expr), modules=["numpy"])
+    brackets, starts = numeric_solve._candidates(f, numeric_solve.SCAN_INTERVAL)
+    assert len(brackets) == 1
+    assert len(starts) == 0
+    start = time.monotonic()
+    roots = numeric_solve.solve(expr, x)
+    assert time.monotonic() - start < 1.0
+    assert len(roots) == 1
+
+
+def test_touching_starts_merged_and_capped():
+    f = sp.lambdify(x, sp.sin(x) ** 2, modules=["numpy"])
+    roots, starts = numeric_solve._candidates(f, numeric_solve.SCAN_INTERVAL)
+    # x=0正好是扫描点，已经是根，其余每个kπ只有一个起点
+    assert list(roots) == [0.0]
+    assert len(starts) == 62
+    assert np.all(np.abs(starts / math.pi - np.round(starts / math.pi)) < 1e-3)
+    assert numeric_solve.MAX_TOUCH_STARTS >= len(starts)
+
+
+def test_underflow_is_not_a_root():
+    """exp(-x**2) 在|x|较大时下溢为0"""
+    assert all(not root.is_real for root in numeric_solve.solve(sp.exp(-x ** 2), x))
@@ -0,0 +1,67 @@
+"""parse_cache：LRU淘汰顺序，以及local_dict、转换规则和角度制不同时缓存键的区分"""
+import sympy as sp
+from sympy.parsing.sympy_parser import implicit_multiplication, standard_transformations
+
+from parse_cache import ParseCache
+
+x, y = sp.symbols('x y')
+
+
+def test_hit_returns_same_object():
+    cache = ParseCache()
+    first = cache.parse("x**2 + 1")
+    assert cache.parse("x**2 + 1") is first
+    assert cache.info() == {"hits": 1, "misses": 1, "size": 1, "maxsize": 256}
+
+
+def test_evicts_least_recently_used():
+    cache = ParseCache(maxsize=2)
+    cache.parse("1")
+    cache.parse("2")
+    # 使用"1"之后，最久未使用的是"2"
+    cache.parse("1")
+    cache.parse("3")
+    assert cache.info()["size"] == 2
+    misses = cache.misses
+    cache.parse("1")
+    cache.parse("3")
+    assert cache.misses == misses
+    cache.parse("2")
+    assert cache.misses == misses + 1
+
+
+def test_local_dicts_give_different_keys():
+    cache = ParseCache()
+    plain = cache.parse("a + 1")
+    substituted = cache.parse("a + 1", local_dict={"a": x})
+    other = cache.parse("a + 1", local_dict={"a": y})
+    assert (plain, substituted, other) == (sp.Symbol("a") + 1, x + 1, y + 1)
+    assert cache.misses == 3
+    # 字典的插入顺序不影响键
+    assert cache.parse("a + b", local_dict={"a": x, "b": y}) is cache.parse("a + b", local_dict={"b": y, "a": x})
+
+
+def test_transformations_and_angle_mode_give_different_keys():
+    cache = ParseCache()
+    implicit = standard_transformations + (implicit_multiplication,)
+    assert cache.parse("2x", transformations=implicit) == 2 * x
+    cache.parse("x", angle_mode="DEG")
+    cache.parse("x", angle_mode="RAD")
+    assert cache.info()["size"] == 3 and cache.misses == 3
+    cache.parse("2x", transformations=implicit)
+    assert cache.hits == 1
+
+
+def test_local_dict_not_modified():
+    cache = ParseCache()
+    names = {"a": x}
+    cache.parse("a + b", local_dict=names)
+    assert names == {"a": x}
+
+
+def test_clear():
+    cache = ParseCache()
+    cache.parse("x")
+    cache.parse("x")
+    cache.clear()
+    assert cache.info() == {"hits": 0, "misses": 0, "size": 0, "maxsize": 256}
@@ -0,0 +1,162 @@
+"""plotting：自适应采样、参数曲线采样和隐函数曲线的精度与间断处理"""
+import math
+
+import numpy as np
+import pytest
+import sympy as sp
+
+import plotting
+
+x, y, t = sp.symbols('x y t')
+
+
+def numpy_function(expr, *variables):
+    return sp.lambdify(variables or (x,), expr, modules=["numpy"])
+
+
+def max_interpolation_error(xs, ys, f, samples=20001):
+    """采样点之间的折线与真实函数在密集网格上的最大偏差（跳过NaN断开的地方）"""
+    dense = np.linspace(xs[0], xs[-1], samples)
+    error = 0.0
+    for segment in np.split(np.arange(len(xs)), np.flatnonzero(np.isnan(ys)) + 1):
+        segment = segment[np.isfinite(ys[segment])]
+        if segment.size < 2:
+            continue
+        inside = dense[(dense >= xs[segment[0]]) & (dense <= xs[segment[-1]])]
+        error = max(error, np.abs(np.interp(inside, xs[segment], ys[segment]) - f(inside)).max())
+    return error
+
+
+@pytest.mark.parametrize("expr, x_min, x_max", [
+    (sp.sin(x), -10, 10),
+    (sp.exp(-x ** 2) * sp.cos(8 * x), -3, 3),
+    (sp.sin(1 / x), 0.05, 1),
+    (x ** 3 - 2 * x, -2, 2),
+])
+def test_adaptive_sample_within_tolerance(expr, x_min, x_max):
+    f = numpy_function(expr)
+    xs, ys = plotting.adaptive_sample(f, x_min, x_max, y_min=-2, y_max=2, tolerance=1e-3)
+    assert np.all(np.diff(xs) > 0)
+    assert xs[0] == x_min and xs[-1] == x_max
+    np.testing.assert_allclose(ys, f(xs), rtol=1e-12, atol=1e-12)
+    # 容差按视图高度换算；中点判据只是估计，允许几倍的容差
+    assert max_interpolation_error(xs, ys, f) < 4 * 1e-3 * (2 - -2)
+
+
+def test_adaptive_sample_uses_fewer_points_where_smooth():
+    xs, _ = plotting.adaptive_sample(numpy_function(sp.sin(1 / x)), 0.05, 1, y_min=-2, y_max=2)
+    # 每单位长度的点数
+    steep, smooth = np.count_nonzero(xs < 0.2) / 0.15, np.count_nonzero(xs > 0.5) / 0.5
+    assert steep > 5 * smooth
+
+
+def test_adaptive_sample_respects_budget():
+    xs, _ = plotting.adaptive_sample(numpy_function(sp.sin(50 * x)), 0, 10, -1, 1, max_points=500)
+    assert len(xs) <= 500
+
+
+@pytest.mark.parametrize("expr, poles", [
+    (1 / x, [0.0]),
+    (sp.tan(x), [-math.pi / 2, math.pi / 2]),
+    (1 / (x ** 2 - 1), [-1.0, 1.0]),
+])
+def test_adaptive_sample_breaks_at_poles(expr, poles):
+    xs, ys = plotting.adaptive_sample(numpy_function(expr), -2.3, 2.3, y_min=-10, y_max=10)
+    breaks = xs[np.isnan(ys)]
+    assert len(breaks) == len(poles)
+    for pole in poles:
+        assert np.min(np.abs(breaks - pole)) < 1e-3
+    # 断开处两侧的点没有被连起来
+    for index in np.flatnonzero(np.isnan(ys)):
+        assert np.sign(ys[index - 1]) != np.sign(ys[index + 1])
+
+
+def test_adaptive_sample_no_break_for_continuous_function():
+    _, ys = plotting.adaptive_sample(numpy_function(sp.tanh(20 * x)), -1, 1, y_min=-1.5, y_max=1.5)
+    assert not np.isnan(ys).any()
+
+
+def test_adaptive_sample_domain_edge():
+    """sqrt(x)在x<0无定义，定义域边界附近要细分到最小宽度"""
+    xs, ys = plotting.adaptive_sample(numpy_function(sp.sqrt(x)), -1, 1, y_min=0, y_max=1)
+    defined = xs[np.isfinite(ys)]
+    assert defined.min() < 1e-3
+    assert np.all(np.isnan(ys[xs < 0]))
+
+
+def test_parametric_circle():
+    fx, fy = numpy_function(sp.cos(t), t), numpy_function(sp.sin(t), t)
+    xs, ys = plotting.parametric_sample(fx, fy, 0, 2 * math.pi, -1.5, 1.5, -1.5, 1.5)
+    assert not np.isnan(xs).any()
+    np.testing.assert_allclose(np.hypot(xs, ys), 1.0, atol=1e-12)
+    # 相邻两点的距离不超过max_length（默认为8倍tolerance，按视图大小归一化）
+    steps = np.hypot(np.diff(xs) / 3, np.diff(ys) / 3)
+    assert steps.max() <= 8e-3 + 1e-12
+    # 点按弧长大致均匀分布
+    assert steps.max() < 3 * np.median(steps)
+
+
+def test_parametric_fast_segments_get_more_points():
+    """x = t³ 在t较大时走得快，那里应有更多的参数点"""
+    fx, fy = numpy_function(t ** 3, t), numpy_function(sp.sin(t), t)
+    xs, _ = plotting.parametric_sample(fx, fy, -2, 2, -8, 8, -1.5, 1.5)
+    # 两个t范围的总长度都是1
+    ts = np.cbrt(xs)
+    assert np.count_nonzero(np.abs(ts) > 1.5) > 1.5 * np.count_nonzero(np.abs(ts) < 0.5)
+
+
+def test_parametric_breaks_at_discontinuity():
+    fx, fy = numpy_function(t, t), numpy_function(1 / t, t)
+    xs, ys = plotting.parametric_sample(fx, fy, -1, 1, -1, 1, -10, 10)
+    # t=0正好是采样点，y为NaN，曲线在那里断开，两侧不再插入多余的NaN
+    assert np.count_nonzero(np.isnan(xs)) == 0
+    gaps = np.flatnonzero(np.isnan(ys))
+    assert len(gaps) == 1 and xs[gaps[0]] == 0
+
+
+def test_parametric_breaks_between_samples():
+    fx, fy = numpy_function(t, t), numpy_function(1 / (t - sp.Rational(1, 7)), t)
+    xs, ys = plotting.parametric_sample(fx, fy, -1, 1, -1, 1, -10, 10)
+    gaps = np.flatnonzero(np.isnan(xs))
+    assert len(gaps) == 1
+    assert abs(xs[gaps[0] - 1] - 1 / 7) < 1e-3
+
+
+@pytest.mark.parametrize("expr, check", [
+    (x ** 2 + y ** 2 - 1, lambda px, py: np.hypot(px, py) - 1),
+    (x ** 2 / 4 + y ** 2 - 1, lambda px, py: np.hypot(px / 2, py) - 1),
+    (y - sp.sin(3 * x), lambda px, py: py - np.sin(3 * px)),
+])
+def test_implicit_contour_points_on_curve(expr, check):
+    f = numpy_function(expr, x, y)
+    xs, ys = plotting.implicit_contour(f, -2.5, 2.5, -2, 2, resolution=256)
+    points = np.isfinite(xs)
+    assert np.count_nonzero(points) > 100
+    # 线性插值的误差与格子大小的平方同阶
+    cell = 5 / 256
+    assert np.abs(check(xs[points], ys[points])).max() < cell ** 2 * 4
+
+
+def test_implicit_contour_covers_whole_circle():
+    xs, ys = plotting.implicit_contour(numpy_function(x ** 2 + y ** 2 - 1, x, y), -2, 2, -2, 2)
+    angles = np.arctan2(ys[np.isfinite(ys)], xs[np.isfinite(xs)])
+    gaps = np.diff(np.sort(angles))
+    assert gaps.max() < 0.05
+
+
+def test_implicit_contour_skips_poles():
+    """1/x = 1/y 在 x=0 或 y=0 两侧变号，但那里是极点而不是曲线"""
+    xs, ys = plotting.implicit_contour(numpy_function(1 / x - 1 / y, x, y), -1, 1, -1, 1)
+    points = np.isfinite(xs)
+    np.testing.assert_allclose(xs[points], ys[points], atol=1e-3)
+
+
+def test_implicit_contour_refines_only_near_curve():
+    calls = []
+
+    def f(px, py):
+        calls.append(np.size(px))
+        return px ** 2 + py ** 2 - 1
+
+    plotting.implicit_contour(f, -2, 2, -2, 2, resolution=1024)
+    assert sum(calls) < 1024 ** 2 / 10
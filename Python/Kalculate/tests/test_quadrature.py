@@ -0,0 +1,116 @@
+"""quadrature：G7-K15自适应求积与已知积分、scipy.integrate和mpmath.quad的结果对比"""
+import math
+
+import mpmath
+import pytest
+import sympy as sp
+from scipy import integrate as scipy_integrate
+
+import quadrature
+
+x, y = sp.symbols('x y')
+oo = sp.oo
+
+
+def to_float(limit):
+    return math.inf if limit == oo else -math.inf if limit == -oo else float(limit)
+
+
+@pytest.mark.parametrize("expr, lower, upper, expected", [
+    (sp.exp(-x ** 2), 0, oo, math.sqrt(math.pi) / 2),
+    (1 / (1 + x ** 2), -oo, oo, math.pi),
+    (sp.sin(x), 0, sp.pi, 2.0),
+    (sp.log(x), 0, 1, -1.0),
+    (1 / sp.sqrt(x), 0, 1, 2.0),
+    (sp.exp(-x), 0, oo, 1.0),
+    (x ** 2 * sp.exp(-x), 0, oo, 2.0),
+    (sp.exp(x), -oo, 0, 1.0),
+    (sp.sin(x) / x, 0, 1, 0.946083070367183),
+])
+def test_known_integrals(expr, lower, upper, expected):
+    value, error = quadrature.integrate(expr, x, lower, upper)
+    assert value == pytest.approx(expected, rel=1e-9, abs=1e-12)
+    assert error < 1e-6
+
+
+@pytest.mark.parametrize("expr, lower, upper", [
+    (sp.cos(x) ** 2 * sp.exp(-x / 3), 0, 20),
+    (sp.sqrt(1 - x ** 2), -1, 1),
+    (sp.atan(x) / (1 + x ** 3), 0, oo),
+    (sp.exp(-x ** 2) * sp.cos(3 * x), -oo, oo),
+    (sp.Abs(x - sp.Rational(1, 3)), 0, 1),
+])
+def test_matches_scipy_and_mpmath(expr, lower, upper):
+    value, _ = quadrature.integrate(expr, x, lower, upper)
+
+    f = sp.lambdify(x, expr, "math")
+    expected, _ = scipy_integrate.quad(f, to_float(lower), to_float(upper), epsabs=1e-13, epsrel=1e-12, limit=200)
+    assert value == pytest.approx(expected, rel=1e-8, abs=1e-11)
+
+    f_mp = sp.lambdify(x, expr, "mpmath")
+    with mpmath.workdps(30):
+        mp_bounds = [mpmath.inf if b == oo else -mpmath.inf if b == -oo else mpmath.mpf(b) for b in (lower, upper)]
+        if expr.has(sp.Abs):
+            mp_bounds.insert(1, mpmath.mpf(1) / 3)
+        expected = float(mpmath.quad(f_mp, mp_bounds))
+    assert value == pytest.approx(expected, rel=1e-8, abs=1e-11)
+
+
+def test_reversed_limits_change_sign():
+    forward, _ = quadrature.integrate(sp.exp(x), x, 0, 1)
+    backward, _ = quadrature.integrate(sp.exp(x), x, 1, 0)
+    assert backward == pytest.approx(-forward, rel=1e-14)
+    assert forward == pytest.approx(math.e - 1, rel=1e-12)
+
+
+def test_removable_singularity():
+    """sin(x)/x在0处为nan，在两侧重新计算"""
+    value, _ = quadrature.integrate(sp.sin(x) / x, x, -1, 1)
+    assert value == pytest.approx(2 * 0.946083070367183, rel=1e-10)
+
+
+@pytest.mark.parametrize("expr, lower, upper", [
+    (1 / x, 0, 1),
+    (1 / x ** 2, -1, 1),
+    (x, 0, oo),
+    (1 / x, 1, oo),
+    (sp.sin(x), 0, oo),
+])
+def test_divergent_integrals_raise(expr, lower, upper):
+    with pytest.raises(ValueError):
+        quadrature.integrate(expr, x, lower, upper)
+
+
+def test_unknown_symbols_raise():
+    with pytest.raises(ValueError):
+        quadrature.integrate(x * y, x, 0, 1)
+    with pytest.raises(ValueError):
+        quadrature.integrate(x, x, 0, y)
+
+
+def test_double_integral_with_variable_inner_limit():
+    """单位圆的四分之一：∫[0,1] ∫[0, sqrt(1-y²)] 1 dx dy = π/4"""
+    value, error = quadrature.double_integrate(1, x, 0, sp.sqrt(1 - y ** 2), y, 0, 1)
+    assert value == pytest.approx(math.pi / 4, rel=1e-8)
+    assert error < 1e-6
+
+
+@pytest.mark.parametrize("expr, inner, outer", [
+    (x * y, (0, y), (0, 2)),
+    (sp.exp(-x ** 2 - y ** 2), (-oo, oo), (-oo, oo)),
+    (sp.cos(x + y), (0, 1), (0, 1)),
+    (x ** 2 + y, (y ** 2, y), (0, 1)),
+])
+def test_double_integral_matches_scipy(expr, inner, outer):
+    value, _ = quadrature.double_integrate(expr, x, *inner, y, *outer)
+
+    # scipy.integrate.dblquad的被积函数为 f(内层变量, 外层变量)
+    f = sp.lambdify((x, y), expr, "math")
+    inner_bounds = [sp.lambdify(y, b, "math") if sp.sympify(b).free_symbols else to_float(b) for b in inner]
+    expected, _ = scipy_integrate.dblquad(f, *map(to_float, outer), *inner_bounds, epsabs=1e-13, epsrel=1e-11)
+    assert value == pytest.approx(expected, rel=1e-8, abs=1e-11)
+
+
+def test_double_integral_gaussian_is_pi():
+    value, _ = quadrature.double_integrate(sp.exp(-x ** 2 - y ** 2), x, -oo, oo, y, -oo, oo)
+    assert value == pytest.approx(math.pi, rel=1e-9)
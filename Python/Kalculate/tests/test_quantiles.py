@@ -0,0 +1,79 @@
+"""quantiles：KLL草图的秩误差、精确分位数与np.quantile的对比"""
+import numpy as np
+import pytest
+
+import quantiles
+from quantiles import KLLSketch
+
+QS = np.linspace(0.01, 0.99, 99)
+
+
+def true_ranks(values, results):
+    """每个结果在数据中的真实秩（小于等于它的数据所占比例）"""
+    ordered = np.sort(values)
+    return np.searchsorted(ordered, results, side="right") / ordered.size
+
+
+def sketch(values, epsilon, seed, chunk=10_000):
+    result = KLLSketch(epsilon, seed=seed)
+    for start in range(0, values.size, chunk):
+        result.update(values[start:start + chunk])
+    return result
+
+
+# 秩误差的界是概率性的（约99%置信度），固定随机种子使结果可重复
+@pytest.mark.parametrize("epsilon", [0.02, 0.01])
+@pytest.mark.parametrize("distribution", ["normal", "pareto", "sorted"])
+def test_rank_error_within_epsilon(epsilon, distribution):
+    rng = np.random.default_rng(13)
+    values = {
+        "normal": rng.normal(size=300_000),
+        "pareto": rng.pareto(1.5, size=300_000),
+        "sorted": np.arange(300_000, dtype=float),
+    }[distribution]
+    for seed in range(5):
+        result = sketch(values, epsilon, seed=seed)
+        assert result.count == values.size
+        assert result.size() < values.size // 20
+        errors = np.abs(true_ranks(values, result.quantiles(QS)) - QS)
+        assert errors.max() <= result.epsilon
+
+
+def test_merge_keeps_rank_error():
+    values = np.random.default_rng(14).exponential(size=200_000)
+    merged = sketch(values[:50_000], 0.01, seed=2)
+    merged.merge(sketch(values[50_000:], 0.01, seed=3))
+    assert merged.count == values.size
+    errors = np.abs(true_ranks(values, merged.quantiles(QS)) - QS)
+    assert errors.max() <= merged.epsilon
+
+
+def test_rank_and_extremes():
+    values = np.random.default_rng(15).uniform(size=100_000)
+    result = sketch(values, 0.01, seed=4)
+    assert result.quantiles([0, 1]) == [values.min(), values.max()]
+    for q in (0.1, 0.5, 0.9):
+        assert result.rank(np.quantile(values, q)) == pytest.approx(q, abs=result.epsilon)
+
+
+def test_nan_and_empty():
+    result = KLLSketch(seed=5)
+    with pytest.raises(ValueError):
+        result.quantile(0.5)
+    result.update([1.0, np.nan, 3.0])
+    assert result.count == 2
+    with pytest.raises(ValueError):
+        result.quantile(1.5)
+
+
+def test_exact_quantiles_match_numpy():
+    values = np.random.default_rng(16).normal(size=10_001)
+    qs = [0, 0.25, 0.5, 0.9, 0.99, 1]
+    assert quantiles.exact_quantiles(values, qs) == pytest.approx(np.quantile(values, qs), rel=0, abs=0)
+
+
+def test_parse_percentiles():
+    assert quantiles.parse_percentiles("25, 75") == [0.25, 0.75]
+    assert quantiles.parse_percentiles("") == [0.5, 0.9, 0.99]
+    with pytest.raises(ValueError):
+        quantiles.parse_percentiles("150")
@@ -0,0 +1,113 @@
+"""result_cache：缓存键、SymPy版本变化时的失效和按最近使用时间淘汰（使用临时数据库）"""
+import hashlib
+import itertools
+import sqlite3
+
+import pytest
+import sympy as sp
+
+import result_cache
+from result_cache import ResultCache, canonical_repr
+
+x, y = sp.symbols('x y')
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """每次调用time.time()递增1，使last_used的顺序确定"""
+    ticks = itertools.count(1000)
+    monkeypatch.setattr(result_cache.time, "time", lambda: float(next(ticks)))
+
+
+def open_cache(tmp_path, **kwargs):
+    return ResultCache(str(tmp_path / "cache" / "results.sqlite3"), **kwargs)
+
+
+def test_key_is_sha256_of_srepr(tmp_path):
+    cache = open_cache(tmp_path)
+    key = cache.make_key("integrate", (x ** 2, x))
+    expected = "'integrate'|" + sp.srepr(x ** 2) + "|" + sp.srepr(x)
+    assert key == hashlib.sha256(expected.encode("utf-8")).hexdigest()
+
+
+def test_key_depends_on_structure_not_construction(tmp_path):
+    cache = open_cache(tmp_path)
+    assert cache.make_key("diff", (x + 1, x)) == cache.make_key("diff", (sp.Add(1, x), x))
+    assert cache.make_key("diff", (x + 1, x)) != cache.make_key("diff", (x + 1, y))
+    assert cache.make_key("diff", (x + 1, x)) != cache.make_key("integrate", (x + 1, x))
+    # 浮点数和有理数的srepr不同
+    assert cache.make_key("n", (sp.Rational(1, 2),)) != cache.make_key("n", (sp.Float(0.5),))
+
+
+def test_canonical_repr_of_functions_and_sequences():
+    assert canonical_repr(sp.integrate) == "sympy.integrals.integrals.integrate"
+    assert canonical_repr([x, (1, "a")]) == f"({sp.srepr(x)},(1,'a'))"
+    assert "0x" not in canonical_repr(lambda: None)
+
+
+def test_put_get_and_persistence(tmp_path):
+    cache = open_cache(tmp_path)
+    assert cache.get("integrate", (x, x)) == (False, None)
+    cache.put("integrate", (x, x), x ** 2 / 2)
+    assert cache.get("integrate", (x, x)) == (True, x ** 2 / 2)
+    assert (cache.hits, cache.misses) == (1, 1)
+    cache.close()
+
+    reopened = open_cache(tmp_path)
+    assert reopened.get("integrate", (x, x)) == (True, x ** 2 / 2)
+
+
+def test_sympy_version_change_clears_results(tmp_path, monkeypatch):
+    cache = open_cache(tmp_path)
+    cache.put("solve", (x - 1, x), [1])
+    cache.close()
+
+    monkeypatch.setattr(result_cache.sp, "__version__", "0.0.test")
+    upgraded = open_cache(tmp_path)
+    assert upgraded.version.endswith("sympy-0.0.test")
+    assert upgraded.get("solve", (x - 1, x)) == (False, None)
+    upgraded.put("solve", (x - 2, x), [2])
+    upgraded.close()
+
+    # 回到原来的版本时同样清空
+    monkeypatch.undo()
+    again = open_cache(tmp_path)
+    assert again.get("solve", (x - 2, x)) == (False, None)
+
+
+def test_evicts_least_recently_used(tmp_path, clock):
+    cache = open_cache(tmp_path, max_entries=3)
+    for n in range(3):
+        cache.put("f", (n,), n)
+    # 使用0之后，最久未使用的是1
+    assert cache.get("f", (0,)) == (True, 0)
+    cache.put("f", (3,), 3)
+    assert cache.get("f", (1,)) == (False, None)
+    assert [cache.get("f", (n,))[0] for n in (0, 2, 3)] == [True, True, True]
+    count = sqlite3.connect(cache.path).execute("SELECT COUNT(*) FROM results").fetchone()[0]
+    assert count == 3
+
+
+def test_disabled_cache(tmp_path):
+    cache = open_cache(tmp_path, enabled=False)
+    cache.put("f", (1,), 1)
+    assert cache.get("f", (1,)) == (False, None)
+    assert not (tmp_path / "cache").exists()
+
+
+def test_unpicklable_and_corrupt_values(tmp_path):
+    cache = open_cache(tmp_path)
+    cache.put("f", (1,), lambda: None)
+    assert cache.get("f", (1,)) == (False, None)
+
+    cache.put("f", (2,), 2)
+    cache.conn.execute("UPDATE results SET value = ?", (b"not a pickle",))
+    cache.conn.commit()
+    assert cache.get("f", (2,)) == (False, None)
+
+
+def test_clear(tmp_path):
+    cache = open_cache(tmp_path)
+    cache.put("f", (1,), 1)
+    cache.clear()
+    assert cache.get("f", (1,)) == (False, None)
@@ -0,0 +1,152 @@
+"""sparse_support：稀疏格式的选择、稀疏LU行列式的符号、文件读写和逆矩阵的限制"""
+import itertools
+
+import numpy as np
+import pytest
+import scipy.sparse as sparse
+
+import sparse_support
+from factorizations import Factorization
+from matrix_workspace import MatrixWorkspace
+
+SIDE = 1000    # SIDE × SIDE = MIN_SPARSE_SIZE
+
+
+def with_density(rows, cols, fraction):
+    """前面 fraction·rows·cols 个元素为1的稠密矩阵"""
+    value = np.zeros(rows * cols)
+    value[:round(fraction * rows * cols)] = 1.0
+    return value.reshape(rows, cols)
+
+
+def test_thresholds():
+    assert SIDE * SIDE == sparse_support.MIN_SPARSE_SIZE
+
+
+def test_large_sparse_dense_array_becomes_csr():
+    value = sparse_support.choose_format(with_density(SIDE, SIDE, sparse_support.DENSITY_THRESHOLD))
+    assert sparse_support.is_sparse(value) and value.format == "csr"
+    assert value.nnz == round(sparse_support.DENSITY_THRESHOLD * SIDE * SIDE)
+
+
+@pytest.mark.parametrize("value", [
+    with_density(SIDE - 1, SIDE, 0.01),
+    with_density(SIDE, SIDE, sparse_support.DENSITY_THRESHOLD + 0.001),
+    np.eye(100),
+    np.eye(999),
+])
+def test_small_or_dense_arrays_stay_dense(value):
+    assert sparse_support.choose_format(value) is value
+
+
+def test_sparse_input_converted_back_when_small_or_dense():
+    assert isinstance(sparse_support.choose_format(sparse.eye_array(100, format="csr")), np.ndarray)
+    dense = sparse.csr_array(with_density(SIDE, SIDE, 0.5))
+    assert isinstance(sparse_support.choose_format(dense), np.ndarray)
+    kept = sparse_support.choose_format(sparse.eye_array(SIDE, format="coo"))
+    assert sparse_support.is_sparse(kept) and kept.format == "csr"
+
+
+def test_non_matrices_unchanged():
+    for value in (3.0, np.arange(5.0), np.zeros((2, 2, 2))):
+        assert sparse_support.choose_format(value) is value
+
+
+def test_density_of_dense_blocks():
+    value = with_density(3000, 10, 0.1)
+    assert sparse_support.density(value) == pytest.approx(0.1)
+    assert sparse_support.density(sparse.csr_array(value)) == pytest.approx(0.1)
+
+
+def inversion_sign(permutation):
+    inversions = sum(a > b for a, b in itertools.combinations(permutation, 2))
+    return -1 if inversions % 2 else 1
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 4, 5])
+def test_permutation_sign_all_small_permutations(size):
+    for permutation in itertools.permutations(range(size)):
+        assert sparse_support._permutation_sign(np.array(permutation)) == inversion_sign(permutation)
+
+
+def test_permutation_sign_random_permutations():
+    rng = np.random.default_rng(0)
+    for size in (10, 51, 200):
+        for _ in range(20):
+            permutation = rng.permutation(size)
+            assert sparse_support._permutation_sign(permutation) == inversion_sign(permutation)
+
+
+def random_sparse(n, seed):
+    """随机稀疏矩阵，行列打乱后行列式的符号是随机的"""
+    rng = np.random.default_rng(seed)
+    value = sparse.random_array((n, n), density=3 / n, rng=rng) - sparse.random_array((n, n), density=3 / n, rng=rng)
+    value = value + sparse.diags_array(rng.uniform(0.5, 2, n) * rng.choice([-1, 1], n))
+    rows, cols = rng.permutation(n), rng.permutation(n)
+    return sparse.csr_array(value.tocsr()[rows][:, cols])
+
+
+@pytest.mark.parametrize("n", [5, 20, 200])
+@pytest.mark.parametrize("seed", range(6))
+def test_lu_slogdet_matches_numpy(n, seed):
+    value = random_sparse(n, seed)
+    sign, logabs = sparse_support.lu_slogdet(sparse_support.splu(value))
+    expected_sign, expected_logabs = np.linalg.slogdet(value.toarray())
+    assert sign == expected_sign
+    assert logabs == pytest.approx(expected_logabs, rel=1e-10, abs=1e-10)
+
+
+def test_lu_slogdet_signs_cover_both_cases():
+    signs = {sparse_support.lu_slogdet(sparse_support.splu(random_sparse(20, seed)))[0] for seed in range(20)}
+    assert signs == {-1.0, 1.0}
+
+
+def test_splu_rejects_singular_and_non_square():
+    singular = sparse.csr_array(np.array([[1.0, 2.0], [2.0, 4.0]]))
+    with pytest.raises(ValueError):
+        sparse_support.splu(singular)
+    with pytest.raises(ValueError):
+        sparse_support.splu(sparse.csr_array(np.ones((2, 3))))
+
+
+@pytest.mark.parametrize("extension", [".npz", ".mtx"])
+def test_save_load_round_trip(tmp_path, extension):
+    value = random_sparse(50, 0)
+    path = str(tmp_path / f"matrix{extension}")
+    sparse_support.save(value, path)
+    loaded = sparse_support.load(path)
+    assert sparse_support.is_sparse(loaded) and loaded.format == "csr"
+    np.testing.assert_allclose(loaded.toarray(), value.toarray(), rtol=1e-15)
+
+
+def test_dense_inverse_allowed_at_budget(monkeypatch):
+    monkeypatch.setattr(sparse_support, "DENSE_INVERSE_MAX_BYTES", 100 * 100 * 8)
+    assert sparse_support.dense_inverse_allowed(sparse.eye_array(100))
+    assert not sparse_support.dense_inverse_allowed(sparse.eye_array(101))
+
+
+def test_sparse_inverse_computed_within_budget():
+    workspace = MatrixWorkspace()
+    value = random_sparse(200, 1)
+    workspace.set("S", value)
+    _, inverse = workspace.evaluate("inv(S)")
+    np.testing.assert_allclose(inverse @ value.toarray(), np.eye(200), atol=1e-9)
+
+
+def test_sparse_inverse_refused_above_budget(monkeypatch):
+    monkeypatch.setattr(sparse_support, "DENSE_INVERSE_MAX_BYTES", 100 * 100 * 8)
+    workspace = MatrixWorkspace()
+    workspace.set("S", sparse.eye_array(200, format="csr"))
+    with pytest.raises(sparse_support.DenseInverseRefused):
+        workspace.evaluate("inv(S)")
+    # 仍然可以求解 Ax=b
+    _, x = workspace.evaluate("solve(S, ones(200, 1))")
+    np.testing.assert_allclose(x, np.ones((200, 1)))
+
+
+def test_sparse_factorization_never_inverts():
+    factorization = Factorization(sparse.eye_array(10, format="csr"))
+    assert factorization.kind == "sparse_lu"
+    with pytest.raises(sparse_support.DenseInverseRefused):
+        factorization.inverse()
+    assert issubclass(sparse_support.DenseInverseRefused, ValueError)
@@ -0,0 +1,50 @@
+"""streaming_stats 与 numpy/scipy 的结果对比"""
+import numpy as np
+import pytest
+from scipy import stats as scipy_stats
+
+import streaming_stats
+from streaming_stats import RunningStats
+
+
+@pytest.fixture
+def values():
+    # 较大的偏移量检验中心矩合并的数值稳定性
+    return np.random.default_rng(12).lognormal(size=100_003) + 1e6
+
+
+def test_matches_numpy_and_scipy(values):
+    stats = RunningStats.from_array(values, chunk_size=4096)
+    assert stats.count == values.size
+    assert stats.total == pytest.approx(values.sum(), rel=1e-12)
+    assert stats.mean == pytest.approx(values.mean(), rel=1e-12)
+    assert stats.variance == pytest.approx(values.var(), rel=1e-9)
+    assert stats.sample_variance == pytest.approx(values.var(ddof=1), rel=1e-9)
+    assert stats.skewness == pytest.approx(scipy_stats.skew(values), rel=1e-6)
+    assert stats.kurtosis == pytest.approx(scipy_stats.kurtosis(values), rel=1e-6)
+    assert (stats.min, stats.max) == (values.min(), values.max())
+
+
+def test_merge_equals_single_pass(values):
+    merged = RunningStats.from_array(values[:1000])
+    merged.merge(RunningStats.from_array(values[1000:]))
+    merged.merge(RunningStats())
+    expected = RunningStats.from_array(values).as_dict()
+    for name, value in merged.as_dict().items():
+        assert value == pytest.approx(expected[name], rel=1e-9), name
+
+
+def test_degenerate_data():
+    with pytest.raises(ValueError):
+        RunningStats().variance
+    single = RunningStats.from_array(np.array([3.0]))
+    assert single.variance == 0 and np.isnan(single.sample_variance) and np.isnan(single.skewness)
+
+
+def test_summarize_file(tmp_path, values):
+    path = tmp_path / "data.csv"
+    np.savetxt(path, np.column_stack([values[:5000], -values[:5000]]), delimiter=",", header="a,b", comments="")
+    stats = streaming_stats.summarize_file(str(path), column=1)
+    assert stats.count == 5000
+    assert stats.mean == pytest.approx(-values[:5000].mean(), rel=1e-12)
+    assert stats.std == pytest.approx(values[:5000].std(), rel=1e-6)
@@ -0,0 +1,36 @@
+"""tables：取值范围的解析与点数上限"""
+import numpy as np
+import pytest
+import sympy as sp
+
+import tables
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("0:1:n=5", [0, 0.25, 0.5, 0.75, 1]),
+    ("0:1:0.25", [0, 0.25, 0.5, 0.75, 1]),
+    ("1:4", [1, 2, 3, 4]),
+    ("1, 2 3", [1, 2, 3]),
+])
+def test_parse_values(text, expected):
+    np.testing.assert_allclose(tables.parse_values(text), expected)
+
+
+@pytest.mark.parametrize("text", [
+    f"0:1:n={tables.MAX_ROWS + 1}",
+    "0:1:n=10000000000",
+    f"0:{tables.MAX_ROWS}:1",
+])
+def test_too_many_points_rejected_before_allocating(text):
+    with pytest.raises(ValueError, match="点数过多"):
+        tables.parse_values(text)
+
+
+def test_largest_allowed_count():
+    assert tables.parse_values(f"0:1:n={tables.MAX_ROWS}").size == tables.MAX_ROWS
+
+
+def test_grid_sweep_limit():
+    x, y = sp.symbols('x y')
+    with pytest.raises(ValueError, match="网格点数过多"):
+        tables.sweep(x + y, {"x": "0:1:n=10000", "y": "0:1:n=10000"})
@@ -0,0 +1,132 @@
+"""workers：进程池的超时、取消和预热任务（不需要显示界面）
+
+提交给工作进程的函数用标准库的函数（time.sleep、math.sqrt），spawn启动的进程可以直接导入。
+"""
+import math
+import os
+import time
+
+import pytest
+
+from workers import ThreadTasks, WorkerPool
+
+
+def wait_for_events(pool, count=1, timeout=20.0):
+    """轮询直到收到count个事件"""
+    events = []
+    deadline = time.monotonic() + timeout
+    while len(events) < count and time.monotonic() < deadline:
+        events += pool.poll()
+        time.sleep(0.01)
+    return events
+
+
+@pytest.fixture
+def pool():
+    pool = WorkerPool(size=1)
+    yield pool
+    pool.shutdown()
+
+
+def test_results_and_errors(pool):
+    done = pool.submit(math.sqrt, 16.0)
+    failed = pool.submit(math.sqrt, -1.0)
+    events = dict((request_id, (status, payload)) for request_id, status, payload in wait_for_events(pool, 2))
+    assert events[done] == ("done", 4.0)
+    assert events[failed] == ("error", "ValueError: math domain error")
+    assert pool.pending() == []
+
+
+def test_timeout_kills_process_and_reports(pool):
+    request_id = pool.submit(time.sleep, 60, timeout=0.3)
+    process = pool.workers[0].process
+    started = time.monotonic()
+    assert wait_for_events(pool) == [(request_id, "timeout", None)]
+    assert time.monotonic() - started < 10
+    assert not process.is_alive()
+    # 补充的新进程可以继续使用
+    request_id = pool.submit(math.sqrt, 9.0)
+    assert wait_for_events(pool) == [(request_id, "done", 3.0)]
+    assert pool.workers[0].process is not process
+
+
+def test_default_timeout():
+    pool = WorkerPool(size=1, default_timeout=0.3)
+    try:
+        request_id = pool.submit(time.sleep, 60)
+        assert wait_for_events(pool) == [(request_id, "timeout", None)]
+    finally:
+        pool.shutdown()
+
+
+def test_cancel_running_task(pool):
+    request_id = pool.submit(time.sleep, 60)
+    process = pool.workers[0].process
+    assert pool.cancel(request_id)
+    assert not process.is_alive()
+    assert pool.pending() == []
+    # 被取消的任务不产生事件
+    other = pool.submit(math.sqrt, 4.0)
+    assert wait_for_events(pool) == [(other, "done", 2.0)]
+
+
+def test_cancel_queued_task(pool):
+    running = pool.submit(time.sleep, 0.5)
+    queued = pool.submit(math.sqrt, 4.0)
+    assert pool.pending() == [running, queued]
+    assert pool.cancel(queued)
+    assert pool.pending() == [running]
+    assert wait_for_events(pool) == [(running, "done", None)]
+    assert not pool.cancel(queued)
+    assert not pool.cancel(12345)
+
+
+def test_crashed_worker_reported(pool):
+    request_id = pool.submit(os._exit, 3)
+    events = wait_for_events(pool)
+    assert [(event[0], event[1]) for event in events] == [(request_id, "error")]
+    request_id = pool.submit(math.sqrt, 1.0)
+    assert wait_for_events(pool) == [(request_id, "done", 1.0)]
+
+
+def test_thread_tasks_cancel_discards_result():
+    tasks = ThreadTasks()
+    kept = tasks.submit(math.sqrt, 25.0)
+    dropped = tasks.submit(time.sleep, 0.2)
+    assert kept < 0 and dropped < 0
+    assert tasks.cancel(dropped)
+    assert not tasks.cancel(dropped)
+    time.sleep(0.4)
+    assert tasks.poll() == [(kept, "done", 5.0)]
+    assert tasks.pending() == []
+
+
+def test_submit_does_not_cancel_warm_up():
+    """EvaluationEngine.submit() 取消上一个请求，但不取消warm_up提交的任务"""
+    QtCore = pytest.importorskip("PySide6.QtCore")
+    from evaluator import EvaluationEngine
+
+    app = QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+    engine = EvaluationEngine(workers=2)
+    try:
+        results = []
+        engine.resultReady.connect(lambda request_id, result: results.append((request_id, result)))
+        engine.warm_up(time.sleep, 0.5)
+        warm_up_ids = engine.pool.pending()
+        assert len(warm_up_ids) == 2
+
+        first = engine.submit(math.sqrt, 4.0)
+        second = engine.submit(math.sqrt, 9.0)
+        pending = engine.pool.pending()
+        # 第一个请求被第二个请求取消，预热任务仍在执行
+        assert first not in pending
+        assert set(warm_up_ids) <= set(pending) and second in pending
+
+        deadline = time.monotonic() + 20
+        while engine.busy and time.monotonic() < deadline:
+            engine._poll()
+            app.processEvents()
+            time.sleep(0.01)
+        assert results == [(second, 3.0)]
+    finally:
+        engine.shutdown()
@@ -0,0 +1,42 @@
+"""界面加载
+
+优先使用由 build_ui.py 从 qtUI.ui 预生成的 ui_qtUI.py，省去启动时用QUiLoader解析2800多行XML。
+预生成模块记录了生成时qtUI.ui的SHA-256，不存在或与当前qtUI.ui不一致时退回到QUiLoader。
+"""
+import hashlib
+import os
+
+UI_DIR = os.path.dirname(os.path.abspath(__file__))
+UI_FILE = os.path.join(UI_DIR, "qtUI.ui")
+
+
+def ui_source_hash():
+    """qtUI.ui的SHA-256（忽略换行符差异）"""
+    with open(UI_FILE, "rb") as f:
+        return hashlib.sha256(f.read().replace(b"\r\n", b"\n")).hexdigest()
+
+
+def load_generated_ui():
+    """导入预生成的界面模块，不可用时返回None"""
+    try:
+        import ui_qtUI
+    except ImportError:
+        return None
+    if getattr(ui_qtUI, "UI_SOURCE_SHA256", None) != ui_source_hash():
+        print("ui_qtUI.py与qtUI.ui不一致，改用QUiLoader（可运行build_ui.py重新生成）")
+        return None
+    return ui_qtUI
+
+
+def load_ui(window):
+    """在window（QMainWindow）上创建界面，返回可按objectName访问各控件的对象"""
+    ui_module = None if os.environ.get("KALCULATE_UI_LOADER") else load_generated_ui()
+    if ui_module is not None:
+        ui = ui_module.Ui_MainWindow()
+        ui.setupUi(window)
+        return ui
+
+    from PySide6.QtUiTools import QUiLoader
+    ui = QUiLoader().load(UI_FILE, window)
+    window.setCentralWidget(ui)
+    return ui
@@ -0,0 +1,1755 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'qtUI.ui'
+##
+## Created by: Qt User Interface Compiler version 6.12.0
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QAction, QBrush, QColor, QConicalGradient,
+    QCursor, QFont, QFontDatabase, QGradient,
+    QIcon, QImage, QKeySequence, QLinearGradient,
+    QPainter, QPalette, QPixmap, QRadialGradient,
+    QTransform)
+from latex_view import web_view_class
+QWebEngineView = web_view_class()
+from PySide6.QtWidgets import (QApplication, QGridLayout, QHBoxLayout, QHeaderView,
+    QLayout, QLineEdit, QMainWindow, QMenu,
+    QMenuBar, QPushButton, QRadioButton, QSizePolicy,
+    QStatusBar, QTabWidget, QTableWidget, QTableWidgetItem,
+    QVBoxLayout, QWidget)
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        if not MainWindow.objectName():
+            MainWindow.setObjectName(u"MainWindow")
+        MainWindow.resize(848, 586)
+        sizePolicy = QSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(MainWindow.sizePolicy().hasHeightForWidth())
+        MainWindow.setSizePolicy(sizePolicy)
+        MainWindow.setMinimumSize(QSize(0, 0))
+        MainWindow.setMaximumSize(QSize(16777215, 16777215))
+        self.actionCalculate = QAction(MainWindow)
+        self.actionCalculate.setObjectName(u"actionCalculate")
+        self.actionCalculate.setCheckable(False)
+        self.action2D_Graphing = QAction(MainWindow)
+        self.action2D_Graphing.setObjectName(u"action2D_Graphing")
+        self.action3D_Graphing = QAction(MainWindow)
+        self.action3D_Graphing.setObjectName(u"action3D_Graphing")
+        self.actionUnit_Conver = QAction(MainWindow)
+        self.actionUnit_Conver.setObjectName(u"actionUnit_Conver")
+        self.actionCoding = QAction(MainWindow)
+        self.actionCoding.setObjectName(u"actionCoding")
+        self.actionAbout = QAction(MainWindow)
+        self.actionAbout.setObjectName(u"actionAbout")
+        self.actionBasic = QAction(MainWindow)
+        self.actionBasic.setObjectName(u"actionBasic")
+        self.actionPhysical = QAction(MainWindow)
+        self.actionPhysical.setObjectName(u"actionPhysical")
+        self.actionShow_History = QAction(MainWindow)
+        self.actionShow_History.setObjectName(u"actionShow_History")
+        self.actionSettings = QAction(MainWindow)
+        self.actionSettings.setObjectName(u"actionSettings")
+        self.actionBinary = QAction(MainWindow)
+        self.actionBinary.setObjectName(u"actionBinary")
+        self.actionOctal = QAction(MainWindow)
+        self.actionOctal.setObjectName(u"actionOctal")
+        self.actionDecimal = QAction(MainWindow)
+        self.actionDecimal.setObjectName(u"actionDecimal")
+        self.actionFunction = QAction(MainWindow)
+        self.actionFunction.setObjectName(u"actionFunction")
+        self.actionVarvivle = QAction(MainWindow)
+        self.actionVarvivle.setObjectName(u"actionVarvivle")
+        self.actionConstant = QAction(MainWindow)
+        self.actionConstant.setObjectName(u"actionConstant")
+        self.actionUnit = QAction(MainWindow)
+        self.actionUnit.setObjectName(u"actionUnit")
+        self.actionImport = QAction(MainWindow)
+        self.actionImport.setObjectName(u"actionImport")
+        self.actionOutport = QAction(MainWindow)
+        self.actionOutport.setObjectName(u"actionOutport")
+        self.actionFunction_2 = QAction(MainWindow)
+        self.actionFunction_2.setObjectName(u"actionFunction_2")
+        self.actionVariable = QAction(MainWindow)
+        self.actionVariable.setObjectName(u"actionVariable")
+        self.actionConstant_2 = QAction(MainWindow)
+        self.actionConstant_2.setObjectName(u"actionConstant_2")
+        self.actionUnit_2 = QAction(MainWindow)
+        self.actionUnit_2.setObjectName(u"actionUnit_2")
+        self.actionGeneral = QAction(MainWindow)
+        self.actionGeneral.setObjectName(u"actionGeneral")
+        self.actionFunction_Graphing = QAction(MainWindow)
+        self.actionFunction_Graphing.setObjectName(u"actionFunction_Graphing")
+        self.actionData_Set = QAction(MainWindow)
+        self.actionData_Set.setObjectName(u"actionData_Set")
+        self.actionGeneral_2 = QAction(MainWindow)
+        self.actionGeneral_2.setObjectName(u"actionGeneral_2")
+        self.actionGeneral_2.setCheckable(True)
+        self.actionGeneral_2.setChecked(True)
+        self.actionUnit_Conver_2 = QAction(MainWindow)
+        self.actionUnit_Conver_2.setObjectName(u"actionUnit_Conver_2")
+        self.actionUnit_Conver_2.setCheckable(True)
+        self.actionRaduis = QAction(MainWindow)
+        self.actionRaduis.setObjectName(u"actionRaduis")
+        self.actionRaduis.setCheckable(True)
+        self.actionRaduis.setChecked(True)
+        self.actionDegree = QAction(MainWindow)
+        self.actionDegree.setObjectName(u"actionDegree")
+        self.actionDegree.setCheckable(True)
+        self.actionGradians = QAction(MainWindow)
+        self.actionGradians.setObjectName(u"actionGradians")
+        self.actionGradians.setCheckable(True)
+        self.actionTurns = QAction(MainWindow)
+        self.actionTurns.setObjectName(u"actionTurns")
+        self.actionUnit_Conver_3 = QAction(MainWindow)
+        self.actionUnit_Conver_3.setObjectName(u"actionUnit_Conver_3")
+        self.actionCoding_2 = QAction(MainWindow)
+        self.actionCoding_2.setObjectName(u"actionCoding_2")
+        self.actionBinary_2 = QAction(MainWindow)
+        self.actionBinary_2.setObjectName(u"actionBinary_2")
+        self.actionOctal_2 = QAction(MainWindow)
+        self.actionOctal_2.setObjectName(u"actionOctal_2")
+        self.actionDecimal_2 = QAction(MainWindow)
+        self.actionDecimal_2.setObjectName(u"actionDecimal_2")
+        self.actionHexadecimal = QAction(MainWindow)
+        self.actionHexadecimal.setObjectName(u"actionHexadecimal")
+        self.actionDuodecimal = QAction(MainWindow)
+        self.actionDuodecimal.setObjectName(u"actionDuodecimal")
+        self.actionSexagesimal = QAction(MainWindow)
+        self.actionSexagesimal.setObjectName(u"actionSexagesimal")
+        self.actionCustom = QAction(MainWindow)
+        self.actionCustom.setObjectName(u"actionCustom")
+        self.actionStatistics = QAction(MainWindow)
+        self.actionStatistics.setObjectName(u"actionStatistics")
+        self.centralwidget = QWidget(MainWindow)
+        self.centralwidget.setObjectName(u"centralwidget")
+        sizePolicy.setHeightForWidth(self.centralwidget.sizePolicy().hasHeightForWidth())
+        self.centralwidget.setSizePolicy(sizePolicy)
+        self.verticalLayout = QVBoxLayout(self.centralwidget)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.lineEdit = QLineEdit(self.centralwidget)
+        self.lineEdit.setObjectName(u"lineEdit")
+        self.lineEdit.setMinimumSize(QSize(480, 0))
+        self.lineEdit.setLocale(QLocale(QLocale.C, QLocale.AnyTerritory))
+
+        self.verticalLayout.addWidget(self.lineEdit)
+
+        self.webEngineView = QWebEngineView(self.centralwidget)
+        self.webEngineView.setObjectName(u"webEngineView")
+        sizePolicy1 = QSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+        sizePolicy1.setHorizontalStretch(0)
+        sizePolicy1.setVerticalStretch(0)
+        sizePolicy1.setHeightForWidth(self.webEngineView.sizePolicy().hasHeightForWidth())
+        self.webEngineView.setSizePolicy(sizePolicy1)
+        self.webEngineView.setMinimumSize(QSize(480, 171))
+        self.webEngineView.setMaximumSize(QSize(16777215, 171))
+        self.webEngineView.setLocale(QLocale(QLocale.C, QLocale.AnyTerritory))
+        self.webEngineView.setUrl(QUrl(u"about:blank"))
+
+        self.verticalLayout.addWidget(self.webEngineView)
+
+        self.tabWidget = QTabWidget(self.centralwidget)
+        self.tabWidget.setObjectName(u"tabWidget")
+        sizePolicy.setHeightForWidth(self.tabWidget.sizePolicy().hasHeightForWidth())
+        self.tabWidget.setSizePolicy(sizePolicy)
+        self.tabWidget.setMinimumSize(QSize(480, 200))
+        self.tabWidget.setLocale(QLocale(QLocale.C, QLocale.AnyTerritory))
+        self.basic_tab = QWidget()
+        self.basic_tab.setObjectName(u"basic_tab")
+        sizePolicy2 = QSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred)
+        sizePolicy2.setHorizontalStretch(0)
+        sizePolicy2.setVerticalStretch(0)
+        sizePolicy2.setHeightForWidth(self.basic_tab.sizePolicy().hasHeightForWidth())
+        self.basic_tab.setSizePolicy(sizePolicy2)
+        self.basic_tab.setLocale(QLocale(QLocale.C, QLocale.AnyTerritory))
+        self.gridLayout_10 = QGridLayout(self.basic_tab)
+        self.gridLayout_10.setObjectName(u"gridLayout_10")
+        self.gridLayout = QGridLayout()
+        self.gridLayout.setSpacing(6)
+        self.gridLayout.setObjectName(u"gridLayout")
+        self.gridLayout.setSizeConstraint(QLayout.SizeConstraint.SetDefaultConstraint)
+        self.pushButton_8 = QPushButton(self.basic_tab)
+        self.pushButton_8.setObjectName(u"pushButton_8")
+        sizePolicy.setHeightForWidth(self.pushButton_8.sizePolicy().hasHeightForWidth())
+        self.pushButton_8.setSizePolicy(sizePolicy)
+        self.pushButton_8.setLocale(QLocale(QLocale.C, QLocale.AnyTerritory))
+
+        self.gridLayout.addWidget(self.pushButton_8, 1, 3, 1, 1)
+
+        self.pushButton_pib = QPushButton(self.basic_tab)
+        self.pushButton_pib.setObjectName(u"pushButton_pib")
+        sizePolicy.setHeightForWidth(self.pushButton_pib.sizePolicy().hasHeightForWidth())
+        self.pushButton_pib.setSizePolicy(sizePolicy)
+        self.pushButton_pib.setLocale(QLocale(QLocale.C, QLocale.AnyTerritory))
+
+        self.gridLayout.addWidget(self.pushButton_pib, 0, 1, 1, 1)
+
+        self.pushButton_ib = QPushButton(self.basic_tab)
+        self.pushButton_ib.setObjectName(u"pushButton_ib")
+        sizePolicy.setHeightForWidth(self.pushButton_ib.sizePolicy().hasHeightForWidth())
+        self.pushButton_ib.setSizePolicy(sizePolicy)
+        self.pushButton_ib.setLocale(QLocale(QLocale.C, QLocale.AnyTerritory))
+
+        self.gridLayout.addWidget(self.pushButton_ib, 0, 2, 1, 1)
+
+        self.pushButton_1 = QPushButton(self.basic_tab)
+        self.pushButton_1.setObjectName(u"pushButton_1")
+        sizePolicy.setHeightForWidth(self.pushButton_1.sizePolicy().hasHeightForWidth())
+        self.pushButton_1.setSizePolicy(sizePolicy)
+        self.pushButton_1.setLocale(QLocale(QLocale.C, QLocale.AnyTerritory))
+
+        self.gridLayout.addWidget(self.pushButton_1, 3, 2, 1, 1)
+
+        self.pushButton_root = QPushButton(self.basic_tab)
+        self.pushButton_root.setObjectName(u"pushButton_root")
+        sizePolicy.setHeightForWidth(self.pushButton_root.sizePolicy().hasHeightForWidth())
+        self.pushButton_root.setSizePolicy(sizePolicy)
+        self.pushButton_root.setLocale(QLocale(QLocale.C, QLocale.AnyTerritory))
+
+        self.gridLayout.addWidget(self.pushButton_root, 2, 0, 1, 1)
+
+        self.pushButton_leb = QPushButton(self.basic_tab)
+        self.pushButton_leb.setObjectName(u"pushButton_leb")
+        sizePolicy.setHeightForWidth(self.pushButton_leb.sizePolicy().hasHeightForWidth())
+        self.pushButton_leb.setSizePolicy(sizePolicy)
+        self.pushButton_leb.setLocale(QLocale(QLocale.C, QLocale.AnyTerritory))
+
+        self.gridLayout.addWidget(self.pushButton_leb, 4, 2, 1, 1)
+
+        self.pushButton_9 = QPushButton(self.basic_tab)
+        self.pushButton_9.setObjectName(u"pushButton_9")
+        sizePolicy.setHeightForWidth(self.pushButton_9.sizePolicy().hasHeightForWidth())
+        self.pushButton_9.setSizePolicy(sizePolicy)
+        self.pushButton_9.setLocale(QLocale(QLocale.C, QLocale.AnyTerritory))
+
+        self.gridLayout.addWidget(self.pushButton_9, 1, 4, 1, 1)
+
+        self.pushButton_div = QPushButton(self.basic_tab)
+        self.pushButton_div.setObjectName(u"pushButton_div")
+        sizePolicy.setHeightForWidth(self.pushButton_div.sizePolicy().hasHeightForWidth())
+        self.pushButton_div.setSizePolicy(sizePolicy)
+        self.pushButton_div.setLocale(QLocale(QLocale.C, QLocale.AnyTerritory))
+
+        self.gridLayout.addWidget(self.pushButton_div, 0, 5, 1, 1)
+
+        self.pushButton_4 = QPushButton(self.basic_tab)
+        self.pushButton_4.setObjectName(u"pushButton_4")
+        sizePolicy.setHeightForWidth(self.pushButton_4.sizePolicy().hasHeightForWidth())
+        self.pushButton_4.setSizePolicy(sizePolicy)
+        self.pushButton_4.setLocale(QLocale(QLocale.C, QLocale.AnyTerritory))
+
+        self.gridLayout.addWidget(self.pushButton_4, 2, 2, 1, 1)
+
+        self.pushButton_xb = QPushButton(self.basic_tab)
+        self.pushButton_xb.setObjectName(u"pushButton_xb")
+        sizePolicy.setHeightForWidth(self.pushButton_xb.sizePolicy().hasHeightForWidth())
+        self.pushButton_xb.setSizePolicy(sizePolicy)
+        self.pushButton_xb.setLocale(QLocale(QLocale.C, QLocale.AnyTerritory))
+
+        self.gridLayout.addWidget(self.pushButton_xb, 2, 1, 1, 1)
+
+        self.pushButton_sub = QPushButton(self.basic_tab)
+        self.pushButton_sub.setObjectName(u"pushButton_sub")
+        sizePolicy.setHeightForWidth(self.pushButton_sub.sizePolicy().hasHeightForWidth())
+        self.pushButton_sub.setSizePolicy(sizePolicy)
+        self.pushButton_sub.setLocale(QLocale(QLocale.C, QLocale.AnyTerritory))
+
+        self.gridLayout.addWidget(self.pushButton_sub, 2, 5, 1, 1)
+
+        self.pushButton_eq = QPushButton(self.basic_tab)
+        self.pushButton_eq.setObjectName(u"pushButton_eq")
+        sizePolicy.setHeightForWidth(self.pushButton_eq.sizePolicy().hasHeightForWidth())
+        self.pushButton_eq.setSizePolicy(sizePolicy)
+        self.pushButton_eq.setLocale(QLocale(QLocale.C, QLocale.AnyTerritory))
+
+        self.gridLayout.addWidget(self.pushButton_eq, 4, 5, 1, 1)
+
+        self.pushButton_pos = QPushButton(self.basic_tab)
+        self.pushButton_pos.setObjectName(u"pushButton_pos")
+        sizePolicy.setHeightForWidth(self.pushButton_pos.sizePolicy().hasHeightForWidth())
+        self.pushButton_pos.setSizePolicy(sizePolicy)
+        self.pushButton_pos.setLocale(QLocale(QLocale.C, QLocale.AnyTerritory))
+
+        self.gridLayout.addWidget(self.pushButton_pos, 4, 0, 1, 1)
+
+        self.pushButton_lbr = QPushButton(self.basic_tab)
+        self.pushButton_lbr.setObjectName(u"pushButton_lbr")
+        sizePolicy.setHeightForWidth(self.pushButton_lbr.sizePolicy().hasHeightForWidth())
+        self.pushButton_lbr.setSizePolicy(sizePolicy)
+        self.pushButton_lbr.setLocale(QLocale(QLocale.C, QLocale.AnyTerritory))
+
+        self.gridLayout.addWidget(self.pushButton_lbr, 0, 3, 1, 1)
+
+        self.pushButton_2 = QPushButton(self.basic_tab)
+        self.pushButton_2.setObjectName(u"pushButton_2")
+        sizePolicy.setHeightForWidth(self.pushButton_2.sizePolicy().hasHeightForWidth())
+        self.pushButton_2.setSizePolicy(sizePolicy)
+        self.pushButton_2.setLocale(QLocale(QLocale.C, QLocale.AnyTerritory))
+
+        self.gridLayout.addWidget(self.pushButton_2, 3, 3, 1, 1)
+
+        self.pushButton_dot = QPushButton(self.basic_tab)
+        self.pushButton_dot.setObjectName(u"pushButton_dot")
+        sizePolicy.setHeightForWidth(self.pushButton_dot.sizePolicy().hasHeightForWidth())
+        self.pushButton_dot.setSizePolicy(sizePolicy)
+        self.pushButton_dot.setLocale(QLocale(QLocale.C, QLocale.AnyTerritory))
+
+        self.gridLayout.addWidget(self.pushButton_dot, 4, 4, 1, 1)
+
+        self.pushButton_yb = QPushButton(self.basic_tab)
+        self.pushButton_yb.setObjectName(u"pushButton_yb")
+        sizePolicy.setHeightForWidth(self.pushButton_yb.sizePolicy().hasHeightForWidth())
+        self.pushButton_yb.setSizePolicy(sizePolicy)
+        self.pushButton_yb.setLocale(QLocale(QLocale.C, QLocale.AnyTerritory))
+
+        self.gridLayout.addWidget(self.pushButton_yb, 3, 1, 1, 1)
+
+        self.pushButton_gtb = QPushButton(self.basic_tab)
+        self.pushButton_gtb.setObjectName(u"pushButton_gtb")
+        sizePolicy.setHeightForWidth(self.pushButton_gtb.sizePolicy().hasHeightForWidth())
+        self.pushButton_gtb.setSizePolicy(sizePolicy)
+        self.pushButton_gtb.setLocale(QLocale(QLocale.C, QLocale.AnyTerritory))
+
+        self.gridLayout.addWidget(self.pushButton_gtb, 4, 1, 1, 1)
+
+        self.pushButton_6 = QPushButton(self.basic_tab)
+        self.pushButton_6.setObjectName(u"pushButton_6")
+        sizePolicy.setHeightForWidth(self.pushButton_6.sizePolicy().hasHeightForWidth())
+        self.pushButton_6.setSizePolicy(sizePolicy)
+        self.pushButton_6.setLocale(QLocale(QLocale.C, QLocale.AnyTerritory))
+
+        self.gridLayout.addWidget(self.pushButton_6, 2, 4, 1, 1)
+
+        self.pushButton_log = QPushButton(self.basic_tab)
+        self.pushButton_log.setObjectName(u"pushButton_log")
+        sizePolicy.setHeightForWidth(self.pushButton_log.sizePolicy().hasHeightForWidth())
+        self.pushButton_log.setSizePolicy(sizePolicy)
+        self.pushButton_log.setLocale(QLocale(QLocale.C, QLocale.AnyTerritory))
+
+        self.gridLayout.addWidget(self.pushButton_log, 3, 0, 1, 1)
+
+        self.pushButton_5 = QPushButton(self.basic_tab)
+        self.pushButton_5.setObjectName(u"pushButton_5")
+        sizePolicy.setHeightForWidth(self.pushButton_5.sizePolicy().hasHeightForWidth())
+        self.pushButton_5.setSizePolicy(sizePolicy)
+        self.pushButton_5.setLocale(QLocale(QLocale.C, QLocale.AnyTerritory))
+
+        self.gridLayout.addWidget(self.pushButton_5, 2, 3, 1, 1)
+
+        self.pushButton_rbr = QPushButton(self.basic_tab)
+        self.pushButton_rbr.setObjectName(u"pushButton_rbr")
+        sizePolicy.setHeightForWidth(self.pushButton_rbr.sizePolicy().hasHeightForWidth())
+        self.pushButton_rbr.setSizePolicy(sizePolicy)
+        self.pushButton_rbr.setLocale(QLocale(QLocale.C, QLocale.AnyTerritory))
+
+        self.gridLayout.addWidget(self.pushButton_rbr, 0, 4, 1, 1)
+
+        self.pushButton_eb = QPushButton(self.basic_tab)
+        self.pushButton_eb.setObjectName(u"pushButton_eb")
+        sizePolicy.setHeightForWidth(self.pushButton_eb.sizePolicy().hasHeightForWidth())
+        self.pushButton_eb.setSizePolicy(sizePolicy)
+        self.pushButton_eb.setLocale(QLocale(QLocale.C, QLocale.AnyTerritory))
+
+        self.gridLayout.addWidget(self.pushButton_eb, 1, 1, 1, 1)
+
+        self.pushButton_add = QPushButton(self.basic_tab)
+        self.pushButton_add.setObjectName(u"pushButton_add")
+        sizePolicy.setHeightForWidth(self.pushButton_add.sizePolicy().hasHeightForWidth())
+        self.pushButton_add.setSizePolicy(sizePolicy)
+        self.pushButton_add.setLocale(QLocale(QLocale.C, QLocale.AnyTerritory))
+
+        self.gridLayout.addWidget(self.pushButton_add, 3, 5, 1, 1)
+
+        self.pushButton_mul = QPushButton(self.basic_tab)
+        self.pushButton_mul.setObjectName(u"pushButton_mul")
+        sizePolicy.setHeightForWidth(self.pushButton_mul.sizePolicy().hasHeightForWidth())
+        self.pushButton_mul.setSizePolicy(sizePolicy)
+        self.pushButton_mul.setLocale(QLocale(QLocale.C, QLocale.AnyTerritory))
+
+        self.gridLayout.addWidget(self.pushButton_mul, 1, 5, 1, 1)
+
+        self.pushButton_ans = QPushButton(self.basic_tab)
+        self.pushButton_ans.setObjectName(u"pushButton_ans")
+        sizePolicy.setHeightForWidth(self.pushButton_ans.sizePolicy().hasHeightForWidth())
+        self.pushButton_ans.setSizePolicy(sizePolicy)
+        self.pushButton_ans.setLocale(QLocale(QLocale.C, QLocale.AnyTerritory))
+
+        self.gridLayout.addWidget(self.pushButton_ans, 0, 0, 1, 1)
+
+        self.pushButton_3 = QPushButton(self.basic_tab)
+        self.pushButton_3.setObjectName(u"pushButton_3")
+        sizePolicy.setHeightForWidth(self.pushButton_3.sizePolicy().hasHeightForWidth())
+        self.pushButton_3.setSizePolicy(sizePolicy)
+        self.pushButton_3.setLocale(QLocale(QLocale.C, QLocale.AnyTerritory))
+
+        self.gridLayout.addWidget(self.pushButton_3, 3, 4, 1, 1)
+
+        self.pushButton_0 = QPushButton(self.basic_tab)
+        self.pushButton_0.setObjectName(u"pushButton_0")
+        sizePolicy.setHeightForWidth(self.pushButton_0.sizePolicy().hasHeightForWidth())
+        self.pushButton_0.setSizePolicy(sizePolicy)
+        self.pushButton_0.setLocale(QLocale(QLocale.C, QLocale.AnyTerritory))
+
+        self.gridLayout.addWidget(self.pushButton_0, 4, 3, 1, 1)
+
+        self.pushButton_7 = QPushButton(self.basic_tab)
+        self.pushButton_7.setObjectName(u"pushButton_7")
+        sizePolicy.setHeightForWidth(self.pushButton_7.sizePolicy().hasHeightForWidth())
+        self.pushButton_7.setSizePolicy(sizePolicy)
+        self.pushButton_7.setLocale(QLocale(QLocale.C, QLocale.AnyTerritory))
+
+        self.gridLayout.addWidget(self.pushButton_7, 1, 2, 1, 1)
+
+        self.pushButton_pow = QPushButton(self.basic_tab)
+        self.pushButton_pow.setObjectName(u"pushButton_pow")
+        sizePolicy.setHeightForWidth(self.pushButton_pow.sizePolicy().hasHeightForWidth())
+        self.pushButton_pow.setSizePolicy(sizePolicy)
+        self.pushButton_pow.setLocale(QLocale(QLocale.C, QLocale.AnyTerritory))
+
+        self.gridLayout.addWidget(self.pushButton_pow, 1, 0, 1, 1)
+
+
+        self.gridLayout_10.addLayout(self.gridLayout, 0, 0, 1, 1)
+
+        self.tabWidget.addTab(self.basic_tab, "")
+        self.tab_alge = QWidget()
+        self.tab_alge.setObjectName(u"tab_alge")
+        self.gridLayout_11 = QGridLayout(self.tab_alge)
+        self.gridLayout_11.setObjectName(u"gridLayout_11")
+        self.gridLayout_2 = QGridLayout()
+        self.gridLayout_2.setObjectName(u"gridLayout_2")
+        self.pushButton_cefl = QPushButton(self.tab_alge)
+        self.pushButton_cefl.setObjectName(u"pushButton_cefl")
+        sizePolicy.setHeightForWidth(self.pushButton_cefl.sizePolicy().hasHeightForWidth())
+        self.pushButton_cefl.setSizePolicy(sizePolicy)
+
+        self.gridLayout_2.addWidget(self.pushButton_cefl, 0, 1, 1, 1)
+
+        self.pushButton_ge = QPushButton(self.tab_alge)
+        self.pushButton_ge.setObjectName(u"pushButton_ge")
+        sizePolicy.setHeightForWidth(self.pushButton_ge.sizePolicy().hasHeightForWidth())
+        self.pushButton_ge.setSizePolicy(sizePolicy)
+
+        self.gridLayout_2.addWidget(self.pushButton_ge, 1, 0, 1, 1)
+
+        self.pushButton_abs = QPushButton(self.tab_alge)
+        self.pushButton_abs.setObjectName(u"pushButton_abs")
+        sizePolicy.setHeightForWidth(self.pushButton_abs.sizePolicy().hasHeightForWidth())
+        self.pushButton_abs.setSizePolicy(sizePolicy)
+
+        self.gridLayout_2.addWidget(self.pushButton_abs, 0, 0, 1, 1)
+
+        self.pushButton_sol = QPushButton(self.tab_alge)
+        self.pushButton_sol.setObjectName(u"pushButton_sol")
+        sizePolicy.setHeightForWidth(self.pushButton_sol.sizePolicy().hasHeightForWidth())
+        self.pushButton_sol.setSizePolicy(sizePolicy)
+
+        self.gridLayout_2.addWidget(self.pushButton_sol, 2, 0, 1, 1)
+
+        self.pushButton_le = QPushButton(self.tab_alge)
+        self.pushButton_le.setObjectName(u"pushButton_le")
+        sizePolicy.setHeightForWidth(self.pushButton_le.sizePolicy().hasHeightForWidth())
+        self.pushButton_le.setSizePolicy(sizePolicy)
+
+        self.gridLayout_2.addWidget(self.pushButton_le, 1, 1, 1, 1)
+
+        self.pushButton_exp = QPushButton(self.tab_alge)
+        self.pushButton_exp.setObjectName(u"pushButton_exp")
+        sizePolicy.setHeightForWidth(self.pushButton_exp.sizePolicy().hasHeightForWidth())
+        self.pushButton_exp.setSizePolicy(sizePolicy)
+
+        self.gridLayout_2.addWidget(self.pushButton_exp, 2, 1, 1, 1)
+
+        self.pushButton_fac = QPushButton(self.tab_alge)
+        self.pushButton_fac.setObjectName(u"pushButton_fac")
+        sizePolicy.setHeightForWidth(self.pushButton_fac.sizePolicy().hasHeightForWidth())
+        self.pushButton_fac.setSizePolicy(sizePolicy)
+
+        self.gridLayout_2.addWidget(self.pushButton_fac, 2, 2, 1, 1)
+
+        self.pushButton_sim = QPushButton(self.tab_alge)
+        self.pushButton_sim.setObjectName(u"pushButton_sim")
+        sizePolicy.setHeightForWidth(self.pushButton_sim.sizePolicy().hasHeightForWidth())
+        self.pushButton_sim.setSizePolicy(sizePolicy)
+
+        self.gridLayout_2.addWidget(self.pushButton_sim, 2, 3, 1, 1)
+
+        self.pushButton_ps = QPushButton(self.tab_alge)
+        self.pushButton_ps.setObjectName(u"pushButton_ps")
+        sizePolicy.setHeightForWidth(self.pushButton_ps.sizePolicy().hasHeightForWidth())
+        self.pushButton_ps.setSizePolicy(sizePolicy)
+
+        self.gridLayout_2.addWidget(self.pushButton_ps, 2, 4, 1, 1)
+
+        self.pushButton_ne = QPushButton(self.tab_alge)
+        self.pushButton_ne.setObjectName(u"pushButton_ne")
+        sizePolicy.setHeightForWidth(self.pushButton_ne.sizePolicy().hasHeightForWidth())
+        self.pushButton_ne.setSizePolicy(sizePolicy)
+
+        self.gridLayout_2.addWidget(self.pushButton_ne, 1, 2, 1, 1)
+
+        self.pushButton_gidp = QPushButton(self.tab_alge)
+        self.pushButton_gidp.setObjectName(u"pushButton_gidp")
+        sizePolicy.setHeightForWidth(self.pushButton_gidp.sizePolicy().hasHeightForWidth())
+        self.pushButton_gidp.setSizePolicy(sizePolicy)
+
+        self.gridLayout_2.addWidget(self.pushButton_gidp, 0, 2, 1, 1)
+
+        self.pushButton_2nda = QPushButton(self.tab_alge)
+        self.pushButton_2nda.setObjectName(u"pushButton_2nda")
+        sizePolicy.setHeightForWidth(self.pushButton_2nda.sizePolicy().hasHeightForWidth())
+        self.pushButton_2nda.setSizePolicy(sizePolicy)
+
+        self.gridLayout_2.addWidget(self.pushButton_2nda, 0, 4, 1, 1)
+
+        self.pushButton_oa = QPushButton(self.tab_alge)
+        self.pushButton_oa.setObjectName(u"pushButton_oa")
+        sizePolicy.setHeightForWidth(self.pushButton_oa.sizePolicy().hasHeightForWidth())
+        self.pushButton_oa.setSizePolicy(sizePolicy)
+
+        self.gridLayout_2.addWidget(self.pushButton_oa, 1, 3, 1, 1)
+
+        self.pushButton_noxo = QPushButton(self.tab_alge)
+        self.pushButton_noxo.setObjectName(u"pushButton_noxo")
+        sizePolicy.setHeightForWidth(self.pushButton_noxo.sizePolicy().hasHeightForWidth())
+        self.pushButton_noxo.setSizePolicy(sizePolicy)
+
+        self.gridLayout_2.addWidget(self.pushButton_noxo, 1, 4, 1, 1)
+
+        self.pushButton_rl = QPushButton(self.tab_alge)
+        self.pushButton_rl.setObjectName(u"pushButton_rl")
+        sizePolicy.setHeightForWidth(self.pushButton_rl.sizePolicy().hasHeightForWidth())
+        self.pushButton_rl.setSizePolicy(sizePolicy)
+
+        self.gridLayout_2.addWidget(self.pushButton_rl, 0, 3, 1, 1)
+
+
+        self.gridLayout_11.addLayout(self.gridLayout_2, 0, 0, 1, 1)
+
+        self.tabWidget.addTab(self.tab_alge, "")
+        self.trigo_tab = QWidget()
+        self.trigo_tab.setObjectName(u"trigo_tab")
+        self.gridLayout_12 = QGridLayout(self.trigo_tab)
+        self.gridLayout_12.setObjectName(u"gridLayout_12")
+        self.gridLayout_4 = QGridLayout()
+        self.gridLayout_4.setObjectName(u"gridLayout_4")
+        self.pushButton_cot = QPushButton(self.trigo_tab)
+        self.pushButton_cot.setObjectName(u"pushButton_cot")
+        sizePolicy.setHeightForWidth(self.pushButton_cot.sizePolicy().hasHeightForWidth())
+        self.pushButton_cot.setSizePolicy(sizePolicy)
+
+        self.gridLayout_4.addWidget(self.pushButton_cot, 1, 1, 1, 1)
+
+        self.pushButton_sin = QPushButton(self.trigo_tab)
+        self.pushButton_sin.setObjectName(u"pushButton_sin")
+        sizePolicy.setHeightForWidth(self.pushButton_sin.sizePolicy().hasHeightForWidth())
+        self.pushButton_sin.setSizePolicy(sizePolicy)
+
+        self.gridLayout_4.addWidget(self.pushButton_sin, 0, 1, 1, 1)
+
+        self.pushButton_csc = QPushButton(self.trigo_tab)
+        self.pushButton_csc.setObjectName(u"pushButton_csc")
+        sizePolicy.setHeightForWidth(self.pushButton_csc.sizePolicy().hasHeightForWidth())
+        self.pushButton_csc.setSizePolicy(sizePolicy)
+
+        self.gridLayout_4.addWidget(self.pushButton_csc, 1, 3, 1, 1)
+
+        self.pushButton_2ndt = QPushButton(self.trigo_tab)
+        self.pushButton_2ndt.setObjectName(u"pushButton_2ndt")
+        sizePolicy.setHeightForWidth(self.pushButton_2ndt.sizePolicy().hasHeightForWidth())
+        self.pushButton_2ndt.setSizePolicy(sizePolicy)
+
+        self.gridLayout_4.addWidget(self.pushButton_2ndt, 0, 0, 1, 1)
+
+        self.pushButton_hyp = QPushButton(self.trigo_tab)
+        self.pushButton_hyp.setObjectName(u"pushButton_hyp")
+        sizePolicy.setHeightForWidth(self.pushButton_hyp.sizePolicy().hasHeightForWidth())
+        self.pushButton_hyp.setSizePolicy(sizePolicy)
+
+        self.gridLayout_4.addWidget(self.pushButton_hyp, 1, 0, 1, 1)
+
+        self.pushButton_cos = QPushButton(self.trigo_tab)
+        self.pushButton_cos.setObjectName(u"pushButton_cos")
+        sizePolicy.setHeightForWidth(self.pushButton_cos.sizePolicy().hasHeightForWidth())
+        self.pushButton_cos.setSizePolicy(sizePolicy)
+
+        self.gridLayout_4.addWidget(self.pushButton_cos, 0, 2, 1, 1)
+
+        self.pushButton_sec = QPushButton(self.trigo_tab)
+        self.pushButton_sec.setObjectName(u"pushButton_sec")
+        sizePolicy.setHeightForWidth(self.pushButton_sec.sizePolicy().hasHeightForWidth())
+        self.pushButton_sec.setSizePolicy(sizePolicy)
+
+        self.gridLayout_4.addWidget(self.pushButton_sec, 1, 2, 1, 1)
+
+        self.pushButton_tan = QPushButton(self.trigo_tab)
+        self.pushButton_tan.setObjectName(u"pushButton_tan")
+        sizePolicy.setHeightForWidth(self.pushButton_tan.sizePolicy().hasHeightForWidth())
+        self.pushButton_tan.setSizePolicy(sizePolicy)
+
+        self.gridLayout_4.addWidget(self.pushButton_tan, 0, 3, 1, 1)
+
+
+        self.gridLayout_12.addLayout(self.gridLayout_4, 0, 0, 1, 1)
+
+        self.tabWidget.addTab(self.trigo_tab, "")
+        self.calcu_tab = QWidget()
+        self.calcu_tab.setObjectName(u"calcu_tab")
+        self.gridLayout_13 = QGridLayout(self.calcu_tab)
+        self.gridLayout_13.setObjectName(u"gridLayout_13")
+        self.gridLayout_5 = QGridLayout()
+        self.gridLayout_5.setObjectName(u"gridLayout_5")
+        self.pushButton_diff = QPushButton(self.calcu_tab)
+        self.pushButton_diff.setObjectName(u"pushButton_diff")
+        sizePolicy.setHeightForWidth(self.pushButton_diff.sizePolicy().hasHeightForWidth())
+        self.pushButton_diff.setSizePolicy(sizePolicy)
+
+        self.gridLayout_5.addWidget(self.pushButton_diff, 0, 0, 1, 1)
+
+        self.pushButton_Ci = QPushButton(self.calcu_tab)
+        self.pushButton_Ci.setObjectName(u"pushButton_Ci")
+        sizePolicy.setHeightForWidth(self.pushButton_Ci.sizePolicy().hasHeightForWidth())
+        self.pushButton_Ci.setSizePolicy(sizePolicy)
+
+        self.gridLayout_5.addWidget(self.pushButton_Ci, 1, 2, 1, 1)
+
+        self.pushButton_li = QPushButton(self.calcu_tab)
+        self.pushButton_li.setObjectName(u"pushButton_li")
+        sizePolicy.setHeightForWidth(self.pushButton_li.sizePolicy().hasHeightForWidth())
+        self.pushButton_li.setSizePolicy(sizePolicy)
+
+        self.gridLayout_5.addWidget(self.pushButton_li, 1, 3, 1, 1)
+
+        self.pushButton_Si = QPushButton(self.calcu_tab)
+        self.pushButton_Si.setObjectName(u"pushButton_Si")
+        sizePolicy.setHeightForWidth(self.pushButton_Si.sizePolicy().hasHeightForWidth())
+        self.pushButton_Si.setSizePolicy(sizePolicy)
+
+        self.gridLayout_5.addWidget(self.pushButton_Si, 0, 2, 1, 1)
+
+        self.pushButton_tayls = QPushButton(self.calcu_tab)
+        self.pushButton_tayls.setObjectName(u"pushButton_tayls")
+        sizePolicy.setHeightForWidth(self.pushButton_tayls.sizePolicy().hasHeightForWidth())
+        self.pushButton_tayls.setSizePolicy(sizePolicy)
+
+        self.gridLayout_5.addWidget(self.pushButton_tayls, 1, 1, 1, 1)
+
+        self.pushButton_lim = QPushButton(self.calcu_tab)
+        self.pushButton_lim.setObjectName(u"pushButton_lim")
+        sizePolicy.setHeightForWidth(self.pushButton_lim.sizePolicy().hasHeightForWidth())
+        self.pushButton_lim.setSizePolicy(sizePolicy)
+
+        self.gridLayout_5.addWidget(self.pushButton_lim, 1, 0, 1, 1)
+
+        self.pushButton_inter = QPushButton(self.calcu_tab)
+        self.pushButton_inter.setObjectName(u"pushButton_inter")
+        sizePolicy.setHeightForWidth(self.pushButton_inter.sizePolicy().hasHeightForWidth())
+        self.pushButton_inter.setSizePolicy(sizePolicy)
+
+        self.gridLayout_5.addWidget(self.pushButton_inter, 0, 1, 1, 1)
+
+        self.pushButton_Oc = QPushButton(self.calcu_tab)
+        self.pushButton_Oc.setObjectName(u"pushButton_Oc")
+        sizePolicy.setHeightForWidth(self.pushButton_Oc.sizePolicy().hasHeightForWidth())
+        self.pushButton_Oc.setSizePolicy(sizePolicy)
+
+        self.gridLayout_5.addWidget(self.pushButton_Oc, 0, 3, 1, 1)
+
+        self.pushButton_bemmac = QPushButton(self.calcu_tab)
+        self.pushButton_bemmac.setObjectName(u"pushButton_bemmac")
+        sizePolicy.setHeightForWidth(self.pushButton_bemmac.sizePolicy().hasHeightForWidth())
+        self.pushButton_bemmac.setSizePolicy(sizePolicy)
+
+        self.gridLayout_5.addWidget(self.pushButton_bemmac, 1, 4, 1, 1)
+
+        self.pushButton_2ndc = QPushButton(self.calcu_tab)
+        self.pushButton_2ndc.setObjectName(u"pushButton_2ndc")
+        sizePolicy.setHeightForWidth(self.pushButton_2ndc.sizePolicy().hasHeightForWidth())
+        self.pushButton_2ndc.setSizePolicy(sizePolicy)
+
+        self.gridLayout_5.addWidget(self.pushButton_2ndc, 0, 4, 1, 1)
+
+
+        self.gridLayout_13.addLayout(self.gridLayout_5, 0, 0, 1, 1)
+
+        self.tabWidget.addTab(self.calcu_tab, "")
+        self.tab_marset = QWidget()
+        self.tab_marset.setObjectName(u"tab_marset")
+        self.gridLayout_15 = QGridLayout(self.tab_marset)
+        self.gridLayout_15.setObjectName(u"gridLayout_15")
+        self.gridLayout_8 = QGridLayout()
+        self.gridLayout_8.setObjectName(u"gridLayout_8")
+        self.pushButton_comp = QPushButton(self.tab_marset)
+        self.pushButton_comp.setObjectName(u"pushButton_comp")
+        sizePolicy.setHeightForWidth(self.pushButton_comp.sizePolicy().hasHeightForWidth())
+        self.pushButton_comp.setSizePolicy(sizePolicy)
+
+        self.gridLayout_8.addWidget(self.pushButton_comp, 2, 2, 1, 1)
+
+        self.pushButton_difs = QPushButton(self.tab_marset)
+        self.pushButton_difs.setObjectName(u"pushButton_difs")
+        sizePolicy.setHeightForWidth(self.pushButton_difs.sizePolicy().hasHeightForWidth())
+        self.pushButton_difs.setSizePolicy(sizePolicy)
+
+        self.gridLayout_8.addWidget(self.pushButton_difs, 1, 2, 1, 1)
+
+        self.pushButton_rbc = QPushButton(self.tab_marset)
+        self.pushButton_rbc.setObjectName(u"pushButton_rbc")
+        sizePolicy.setHeightForWidth(self.pushButton_rbc.sizePolicy().hasHeightForWidth())
+        self.pushButton_rbc.setSizePolicy(sizePolicy)
+
+        self.gridLayout_8.addWidget(self.pushButton_rbc, 0, 3, 1, 1)
+
+        self.pushButton_rsb = QPushButton(self.tab_marset)
+        self.pushButton_rsb.setObjectName(u"pushButton_rsb")
+        sizePolicy.setHeightForWidth(self.pushButton_rsb.sizePolicy().hasHeightForWidth())
+        self.pushButton_rsb.setSizePolicy(sizePolicy)
+
+        self.gridLayout_8.addWidget(self.pushButton_rsb, 0, 1, 1, 1)
+
+        self.pushButton_sep = QPushButton(self.tab_marset)
+        self.pushButton_sep.setObjectName(u"pushButton_sep")
+        sizePolicy.setHeightForWidth(self.pushButton_sep.sizePolicy().hasHeightForWidth())
+        self.pushButton_sep.setSizePolicy(sizePolicy)
+
+        self.gridLayout_8.addWidget(self.pushButton_sep, 0, 5, 1, 1)
+
+        self.pushButton_bel2 = QPushButton(self.tab_marset)
+        self.pushButton_bel2.setObjectName(u"pushButton_bel2")
+        sizePolicy.setHeightForWidth(self.pushButton_bel2.sizePolicy().hasHeightForWidth())
+        self.pushButton_bel2.setSizePolicy(sizePolicy)
+
+        self.gridLayout_8.addWidget(self.pushButton_bel2, 0, 4, 1, 1)
+
+        self.pushButton_sn = QPushButton(self.tab_marset)
+        self.pushButton_sn.setObjectName(u"pushButton_sn")
+        sizePolicy.setHeightForWidth(self.pushButton_sn.sizePolicy().hasHeightForWidth())
+        self.pushButton_sn.setSizePolicy(sizePolicy)
+
+        self.gridLayout_8.addWidget(self.pushButton_sn, 2, 4, 1, 1)
+
+        self.pushButton_ins = QPushButton(self.tab_marset)
+        self.pushButton_ins.setObjectName(u"pushButton_ins")
+        sizePolicy.setHeightForWidth(self.pushButton_ins.sizePolicy().hasHeightForWidth())
+        self.pushButton_ins.setSizePolicy(sizePolicy)
+
+        self.gridLayout_8.addWidget(self.pushButton_ins, 1, 0, 1, 1)
+
+        self.pushButton_exs = QPushButton(self.tab_marset)
+        self.pushButton_exs.setObjectName(u"pushButton_exs")
+        sizePolicy.setHeightForWidth(self.pushButton_exs.sizePolicy().hasHeightForWidth())
+        self.pushButton_exs.setSizePolicy(sizePolicy)
+
+        self.gridLayout_8.addWidget(self.pushButton_exs, 2, 6, 1, 1)
+
+        self.pushButton_es = QPushButton(self.tab_marset)
+        self.pushButton_es.setObjectName(u"pushButton_es")
+        sizePolicy.setHeightForWidth(self.pushButton_es.sizePolicy().hasHeightForWidth())
+        self.pushButton_es.setSizePolicy(sizePolicy)
+
+        self.gridLayout_8.addWidget(self.pushButton_es, 2, 5, 1, 1)
+
+        self.pushButton_tsbs = QPushButton(self.tab_marset)
+        self.pushButton_tsbs.setObjectName(u"pushButton_tsbs")
+        sizePolicy.setHeightForWidth(self.pushButton_tsbs.sizePolicy().hasHeightForWidth())
+        self.pushButton_tsbs.setSizePolicy(sizePolicy)
+
+        self.gridLayout_8.addWidget(self.pushButton_tsbs, 1, 4, 1, 1)
+
+        self.pushButton_uni = QPushButton(self.tab_marset)
+        self.pushButton_uni.setObjectName(u"pushButton_uni")
+        sizePolicy.setHeightForWidth(self.pushButton_uni.sizePolicy().hasHeightForWidth())
+        self.pushButton_uni.setSizePolicy(sizePolicy)
+
+        self.gridLayout_8.addWidget(self.pushButton_uni, 1, 1, 1, 1)
+
+        self.pushButton_lsb = QPushButton(self.tab_marset)
+        self.pushButton_lsb.setObjectName(u"pushButton_lsb")
+        sizePolicy.setHeightForWidth(self.pushButton_lsb.sizePolicy().hasHeightForWidth())
+        self.pushButton_lsb.setSizePolicy(sizePolicy)
+
+        self.gridLayout_8.addWidget(self.pushButton_lsb, 0, 0, 1, 1)
+
+        self.pushButton_lbc = QPushButton(self.tab_marset)
+        self.pushButton_lbc.setObjectName(u"pushButton_lbc")
+        sizePolicy.setHeightForWidth(self.pushButton_lbc.sizePolicy().hasHeightForWidth())
+        self.pushButton_lbc.setSizePolicy(sizePolicy)
+
+        self.gridLayout_8.addWidget(self.pushButton_lbc, 0, 2, 1, 1)
+
+        self.pushButton_sbs = QPushButton(self.tab_marset)
+        self.pushButton_sbs.setObjectName(u"pushButton_sbs")
+        sizePolicy.setHeightForWidth(self.pushButton_sbs.sizePolicy().hasHeightForWidth())
+        self.pushButton_sbs.setSizePolicy(sizePolicy)
+
+        self.gridLayout_8.addWidget(self.pushButton_sbs, 2, 0, 1, 1)
+
+        self.pushButton_tsps = QPushButton(self.tab_marset)
+        self.pushButton_tsps.setObjectName(u"pushButton_tsps")
+        sizePolicy.setHeightForWidth(self.pushButton_tsps.sizePolicy().hasHeightForWidth())
+        self.pushButton_tsps.setSizePolicy(sizePolicy)
+
+        self.gridLayout_8.addWidget(self.pushButton_tsps, 1, 5, 1, 1)
+
+        self.pushButton_4a = QPushButton(self.tab_marset)
+        self.pushButton_4a.setObjectName(u"pushButton_4a")
+        sizePolicy.setHeightForWidth(self.pushButton_4a.sizePolicy().hasHeightForWidth())
+        self.pushButton_4a.setSizePolicy(sizePolicy)
+
+        self.gridLayout_8.addWidget(self.pushButton_4a, 1, 6, 1, 1)
+
+        self.pushButton_Pm = QPushButton(self.tab_marset)
+        self.pushButton_Pm.setObjectName(u"pushButton_Pm")
+        sizePolicy.setHeightForWidth(self.pushButton_Pm.sizePolicy().hasHeightForWidth())
+        self.pushButton_Pm.setSizePolicy(sizePolicy)
+
+        self.gridLayout_8.addWidget(self.pushButton_Pm, 2, 3, 1, 1)
+
+        self.pushButton_sd = QPushButton(self.tab_marset)
+        self.pushButton_sd.setObjectName(u"pushButton_sd")
+        sizePolicy.setHeightForWidth(self.pushButton_sd.sizePolicy().hasHeightForWidth())
+        self.pushButton_sd.setSizePolicy(sizePolicy)
+
+        self.gridLayout_8.addWidget(self.pushButton_sd, 1, 3, 1, 1)
+
+        self.pushButton_2ndms = QPushButton(self.tab_marset)
+        self.pushButton_2ndms.setObjectName(u"pushButton_2ndms")
+        sizePolicy.setHeightForWidth(self.pushButton_2ndms.sizePolicy().hasHeightForWidth())
+        self.pushButton_2ndms.setSizePolicy(sizePolicy)
+
+        self.gridLayout_8.addWidget(self.pushButton_2ndms, 0, 6, 1, 1)
+
+        self.pushButton_sps = QPushButton(self.tab_marset)
+        self.pushButton_sps.setObjectName(u"pushButton_sps")
+        sizePolicy.setHeightForWidth(self.pushButton_sps.sizePolicy().hasHeightForWidth())
+        self.pushButton_sps.setSizePolicy(sizePolicy)
+
+        self.gridLayout_8.addWidget(self.pushButton_sps, 2, 1, 1, 1)
+
+        self.pushButton_nat = QPushButton(self.tab_marset)
+        self.pushButton_nat.setObjectName(u"pushButton_nat")
+        sizePolicy.setHeightForWidth(self.pushButton_nat.sizePolicy().hasHeightForWidth())
+        self.pushButton_nat.setSizePolicy(sizePolicy)
+
+        self.gridLayout_8.addWidget(self.pushButton_nat, 3, 0, 1, 1)
+
+        self.pushButton_intms = QPushButton(self.tab_marset)
+        self.pushButton_intms.setObjectName(u"pushButton_intms")
+        sizePolicy.setHeightForWidth(self.pushButton_intms.sizePolicy().hasHeightForWidth())
+        self.pushButton_intms.setSizePolicy(sizePolicy)
+
+        self.gridLayout_8.addWidget(self.pushButton_intms, 3, 1, 1, 1)
+
+        self.pushButton_rat = QPushButton(self.tab_marset)
+        self.pushButton_rat.setObjectName(u"pushButton_rat")
+        sizePolicy.setHeightForWidth(self.pushButton_rat.sizePolicy().hasHeightForWidth())
+        self.pushButton_rat.setSizePolicy(sizePolicy)
+
+        self.gridLayout_8.addWidget(self.pushButton_rat, 3, 2, 1, 1)
+
+        self.pushButton_real = QPushButton(self.tab_marset)
+        self.pushButton_real.setObjectName(u"pushButton_real")
+        sizePolicy.setHeightForWidth(self.pushButton_real.sizePolicy().hasHeightForWidth())
+        self.pushButton_real.setSizePolicy(sizePolicy)
+
+        self.gridLayout_8.addWidget(self.pushButton_real, 3, 3, 1, 1)
+
+        self.pushButton_imag = QPushButton(self.tab_marset)
+        self.pushButton_imag.setObjectName(u"pushButton_imag")
+        sizePolicy.setHeightForWidth(self.pushButton_imag.sizePolicy().hasHeightForWidth())
+        self.pushButton_imag.setSizePolicy(sizePolicy)
+
+        self.gridLayout_8.addWidget(self.pushButton_imag, 3, 4, 1, 1)
+
+        self.pushButton_compl = QPushButton(self.tab_marset)
+        self.pushButton_compl.setObjectName(u"pushButton_compl")
+        sizePolicy.setHeightForWidth(self.pushButton_compl.sizePolicy().hasHeightForWidth())
+        self.pushButton_compl.setSizePolicy(sizePolicy)
+
+        self.gridLayout_8.addWidget(self.pushButton_compl, 3, 5, 1, 1)
+
+        self.pushButton_algn = QPushButton(self.tab_marset)
+        self.pushButton_algn.setObjectName(u"pushButton_algn")
+        sizePolicy.setHeightForWidth(self.pushButton_algn.sizePolicy().hasHeightForWidth())
+        self.pushButton_algn.setSizePolicy(sizePolicy)
+
+        self.gridLayout_8.addWidget(self.pushButton_algn, 3, 6, 1, 1)
+
+
+        self.gridLayout_15.addLayout(self.gridLayout_8, 0, 0, 1, 1)
+
+        self.tabWidget.addTab(self.tab_marset, "")
+        self.tab_char = QWidget()
+        self.tab_char.setObjectName(u"tab_char")
+        self.gridLayout_16 = QGridLayout(self.tab_char)
+        self.gridLayout_16.setObjectName(u"gridLayout_16")
+        self.gridLayout_9 = QGridLayout()
+        self.gridLayout_9.setObjectName(u"gridLayout_9")
+        self.pushButton_z = QPushButton(self.tab_char)
+        self.pushButton_z.setObjectName(u"pushButton_z")
+        sizePolicy.setHeightForWidth(self.pushButton_z.sizePolicy().hasHeightForWidth())
+        self.pushButton_z.setSizePolicy(sizePolicy)
+
+        self.gridLayout_9.addWidget(self.pushButton_z, 3, 5, 1, 1)
+
+        self.pushButton_j = QPushButton(self.tab_char)
+        self.pushButton_j.setObjectName(u"pushButton_j")
+        sizePolicy.setHeightForWidth(self.pushButton_j.sizePolicy().hasHeightForWidth())
+        self.pushButton_j.setSizePolicy(sizePolicy)
+
+        self.gridLayout_9.addWidget(self.pushButton_j, 1, 9, 1, 1)
+
+        self.pushButton_phi = QPushButton(self.tab_char)
+        self.pushButton_phi.setObjectName(u"pushButton_phi")
+        sizePolicy.setHeightForWidth(self.pushButton_phi.sizePolicy().hasHeightForWidth())
+        self.pushButton_phi.setSizePolicy(sizePolicy)
+
+        self.gridLayout_9.addWidget(self.pushButton_phi, 5, 6, 1, 1)
+
+        self.pushButton_mu = QPushButton(self.tab_char)
+        self.pushButton_mu.setObjectName(u"pushButton_mu")
+        sizePolicy.setHeightForWidth(self.pushButton_mu.sizePolicy().hasHeightForWidth())
+        self.pushButton_mu.setSizePolicy(sizePolicy)
+
+        self.gridLayout_9.addWidget(self.pushButton_mu, 4, 7, 1, 1)
+
+        self.pushButton_a = QPushButton(self.tab_char)
+        self.pushButton_a.setObjectName(u"pushButton_a")
+        sizePolicy.setHeightForWidth(self.pushButton_a.sizePolicy().hasHeightForWidth())
+        self.pushButton_a.setSizePolicy(sizePolicy)
+
+        self.gridLayout_9.addWidget(self.pushButton_a, 1, 0, 1, 1)
+
+        self.pushButton_o = QPushButton(self.tab_char)
+        self.pushButton_o.setObjectName(u"pushButton_o")
+        sizePolicy.setHeightForWidth(self.pushButton_o.sizePolicy().hasHeightForWidth())
+        self.pushButton_o.setSizePolicy(sizePolicy)
+
+        self.gridLayout_9.addWidget(self.pushButton_o, 2, 4, 1, 1)
+
+        self.pushButton_delt = QPushButton(self.tab_char)
+        self.pushButton_delt.setObjectName(u"pushButton_delt")
+        sizePolicy.setHeightForWidth(self.pushButton_delt.sizePolicy().hasHeightForWidth())
+        self.pushButton_delt.setSizePolicy(sizePolicy)
+
+        self.gridLayout_9.addWidget(self.pushButton_delt, 3, 9, 1, 1)
+
+        self.pushButton_omic = QPushButton(self.tab_char)
+        self.pushButton_omic.setObjectName(u"pushButton_omic")
+        sizePolicy.setHeightForWidth(self.pushButton_omic.sizePolicy().hasHeightForWidth())
+        self.pushButton_omic.setSizePolicy(sizePolicy)
+
+        self.gridLayout_9.addWidget(self.pushButton_omic, 5, 0, 1, 1)
+
+        self.pushButton_h = QPushButton(self.tab_char)
+        self.pushButton_h.setObjectName(u"pushButton_h")
+        sizePolicy.setHeightForWidth(self.pushButton_h.sizePolicy().hasHeightForWidth())
+        self.pushButton_h.setSizePolicy(sizePolicy)
+
+        self.gridLayout_9.addWidget(self.pushButton_h, 1, 7, 1, 1)
+
+        self.pushButton_sigm = QPushButton(self.tab_char)
+        self.pushButton_sigm.setObjectName(u"pushButton_sigm")
+        sizePolicy.setHeightForWidth(self.pushButton_sigm.sizePolicy().hasHeightForWidth())
+        self.pushButton_sigm.setSizePolicy(sizePolicy)
+
+        self.gridLayout_9.addWidget(self.pushButton_sigm, 5, 3, 1, 1)
+
+        self.pushButton_omeg = QPushButton(self.tab_char)
+        self.pushButton_omeg.setObjectName(u"pushButton_omeg")
+        sizePolicy.setHeightForWidth(self.pushButton_omeg.sizePolicy().hasHeightForWidth())
+        self.pushButton_omeg.setSizePolicy(sizePolicy)
+
+        self.gridLayout_9.addWidget(self.pushButton_omeg, 5, 9, 1, 1)
+
+        self.pushButton_b = QPushButton(self.tab_char)
+        self.pushButton_b.setObjectName(u"pushButton_b")
+        sizePolicy.setHeightForWidth(self.pushButton_b.sizePolicy().hasHeightForWidth())
+        self.pushButton_b.setSizePolicy(sizePolicy)
+
+        self.gridLayout_9.addWidget(self.pushButton_b, 1, 1, 1, 1)
+
+        self.pushButton_g = QPushButton(self.tab_char)
+        self.pushButton_g.setObjectName(u"pushButton_g")
+        sizePolicy.setHeightForWidth(self.pushButton_g.sizePolicy().hasHeightForWidth())
+        self.pushButton_g.setSizePolicy(sizePolicy)
+
+        self.gridLayout_9.addWidget(self.pushButton_g, 1, 6, 1, 1)
+
+        self.pushButton_t = QPushButton(self.tab_char)
+        self.pushButton_t.setObjectName(u"pushButton_t")
+        sizePolicy.setHeightForWidth(self.pushButton_t.sizePolicy().hasHeightForWidth())
+        self.pushButton_t.setSizePolicy(sizePolicy)
+
+        self.gridLayout_9.addWidget(self.pushButton_t, 2, 9, 1, 1)
+
+        self.pushButton_n = QPushButton(self.tab_char)
+        self.pushButton_n.setObjectName(u"pushButton_n")
+        sizePolicy.setHeightForWidth(self.pushButton_n.sizePolicy().hasHeightForWidth())
+        self.pushButton_n.setSizePolicy(sizePolicy)
+
+        self.gridLayout_9.addWidget(self.pushButton_n, 2, 3, 1, 1)
+
+        self.pushButton_l = QPushButton(self.tab_char)
+        self.pushButton_l.setObjectName(u"pushButton_l")
+        sizePolicy.setHeightForWidth(self.pushButton_l.sizePolicy().hasHeightForWidth())
+        self.pushButton_l.setSizePolicy(sizePolicy)
+
+        self.gridLayout_9.addWidget(self.pushButton_l, 2, 1, 1, 1)
+
+        self.pushButton_m = QPushButton(self.tab_char)
+        self.pushButton_m.setObjectName(u"pushButton_m")
+        sizePolicy.setHeightForWidth(self.pushButton_m.sizePolicy().hasHeightForWidth())
+        self.pushButton_m.setSizePolicy(sizePolicy)
+
+        self.gridLayout_9.addWidget(self.pushButton_m, 2, 2, 1, 1)
+
+        self.pushButton_lamd = QPushButton(self.tab_char)
+        self.pushButton_lamd.setObjectName(u"pushButton_lamd")
+        sizePolicy.setHeightForWidth(self.pushButton_lamd.sizePolicy().hasHeightForWidth())
+        self.pushButton_lamd.setSizePolicy(sizePolicy)
+
+        self.gridLayout_9.addWidget(self.pushButton_lamd, 4, 6, 1, 1)
+
+        self.pushButton_alph = QPushButton(self.tab_char)
+        self.pushButton_alph.setObjectName(u"pushButton_alph")
+        sizePolicy.setHeightForWidth(self.pushButton_alph.sizePolicy().hasHeightForWidth())
+        self.pushButton_alph.setSizePolicy(sizePolicy)
+
+        self.gridLayout_9.addWidget(self.pushButton_alph, 3, 6, 1, 1)
+
+        self.pushButton_iota = QPushButton(self.tab_char)
+        self.pushButton_iota.setObjectName(u"pushButton_iota")
+        sizePolicy.setHeightForWidth(self.pushButton_iota.sizePolicy().hasHeightForWidth())
+        self.pushButton_iota.setSizePolicy(sizePolicy)
+
+        self.gridLayout_9.addWidget(self.pushButton_iota, 4, 4, 1, 1)
+
+        self.pushButton_ksi = QPushButton(self.tab_char)
+        self.pushButton_ksi.setObjectName(u"pushButton_ksi")
+        sizePolicy.setHeightForWidth(self.pushButton_ksi.sizePolicy().hasHeightForWidth())
+        self.pushButton_ksi.setSizePolicy(sizePolicy)
+
+        self.gridLayout_9.addWidget(self.pushButton_ksi, 4, 9, 1, 1)
+
+        self.pushButton_q = QPushButton(self.tab_char)
+        self.pushButton_q.setObjectName(u"pushButton_q")
+        sizePolicy.setHeightForWidth(self.pushButton_q.sizePolicy().hasHeightForWidth())
+        self.pushButton_q.setSizePolicy(sizePolicy)
+
+        self.gridLayout_9.addWidget(self.pushButton_q, 2, 6, 1, 1)
+
+        self.pushButton_u = QPushButton(self.tab_char)
+        self.pushButton_u.setObjectName(u"pushButton_u")
+        sizePolicy.setHeightForWidth(self.pushButton_u.sizePolicy().hasHeightForWidth())
+        self.pushButton_u.setSizePolicy(sizePolicy)
+
+        self.gridLayout_9.addWidget(self.pushButton_u, 3, 0, 1, 1)
+
+        self.pushButton_nu = QPushButton(self.tab_char)
+        self.pushButton_nu.setObjectName(u"pushButton_nu")
+        sizePolicy.setHeightForWidth(self.pushButton_nu.sizePolicy().hasHeightForWidth())
+        self.pushButton_nu.setSizePolicy(sizePolicy)
+
+        self.gridLayout_9.addWidget(self.pushButton_nu, 4, 8, 1, 1)
+
+        self.pushButton_psi = QPushButton(self.tab_char)
+        self.pushButton_psi.setObjectName(u"pushButton_psi")
+        sizePolicy.setHeightForWidth(self.pushButton_psi.sizePolicy().hasHeightForWidth())
+        self.pushButton_psi.setSizePolicy(sizePolicy)
+
+        self.gridLayout_9.addWidget(self.pushButton_psi, 5, 8, 1, 1)
+
+        self.pushButton_beta = QPushButton(self.tab_char)
+        self.pushButton_beta.setObjectName(u"pushButton_beta")
+        sizePolicy.setHeightForWidth(self.pushButton_beta.sizePolicy().hasHeightForWidth())
+        self.pushButton_beta.setSizePolicy(sizePolicy)
+
+        self.gridLayout_9.addWidget(self.pushButton_beta, 3, 7, 1, 1)
+
+        self.pushButton_x = QPushButton(self.tab_char)
+        self.pushButton_x.setObjectName(u"pushButton_x")
+        sizePolicy.setHeightForWidth(self.pushButton_x.sizePolicy().hasHeightForWidth())
+        self.pushButton_x.setSizePolicy(sizePolicy)
+
+        self.gridLayout_9.addWidget(self.pushButton_x, 3, 3, 1, 1)
+
+        self.pushButton_epsi = QPushButton(self.tab_char)
+        self.pushButton_epsi.setObjectName(u"pushButton_epsi")
+        sizePolicy.setHeightForWidth(self.pushButton_epsi.sizePolicy().hasHeightForWidth())
+        self.pushButton_epsi.setSizePolicy(sizePolicy)
+
+        self.gridLayout_9.addWidget(self.pushButton_epsi, 4, 0, 1, 1)
+
+        self.pushButton_e = QPushButton(self.tab_char)
+        self.pushButton_e.setObjectName(u"pushButton_e")
+        sizePolicy.setHeightForWidth(self.pushButton_e.sizePolicy().hasHeightForWidth())
+        self.pushButton_e.setSizePolicy(sizePolicy)
+
+        self.gridLayout_9.addWidget(self.pushButton_e, 1, 4, 1, 1)
+
+        self.pushButton_f = QPushButton(self.tab_char)
+        self.pushButton_f.setObjectName(u"pushButton_f")
+        sizePolicy.setHeightForWidth(self.pushButton_f.sizePolicy().hasHeightForWidth())
+        self.pushButton_f.setSizePolicy(sizePolicy)
+
+        self.gridLayout_9.addWidget(self.pushButton_f, 1, 5, 1, 1)
+
+        self.pushButton_zeta = QPushButton(self.tab_char)
+        self.pushButton_zeta.setObjectName(u"pushButton_zeta")
+        sizePolicy.setHeightForWidth(self.pushButton_zeta.sizePolicy().hasHeightForWidth())
+        self.pushButton_zeta.setSizePolicy(sizePolicy)
+
+        self.gridLayout_9.addWidget(self.pushButton_zeta, 4, 1, 1, 1)
+
+        self.pushButton_tau = QPushButton(self.tab_char)
+        self.pushButton_tau.setObjectName(u"pushButton_tau")
+        sizePolicy.setHeightForWidth(self.pushButton_tau.sizePolicy().hasHeightForWidth())
+        self.pushButton_tau.setSizePolicy(sizePolicy)
+
+        self.gridLayout_9.addWidget(self.pushButton_tau, 5, 4, 1, 1)
+
+        self.pushButton_s = QPushButton(self.tab_char)
+        self.pushButton_s.setObjectName(u"pushButton_s")
+        sizePolicy.setHeightForWidth(self.pushButton_s.sizePolicy().hasHeightForWidth())
+        self.pushButton_s.setSizePolicy(sizePolicy)
+
+        self.gridLayout_9.addWidget(self.pushButton_s, 2, 8, 1, 1)
+
+        self.pushButton_thet = QPushButton(self.tab_char)
+        self.pushButton_thet.setObjectName(u"pushButton_thet")
+        sizePolicy.setHeightForWidth(self.pushButton_thet.sizePolicy().hasHeightForWidth())
+        self.pushButton_thet.setSizePolicy(sizePolicy)
+
+        self.gridLayout_9.addWidget(self.pushButton_thet, 4, 3, 1, 1)
+
+        self.pushButton_c = QPushButton(self.tab_char)
+        self.pushButton_c.setObjectName(u"pushButton_c")
+        sizePolicy.setHeightForWidth(self.pushButton_c.sizePolicy().hasHeightForWidth())
+        self.pushButton_c.setSizePolicy(sizePolicy)
+
+        self.gridLayout_9.addWidget(self.pushButton_c, 1, 2, 1, 1)
+
+        self.pushButton_rho = QPushButton(self.tab_char)
+        self.pushButton_rho.setObjectName(u"pushButton_rho")
+        sizePolicy.setHeightForWidth(self.pushButton_rho.sizePolicy().hasHeightForWidth())
+        self.pushButton_rho.setSizePolicy(sizePolicy)
+
+        self.gridLayout_9.addWidget(self.pushButton_rho, 5, 2, 1, 1)
+
+        self.pushButton_kapa = QPushButton(self.tab_char)
+        self.pushButton_kapa.setObjectName(u"pushButton_kapa")
+        sizePolicy.setHeightForWidth(self.pushButton_kapa.sizePolicy().hasHeightForWidth())
+        self.pushButton_kapa.setSizePolicy(sizePolicy)
+
+        self.gridLayout_9.addWidget(self.pushButton_kapa, 4, 5, 1, 1)
+
+        self.pushButton_gama = QPushButton(self.tab_char)
+        self.pushButton_gama.setObjectName(u"pushButton_gama")
+        sizePolicy.setHeightForWidth(self.pushButton_gama.sizePolicy().hasHeightForWidth())
+        self.pushButton_gama.setSizePolicy(sizePolicy)
+
+        self.gridLayout_9.addWidget(self.pushButton_gama, 3, 8, 1, 1)
+
+        self.pushButton_eta = QPushButton(self.tab_char)
+        self.pushButton_eta.setObjectName(u"pushButton_eta")
+        sizePolicy.setHeightForWidth(self.pushButton_eta.sizePolicy().hasHeightForWidth())
+        self.pushButton_eta.setSizePolicy(sizePolicy)
+
+        self.gridLayout_9.addWidget(self.pushButton_eta, 4, 2, 1, 1)
+
+        self.pushButton_v = QPushButton(self.tab_char)
+        self.pushButton_v.setObjectName(u"pushButton_v")
+        sizePolicy.setHeightForWidth(self.pushButton_v.sizePolicy().hasHeightForWidth())
+        self.pushButton_v.setSizePolicy(sizePolicy)
+
+        self.gridLayout_9.addWidget(self.pushButton_v, 3, 1, 1, 1)
+
+        self.pushButton_r = QPushButton(self.tab_char)
+        self.pushButton_r.setObjectName(u"pushButton_r")
+        sizePolicy.setHeightForWidth(self.pushButton_r.sizePolicy().hasHeightForWidth())
+        self.pushButton_r.setSizePolicy(sizePolicy)
+
+        self.gridLayout_9.addWidget(self.pushButton_r, 2, 7, 1, 1)
+
+        self.pushButton_k = QPushButton(self.tab_char)
+        self.pushButton_k.setObjectName(u"pushButton_k")
+        sizePolicy.setHeightForWidth(self.pushButton_k.sizePolicy().hasHeightForWidth())
+        self.pushButton_k.setSizePolicy(sizePolicy)
+
+        self.gridLayout_9.addWidget(self.pushButton_k, 2, 0, 1, 1)
+
+        self.pushButton_w = QPushButton(self.tab_char)
+        self.pushButton_w.setObjectName(u"pushButton_w")
+        sizePolicy.setHeightForWidth(self.pushButton_w.sizePolicy().hasHeightForWidth())
+        self.pushButton_w.setSizePolicy(sizePolicy)
+
+        self.gridLayout_9.addWidget(self.pushButton_w, 3, 2, 1, 1)
+
+        self.pushButton_pi = QPushButton(self.tab_char)
+        self.pushButton_pi.setObjectName(u"pushButton_pi")
+        sizePolicy.setHeightForWidth(self.pushButton_pi.sizePolicy().hasHeightForWidth())
+        self.pushButton_pi.setSizePolicy(sizePolicy)
+
+        self.gridLayout_9.addWidget(self.pushButton_pi, 5, 1, 1, 1)
+
+        self.pushButton_d = QPushButton(self.tab_char)
+        self.pushButton_d.setObjectName(u"pushButton_d")
+        sizePolicy.setHeightForWidth(self.pushButton_d.sizePolicy().hasHeightForWidth())
+        self.pushButton_d.setSizePolicy(sizePolicy)
+
+        self.gridLayout_9.addWidget(self.pushButton_d, 1, 3, 1, 1)
+
+        self.pushButton_chi = QPushButton(self.tab_char)
+        self.pushButton_chi.setObjectName(u"pushButton_chi")
+        sizePolicy.setHeightForWidth(self.pushButton_chi.sizePolicy().hasHeightForWidth())
+        self.pushButton_chi.setSizePolicy(sizePolicy)
+
+        self.gridLayout_9.addWidget(self.pushButton_chi, 5, 7, 1, 1)
+
+        self.pushButton_y = QPushButton(self.tab_char)
+        self.pushButton_y.setObjectName(u"pushButton_y")
+        sizePolicy.setHeightForWidth(self.pushButton_y.sizePolicy().hasHeightForWidth())
+        self.pushButton_y.setSizePolicy(sizePolicy)
+
+        self.gridLayout_9.addWidget(self.pushButton_y, 3, 4, 1, 1)
+
+        self.pushButton_upsi = QPushButton(self.tab_char)
+        self.pushButton_upsi.setObjectName(u"pushButton_upsi")
+        sizePolicy.setHeightForWidth(self.pushButton_upsi.sizePolicy().hasHeightForWidth())
+        self.pushButton_upsi.setSizePolicy(sizePolicy)
+
+        self.gridLayout_9.addWidget(self.pushButton_upsi, 5, 5, 1, 1)
+
+        self.pushButton_p = QPushButton(self.tab_char)
+        self.pushButton_p.setObjectName(u"pushButton_p")
+        sizePolicy.setHeightForWidth(self.pushButton_p.sizePolicy().hasHeightForWidth())
+        self.pushButton_p.setSizePolicy(sizePolicy)
+
+        self.gridLayout_9.addWidget(self.pushButton_p, 2, 5, 1, 1)
+
+        self.pushButton_i = QPushButton(self.tab_char)
+        self.pushButton_i.setObjectName(u"pushButton_i")
+        sizePolicy.setHeightForWidth(self.pushButton_i.sizePolicy().hasHeightForWidth())
+        self.pushButton_i.setSizePolicy(sizePolicy)
+
+        self.gridLayout_9.addWidget(self.pushButton_i, 1, 8, 1, 1)
+
+        self.pushButton_sym1 = QPushButton(self.tab_char)
+        self.pushButton_sym1.setObjectName(u"pushButton_sym1")
+        sizePolicy.setHeightForWidth(self.pushButton_sym1.sizePolicy().hasHeightForWidth())
+        self.pushButton_sym1.setSizePolicy(sizePolicy)
+
+        self.gridLayout_9.addWidget(self.pushButton_sym1, 0, 0, 1, 1)
+
+        self.pushButton_sym2 = QPushButton(self.tab_char)
+        self.pushButton_sym2.setObjectName(u"pushButton_sym2")
+        sizePolicy.setHeightForWidth(self.pushButton_sym2.sizePolicy().hasHeightForWidth())
+        self.pushButton_sym2.setSizePolicy(sizePolicy)
+
+        self.gridLayout_9.addWidget(self.pushButton_sym2, 0, 1, 1, 1)
+
+        self.pushButton_sym3 = QPushButton(self.tab_char)
+        self.pushButton_sym3.setObjectName(u"pushButton_sym3")
+        sizePolicy.setHeightForWidth(self.pushButton_sym3.sizePolicy().hasHeightForWidth())
+        self.pushButton_sym3.setSizePolicy(sizePolicy)
+
+        self.gridLayout_9.addWidget(self.pushButton_sym3, 0, 2, 1, 1)
+
+        self.pushButton_sym4 = QPushButton(self.tab_char)
+        self.pushButton_sym4.setObjectName(u"pushButton_sym4")
+        sizePolicy.setHeightForWidth(self.pushButton_sym4.sizePolicy().hasHeightForWidth())
+        self.pushButton_sym4.setSizePolicy(sizePolicy)
+
+        self.gridLayout_9.addWidget(self.pushButton_sym4, 0, 3, 1, 1)
+
+        self.pushButton_sym5 = QPushButton(self.tab_char)
+        self.pushButton_sym5.setObjectName(u"pushButton_sym5")
+        sizePolicy.setHeightForWidth(self.pushButton_sym5.sizePolicy().hasHeightForWidth())
+        self.pushButton_sym5.setSizePolicy(sizePolicy)
+
+        self.gridLayout_9.addWidget(self.pushButton_sym5, 0, 4, 1, 1)
+
+        self.pushButton_2ndch = QPushButton(self.tab_char)
+        self.pushButton_2ndch.setObjectName(u"pushButton_2ndch")
+        sizePolicy.setHeightForWidth(self.pushButton_2ndch.sizePolicy().hasHeightForWidth())
+        self.pushButton_2ndch.setSizePolicy(sizePolicy)
+
+        self.gridLayout_9.addWidget(self.pushButton_2ndch, 0, 9, 1, 1)
+
+        self.pushButton_sym6 = QPushButton(self.tab_char)
+        self.pushButton_sym6.setObjectName(u"pushButton_sym6")
+        sizePolicy.setHeightForWidth(self.pushButton_sym6.sizePolicy().hasHeightForWidth())
+        self.pushButton_sym6.setSizePolicy(sizePolicy)
+
+        self.gridLayout_9.addWidget(self.pushButton_sym6, 0, 5, 1, 1)
+
+        self.pushButton_sym7 = QPushButton(self.tab_char)
+        self.pushButton_sym7.setObjectName(u"pushButton_sym7")
+        sizePolicy.setHeightForWidth(self.pushButton_sym7.sizePolicy().hasHeightForWidth())
+        self.pushButton_sym7.setSizePolicy(sizePolicy)
+
+        self.gridLayout_9.addWidget(self.pushButton_sym7, 0, 6, 1, 1)
+
+        self.pushButton_sym8 = QPushButton(self.tab_char)
+        self.pushButton_sym8.setObjectName(u"pushButton_sym8")
+        sizePolicy.setHeightForWidth(self.pushButton_sym8.sizePolicy().hasHeightForWidth())
+        self.pushButton_sym8.setSizePolicy(sizePolicy)
+
+        self.gridLayout_9.addWidget(self.pushButton_sym8, 0, 7, 1, 1)
+
+        self.pushButton_sym9 = QPushButton(self.tab_char)
+        self.pushButton_sym9.setObjectName(u"pushButton_sym9")
+        sizePolicy.setHeightForWidth(self.pushButton_sym9.sizePolicy().hasHeightForWidth())
+        self.pushButton_sym9.setSizePolicy(sizePolicy)
+
+        self.gridLayout_9.addWidget(self.pushButton_sym9, 0, 8, 1, 1)
+
+
+        self.gridLayout_16.addLayout(self.gridLayout_9, 0, 0, 1, 1)
+
+        self.tabWidget.addTab(self.tab_char, "")
+        self.tab_histo = QWidget()
+        self.tab_histo.setObjectName(u"tab_histo")
+        self.gridLayout_3 = QGridLayout(self.tab_histo)
+        self.gridLayout_3.setObjectName(u"gridLayout_3")
+        self.horizontalLayout_2 = QHBoxLayout()
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.pushButton_cle = QPushButton(self.tab_histo)
+        self.pushButton_cle.setObjectName(u"pushButton_cle")
+
+        self.horizontalLayout_2.addWidget(self.pushButton_cle)
+
+        self.pushButton_del = QPushButton(self.tab_histo)
+        self.pushButton_del.setObjectName(u"pushButton_del")
+
+        self.horizontalLayout_2.addWidget(self.pushButton_del)
+
+        self.pushButton_setan = QPushButton(self.tab_histo)
+        self.pushButton_setan.setObjectName(u"pushButton_setan")
+
+        self.horizontalLayout_2.addWidget(self.pushButton_setan)
+
+
+        self.gridLayout_3.addLayout(self.horizontalLayout_2, 2, 0, 1, 1)
+
+        self.verticalLayout_2 = QVBoxLayout()
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.tableWidget = QTableWidget(self.tab_histo)
+        if (self.tableWidget.columnCount() < 3):
+            self.tableWidget.setColumnCount(3)
+        __qtablewidgetitem = QTableWidgetItem()
+        self.tableWidget.setHorizontalHeaderItem(0, __qtablewidgetitem)
+        __qtablewidgetitem1 = QTableWidgetItem()
+        self.tableWidget.setHorizontalHeaderItem(1, __qtablewidgetitem1)
+        __qtablewidgetitem2 = QTableWidgetItem()
+        self.tableWidget.setHorizontalHeaderItem(2, __qtablewidgetitem2)
+        self.tableWidget.setObjectName(u"tableWidget")
+
+        self.verticalLayout_2.addWidget(self.tableWidget)
+
+
+        self.gridLayout_3.addLayout(self.verticalLayout_2, 1, 0, 1, 1)
+
+        self.tabWidget.addTab(self.tab_histo, "")
+        self.tab_graph = QWidget()
+        self.tab_graph.setObjectName(u"tab_graph")
+        self.gridLayout_17 = QGridLayout(self.tab_graph)
+        self.gridLayout_17.setObjectName(u"gridLayout_17")
+        self.lineEdit_func = QLineEdit(self.tab_graph)
+        self.lineEdit_func.setObjectName(u"lineEdit_func")
+
+        self.gridLayout_17.addWidget(self.lineEdit_func, 0, 0, 1, 1)
+
+        self.radioButton_2d = QRadioButton(self.tab_graph)
+        self.radioButton_2d.setObjectName(u"radioButton_2d")
+        sizePolicy3 = QSizePolicy(QSizePolicy.Policy.Maximum, QSizePolicy.Policy.Fixed)
+        sizePolicy3.setHorizontalStretch(0)
+        sizePolicy3.setVerticalStretch(0)
+        sizePolicy3.setHeightForWidth(self.radioButton_2d.sizePolicy().hasHeightForWidth())
+        self.radioButton_2d.setSizePolicy(sizePolicy3)
+
+        self.gridLayout_17.addWidget(self.radioButton_2d, 0, 1, 1, 1)
+
+        self.radioButton_3d = QRadioButton(self.tab_graph)
+        self.radioButton_3d.setObjectName(u"radioButton_3d")
+
+        self.gridLayout_17.addWidget(self.radioButton_3d, 0, 2, 1, 1)
+
+        self.tabWidget.addTab(self.tab_graph, "")
+
+        self.verticalLayout.addWidget(self.tabWidget)
+
+        self.horizontalLayout = QHBoxLayout()
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalLayout.setSizeConstraint(QLayout.SizeConstraint.SetDefaultConstraint)
+        self.pushButton_clr = QPushButton(self.centralwidget)
+        self.pushButton_clr.setObjectName(u"pushButton_clr")
+        sizePolicy.setHeightForWidth(self.pushButton_clr.sizePolicy().hasHeightForWidth())
+        self.pushButton_clr.setSizePolicy(sizePolicy)
+        self.pushButton_clr.setMinimumSize(QSize(80, 30))
+        self.pushButton_clr.setMaximumSize(QSize(16777215, 100))
+        self.pushButton_clr.setLocale(QLocale(QLocale.C, QLocale.AnyTerritory))
+
+        self.horizontalLayout.addWidget(self.pushButton_clr)
+
+        self.pushButton_lf = QPushButton(self.centralwidget)
+        self.pushButton_lf.setObjectName(u"pushButton_lf")
+        sizePolicy.setHeightForWidth(self.pushButton_lf.sizePolicy().hasHeightForWidth())
+        self.pushButton_lf.setSizePolicy(sizePolicy)
+        self.pushButton_lf.setMinimumSize(QSize(80, 30))
+        self.pushButton_lf.setMaximumSize(QSize(16777215, 100))
+        self.pushButton_lf.setLocale(QLocale(QLocale.C, QLocale.AnyTerritory))
+
+        self.horizontalLayout.addWidget(self.pushButton_lf)
+
+        self.pushButton_rf = QPushButton(self.centralwidget)
+        self.pushButton_rf.setObjectName(u"pushButton_rf")
+        sizePolicy.setHeightForWidth(self.pushButton_rf.sizePolicy().hasHeightForWidth())
+        self.pushButton_rf.setSizePolicy(sizePolicy)
+        self.pushButton_rf.setMinimumSize(QSize(80, 30))
+        self.pushButton_rf.setMaximumSize(QSize(16777215, 100))
+        self.pushButton_rf.setLocale(QLocale(QLocale.C, QLocale.AnyTerritory))
+
+        self.horizontalLayout.addWidget(self.pushButton_rf)
+
+        self.pushButton_nl = QPushButton(self.centralwidget)
+        self.pushButton_nl.setObjectName(u"pushButton_nl")
+        sizePolicy.setHeightForWidth(self.pushButton_nl.sizePolicy().hasHeightForWidth())
+        self.pushButton_nl.setSizePolicy(sizePolicy)
+        self.pushButton_nl.setMinimumSize(QSize(80, 30))
+        self.pushButton_nl.setMaximumSize(QSize(16777215, 100))
+        self.pushButton_nl.setLocale(QLocale(QLocale.C, QLocale.AnyTerritory))
+
+        self.horizontalLayout.addWidget(self.pushButton_nl)
+
+        self.pushButton_bs = QPushButton(self.centralwidget)
+        self.pushButton_bs.setObjectName(u"pushButton_bs")
+        sizePolicy.setHeightForWidth(self.pushButton_bs.sizePolicy().hasHeightForWidth())
+        self.pushButton_bs.setSizePolicy(sizePolicy)
+        self.pushButton_bs.setMinimumSize(QSize(80, 30))
+        self.pushButton_bs.setMaximumSize(QSize(16777215, 100))
+        self.pushButton_bs.setLocale(QLocale(QLocale.C, QLocale.AnyTerritory))
+
+        self.horizontalLayout.addWidget(self.pushButton_bs)
+
+        self.pushButton_calc = QPushButton(self.centralwidget)
+        self.pushButton_calc.setObjectName(u"pushButton_calc")
+        sizePolicy.setHeightForWidth(self.pushButton_calc.sizePolicy().hasHeightForWidth())
+        self.pushButton_calc.setSizePolicy(sizePolicy)
+        self.pushButton_calc.setMinimumSize(QSize(80, 30))
+        self.pushButton_calc.setMaximumSize(QSize(16777215, 100))
+        self.pushButton_calc.setLocale(QLocale(QLocale.C, QLocale.AnyTerritory))
+
+        self.horizontalLayout.addWidget(self.pushButton_calc)
+
+
+        self.verticalLayout.addLayout(self.horizontalLayout)
+
+        MainWindow.setCentralWidget(self.centralwidget)
+        self.menubar = QMenuBar(MainWindow)
+        self.menubar.setObjectName(u"menubar")
+        self.menubar.setGeometry(QRect(0, 0, 848, 33))
+        self.menuHelp = QMenu(self.menubar)
+        self.menuHelp.setObjectName(u"menuHelp")
+        self.menuFile = QMenu(self.menubar)
+        self.menuFile.setObjectName(u"menuFile")
+        self.menuNew = QMenu(self.menuFile)
+        self.menuNew.setObjectName(u"menuNew")
+        self.menuCSV_File = QMenu(self.menuFile)
+        self.menuCSV_File.setObjectName(u"menuCSV_File")
+        self.menuAngular_Unit = QMenu(self.menuFile)
+        self.menuAngular_Unit.setObjectName(u"menuAngular_Unit")
+        self.menuBase = QMenu(self.menuFile)
+        self.menuBase.setObjectName(u"menuBase")
+        self.menuOptions = QMenu(self.menubar)
+        self.menuOptions.setObjectName(u"menuOptions")
+        MainWindow.setMenuBar(self.menubar)
+        self.statusbar = QStatusBar(MainWindow)
+        self.statusbar.setObjectName(u"statusbar")
+        MainWindow.setStatusBar(self.statusbar)
+
+        self.menubar.addAction(self.menuFile.menuAction())
+        self.menubar.addAction(self.menuOptions.menuAction())
+        self.menubar.addAction(self.menuHelp.menuAction())
+        self.menuHelp.addAction(self.actionAbout)
+        self.menuFile.addAction(self.menuNew.menuAction())
+        self.menuFile.addAction(self.menuCSV_File.menuAction())
+        self.menuFile.addAction(self.menuAngular_Unit.menuAction())
+        self.menuFile.addAction(self.menuBase.menuAction())
+        self.menuFile.addSeparator()
+        self.menuFile.addAction(self.actionUnit_Conver_3)
+        self.menuFile.addAction(self.actionCoding_2)
+        self.menuFile.addAction(self.actionStatistics)
+        self.menuNew.addAction(self.actionFunction)
+        self.menuNew.addAction(self.actionVarvivle)
+        self.menuNew.addAction(self.actionConstant)
+        self.menuNew.addAction(self.actionUnit)
+        self.menuCSV_File.addAction(self.actionImport)
+        self.menuCSV_File.addAction(self.actionOutport)
+        self.menuAngular_Unit.addAction(self.actionRaduis)
+        self.menuAngular_Unit.addAction(self.actionDegree)
+        self.menuAngular_Unit.addAction(self.actionGradians)
+        self.menuBase.addAction(self.actionBinary_2)
+        self.menuBase.addAction(self.actionOctal_2)
+        self.menuBase.addAction(self.actionDecimal_2)
+        self.menuBase.addAction(self.actionHexadecimal)
+        self.menuBase.addAction(self.actionDuodecimal)
+        self.menuBase.addAction(self.actionSexagesimal)
+        self.menuBase.addAction(self.actionCustom)
+        self.menuOptions.addAction(self.actionSettings)
+        self.menuOptions.addSeparator()
+        self.menuOptions.addAction(self.actionFunction_2)
+        self.menuOptions.addAction(self.actionVariable)
+        self.menuOptions.addAction(self.actionConstant_2)
+        self.menuOptions.addAction(self.actionUnit_2)
+
+        self.retranslateUi(MainWindow)
+
+        self.tabWidget.setCurrentIndex(0)
+
+
+        QMetaObject.connectSlotsByName(MainWindow)
+    # setupUi
+
+    def retranslateUi(self, MainWindow):
+        MainWindow.setWindowTitle(QCoreApplication.translate("MainWindow", u"Kalculate", None))
+        self.actionCalculate.setText(QCoreApplication.translate("MainWindow", u"General", None))
+        self.action2D_Graphing.setText(QCoreApplication.translate("MainWindow", u"2D Graphing", None))
+        self.action3D_Graphing.setText(QCoreApplication.translate("MainWindow", u"3D Graphing", None))
+        self.actionUnit_Conver.setText(QCoreApplication.translate("MainWindow", u"Unit Conver", None))
+        self.actionCoding.setText(QCoreApplication.translate("MainWindow", u"Coding", None))
+        self.actionAbout.setText(QCoreApplication.translate("MainWindow", u"About", None))
+        self.actionBasic.setText(QCoreApplication.translate("MainWindow", u"Constant", None))
+        self.actionPhysical.setText(QCoreApplication.translate("MainWindow", u"Function", None))
+        self.actionShow_History.setText(QCoreApplication.translate("MainWindow", u"Show History", None))
+        self.actionSettings.setText(QCoreApplication.translate("MainWindow", u"Settings", None))
+        self.actionBinary.setText(QCoreApplication.translate("MainWindow", u"Binary", None))
+        self.actionOctal.setText(QCoreApplication.translate("MainWindow", u"Octal", None))
+        self.actionDecimal.setText(QCoreApplication.translate("MainWindow", u"Decimal", None))
+        self.actionFunction.setText(QCoreApplication.translate("MainWindow", u"Function", None))
+        self.actionVarvivle.setText(QCoreApplication.translate("MainWindow", u"Variable", None))
+        self.actionConstant.setText(QCoreApplication.translate("MainWindow", u"Constant", None))
+        self.actionUnit.setText(QCoreApplication.translate("MainWindow", u"Unit", None))
+        self.actionImport.setText(QCoreApplication.translate("MainWindow", u"Import", None))
+        self.actionOutport.setText(QCoreApplication.translate("MainWindow", u"Outport", None))
+        self.actionFunction_2.setText(QCoreApplication.translate("MainWindow", u"Function", None))
+        self.actionVariable.setText(QCoreApplication.translate("MainWindow", u"Variable", None))
+        self.actionConstant_2.setText(QCoreApplication.translate("MainWindow", u"Constant", None))
+        self.actionUnit_2.setText(QCoreApplication.translate("MainWindow", u"Unit", None))
+        self.actionGeneral.setText(QCoreApplication.translate("MainWindow", u"General", None))
+        self.actionFunction_Graphing.setText(QCoreApplication.translate("MainWindow", u"Function Graphing", None))
+        self.actionData_Set.setText(QCoreApplication.translate("MainWindow", u"Data Set", None))
+        self.actionGeneral_2.setText(QCoreApplication.translate("MainWindow", u"General", None))
+        self.actionUnit_Conver_2.setText(QCoreApplication.translate("MainWindow", u"Unit Conver", None))
+        self.actionRaduis.setText(QCoreApplication.translate("MainWindow", u"Radians", None))
+        self.actionDegree.setText(QCoreApplication.translate("MainWindow", u"Degress", None))
+        self.actionGradians.setText(QCoreApplication.translate("MainWindow", u"Gradians", None))
+        self.actionTurns.setText(QCoreApplication.translate("MainWindow", u"Turns", None))
+        self.actionUnit_Conver_3.setText(QCoreApplication.translate("MainWindow", u"Unit Conver", None))
+        self.actionCoding_2.setText(QCoreApplication.translate("MainWindow", u"Coding", None))
+        self.actionBinary_2.setText(QCoreApplication.translate("MainWindow", u"Binary", None))
+        self.actionOctal_2.setText(QCoreApplication.translate("MainWindow", u"Octal", None))
+        self.actionDecimal_2.setText(QCoreApplication.translate("MainWindow", u"Decimal", None))
+        self.actionHexadecimal.setText(QCoreApplication.translate("MainWindow", u"Hexadecimal", None))
+        self.actionDuodecimal.setText(QCoreApplication.translate("MainWindow", u"Duodecimal", None))
+        self.actionSexagesimal.setText(QCoreApplication.translate("MainWindow", u"Sexagesimal", None))
+        self.actionCustom.setText(QCoreApplication.translate("MainWindow", u"Custom", None))
+        self.actionStatistics.setText(QCoreApplication.translate("MainWindow", u"Statistics", None))
+        self.lineEdit.setPlaceholderText(QCoreApplication.translate("MainWindow", u"Enter expression here\u2026", None))
+        self.pushButton_8.setText(QCoreApplication.translate("MainWindow", u"8", None))
+        self.pushButton_pib.setText(QCoreApplication.translate("MainWindow", u"\u03c0", None))
+        self.pushButton_ib.setText(QCoreApplication.translate("MainWindow", u"i", None))
+        self.pushButton_1.setText(QCoreApplication.translate("MainWindow", u"1", None))
+        self.pushButton_root.setText(QCoreApplication.translate("MainWindow", u"\u221a", None))
+        self.pushButton_leb.setText(QCoreApplication.translate("MainWindow", u"<", None))
+        self.pushButton_9.setText(QCoreApplication.translate("MainWindow", u"9", None))
+        self.pushButton_div.setText(QCoreApplication.translate("MainWindow", u"\u00f7", None))
+        self.pushButton_4.setText(QCoreApplication.translate("MainWindow", u"4", None))
+        self.pushButton_xb.setText(QCoreApplication.translate("MainWindow", u"x", None))
+        self.pushButton_sub.setText(QCoreApplication.translate("MainWindow", u"-", None))
+        self.pushButton_eq.setText(QCoreApplication.translate("MainWindow", u"=", None))
+        self.pushButton_pos.setText(QCoreApplication.translate("MainWindow", u"+/-", None))
+        self.pushButton_lbr.setText(QCoreApplication.translate("MainWindow", u"\uff08", None))
+        self.pushButton_2.setText(QCoreApplication.translate("MainWindow", u"2", None))
+        self.pushButton_dot.setText(QCoreApplication.translate("MainWindow", u".", None))
+        self.pushButton_yb.setText(QCoreApplication.translate("MainWindow", u"y", None))
+        self.pushButton_gtb.setText(QCoreApplication.translate("MainWindow", u">", None))
+        self.pushButton_6.setText(QCoreApplication.translate("MainWindow", u"6", None))
+        self.pushButton_log.setText(QCoreApplication.translate("MainWindow", u"log", None))
+        self.pushButton_5.setText(QCoreApplication.translate("MainWindow", u"5", None))
+        self.pushButton_rbr.setText(QCoreApplication.translate("MainWindow", u")", None))
+        self.pushButton_eb.setText(QCoreApplication.translate("MainWindow", u"e", None))
+        self.pushButton_add.setText(QCoreApplication.translate("MainWindow", u"+", None))
+        self.pushButton_mul.setText(QCoreApplication.translate("MainWindow", u"\u00d7", None))
+        self.pushButton_ans.setText(QCoreApplication.translate("MainWindow", u"Answer", None))
+        self.pushButton_3.setText(QCoreApplication.translate("MainWindow", u"3", None))
+        self.pushButton_0.setText(QCoreApplication.translate("MainWindow", u"0", None))
+        self.pushButton_7.setText(QCoreApplication.translate("MainWindow", u"7", None))
+        self.pushButton_pow.setText(QCoreApplication.translate("MainWindow", u"^", None))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.basic_tab), QCoreApplication.translate("MainWindow", u"Basic", None))
+        self.pushButton_cefl.setText(QCoreApplication.translate("MainWindow", u"\u2308a\u2309", None))
+        self.pushButton_ge.setText(QCoreApplication.translate("MainWindow", u"\u2265", None))
+        self.pushButton_abs.setText(QCoreApplication.translate("MainWindow", u"|a|", None))
+        self.pushButton_sol.setText(QCoreApplication.translate("MainWindow", u"Solve", None))
+        self.pushButton_le.setText(QCoreApplication.translate("MainWindow", u"\u2264", None))
+        self.pushButton_exp.setText(QCoreApplication.translate("MainWindow", u"Expend", None))
+        self.pushButton_fac.setText(QCoreApplication.translate("MainWindow", u"Factor", None))
+        self.pushButton_sim.setText(QCoreApplication.translate("MainWindow", u"Simplify", None))
+        self.pushButton_ps.setText(QCoreApplication.translate("MainWindow", u"\u00b1", None))
+        self.pushButton_ne.setText(QCoreApplication.translate("MainWindow", u"\u2260", None))
+        self.pushButton_gidp.setText(QCoreApplication.translate("MainWindow", u"[a]", None))
+        self.pushButton_2nda.setText(QCoreApplication.translate("MainWindow", u"2nd", None))
+        self.pushButton_oa.setText(QCoreApplication.translate("MainWindow", u"\u2228", None))
+        self.pushButton_noxo.setText(QCoreApplication.translate("MainWindow", u"\u00ac", None))
+        self.pushButton_rl.setText(QCoreApplication.translate("MainWindow", u"\u2192", None))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_alge), QCoreApplication.translate("MainWindow", u"Algebra", None))
+        self.pushButton_cot.setText(QCoreApplication.translate("MainWindow", u"cot", None))
+        self.pushButton_sin.setText(QCoreApplication.translate("MainWindow", u"sin", None))
+        self.pushButton_csc.setText(QCoreApplication.translate("MainWindow", u"csc", None))
+        self.pushButton_2ndt.setText(QCoreApplication.translate("MainWindow", u"2nd", None))
+        self.pushButton_hyp.setText(QCoreApplication.translate("MainWindow", u"hyp", None))
+        self.pushButton_cos.setText(QCoreApplication.translate("MainWindow", u"cos", None))
+        self.pushButton_sec.setText(QCoreApplication.translate("MainWindow", u"sec", None))
+        self.pushButton_tan.setText(QCoreApplication.translate("MainWindow", u"tan", None))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.trigo_tab), QCoreApplication.translate("MainWindow", u"Trigomometry", None))
+        self.pushButton_diff.setText(QCoreApplication.translate("MainWindow", u"'", None))
+        self.pushButton_Ci.setText(QCoreApplication.translate("MainWindow", u"Ci", None))
+        self.pushButton_li.setText(QCoreApplication.translate("MainWindow", u"li", None))
+        self.pushButton_Si.setText(QCoreApplication.translate("MainWindow", u"Si", None))
+        self.pushButton_tayls.setText(QCoreApplication.translate("MainWindow", u"Taylor Series", None))
+        self.pushButton_lim.setText(QCoreApplication.translate("MainWindow", u"lim", None))
+        self.pushButton_inter.setText(QCoreApplication.translate("MainWindow", u"\u222b", None))
+        self.pushButton_Oc.setText(QCoreApplication.translate("MainWindow", u"O", None))
+        self.pushButton_bemmac.setText(QCoreApplication.translate("MainWindow", u"\u0393", None))
+        self.pushButton_2ndc.setText(QCoreApplication.translate("MainWindow", u"2nd", None))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.calcu_tab), QCoreApplication.translate("MainWindow", u"Calculus", None))
+        self.pushButton_comp.setText(QCoreApplication.translate("MainWindow", u"A\u1d9c", None))
+        self.pushButton_difs.setText(QCoreApplication.translate("MainWindow", u"\\", None))
+        self.pushButton_rbc.setText(QCoreApplication.translate("MainWindow", u"}", None))
+        self.pushButton_rsb.setText(QCoreApplication.translate("MainWindow", u"]", None))
+        self.pushButton_sep.setText(QCoreApplication.translate("MainWindow", u"|", None))
+        self.pushButton_bel2.setText(QCoreApplication.translate("MainWindow", u"\u2208", None))
+        self.pushButton_sn.setText(QCoreApplication.translate("MainWindow", u"#", None))
+        self.pushButton_ins.setText(QCoreApplication.translate("MainWindow", u"\u2229", None))
+        self.pushButton_exs.setText(QCoreApplication.translate("MainWindow", u"\u2203", None))
+        self.pushButton_es.setText(QCoreApplication.translate("MainWindow", u"\u2205", None))
+        self.pushButton_tsbs.setText(QCoreApplication.translate("MainWindow", u"\u2282", None))
+        self.pushButton_uni.setText(QCoreApplication.translate("MainWindow", u"\u222a", None))
+        self.pushButton_lsb.setText(QCoreApplication.translate("MainWindow", u"[", None))
+        self.pushButton_lbc.setText(QCoreApplication.translate("MainWindow", u"{", None))
+        self.pushButton_sbs.setText(QCoreApplication.translate("MainWindow", u"\u2286", None))
+        self.pushButton_tsps.setText(QCoreApplication.translate("MainWindow", u"\u2283", None))
+        self.pushButton_4a.setText(QCoreApplication.translate("MainWindow", u",", None))
+        self.pushButton_Pm.setText(QCoreApplication.translate("MainWindow", u"P", None))
+        self.pushButton_sd.setText(QCoreApplication.translate("MainWindow", u"\u25b3", None))
+        self.pushButton_2ndms.setText(QCoreApplication.translate("MainWindow", u"2nd", None))
+        self.pushButton_sps.setText(QCoreApplication.translate("MainWindow", u"\u2287", None))
+        self.pushButton_nat.setText(QCoreApplication.translate("MainWindow", u"\u2115", None))
+        self.pushButton_intms.setText(QCoreApplication.translate("MainWindow", u"\u2124", None))
+        self.pushButton_rat.setText(QCoreApplication.translate("MainWindow", u"\u211a", None))
+        self.pushButton_real.setText(QCoreApplication.translate("MainWindow", u"\u211d", None))
+        self.pushButton_imag.setText(QCoreApplication.translate("MainWindow", u"\U0001d540", None))
+        self.pushButton_compl.setText(QCoreApplication.translate("MainWindow", u"\u2102", None))
+        self.pushButton_algn.setText(QCoreApplication.translate("MainWindow", u"\U0001d538", None))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_marset), QCoreApplication.translate("MainWindow", u"Martix/Set", None))
+        self.pushButton_z.setText(QCoreApplication.translate("MainWindow", u"z", None))
+        self.pushButton_j.setText(QCoreApplication.translate("MainWindow", u"j", None))
+        self.pushButton_phi.setText(QCoreApplication.translate("MainWindow", u"\u03c6", None))
+        self.pushButton_mu.setText(QCoreApplication.translate("MainWindow", u"\u03bc", None))
+        self.pushButton_a.setText(QCoreApplication.translate("MainWindow", u"a", None))
+        self.pushButton_o.setText(QCoreApplication.translate("MainWindow", u"o", None))
+        self.pushButton_delt.setText(QCoreApplication.translate("MainWindow", u"\u03b4", None))
+        self.pushButton_omic.setText(QCoreApplication.translate("MainWindow", u"\u03bf", None))
+        self.pushButton_h.setText(QCoreApplication.translate("MainWindow", u"h", None))
+        self.pushButton_sigm.setText(QCoreApplication.translate("MainWindow", u"\u03c3", None))
+        self.pushButton_omeg.setText(QCoreApplication.translate("MainWindow", u"\u03c9", None))
+        self.pushButton_b.setText(QCoreApplication.translate("MainWindow", u"b", None))
+        self.pushButton_g.setText(QCoreApplication.translate("MainWindow", u"g", None))
+        self.pushButton_t.setText(QCoreApplication.translate("MainWindow", u"t", None))
+        self.pushButton_n.setText(QCoreApplication.translate("MainWindow", u"n", None))
+        self.pushButton_l.setText(QCoreApplication.translate("MainWindow", u"l", None))
+        self.pushButton_m.setText(QCoreApplication.translate("MainWindow", u"m", None))
+        self.pushButton_lamd.setText(QCoreApplication.translate("MainWindow", u"\u03bb", None))
+        self.pushButton_alph.setText(QCoreApplication.translate("MainWindow", u"\u03b1", None))
+        self.pushButton_iota.setText(QCoreApplication.translate("MainWindow", u"\u03b9", None))
+        self.pushButton_ksi.setText(QCoreApplication.translate("MainWindow", u"\u03be", None))
+        self.pushButton_q.setText(QCoreApplication.translate("MainWindow", u"q", None))
+        self.pushButton_u.setText(QCoreApplication.translate("MainWindow", u"u", None))
+        self.pushButton_nu.setText(QCoreApplication.translate("MainWindow", u"\u03bd", None))
+        self.pushButton_psi.setText(QCoreApplication.translate("MainWindow", u"\u03c8", None))
+        self.pushButton_beta.setText(QCoreApplication.translate("MainWindow", u"\u03b2", None))
+        self.pushButton_x.setText(QCoreApplication.translate("MainWindow", u"x", None))
+        self.pushButton_epsi.setText(QCoreApplication.translate("MainWindow", u"\u03b5", None))
+        self.pushButton_e.setText(QCoreApplication.translate("MainWindow", u"e", None))
+        self.pushButton_f.setText(QCoreApplication.translate("MainWindow", u"f", None))
+        self.pushButton_zeta.setText(QCoreApplication.translate("MainWindow", u"\u03b6", None))
+        self.pushButton_tau.setText(QCoreApplication.translate("MainWindow", u"\u03c4", None))
+        self.pushButton_s.setText(QCoreApplication.translate("MainWindow", u"s", None))
+        self.pushButton_thet.setText(QCoreApplication.translate("MainWindow", u"\u03b8", None))
+        self.pushButton_c.setText(QCoreApplication.translate("MainWindow", u"c", None))
+        self.pushButton_rho.setText(QCoreApplication.translate("MainWindow", u"\u03c1", None))
+        self.pushButton_kapa.setText(QCoreApplication.translate("MainWindow", u"\u03ba", None))
+        self.pushButton_gama.setText(QCoreApplication.translate("MainWindow", u"\u03b3", None))
+        self.pushButton_eta.setText(QCoreApplication.translate("MainWindow", u"\u03b7", None))
+        self.pushButton_v.setText(QCoreApplication.translate("MainWindow", u"v", None))
+        self.pushButton_r.setText(QCoreApplication.translate("MainWindow", u"r", None))
+        self.pushButton_k.setText(QCoreApplication.translate("MainWindow", u"k", None))
+        self.pushButton_w.setText(QCoreApplication.translate("MainWindow", u"w", None))
+        self.pushButton_pi.setText(QCoreApplication.translate("MainWindow", u"\u03c0", None))
+        self.pushButton_d.setText(QCoreApplication.translate("MainWindow", u"d", None))
+        self.pushButton_chi.setText(QCoreApplication.translate("MainWindow", u"\u03c7", None))
+        self.pushButton_y.setText(QCoreApplication.translate("MainWindow", u"y", None))
+        self.pushButton_upsi.setText(QCoreApplication.translate("MainWindow", u"\u03c5", None))
+        self.pushButton_p.setText(QCoreApplication.translate("MainWindow", u"p", None))
+        self.pushButton_i.setText(QCoreApplication.translate("MainWindow", u"i", None))
+        self.pushButton_sym1.setText(QCoreApplication.translate("MainWindow", u"\u221e", None))
+        self.pushButton_sym2.setText(QCoreApplication.translate("MainWindow", u"z\u0304", None))
+        self.pushButton_sym3.setText(QCoreApplication.translate("MainWindow", u"%", None))
+        self.pushButton_sym4.setText(QCoreApplication.translate("MainWindow", u"mod", None))
+        self.pushButton_sym5.setText(QCoreApplication.translate("MainWindow", u"\u2202", None))
+        self.pushButton_2ndch.setText(QCoreApplication.translate("MainWindow", u"2nd", None))
+        self.pushButton_sym6.setText(QCoreApplication.translate("MainWindow", u"!", None))
+        self.pushButton_sym7.setText(QCoreApplication.translate("MainWindow", u"a/b", None))
+        self.pushButton_sym8.setText(QCoreApplication.translate("MainWindow", u"\u220f", None))
+        self.pushButton_sym9.setText(QCoreApplication.translate("MainWindow", u"\u03a3", None))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_char), QCoreApplication.translate("MainWindow", u"Characters", None))
+        self.pushButton_cle.setText(QCoreApplication.translate("MainWindow", u"Clear", None))
+        self.pushButton_del.setText(QCoreApplication.translate("MainWindow", u"Delete", None))
+        self.pushButton_setan.setText(QCoreApplication.translate("MainWindow", u"Set Answer", None))
+        ___qtablewidgetitem = self.tableWidget.horizontalHeaderItem(0)
+        ___qtablewidgetitem.setText(QCoreApplication.translate("MainWindow", u"Equation", None))
+        ___qtablewidgetitem1 = self.tableWidget.horizontalHeaderItem(1)
+        ___qtablewidgetitem1.setText(QCoreApplication.translate("MainWindow", u"Result", None))
+        ___qtablewidgetitem2 = self.tableWidget.horizontalHeaderItem(2)
+        ___qtablewidgetitem2.setText(QCoreApplication.translate("MainWindow", u"Is Answer", None))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_histo), QCoreApplication.translate("MainWindow", u"History", None))
+        self.lineEdit_func.setPlaceholderText(QCoreApplication.translate("MainWindow", u"Enter function of x (and y), e.g., sin(x), x^2", None))
+        self.radioButton_2d.setText(QCoreApplication.translate("MainWindow", u"2D", None))
+        self.radioButton_3d.setText(QCoreApplication.translate("MainWindow", u"3D", None))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_graph), QCoreApplication.translate("MainWindow", u"Graph", None))
+        self.pushButton_clr.setText(QCoreApplication.translate("MainWindow", u"Clear", None))
+        self.pushButton_lf.setText(QCoreApplication.translate("MainWindow", u"\u2190", None))
+        self.pushButton_rf.setText(QCoreApplication.translate("MainWindow", u"\u2192", None))
+        self.pushButton_nl.setText(QCoreApplication.translate("MainWindow", u"\u21b5", None))
+        self.pushButton_bs.setText(QCoreApplication.translate("MainWindow", u"\u232b", None))
+        self.pushButton_calc.setText(QCoreApplication.translate("MainWindow", u"Calc", None))
+        self.menuHelp.setTitle(QCoreApplication.translate("MainWindow", u"Help", None))
+        self.menuFile.setTitle(QCoreApplication.translate("MainWindow", u"File", None))
+        self.menuNew.setTitle(QCoreApplication.translate("MainWindow", u"New", None))
+        self.menuCSV_File.setTitle(QCoreApplication.translate("MainWindow", u"CSV File", None))
+        self.menuAngular_Unit.setTitle(QCoreApplication.translate("MainWindow", u"Angular Unit", None))
+        self.menuBase.setTitle(QCoreApplication.translate("MainWindow", u"Base", None))
+        self.menuOptions.setTitle(QCoreApplication.translate("MainWindow", u"Options", None))
+    # retranslateUi
+
+
+
+UI_SOURCE_SHA256 = "727c1df4b4ba7b4aeb5b8d655837ac02797df14fdfa66dc4f404b9587207f41b"
@@ -0,0 +1,246 @@
+"""后台计算进程池（不依赖Qt）
+
+每个工作进程一次只执行一个任务。任务超时或被取消时直接结束对应的进程并补充一个新进程，
+这样卡死在 sp.integrate / sp.solve 里的计算也能被真正终止。
+需要直接使用主进程中数据的计算（如矩阵工作区）改用 ThreadTasks 在后台线程中执行。
+"""
+import itertools
+import multiprocessing as mp
+import queue
+import threading
+import time
+from collections import deque
+
+
+def _worker_main(conn):
+    """工作进程主循环：接收任务，执行后把结果发回主进程"""
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            break
+        if message is None:
+            break
+
+        request_id, func, args, kwargs = message
+        try:
+            result = func(*args, **kwargs)
+            reply = (request_id, True, result)
+        except Exception as e:
+            reply = (request_id, False, f"{type(e).__name__}: {e}")
+
+        try:
+            conn.send(reply)
+        except Exception as e:
+            # 结果无法序列化时，改为返回错误信息
+            conn.send((request_id, False, f"结果无法传回主进程: {e}"))
+
+
+class _Worker:
+    """一个工作进程及其当前任务"""
+
+    def __init__(self, context):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child_conn,), daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.request_id = None
+        self.deadline = None
+
+    @property
+    def busy(self):
+        return self.request_id is not None
+
+    def start_task(self, request_id, func, args, kwargs, timeout):
+        self.request_id = request_id
+        self.deadline = time.monotonic() + timeout if timeout else None
+        self.conn.send((request_id, func, args, kwargs))
+
+    def kill(self):
+        """立即结束进程（用于超时和取消）"""
+        try:
+            self.conn.close()
+        except OSError:
+            pass
+        if self.process.is_alive():
+            self.process.terminate()
+        self.process.join(1)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+
+    def stop(self):
+        """正常退出进程"""
+        try:
+            self.conn.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(0.5)
+        if self.process.is_alive():
+            self.kill()
+
+
+class WorkerPool:
+    """基于进程的任务池，支持单个任务的超时和取消
+
+    poll() 返回事件列表，每个事件为 (request_id, status, payload)，
+    status 取值为 "done"、"error" 或 "timeout"。被取消的任务不会产生事件。
+    """
+
+    def __init__(self, size=2, default_timeout=None, start_method="spawn"):
+        self.size = max(1, size)
+        self.default_timeout = default_timeout
+        self.context = mp.get_context(start_method)
+        self.workers = []
+        self.queue = deque()
+        self._ids = itertools.count(1)
+
+    def _ensure_workers(self):
+        # 进程按需启动，避免拖慢程序启动
+        self.workers = [w for w in self.workers if w.process.is_alive() or w.busy]
+        while len(self.workers) < self.size:
+            self.workers.append(_Worker(self.context))
+
+    def submit(self, func, *args, timeout=None, **kwargs):
+        """提交任务，返回请求编号"""
+        request_id = next(self._ids)
+        if timeout is None:
+            timeout = self.default_timeout
+        self.queue.append((request_id, func, args, kwargs, timeout))
+        self._dispatch()
+        return request_id
+
+    def start(self):
+        """提前启动所有工作进程（预热），不调用时进程在第一次提交任务时才启动"""
+        self._ensure_workers()
+
+    def _dispatch(self):
+        if not self.queue:
+            return
+        self._ensure_workers()
+        for worker in self.workers:
+            if not self.queue:
+                break
+            if not worker.busy:
+                request_id, func, args, kwargs, timeout = self.queue.popleft()
+                worker.start_task(request_id, func, args, kwargs, timeout)
+
+    def _replace(self, worker):
+        worker.kill()
+        self.workers.remove(worker)
+        self.workers.append(_Worker(self.context))
+
+    def cancel(self, request_id):
+        """取消任务，正在执行的任务会连同进程一起结束。返回是否找到该任务"""
+        for item in self.queue:
+            if item[0] == request_id:
+                self.queue.remove(item)
+                return True
+        for worker in self.workers:
+            if worker.request_id == request_id:
+                self._replace(worker)
+                self._dispatch()
+                return True
+        return False
+
+    def pending(self):
+        """返回尚未完成的请求编号"""
+        running = [w.request_id for w in self.workers if w.busy]
+        return running + [item[0] for item in self.queue]
+
+    def poll(self):
+        """收集已完成或超时的任务"""
+        events = []
+        now = time.monotonic()
+        for worker in list(self.workers):
+            if not worker.busy:
+                continue
+            request_id = worker.request_id
+            try:
+                has_reply = worker.conn.poll()
+            except (EOFError, OSError):
+                has_reply = False
+                worker.process.join(0)
+
+            if has_reply:
+                try:
+                    _, ok, payload = worker.conn.recv()
+                except (EOFError, OSError) as e:
+                    events.append((request_id, "error", f"工作进程异常退出: {e}"))
+                    self._replace(worker)
+                    continue
+                worker.request_id = None
+                worker.deadline = None
+                events.append((request_id, "done" if ok else "error", payload))
+            elif not worker.process.is_alive():
+                events.append((request_id, "error", "工作进程异常退出"))
+                self._replace(worker)
+            elif worker.deadline is not None and now >= worker.deadline:
+                events.append((request_id, "timeout", None))
+                self._replace(worker)
+
+        self._dispatch()
+        return events
+
+    def shutdown(self):
+        """结束所有工作进程"""
+        self.queue.clear()
+        for worker in self.workers:
+            if worker.busy:
+                worker.kill()
+            else:
+                worker.stop()
+        self.workers = []
+
+
+class ThreadTasks:
+    """在主进程的后台线程中执行任务，用于需要访问主进程中数据的计算（如矩阵工作区）
+
+    numpy/SciPy的计算（LAPACK、SuperLU）会释放GIL，界面线程不会被阻塞。线程无法被强制结束，
+    cancel() 只是丢弃结果，计算本身在后台继续直到完成。请求编号为负数，不会与WorkerPool的编号重复；
+    poll() 返回的事件与 WorkerPool.poll() 相同（没有超时）。
+    """
+
+    def __init__(self):
+        self.results = queue.SimpleQueue()
+        self.running = set()
+        self._ids = itertools.count(-1, -1)
+
+    def submit(self, func, *args, **kwargs):
+        """提交任务，返回请求编号"""
+        request_id = next(self._ids)
+        self.running.add(request_id)
+        thread = threading.Thread(target=self._run, args=(request_id, func, args, kwargs), daemon=True)
+        thread.start()
+        return request_id
+
+    def _run(self, request_id, func, args, kwargs):
+        try:
+            reply = (request_id, "done", func(*args, **kwargs))
+        except Exception as e:
+            reply = (request_id, "error", f"{type(e).__name__}: {e}")
+        self.results.put(reply)
+
+    def cancel(self, request_id):
+        """丢弃任务的结果，返回是否找到该任务"""
+        if request_id not in self.running:
+            return False
+        self.running.discard(request_id)
+        return True
+
+    def pending(self):
+        """返回尚未完成的请求编号"""
+        return list(self.running)
+
+    def poll(self):
+        """收集已完成的任务，被取消的任务的结果被丢弃"""
+        events = []
+        while True:
+            try:
+                event = self.results.get_nowait()
+            except queue.Empty:
+                break
+            if event[0] in self.running:
+                self.running.discard(event[0])
+                events.append(event)
+        return events